@@ -4,10 +4,6 @@ import streamlit as st
 # Impotar modulos
 import src.streamlit_analitica as streamlit_analitica
 
-# Locale
-import locale
-locale.setlocale(locale.LC_ALL, "es_ES.UTF-8")
-
 # Configuración página web - tipo wide sin sidebar activa
 st.set_page_config(page_title="Inicio", 
                    page_icon = ':airplane_arriving:', 
@@ -54,6 +50,8 @@ if st.query_params.page == '2':
     st.switch_page("pages/centro_inteligencia.py")
 if st.query_params.page == '3':
     st.switch_page("pages/fuentes.py")
+if st.query_params.page == '4':
+    st.switch_page("pages/comparacion.py")
 
 # Estructura
 leftsidebar, body, rightsidebar = st.columns([0.01,0.98, 0.01], gap='small',vertical_alignment='top')
@@ -0,0 +1,58 @@
+# Librerias
+import os
+import streamlit as st
+
+# Impotar modulos
+import src.streamlit_analitica as streamlit_analitica
+import src.plotly_analitica as plotly_analitica
+import src.snowflake_analitica as snowflake_analitica
+import src.datos_citi as datos_citi
+
+# Configuración página web - tipo wide sin sidebar activa
+st.set_page_config(page_title="Administración",
+                   page_icon = ':gear:',
+                   layout="wide",
+                   initial_sidebar_state="expanded")
+
+###########
+# CONTENIDO
+###########
+
+# Acceso restringido: la página solo se muestra si el token de la URL coincide con CITI_ADMIN_TOKEN
+token_admin = os.getenv('CITI_ADMIN_TOKEN')
+if not token_admin or st.query_params.get('token') != token_admin:
+    st.error("Acceso no autorizado.")
+    st.stop()
+
+st.title("Administración: memoria de las sesiones")
+
+# Número de sesiones y llaves a mostrar
+top_n = st.number_input(label='Número de registros a mostrar:', min_value=5, max_value=100, value=10, step=5)
+
+# Panel con las sesiones y llaves de mayor consumo
+streamlit_analitica.panel_memoria(top_n=int(top_n))
+
+# Desalojo manual según los presupuestos configurados
+if st.button('Aplicar presupuestos de memoria ahora'):
+    desalojadas = streamlit_analitica.aplicar_presupuesto()
+    st.success(f"Se desalojaron {len(desalojadas)} llaves recalculables.")
+
+# Estado de la caché de figuras compartida entre sesiones
+st.markdown('#### Caché de figuras compartida')
+st.json(plotly_analitica.estadisticas_cache_figuras())
+
+# Tamaño de payload por gráfico enviado al navegador
+st.markdown('#### Payload por gráfico')
+st.dataframe(plotly_analitica.reporte_payload(), use_container_width=True, hide_index=True)
+
+# Paridad entre el procesamiento en pandas y en el warehouse
+st.markdown('#### Paridad de modos de procesamiento')
+st.caption(f"Modo activo: {datos_citi.MODO_PROCESAMIENTO} (variable CITI_MODO_PROCESAMIENTO).")
+pais_paridad = st.text_input(label='País a verificar:', value='Chile')
+if st.button('Comparar pandas y warehouse'):
+    snowflake_analitica.flujo_snowflake()
+    st.dataframe(datos_citi.comparar_modos_procesamiento(pais_paridad, st.session_state.session), use_container_width=True, hide_index=True)
+
+# Réplica local de lectura
+st.markdown('#### Réplica local de lectura')
+st.json(snowflake_analitica.estado_replica())
@@ -52,6 +52,8 @@ if st.query_params.page == '1':
     st.switch_page("app.py") 
 if st.query_params.page == '3':
     st.switch_page("pages/fuentes.py")
+if st.query_params.page == '4':
+    st.switch_page("pages/comparacion.py")
 
 # Función para cargar contraseñas
 def cargar_contraseñas(nombre_archivo):
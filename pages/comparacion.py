@@ -0,0 +1,154 @@
+# Librerias
+import streamlit as st
+from datetime import datetime, timedelta
+
+# Impotar modulos
+import src.streamlit_analitica as streamlit_analitica
+import src.snowflake_analitica as snowflake_analitica
+import src.plotly_analitica as plotly_analitica
+from src.datos_citi import unir_series_paises
+
+# Configuración página web - tipo wide sin sidebar activa
+st.set_page_config(page_title="Comparación de países",
+                   page_icon = ':bar_chart:',
+                   layout="wide",
+                   initial_sidebar_state="expanded")
+
+# Inclusión de la hoja de estilos de Bootstrap para mejorar la apariencia.
+st.markdown("""
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet" integrity="sha384-QWTKZyjpPEjISv5WaRU9OFeRpok6YctnYmDr5pNlyT2bRjXh0JMhjY6hW+ALEwIH" crossorigin="anonymous">
+""", unsafe_allow_html=True)
+
+# Ajuste de producción
+st.markdown("""
+    <style>
+    /* Ocultar el header, la decoración y la toolbar */
+    header[data-testid="stHeader"],
+    [data-testid="stDecoration"],
+    [data-testid="stToolbar"] {
+        display: none !important;
+    }
+
+    /* Opcional: Asegurarnos de que el header no deje altura en blanco */
+    header[data-testid="stHeader"] {
+        height: 0px !important;
+        max-height: 0px !important;
+        padding: 0 !important;
+        margin: 0 !important;
+    }
+    </style>
+""", unsafe_allow_html=True)
+
+# Incializar el estado en la página inicial
+if "page" not in st.query_params:
+    st.query_params.page = '4'
+
+# Incluir la barra de navegación
+streamlit_analitica.navbar()
+
+# Redirección condicional según el valor del parámetro 'page' en la URL.
+if st.query_params.page == '1':
+    st.switch_page("app.py")
+if st.query_params.page == '2':
+    st.switch_page("pages/centro_inteligencia.py")
+if st.query_params.page == '3':
+    st.switch_page("pages/fuentes.py")
+
+# Inicializar variables de sesión si no existen
+if 'session' not in st.session_state:
+    st.session_state.session = None  # Sesión inicializada como None
+if 'last_activity_time' not in st.session_state:
+    st.session_state.last_activity_time = datetime.now()  # Última actividad es el momento actual
+
+# Definir tiempo de espera de sesión (15 minutos)
+SESSION_TIMEOUT = timedelta(minutes=15)
+
+# Número máximo de países a comparar
+MAX_PAISES_COMPARACION = 4
+
+###########
+# CONTENIDO
+###########
+
+# Estructura
+leftsidebar, body, rightsidebar = st.columns([0.01,0.98, 0.01], gap='small',vertical_alignment='top')
+
+# Aprovechar el máximo espacio horizontal de la pantalla
+with body:
+
+    # Marcador para volver al inicio
+    st.markdown("<a id='top'></a>", unsafe_allow_html=True)
+
+    st.title("Comparación de países")
+
+    st.divider()
+
+    # Actualizar flujo de Snowflake
+    snowflake_analitica.flujo_snowflake()
+
+    # Actualizar tiempo de última actividad
+    snowflake_analitica.update_last_activity()
+
+    ########################
+    # Selector de países
+    ########################
+    paises_elegidos = st.multiselect(label='Seleccione los países a comparar:',
+                options=snowflake_analitica.obtener_selector(query="SELECT DISTINCT COUNTRY_OR_AREA FROM REPOSITORIO_TURISMO.VISTAS.GEOGRAFIA", columna='COUNTRY_OR_AREA', session=st.session_state.session),
+                placeholder='Elija entre 2 y 4 países',
+                max_selections=MAX_PAISES_COMPARACION,
+                help = f'Seleccione hasta {MAX_PAISES_COMPARACION} países para comparar sus indicadores de turismo.',
+                key = 'widget_paises_comparacion'
+                )
+    st.divider()
+
+    # Habilitar contenido si se seleccionan al menos dos países
+    if len(paises_elegidos) >= 2:
+
+        # Registrar evento
+        snowflake_analitica.registrar_evento(sesion_activa= st.session_state.session, tipo_evento = 'Comparación de países', detalle_evento = 'Visualización de comparación', unidad = ', '.join(paises_elegidos))
+
+        #########################################################
+        # Obtener datos de los países elegidos (una consulta por fuente)
+        #########################################################
+        datos_comparacion = streamlit_analitica.obtener_datos_comparacion(_paises=paises_elegidos)
+
+        # Tabla resumen lado a lado
+        df_comparacion = streamlit_analitica.generar_tabla_comparacion(datos_comparacion=datos_comparacion, year_global_data='2025', year_oag_mundo='2024', year_oag_colombia='2024', year_credibanco='2024', year_iata='2024')
+
+        if not df_comparacion.empty:
+            st.markdown("## Resumen")
+            st.dataframe(data=df_comparacion, use_container_width=True, hide_index=True, key='tabla_comparacion')
+            st.caption("Fuente: GlobalData, OAG, Credibanco y IATA-GAP")
+
+        ##########################
+        # Series de tiempo superpuestas
+        ##########################
+        st.divider()
+        st.markdown("## Series de tiempo")
+
+        # Viajeros hacia el mundo
+        with st.container(border=True):
+            st.markdown('<h6 class="custom-header" style="text-align:center;">Flujos de viajeros hacia el mundo (miles)</h6>', unsafe_allow_html=True)
+            df_viajeros = unir_series_paises(datos_comparacion, 'df_global_data', 'viajeros_serie_tiempo')
+            fig_viajeros = plotly_analitica.plot_multiple_time_series(df=df_viajeros, date_col='Año', value_col='Viajeros', group_col='País de origen', x_label='Año', y_label='Viajeros (miles)', show_labels=False, decimal_places=0, legend_title='País', mensual=False)
+            streamlit_analitica.mostrar_resultado_en_streamlit(resultado=fig_viajeros, fuente='GlobalData', llave='graph_comparacion_1')
+
+        # Frecuencias aéreas hacia Colombia
+        with st.container(border=True):
+            st.markdown('<h6 class="custom-header" style="text-align:center;">Frecuencias aéreas hacia Colombia</h6>', unsafe_allow_html=True)
+            df_frecuencias = unir_series_paises(datos_comparacion, 'df_oag', 'conectividad_colombia_serie_tiempo')
+            fig_frecuencias = plotly_analitica.plot_multiple_time_series(df=df_frecuencias, date_col='Año', value_col='Frecuencias', group_col='País de origen', x_label='Año', y_label='Frecuencias', show_labels=False, decimal_places=0, legend_title='País', mensual=False)
+            streamlit_analitica.mostrar_resultado_en_streamlit(resultado=fig_frecuencias, fuente='OAG', llave='graph_comparacion_2')
+
+        # Reservas aéreas hacia Colombia
+        with st.container(border=True):
+            st.markdown('<h6 class="custom-header" style="text-align:center;">Reservas aéreas hacia Colombia</h6>', unsafe_allow_html=True)
+            df_reservas = unir_series_paises(datos_comparacion, 'df_fk', 'reservas_serie_tiempo_colombia')
+            fig_reservas = plotly_analitica.plot_multiple_time_series(df=df_reservas, date_col='Fecha', value_col='Reservas', group_col='País de origen', x_label='Fecha', y_label='Reservas', show_labels=False, decimal_places=0, legend_title='País')
+            streamlit_analitica.mostrar_resultado_en_streamlit(resultado=fig_reservas, fuente='Forward Keys', llave='graph_comparacion_3')
+
+    elif len(paises_elegidos) == 1:
+        st.info("Seleccione al menos un país adicional para comparar.")
+
+# Agregar footer
+streamlit_analitica.footer()
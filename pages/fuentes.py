@@ -51,6 +51,8 @@ if st.query_params.page == '1':
     st.switch_page("app.py") 
 if st.query_params.page == '2':
     st.switch_page("pages/centro_inteligencia.py")
+if st.query_params.page == '4':
+    st.switch_page("pages/comparacion.py")
 
 ###########
 # CONTENIDO
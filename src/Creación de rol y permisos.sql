@@ -47,6 +47,8 @@ GRANT USAGE ON DATABASE REPOSITORIO_TURISMO TO ROLE APP_CITI;
 -- Permisos sobre todos los esquemas:
 GRANT USAGE ON ALL SCHEMAS IN DATABASE REPOSITORIO_TURISMO TO ROLE APP_CITI;
 -- Permite al rol APP_CITI utilizar todos los esquemas dentro de la base de datos REPOSITORIO_TURISMO.
+GRANT USAGE ON FUTURE SCHEMAS IN DATABASE REPOSITORIO_TURISMO TO ROLE APP_CITI;
+-- Cubre los esquemas creados después de ejecutar este script (por ejemplo SERVICIO, que crea el cargue).
 
 -- Auditoria:
 -- Se conceden permisos de SELECT en todas y futuras tablas del esquema AUDITORIA.
@@ -118,6 +120,15 @@ GRANT SELECT ON VIEW REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_VIAJEROS_MUNDO TO ROL
 -- Permitir el acceso a futuras vistas creadas en el esquema VISTAS.
 GRANT SELECT ON FUTURE VIEWS IN SCHEMA REPOSITORIO_TURISMO.VISTAS TO ROLE APP_CITI;
 
+-- Servicio:
+-- Tablas materializadas (CLUSTER BY país) que consulta el aplicativo. Se publican con ALTER TABLE ... SWAP WITH,
+-- por lo que se otorgan permisos de SELECT en todas y futuras tablas del esquema SERVICIO.
+-- El esquema lo crea el cargue (materializar_tablas_servicio); si ya existía al ejecutar este script no lo cubre
+-- la concesión sobre esquemas futuros, por lo que se otorga USAGE de forma explícita.
+GRANT USAGE ON SCHEMA REPOSITORIO_TURISMO.SERVICIO TO ROLE APP_CITI;
+GRANT SELECT ON FUTURE TABLES IN SCHEMA REPOSITORIO_TURISMO.SERVICIO TO ROLE APP_CITI;
+GRANT SELECT ON ALL TABLES IN SCHEMA REPOSITORIO_TURISMO.SERVICIO TO ROLE APP_CITI;
+
 -- ======================================================
 -- Otorgamiento de permisos de escritura en la tabla de seguimiento
 -- ======================================================
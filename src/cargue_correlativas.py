@@ -48,11 +48,12 @@ snowflake_analitica.update_session_params(sesion_activa, database='REPOSITORIO_T
 path_insumos = "./data/GEOGRAFIA/"
 divipola_file = 'DIVIPOLA.xlsx'
 
-# Importar datos
-df_departamentos_divipola = pd.read_excel(path_insumos + divipola_file, sheet_name="Departamento", dtype=str)
-df_municipio_divipola = pd.read_excel(path_insumos + divipola_file, sheet_name="Municipio", dtype=str)
-df_departamentos_municipio_divipola = pd.read_excel(path_insumos + divipola_file, sheet_name="Departamento - Municipio", dtype=str)
-df_aeropuertos = pd.read_excel(path_insumos + divipola_file, sheet_name="Aeropuertos", dtype=str)
+# Importar datos: el libro se abre una sola vez para todas las hojas y se guarda en caché en Parquet
+hojas_divipola = snowflake_analitica.leer_hojas_excel(path_insumos + divipola_file, ["Departamento", "Municipio", "Departamento - Municipio", "Aeropuertos"], dtype=str)
+df_departamentos_divipola = hojas_divipola["Departamento"]
+df_municipio_divipola = hojas_divipola["Municipio"]
+df_departamentos_municipio_divipola = hojas_divipola["Departamento - Municipio"]
+df_aeropuertos = hojas_divipola["Aeropuertos"]
 
 # Nombres de los archivos cargados
 df_departamentos_divipola_name = path_insumos + divipola_file + '/' + 'Departamento'
@@ -63,17 +64,18 @@ df_aeropuertos_name = path_insumos + divipola_file + '/' + 'Aeropuertos'
 # Datos del modelos relacional de países
 correlativa_file = 'MODELO RELACIONAL PAISES.xlsx'
 
-# Importar datos
-df_continentes = pd.read_excel(path_insumos + correlativa_file, sheet_name="CONTINENTES", dtype=str)
-df_region = pd.read_excel(path_insumos + correlativa_file, sheet_name="REGION", dtype=str)
-df_subregion = pd.read_excel(path_insumos + correlativa_file, sheet_name="SUBREGION", dtype=str)
-df_paises = pd.read_excel(path_insumos + correlativa_file, sheet_name="PAISES", dtype=str)
-df_paises_migracion = pd.read_excel(path_insumos + correlativa_file, sheet_name="MIGRACION", dtype=str)
-df_paises_global_data = pd.read_excel(path_insumos + correlativa_file, sheet_name="GLOBALDATA", dtype=str)
-df_paises_oag = pd.read_excel(path_insumos + correlativa_file, sheet_name="OAG", dtype=str)
-df_paises_forwardkeys = pd.read_excel(path_insumos + correlativa_file, sheet_name="FORWARDKEYS", dtype=str)
-df_paises_credibanco = pd.read_excel(path_insumos + correlativa_file, sheet_name="CREDIBANCO", dtype=str)
-df_paises_iatagap = pd.read_excel(path_insumos + correlativa_file, sheet_name="IATAGAP", dtype=str)
+# Importar datos: el libro se abre una sola vez para todas las hojas y se guarda en caché en Parquet
+hojas_correlativas = snowflake_analitica.leer_hojas_excel(path_insumos + correlativa_file, ["CONTINENTES", "REGION", "SUBREGION", "PAISES", "MIGRACION", "GLOBALDATA", "OAG", "FORWARDKEYS", "CREDIBANCO", "IATAGAP"], dtype=str)
+df_continentes = hojas_correlativas["CONTINENTES"]
+df_region = hojas_correlativas["REGION"]
+df_subregion = hojas_correlativas["SUBREGION"]
+df_paises = hojas_correlativas["PAISES"]
+df_paises_migracion = hojas_correlativas["MIGRACION"]
+df_paises_global_data = hojas_correlativas["GLOBALDATA"]
+df_paises_oag = hojas_correlativas["OAG"]
+df_paises_forwardkeys = hojas_correlativas["FORWARDKEYS"]
+df_paises_credibanco = hojas_correlativas["CREDIBANCO"]
+df_paises_iatagap = hojas_correlativas["IATAGAP"]
 
 # Eliminar la columna de validación manual
 df_paises_migracion = df_paises_migracion.drop(columns=["¿ESTA_EN_PAISES?"])
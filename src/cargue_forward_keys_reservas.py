@@ -56,51 +56,18 @@ pprint.pprint(pd.DataFrame(sesion_activa_forward_keys.sql(query_params).collect(
 # Mensaje de inicio de proceso de cargue
 print('Iniciando proceso de extracción de datos desde el servidor de Forward Keys...')
 
-# Consulta para extraer información desde Forward Keys
-query_reservas = f"""
-SELECT 
-    A.FLIGHT_TICKET_ISSUE_DATE,
-    A.FLIGHT_LEG_LEAD_TIME,
-    A.TRIP_ORIGIN_CITY,
-    A.TRIP_ORIGIN_COUNTRY,
-    A.FLIGHT_LEG_ORIGIN_AIRPORT,
-    A.FLIGHT_LEG_ORIGIN_CITY,
-    A.FLIGHT_LEG_ORIGIN_COUNTRY,
-    A.FLIGHT_LEG_DESTINATION_AIRPORT,
-    A.FLIGHT_LEG_DESTINATION_CITY,
-    A.FLIGHT_LEG_DESTINATION_COUNTRY,
-    A.FLIGHT_LEG_DEPARTURE_DATE,
-    A.FLIGHT_LEG_ARRIVAL_DATE,
-    A.EXTRACTION_DATE,
-    A.LOS_AT_DESTINATION_CAT,
-    A.LOS_AT_DESTINATION_NIGHTS,
-    A.TRIP_CABIN_CLASS,
-    A.TRIP_INTERNATIONAL,
-    A.TRIP_ORIGIN_AIRPORT,
-    A.TRUE_ORIGIN_AIRPORT,
-    A.TRUE_ORIGIN_CITY,
-    A.PAX_PROFILE,
-    A.PAX
-FROM CUSTOM_SPACE.PUBLIC.PROYECTO_CIFRAS_RESERVAS AS A
-WHERE A.FLIGHT_LEG_ARRIVAL_DATE BETWEEN CURRENT_DATE() AND DATEADD(MONTH, {meses_cargue}, CURRENT_DATE());
-"""
-
-# Obtener dataframe
-df_reservas = pd.DataFrame(sesion_activa_forward_keys.sql(query_reservas).collect())
-
-# Verificar si el dataframe está vacío
-if df_reservas.empty:
+# Extraer los meses de llegada de la ventana en paralelo directamente a Parquet (./data/FORWARDKEYS_RESERVAS/Meses/ o
+# CITI_RUTA_DATOS). Los meses cuyo número de registros y HASH_AGG no cambiaron en la fuente no se vuelven a consultar.
+resultados_extraccion = snowflake_analitica.extraer_particiones(sesion_origen=sesion_activa_forward_keys,
+                                                                extraccion=snowflake_analitica.EXTRACCION_FORWARD_KEYS_RESERVAS,
+                                                                filtro=f"A.FLIGHT_LEG_ARRIVAL_DATE BETWEEN CURRENT_DATE() AND DATEADD(MONTH, {meses_cargue}, CURRENT_DATE())")
+
+# Verificar que haya datos y que todos los meses se hayan extraído (la tabla de reservas se reemplaza con la ventana completa)
+if not resultados_extraccion:
     raise ValueError("No hay datos para la elección de parámetros elegidos.")
-
-# Exportar a CSV de la conulta
-
-# Exportar
-try:
-    df_reservas.to_csv('C:/Users/nrivera/OneDrive - PROCOLOMBIA/Documentos/022-Repositorio-Turismo/app-repo-turismo/data/FORWARDKEYS_RESERVAS/Meses/forward_keys_reservas.csv', sep='|', index=False)
-    # Mensaje de éxito en la exportación
-    print("forward_keys_reservas exportado correctamente a CSV")
-except Exception as e:
-    print(f"Error al exportar forward_keys_reservas a CSV. Detalles: {e}")
+meses_con_error = [resultado['mensaje'] for resultado in resultados_extraccion if resultado['estado'] == 'error']
+if meses_con_error:
+    raise ValueError(f"No fue posible extraer todos los meses: {meses_con_error}")
 
 # Cerrar sesión en ForwardKeys
 sesion_activa_forward_keys.close()
@@ -113,179 +80,74 @@ print("Sesión en Forward Keys cerrada correctamente")
 # 5. Leer y transformar archivos Forward Keys
 # -------------------------------------------
 
-# Ruta donde están los archivos
-path_forward_keys = './data/FORWARDKEYS_RESERVAS/Meses/'
-
-# Archivo que se sube a Snowflake
-files_forward_keys = ['forward_keys_reservas.csv']
+# Archivos Parquet de los meses extraídos
+files_forward_keys = [resultado['archivo'] for resultado in resultados_extraccion]
 
 # Archivos a subir
-print(f"Los archivos a cargar son: {files_forward_keys}")
+print(f"Los archivos a cargar son: {[os.path.basename(archivo) for archivo in files_forward_keys]}")
 
 # Lista de rutas de archivos
-rutas_archivos = [path_forward_keys + archivo for archivo in files_forward_keys]
-
-# Columna que debe ser numérica
-columnas_float64 = ['FLIGHT_LEG_LEAD_TIME', 'LOS_AT_DESTINATION_NIGHTS', 'PAX']
-
-# Diccionario con los nombres de datos y columnas esperados en la importación
-expected_schema = {'columns': ['FLIGHT_TICKET_ISSUE_DATE',
-    'FLIGHT_LEG_LEAD_TIME',
-    'TRIP_ORIGIN_CITY',
-    'TRIP_ORIGIN_COUNTRY',
-    'FLIGHT_LEG_ORIGIN_AIRPORT',
-    'FLIGHT_LEG_ORIGIN_CITY',
-    'FLIGHT_LEG_ORIGIN_COUNTRY',
-    'FLIGHT_LEG_DESTINATION_AIRPORT',
-    'FLIGHT_LEG_DESTINATION_CITY',
-    'FLIGHT_LEG_DESTINATION_COUNTRY',
-    'FLIGHT_LEG_DEPARTURE_DATE',
-    'FLIGHT_LEG_ARRIVAL_DATE',
-    'EXTRACTION_DATE',
-    'LOS_AT_DESTINATION_CAT',
-    'LOS_AT_DESTINATION_NIGHTS',
-    'TRIP_CABIN_CLASS',
-    'TRIP_INTERNATIONAL',
-    'TRIP_ORIGIN_AIRPORT',
-    'TRUE_ORIGIN_AIRPORT',
-    'TRUE_ORIGIN_CITY',
-    'PAX_PROFILE',
-    'PAX']}
-
-# Mensaje de inicio de proceso de importación
-print('Iniciando proceso de importación...')
+rutas_archivos = files_forward_keys
 
 # Verificar si la lista de archivos está vacía
 if not files_forward_keys:
     raise ValueError("No hay archivos válidos para cargar. Verifique la lista de archivos.")
 
-# Iterar sobre los archivos a importar
-
-# Crear una lista vacía para concatenar los datos
-dfs_fk = []
-
-# Loop de los archivos válidos (1 o más archivos)
-
-for file_fk in files_forward_keys:
-    # Importar datos
-    df_fk_insumo = pd.read_csv(path_forward_keys + file_fk, sep='|', dtype=str)
-
-    # Limpiar los nombres de las columnas
-    df_fk_insumo.columns = [snowflake_analitica.clean_column_name(col) for col in df_fk_insumo.columns]
-
-    # Convertir las columnas definidas a float64 si existen en el DataFrame
-    for col in columnas_float64:
-        if col in df_fk_insumo.columns:
-            df_fk_insumo[col] = pd.to_numeric(df_fk_insumo[col], errors='coerce') 
-
-    # Convertir todas las columnas que no están en la lista 'columnas_float64' a string
-    columnas_otros = [col for col in df_fk_insumo.columns if col not in columnas_float64]
-    df_fk_insumo[columnas_otros] = df_fk_insumo[columnas_otros].astype(str)
-
-    # Mostrar que se ha cargado y limpiado correctamente
-    print(f"Archivo {file_fk} cargado, nombres de columnas limpiados, columnas especificadas convertidas a float64")
-
-    # Agregar el DataFrame procesado a la lista
-    dfs_fk.append(df_fk_insumo)
-
-# Concatenar todos los DataFrames en uno solo para validación
-df_fk_validacion = pd.concat(dfs_fk, ignore_index=True)
-
-# Validación de columnas
-columnas_esperadas = [snowflake_analitica.clean_column_name(col) for col in expected_schema['columns']]
-columnas_df = list(df_fk_validacion.columns)
-columnas_faltantes = set(columnas_esperadas) - set(columnas_df)
-columnas_extras = set(columnas_df) - set(columnas_esperadas)
-
-# Inicializar variable para errores críticos
-errores_criticos = False
-
-# Construir el mensaje de validación
-mensaje_validacion = "\nResultados de la validación de columnas:\n"
-if columnas_faltantes:
-    mensaje_validacion += f"  - Columnas faltantes: {sorted(columnas_faltantes)}\n"
-    errores_criticos = True
-if columnas_extras:
-    mensaje_validacion += f"  - Columnas adicionales no esperadas: {sorted(columnas_extras)}\n"
-    errores_criticos = True
-if not columnas_faltantes and not columnas_extras:
-    mensaje_validacion += "  Todas las columnas esperadas están presentes.\n"
-
-# Imprimir resultados de validación
-print(mensaje_validacion)
-
-# Si hay errores críticos, detener el proceso
-if errores_criticos:
-    raise ValueError("Se encontraron errores en la validación de las columnas. Proceso detenido.")
-
 # --------------------
 # 6. Subir a Snowflake
 # --------------------
 
-# Drop tabla de búsquedas para volverla a cargar desde cero con información actualizada
-print("Eliminar la tabla anterior para cargar los datos desde cero con información actualizada")
-sesion_activa_procolombia.sql("DROP TABLE IF EXISTS REPOSITORIO_TURISMO.FORWARDKEYS.RESERVAS").collect()
-
 # Mensaje de inicio de proceso de cargue
-print('Iniciando proceso de cargue...')
+print('Iniciando proceso de importación y cargue por lotes...')
 
 # Lista para almacenar los resultados de cada carga
 resultados_carga = []
 
-# Loop para subir los DataFrames a Snowflake
-for df, nombre_archivo in zip(dfs_fk, rutas_archivos):
-
-    # Cambiar ubicación de la sesión para carga de datos de ForwardKeys
-    snowflake_analitica.update_session_params(sesion_activa_procolombia,  database='REPOSITORIO_TURISMO', schema='FORWARDKEYS')
-
-    # Obtener números de registros
-    obs = len(df)
-
-    # Verificar que la tabla exista en Snowflake
-    try:
-        tabla_existe = pd.DataFrame(sesion_activa_procolombia.sql("""SELECT 1 FROM REPOSITORIO_TURISMO.FORWARDKEYS.RESERVAS LIMIT 1;""").collect())
-        print("La tabla existe. Se procede a cargar los datos.")
-        create_table_param = False
-        overwrite_param = False
-    except Exception as e:
-        print(f"Advertencia: La tabla REPOSITORIO_TURISMO.OAG.RESERVAS no existe. Detalles: {e}")
-        print("Se procede a crear la tabla para insertar los datos.")
-        create_table_param = True
-        overwrite_param = True
-
-    # Llamar a la función upload_dataframe_to_snowflake
-    mensajes = snowflake_analitica.upload_dataframe_to_snowflake(
-        sesion_activa=sesion_activa_procolombia, 
-        df=df, 
-        nombre_tabla='RESERVAS', 
-        create_table=create_table_param, 
-        overwrite=overwrite_param, 
-        ram_gb=32
-    )
-
-    # Almacenar el resultado en un diccionario
-    resultado = {
-        'nombre_tabla': 'RESERVAS',
-        'df': nombre_archivo,
-        'mensajes': '\n'.join(mensajes),  # Unir los mensajes en un solo string para la tabla
-    }
-
-    # Agregar el resultado a la lista
+# Tabla de la ventana: todos los meses se cargan en ella y la tabla RESERVAS se reemplaza una sola vez, cuando todos
+# los meses concilian. Si un mes falla, RESERVAS conserva la ventana anterior completa.
+tabla_ventana = 'RESERVAS__CARGUE'
+sesion_activa_procolombia.sql(f"DROP TABLE IF EXISTS REPOSITORIO_TURISMO.FORWARDKEYS.{tabla_ventana};").collect()
+
+# Leer cada archivo Parquet por lotes en los tipos de su esquema declarado (memoria acotada por
+# CITI_MEMORIA_MAXIMA_INGESTA_MB), escribir cada lote en Parquet, subirlo al stage en paralelo y cargar con COPY INTO.
+# Al final de cada archivo se concilian los registros y la suma de las columnas numéricas contra el archivo y el mes
+# se agrega a la tabla de la ventana.
+for index, nombre_archivo in enumerate(rutas_archivos):
+    resultado = snowflake_analitica.cargar_archivo_por_lotes(sesion_activa=sesion_activa_procolombia,
+                                                            ruta_archivo=nombre_archivo,
+                                                            nombre_tabla=tabla_ventana,
+                                                            esquema='FORWARDKEYS',
+                                                            formato='parquet',
+                                                            opciones_lectura={'esquema': snowflake_analitica.ESQUEMA_FORWARD_KEYS_RESERVAS},
+                                                            reemplazar=index == 0,
+                                                            reglas=snowflake_analitica.REGLAS_FORWARD_KEYS_RESERVAS,
+                                                            metodo='copy',
+                                                            manifiesto=True)
     resultados_carga.append(resultado)
-
-    # Cambiar ubicación de la sesión para carga de datos a la tabla de auditoria
-    snowflake_analitica.update_session_params(sesion_activa_procolombia,  database='REPOSITORIO_TURISMO', schema='AUDITORIA')
-
-    # Registrar evento de cargue
-    resultado_str = '\n'.join(mensajes)
-    snowflake_analitica.registrar_evento_auditoria(sesion_activa=sesion_activa_procolombia, 
-                                                    nombre_esquema_destino='FORWARDKEYS', 
-                                                    nombre_tabla='RESERVAS', 
-                                                    ruta_archivo=nombre_archivo, 
-                                                    numero_registros=obs, 
-                                                    mensaje=resultado_str)
-    # Mensaje de resultado
-    print(f"{nombre_archivo} cargado y auditado.")
+    # Si un mes falla, la ventana queda incompleta y no se publica
+    if resultado['estado'] == 'error':
+        break
+
+# Publicar la ventana en RESERVAS con un solo SWAP, después de verificar que tiene los registros de todos los meses
+if len(resultados_carga) == len(rutas_archivos) and all(resultado['estado'] == 'cargado' for resultado in resultados_carga):
+    registros_ventana = sum(resultado['registros'] for resultado in resultados_carga)
+    registros_tabla = sesion_activa_procolombia.sql(f"SELECT COUNT(*) FROM REPOSITORIO_TURISMO.FORWARDKEYS.{tabla_ventana};").collect()[0][0]
+    if registros_tabla != registros_ventana:
+        raise ValueError(f"La tabla {tabla_ventana} tiene {registros_tabla} registros y los meses cargados suman {registros_ventana}. RESERVAS no se modificó.")
+    if snowflake_analitica.tabla_existe(sesion_activa_procolombia, 'FORWARDKEYS', 'RESERVAS'):
+        sesion_activa_procolombia.sql(f"ALTER TABLE REPOSITORIO_TURISMO.FORWARDKEYS.RESERVAS SWAP WITH REPOSITORIO_TURISMO.FORWARDKEYS.{tabla_ventana};").collect()
+        sesion_activa_procolombia.sql(f"DROP TABLE IF EXISTS REPOSITORIO_TURISMO.FORWARDKEYS.{tabla_ventana};").collect()
+    else:
+        sesion_activa_procolombia.sql(f"ALTER TABLE REPOSITORIO_TURISMO.FORWARDKEYS.{tabla_ventana} RENAME TO REPOSITORIO_TURISMO.FORWARDKEYS.RESERVAS;").collect()
+    snowflake_analitica.registrar_evento_auditoria(sesion_activa=sesion_activa_procolombia,
+                                                   nombre_esquema_destino='FORWARDKEYS',
+                                                   nombre_tabla='RESERVAS',
+                                                   ruta_archivo=', '.join(os.path.basename(archivo) for archivo in rutas_archivos),
+                                                   numero_registros=registros_ventana,
+                                                   mensaje=f"Ventana de {len(rutas_archivos)} meses publicada en RESERVAS ({registros_ventana} registros).")
+    print(f"Ventana de {len(rutas_archivos)} meses publicada en RESERVAS ({registros_ventana} registros).")
+else:
+    print("No todos los meses se cargaron: RESERVAS conserva la ventana anterior.")
 
 # Convertir los resultados en un DataFrame para mostrar de manera organizada
 df_resultados_carga = pd.DataFrame(resultados_carga)
@@ -9,6 +9,9 @@ import warnings
 # OS
 import os
 
+# Sistema
+import sys
+
 # Importar pandas
 import pandas as pd
 
@@ -40,8 +43,28 @@ sesion_activa, conexion_activa = snowflake_analitica.create_session_from_json(js
 # -------------------------------------------------------
 snowflake_analitica.update_session_params(sesion_activa, database='REPOSITORIO_TURISMO')
 
+# ---------------------------------------------------
+# 5. Plan de actualización (solo fuentes modificadas)
+# ---------------------------------------------------
+
+# Con el argumento --completo se reconstruyen todas las vistas y tablas de servicio
+actualizacion_completa = '--completo' in sys.argv
+
+print("Comparando las firmas de las tablas de origen con la última actualización...")
+plan = snowflake_analitica.planificar_actualizacion(sesion_activa, forzar=actualizacion_completa)
+
+# Si ninguna fuente cambió no hay nada que reconstruir
+if not plan['fuentes']:
+    print("Ninguna fuente cambió desde la última actualización. No se reconstruyen vistas ni tablas de servicio.")
+    sesion_activa.close()
+    conexion_activa.close()
+    sys.exit(0)
+
+# Si cambian las correlativas se reconstruye todo (todas las vistas dependen de la geografía)
+fuentes_a_verificar = list(snowflake_analitica.FUENTES) if 'CORRELATIVAS' in plan['fuentes'] else plan['fuentes']
+
 # ------------------------------
-# 5. Verificación de completitud
+# 6. Verificación de completitud
 # ------------------------------
 
 # Creación de la vista de Geografía
@@ -50,6 +73,7 @@ snowflake_analitica.update_session_params(sesion_activa, database='REPOSITORIO_T
 query_sql_geografia = """
 CREATE OR REPLACE VIEW VISTAS.GEOGRAFIA AS
 SELECT PAISES.M49_CODE,
+    TRY_TO_NUMBER(PAISES.M49_CODE) AS ID_PAIS,
     PAISES.ISO_ALPHA2_CODE,
     PAISES.ISO_ALPHA3_CODE,
     PAISES.COUNTRY_OR_AREA,
@@ -76,10 +100,11 @@ FROM CORRELATIVAS.PAISES AS PAISES
     LEFT JOIN (SELECT DISTINCT COUNTRYCODE, M49_CODE FROM CORRELATIVAS.PAISES_FORWARDKEYS) AS FORWARDKEYS ON PAISES.M49_CODE = FORWARDKEYS.M49_CODE;
 """
 
-# Creación de la vista
-pd.DataFrame(sesion_activa.sql(query_sql_geografia).collect())
+# Creación de la vista (solo si cambiaron las correlativas)
+if 'CORRELATIVAS' in plan['fuentes']:
+    pd.DataFrame(sesion_activa.sql(query_sql_geografia).collect())
 
-print("Actualizando la vista de datos geográficos")
+    print("Actualizando la vista de datos geográficos")
 
 # Definición de consultas
 
@@ -224,23 +249,35 @@ WHERE PAISES.PAIS IS NULL;
 errores_criticos = False
 mensajes_errores = []  # Para acumular mensajes de error
 
-# Lista de consultas y descripciones para identificar los errores
+# Lista de consultas, descripciones y fuente verificada
 consultas = [
-    {"query": query_sql_global_data, "descripcion": "Verificación de completitud de países en Global Data"},
-    {"query": query_sql_oag_paises, "descripcion": "Verificación de completitud de países en OAG Países"},
-    {"query": query_sql_oag_ciudades, "descripcion": "Verificación de completitud de ciudades en OAG Ciudades"},
-    {"query": query_forward_keys, "descripcion": "Verificación de completitud de países en Forward Keys"},
-    {"query": query_sql_credibanco, "descripcion": "Verificación de completitud de países en Credibanco"},
-    {"query": query_sql_iatagap, "descripcion": "Verificación de completitud de países en IATAGAP"},
+    {"query": query_sql_global_data, "descripcion": "Verificación de completitud de países en Global Data", "fuente": "GLOBALDATA"},
+    {"query": query_sql_oag_paises, "descripcion": "Verificación de completitud de países en OAG Países", "fuente": "OAG"},
+    {"query": query_sql_oag_ciudades, "descripcion": "Verificación de completitud de ciudades en OAG Ciudades", "fuente": "OAG"},
+    {"query": query_forward_keys, "descripcion": "Verificación de completitud de países en Forward Keys", "fuente": "FORWARDKEYS"},
+    {"query": query_sql_credibanco, "descripcion": "Verificación de completitud de países en Credibanco", "fuente": "CREDIBANCO"},
+    {"query": query_sql_iatagap, "descripcion": "Verificación de completitud de países en IATAGAP", "fuente": "IATAGAP"},
 ]
 
-# Ejecutar todas las consultas
+# Verificar únicamente las fuentes que se van a reconstruir
+consultas = [consulta for consulta in consultas if consulta["fuente"] in fuentes_a_verificar]
+
+# Enviar todas las consultas de forma asíncrona (son independientes entre sí y se ejecutan en paralelo)
+trabajos = []
 for index, consulta in enumerate(consultas, start=1):
     try:
-        print(f"Ejecutando consulta {index}/{len(consultas)}: {consulta['descripcion']}...")
-        
-        # Ejecutar la consulta
-        tabla_existe = pd.DataFrame(sesion_activa.sql(consulta["query"]).collect())
+        print(f"Enviando consulta {index}/{len(consultas)}: {consulta['descripcion']}...")
+        trabajos.append((index, consulta, sesion_activa.sql(consulta["query"]).collect_nowait()))
+    except Exception as e:
+        errores_criticos = True
+        mensajes_errores.append(f"Error ejecutando la consulta: {consulta['descripcion']}. Detalles: {str(e)}")
+        print(f"Error durante la ejecución de la consulta {index}/{len(consultas)}: {str(e)}")
+
+# Recoger los resultados
+for index, consulta, trabajo in trabajos:
+    try:
+        # Esperar el resultado de la consulta
+        tabla_existe = pd.DataFrame(trabajo.result())
         
         # Verificar si la consulta devuelve resultados
         if not tabla_existe.empty:
@@ -266,23 +303,67 @@ else:
     print("\nTodas las consultas se ejecutaron correctamente. No se detectaron errores.")
 
 # ---------------------
-# 6. Creación de vistas
+# 7. Creación de vistas
 # ---------------------
 
-print("Creando vistas para el aplicativo...")
+print(f"Creando vistas para el aplicativo (secciones: {', '.join(plan['secciones_sql'])})...")
 
 # Leer el archivo SQL con la codificación correcta
 file_path = '.\src\creacion_vistas.sql'
 with open(file_path, 'r', encoding='utf-8') as file:
     sql_script = file.read()
 
-# Ejecutar funciones de ETL
-snowflake_analitica.ejecutar_script_sql_snowpark(sesion_activa, sql_script)
+# Conservar únicamente las secciones de las fuentes modificadas
+sql_script = snowflake_analitica.filtrar_script_por_secciones(sql_script, plan['secciones_sql'])
 
-print('Vistas materializadas creadas correctamente.')
+# Ejecutar funciones de ETL (en paralelo según las dependencias entre vistas)
+resultados_vistas, errores_vistas = snowflake_analitica.ejecutar_script_sql_paralelo(sesion_activa, sql_script)
 
-# ---------------------------
-# 7. Cerrar sesión y conexión
+# Solo se materializan y registran las secciones cuyas vistas se crearon todas sin errores
+# (las fuentes de las secciones con errores conservan su firma anterior y se reconstruyen en la próxima ejecución)
+plan_exitoso = snowflake_analitica.ajustar_plan_por_errores(plan, sql_script, errores_vistas)
+
+if errores_vistas:
+    print("\nResumen de errores en la creación de vistas:")
+    for error in errores_vistas:
+        print(f"{' '.join(error['sentencia'].split())[:100]}... -> {error['error']}")
+    print(f"Secciones con errores (no se materializan ni se registran): {', '.join(plan_exitoso['secciones_fallidas'])}.")
+else:
+    print('Vistas materializadas creadas correctamente.')
+
+# ------------------------------------------------------------
+# 8. Materialización de las tablas de servicio del aplicativo
+# ------------------------------------------------------------
+
+print("Materializando tablas de servicio (CLUSTER BY país) con intercambio atómico...")
+
+# Cada vista se materializa en SERVICIO.<VISTA> y se publica con ALTER TABLE ... SWAP WITH
+if plan_exitoso['tablas_servicio']:
+    snowflake_analitica.materializar_tablas_servicio(sesion_activa, tablas=plan_exitoso['tablas_servicio'])
+
+    print('Tablas de servicio publicadas correctamente.')
+
+# Registrar las firmas de las fuentes cuyas vistas y tablas se actualizaron sin errores
+snowflake_analitica.registrar_estado(sesion_activa, plan_exitoso['firmas'])
+
+# Detener el cargue si alguna sección falló, después de registrar las que sí terminaron
+if errores_vistas:
+    raise ValueError(f"No fue posible crear {len(errores_vistas)} vista(s) de las secciones {', '.join(plan_exitoso['secciones_fallidas'])}. Revisa los mensajes de error.")
+
+# ------------------------------------------------------------
+# 9. Réplica local de lectura de la capa de servicio
+# ------------------------------------------------------------
+
+# El aplicativo puede leer de la réplica (CITI_MODO_LECTURA=replica) y seguir funcionando si Snowflake no está disponible.
+# Un error en la réplica no invalida el cargue: el aplicativo sigue leyendo de Snowflake o de la réplica anterior.
+print(f"Exportando la réplica local de lectura a {snowflake_analitica.RUTA_REPLICA}...")
+try:
+    snowflake_analitica.exportar_replica(sesion_activa)
+except Exception as e:
+    print(f"No fue posible exportar la réplica local: {str(e)}")
+
+# ----------------------------
+# 10. Cerrar sesión y conexión
 # ---------------------------
 sesion_activa.close()
 conexion_activa.close()
\ No newline at end of file
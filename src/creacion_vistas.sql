@@ -15,6 +15,8 @@ USE DATABASE REPOSITORIO_TURISMO;
 ---------------
 CREATE OR REPLACE VIEW VISTAS.GEOGRAFIA AS
 SELECT DISTINCT PAISES.M49_CODE,
+    -- Llave sustituta entera del país (dimensión conformada)
+    TRY_TO_NUMBER(PAISES.M49_CODE) AS ID_PAIS,
     PAISES.ISO_ALPHA2_CODE,
     PAISES.ISO_ALPHA3_CODE,
     PAISES.COUNTRY_OR_AREA,
@@ -40,6 +42,19 @@ FROM CORRELATIVAS.PAISES AS PAISES
     LEFT JOIN CORRELATIVAS.REGIONES AS REGIONES ON PAISES.SUB_REGION_CODE = REGIONES.SUB_REGION_CODE
     LEFT JOIN (SELECT DISTINCT COUNTRYCODE, M49_CODE FROM CORRELATIVAS.PAISES_FORWARDKEYS) AS FORWARDKEYS ON PAISES.M49_CODE = FORWARDKEYS.M49_CODE;
 
+-- Dimensión conformada de países: una fila por país con su llave sustituta entera (ID_PAIS, derivada de M49_CODE).
+-- Todas las tablas de servicio llevan las llaves ID_PAIS_* y el aplicativo filtra por ellas.
+CREATE OR REPLACE VIEW VISTAS.DIM_PAIS AS
+SELECT DISTINCT ID_PAIS,
+    M49_CODE,
+    ISO_ALPHA2_CODE,
+    ISO_ALPHA3_CODE,
+    COUNTRY_OR_AREA,
+    REGION_NAME,
+    SUB_REGION_NAME
+FROM VISTAS.GEOGRAFIA
+WHERE ID_PAIS IS NOT NULL;
+
 ----------------
 -- 2. GlobalData
 ----------------
@@ -50,6 +65,7 @@ CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_VIAJEROS_MUNDO AS
 SELECT 
     VIAJEROS_MUNDO.COUNTRY AS PAIS_GLOBALDATA,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     -- Traducción de los valores de la columna SUB_INDICATORS_1 (MEDIO) a español
     CASE 
         WHEN VIAJEROS_MUNDO.SUB_INDICATORS_1 = 'Land' THEN 'Tierra'
@@ -61,10 +77,10 @@ SELECT
     VIAJEROS_MUNDO.YEAR AS YEAR,
     CAST(SUM(VIAJEROS_MUNDO.VALUE) AS BIGINT) AS VIAJEROS
 FROM GLOBALDATA.FLUJO_VIAJEROS_MUNDO AS VIAJEROS_MUNDO
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON VIAJEROS_MUNDO.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON VIAJEROS_MUNDO.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
 GROUP BY 
     VIAJEROS_MUNDO.COUNTRY, 
-    GEOGRAFIA.COUNTRY_OR_AREA, 
+    GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS, 
     VIAJEROS_MUNDO.SUB_INDICATORS_1, 
     VIAJEROS_MUNDO.YEAR
 ORDER BY 
@@ -77,11 +93,12 @@ ORDER BY
 CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_NOCHES_PROMEDIO AS
 SELECT NOCHES_PROMEDIO.COUNTRY AS PAIS_GLOBALDATA,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     NOCHES_PROMEDIO.YEAR_COPY AS YEAR,
     CAST(SUM(NOCHES_PROMEDIO.AVERAGE_LENGTH_OF_TRIP_BY_TYPE_DAYS) AS BIGINT) AS NOCHES
 FROM GLOBALDATA.NOCHES_PROMEDIO AS NOCHES_PROMEDIO
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON NOCHES_PROMEDIO.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
-GROUP BY NOCHES_PROMEDIO.COUNTRY, GEOGRAFIA.COUNTRY_OR_AREA, NOCHES_PROMEDIO.YEAR_COPY
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON NOCHES_PROMEDIO.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
+GROUP BY NOCHES_PROMEDIO.COUNTRY, GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS, NOCHES_PROMEDIO.YEAR_COPY
 ORDER BY GEOGRAFIA.COUNTRY_OR_AREA, NOCHES_PROMEDIO.YEAR_COPY ASC;
 
 
@@ -91,6 +108,7 @@ CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_CATEGORIAS_GASTO AS
 SELECT 
     CATEGORIAS_GASTO.COUNTRY AS PAIS_GLOBALDATA,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     CATEGORIAS_GASTO.YEAR AS YEAR,
     -- Traducción de los valores de la columna _SECTOR_ (CATEGORIA_GASTO) a español
     CASE 
@@ -105,10 +123,10 @@ SELECT
     END AS CATEGORIA_GASTO,
     CAST(SUM(CATEGORIAS_GASTO.VALUE_1) AS BIGINT) AS GASTO
 FROM GLOBALDATA.CATEGORIAS_GASTO AS CATEGORIAS_GASTO
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON CATEGORIAS_GASTO.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON CATEGORIAS_GASTO.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
 GROUP BY 
     CATEGORIAS_GASTO.COUNTRY, 
-    GEOGRAFIA.COUNTRY_OR_AREA, 
+    GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS, 
     CATEGORIAS_GASTO.YEAR, 
     CATEGORIAS_GASTO._SECTOR_
 ORDER BY 
@@ -121,6 +139,7 @@ CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_RANGO_EDAD AS
 SELECT 
     RANGO_EDAD.COUNTRY AS PAIS_GLOBALDATA,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     RANGO_EDAD.YEAR AS YEAR,
     -- Traducción de los valores de la columna SUB_INDICATORS_1 (RANGO_EDAD) a español
     CASE 
@@ -134,10 +153,10 @@ SELECT
     END AS RANGO_EDAD,
     CAST(SUM(RANGO_EDAD.VALUE) AS BIGINT) AS VIAJEROS
 FROM GLOBALDATA.RANGO_EDAD AS RANGO_EDAD
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON RANGO_EDAD.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON RANGO_EDAD.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
 GROUP BY 
     RANGO_EDAD.COUNTRY, 
-    GEOGRAFIA.COUNTRY_OR_AREA, 
+    GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS, 
     RANGO_EDAD.YEAR, 
     RANGO_EDAD.SUB_INDICATORS_1
 ORDER BY 
@@ -150,6 +169,7 @@ CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_MOTIVO_VIAJE AS
 SELECT 
     MOTIVO_VIAJE.COUNTRY AS PAIS_GLOBALDATA,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     MOTIVO_VIAJE.YEAR AS YEAR,
     -- Traducción de los valores de la columna PURPOSE (MOTIVO_VIAJE) a español
     CASE 
@@ -161,10 +181,10 @@ SELECT
     END AS MOTIVO_VIAJE,
     CAST(SUM(MOTIVO_VIAJE.VALUE) AS BIGINT) AS VIAJEROS
 FROM GLOBALDATA.MOTIVO_VIAJE AS MOTIVO_VIAJE
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON MOTIVO_VIAJE.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON MOTIVO_VIAJE.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
 GROUP BY 
     MOTIVO_VIAJE.COUNTRY, 
-    GEOGRAFIA.COUNTRY_OR_AREA, 
+    GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS, 
     MOTIVO_VIAJE.YEAR, 
     MOTIVO_VIAJE.PURPOSE
 ORDER BY 
@@ -176,6 +196,7 @@ CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_FORMA_VIAJE AS
 SELECT 
     FORMA_VIAJE.COUNTRY AS PAIS_GLOBALDATA,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     FORMA_VIAJE.YEAR AS YEAR,
     -- Traducción de los valores de la columna SUB_INDICATORS_1 (FORMA_VIAJE) a español
     CASE 
@@ -187,10 +208,10 @@ SELECT
     END AS FORMA_VIAJE,
     CAST(SUM(FORMA_VIAJE.VALUE) AS BIGINT) AS VIAJEROS
 FROM GLOBALDATA.FORMA_VIAJE AS FORMA_VIAJE
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON FORMA_VIAJE.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON FORMA_VIAJE.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
 GROUP BY 
     FORMA_VIAJE.COUNTRY, 
-    GEOGRAFIA.COUNTRY_OR_AREA, 
+    GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS, 
     FORMA_VIAJE.YEAR, 
     FORMA_VIAJE.SUB_INDICATORS_1
 ORDER BY 
@@ -202,13 +223,15 @@ ORDER BY
 CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_FLUJOS_VIAJEROS_REGION AS
 SELECT VIAJEROS_REGION.COUNTRY AS PAIS_GLOBALDATA_ORIGEN,
     GEOGRAFIA_ORIGEN.COUNTRY_OR_AREA AS PAIS_ORIGEN,
+    GEOGRAFIA_ORIGEN.ID_PAIS AS ID_PAIS_ORIGEN,
     VIAJEROS_REGION.COUNTRY_OF_ORIGIN_DESTINATION AS PAIS_GLOBALDATA_DESTINO,
     GEOGRAFIA_DESTINO.COUNTRY_OR_AREA AS PAIS_DESTINO,
+    GEOGRAFIA_DESTINO.ID_PAIS AS ID_PAIS_DESTINO,
     VIAJEROS_REGION.YEAR AS YEAR,
     CAST(VIAJEROS_REGION.VALUE AS BIGINT) AS VIAJEROS
 FROM GLOBALDATA.FLUJO_VIAJEROS_REGION AS VIAJEROS_REGION
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA_ORIGEN ON VIAJEROS_REGION.COUNTRY = GEOGRAFIA_ORIGEN.NOMBRE_GLOBAL_DATA
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA_DESTINO ON VIAJEROS_REGION.COUNTRY_OF_ORIGIN_DESTINATION = GEOGRAFIA_DESTINO.NOMBRE_GLOBAL_DATA;
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA_ORIGEN ON VIAJEROS_REGION.COUNTRY = GEOGRAFIA_ORIGEN.NOMBRE_GLOBAL_DATA
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA_DESTINO ON VIAJEROS_REGION.COUNTRY_OF_ORIGIN_DESTINATION = GEOGRAFIA_DESTINO.NOMBRE_GLOBAL_DATA;
 
 
 -- Flujos internacionales por motivo de negocios
@@ -217,6 +240,7 @@ CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_MICE AS
 SELECT 
     MICE.COUNTRY AS PAIS_GLOBALDATA,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     MICE.YEAR AS YEAR,
     -- Traducción de los valores de la columna SUB_INDICATORS_1 (MOTIVO_VIAJE) a español
     CASE 
@@ -226,16 +250,56 @@ SELECT
     END AS MOTIVO_VIAJE,
     CAST(SUM(MICE.VALUE) AS BIGINT) AS VIAJEROS
 FROM GLOBALDATA.FLUJO_MICE AS MICE
-    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON MICE.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
+    LEFT JOIN (SELECT DISTINCT NOMBRE_GLOBAL_DATA, COUNTRY_OR_AREA, ID_PAIS FROM VISTAS.GEOGRAFIA) AS GEOGRAFIA ON MICE.COUNTRY = GEOGRAFIA.NOMBRE_GLOBAL_DATA
 GROUP BY 
     MICE.COUNTRY, 
-    GEOGRAFIA.COUNTRY_OR_AREA, 
+    GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS, 
     MICE.YEAR, 
     MICE.SUB_INDICATORS_1
 ORDER BY 
     GEOGRAFIA.COUNTRY_OR_AREA, 
     MICE.YEAR ASC;
 
+-- Indicadores de GlobalData de todos los países para las referencias entre países (VISTAS.BENCHMARK_PAISES).
+-- ADITIVO indica si el indicador se puede sumar entre países (participación en el total).
+
+CREATE OR REPLACE VIEW VISTAS.GLOBALDATA_INDICADORES_PAISES AS
+-- Viajeros del país hacia el mundo
+SELECT ID_PAIS,
+    'GlobalData' AS FUENTE,
+    'VIAJEROS_MUNDO' AS INDICADOR,
+    CAST(YEAR AS INT) AS YEAR,
+    SUM(VIAJEROS)::FLOAT AS VALOR,
+    TRUE AS ADITIVO
+FROM VISTAS.GLOBALDATA_VIAJEROS_MUNDO
+WHERE ID_PAIS IS NOT NULL
+GROUP BY ID_PAIS, YEAR
+UNION ALL
+-- Viajeros del país hacia Colombia (posición entre los mercados emisores)
+SELECT ID_PAIS_ORIGEN AS ID_PAIS,
+    'GlobalData' AS FUENTE,
+    'VIAJEROS_COLOMBIA' AS INDICADOR,
+    CAST(YEAR AS INT) AS YEAR,
+    SUM(VIAJEROS)::FLOAT AS VALOR,
+    TRUE AS ADITIVO
+FROM VISTAS.GLOBALDATA_FLUJOS_VIAJEROS_REGION
+WHERE ID_PAIS_ORIGEN IS NOT NULL
+    AND PAIS_DESTINO = 'Colombia'
+    AND PAIS_ORIGEN <> 'Colombia'
+GROUP BY ID_PAIS_ORIGEN, YEAR
+UNION ALL
+-- Participación de Colombia en los viajeros del país hacia la región (%)
+SELECT ID_PAIS_ORIGEN AS ID_PAIS,
+    'GlobalData' AS FUENTE,
+    'PARTICIPACION_COLOMBIA' AS INDICADOR,
+    CAST(YEAR AS INT) AS YEAR,
+    SUM(IFF(PAIS_DESTINO = 'Colombia', VIAJEROS, 0))::FLOAT / NULLIF(SUM(VIAJEROS), 0) * 100 AS VALOR,
+    FALSE AS ADITIVO
+FROM VISTAS.GLOBALDATA_FLUJOS_VIAJEROS_REGION
+WHERE ID_PAIS_ORIGEN IS NOT NULL
+    AND PAIS_ORIGEN <> 'Colombia'
+GROUP BY ID_PAIS_ORIGEN, YEAR;
+
 ---------
 -- 3. OAG
 ---------
@@ -245,9 +309,11 @@ CREATE OR REPLACE VIEW VISTAS.OAG_CONECTIVIDAD_MUNDO AS
 SELECT OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_CODE,
     OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_NAME,
     GEOGRAFIA_DEP.COUNTRY_OR_AREA AS PAIS_DEPARTURE,
+    GEOGRAFIA_DEP.ID_PAIS AS ID_PAIS_DEPARTURE,
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_CODE,
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_NAME,
     GEOGRAFIA_ARR.COUNTRY_OR_AREA AS PAIS_ARRIVAL,
+    GEOGRAFIA_ARR.ID_PAIS AS ID_PAIS_ARRIVAL,
     OAG_CONECTIVIDAD_MUNDO.TIME_SERIES,
     CAST(SUM(OAG_CONECTIVIDAD_MUNDO.FREQUENCY) AS BIGINT) AS FRECUENCIAS,
     CAST(SUM(OAG_CONECTIVIDAD_MUNDO.SEATS_TOTAL) AS BIGINT) AS SILLAS
@@ -256,10 +322,10 @@ FROM OAG.CONECTIVIDAD_DIRECTA AS OAG_CONECTIVIDAD_MUNDO
     LEFT JOIN VISTAS.GEOGRAFIA AS GEOGRAFIA_ARR ON OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_CODE = GEOGRAFIA_ARR.COUNTRYCODE_FORWARDKEYS
 GROUP BY OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_CODE, 
     OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_NAME, 
-    GEOGRAFIA_DEP.COUNTRY_OR_AREA, 
+    GEOGRAFIA_DEP.COUNTRY_OR_AREA, GEOGRAFIA_DEP.ID_PAIS, 
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_CODE, 
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_NAME, 
-    GEOGRAFIA_ARR.COUNTRY_OR_AREA,
+    GEOGRAFIA_ARR.COUNTRY_OR_AREA, GEOGRAFIA_ARR.ID_PAIS,
     OAG_CONECTIVIDAD_MUNDO.TIME_SERIES
 ORDER BY GEOGRAFIA_DEP.COUNTRY_OR_AREA, GEOGRAFIA_ARR.COUNTRY_OR_AREA, OAG_CONECTIVIDAD_MUNDO.TIME_SERIES ASC;
 
@@ -269,9 +335,11 @@ CREATE OR REPLACE VIEW VISTAS.OAG_CONECTIVIDAD_COLOMBIA AS
 SELECT OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_CODE,
     OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_NAME,
     GEOGRAFIA_DEP.COUNTRY_OR_AREA AS PAIS_DEPARTURE,
+    GEOGRAFIA_DEP.ID_PAIS AS ID_PAIS_DEPARTURE,
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_CODE,
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_NAME,
     GEOGRAFIA_ARR.COUNTRY_OR_AREA AS PAIS_ARRIVAL,
+    GEOGRAFIA_ARR.ID_PAIS AS ID_PAIS_ARRIVAL,
     OAG_CONECTIVIDAD_MUNDO.ARR_CITY_CODE,
     OAG_CONECTIVIDAD_MUNDO.ARR_CITY_NAME,
     AEROPUERTOS.COD_DANE_MUNICIPIO,
@@ -288,10 +356,10 @@ FROM OAG.CONECTIVIDAD_DIRECTA AS OAG_CONECTIVIDAD_MUNDO
 WHERE GEOGRAFIA_ARR.COUNTRY_OR_AREA = 'Colombia'
 GROUP BY OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_CODE, 
     OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_NAME, 
-    GEOGRAFIA_DEP.COUNTRY_OR_AREA, 
+    GEOGRAFIA_DEP.COUNTRY_OR_AREA, GEOGRAFIA_DEP.ID_PAIS, 
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_CODE, 
     OAG_CONECTIVIDAD_MUNDO.ARR_IATA_COUNTRY_NAME, 
-    GEOGRAFIA_ARR.COUNTRY_OR_AREA,
+    GEOGRAFIA_ARR.COUNTRY_OR_AREA, GEOGRAFIA_ARR.ID_PAIS,
     OAG_CONECTIVIDAD_MUNDO.ARR_CITY_CODE,
     OAG_CONECTIVIDAD_MUNDO.ARR_CITY_NAME,
     AEROPUERTOS.COD_DANE_MUNICIPIO,
@@ -301,6 +369,56 @@ GROUP BY OAG_CONECTIVIDAD_MUNDO.DEP_IATA_COUNTRY_CODE,
     OAG_CONECTIVIDAD_MUNDO.TIME_SERIES
 ORDER BY GEOGRAFIA_DEP.COUNTRY_OR_AREA, GEOGRAFIA_ARR.COUNTRY_OR_AREA, OAG_CONECTIVIDAD_MUNDO.TIME_SERIES ASC;
 
+-- Indicadores de OAG de todos los países para las referencias entre países (VISTAS.BENCHMARK_PAISES)
+
+CREATE OR REPLACE VIEW VISTAS.OAG_INDICADORES_PAISES AS
+-- Sillas internacionales directas desde el país hacia el mundo
+SELECT ID_PAIS_DEPARTURE AS ID_PAIS,
+    'OAG' AS FUENTE,
+    'SILLAS_MUNDO' AS INDICADOR,
+    TRY_TO_NUMBER(SUBSTR(TIME_SERIES, 1, 4)) AS YEAR,
+    SUM(SILLAS)::FLOAT AS VALOR,
+    TRUE AS ADITIVO
+FROM VISTAS.OAG_CONECTIVIDAD_MUNDO
+WHERE ID_PAIS_DEPARTURE IS NOT NULL
+    AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE
+GROUP BY ID_PAIS_DEPARTURE, YEAR
+UNION ALL
+-- Países con los que el país tiene conexión aérea directa
+SELECT ID_PAIS_DEPARTURE AS ID_PAIS,
+    'OAG' AS FUENTE,
+    'PAISES_CONECTADOS' AS INDICADOR,
+    TRY_TO_NUMBER(SUBSTR(TIME_SERIES, 1, 4)) AS YEAR,
+    COUNT(DISTINCT ID_PAIS_ARRIVAL)::FLOAT AS VALOR,
+    FALSE AS ADITIVO
+FROM VISTAS.OAG_CONECTIVIDAD_MUNDO
+WHERE ID_PAIS_DEPARTURE IS NOT NULL
+    AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE
+GROUP BY ID_PAIS_DEPARTURE, YEAR
+UNION ALL
+-- Frecuencias y sillas directas del país hacia Colombia (posición entre los mercados de origen)
+SELECT ID_PAIS_DEPARTURE AS ID_PAIS,
+    'OAG' AS FUENTE,
+    'FRECUENCIAS_COLOMBIA' AS INDICADOR,
+    TRY_TO_NUMBER(SUBSTR(TIME_SERIES, 1, 4)) AS YEAR,
+    SUM(FRECUENCIAS)::FLOAT AS VALOR,
+    TRUE AS ADITIVO
+FROM VISTAS.OAG_CONECTIVIDAD_COLOMBIA
+WHERE ID_PAIS_DEPARTURE IS NOT NULL
+    AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE
+GROUP BY ID_PAIS_DEPARTURE, YEAR
+UNION ALL
+SELECT ID_PAIS_DEPARTURE AS ID_PAIS,
+    'OAG' AS FUENTE,
+    'SILLAS_COLOMBIA' AS INDICADOR,
+    TRY_TO_NUMBER(SUBSTR(TIME_SERIES, 1, 4)) AS YEAR,
+    SUM(SILLAS)::FLOAT AS VALOR,
+    TRUE AS ADITIVO
+FROM VISTAS.OAG_CONECTIVIDAD_COLOMBIA
+WHERE ID_PAIS_DEPARTURE IS NOT NULL
+    AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE
+GROUP BY ID_PAIS_DEPARTURE, YEAR;
+
 -----------------
 -- 4. ForwardKeys
 -----------------
@@ -311,8 +429,10 @@ CREATE OR REPLACE VIEW VISTAS.FORWARDKEYS_RESERVAS_PAISES AS
 SELECT 
     FORWARDKEYS_RESERVAS_PAISES.TRIP_ORIGIN_COUNTRY,
     GEOGRAFIA_DEP.COUNTRY_OR_AREA AS PAIS_DEPARTURE,
+    GEOGRAFIA_DEP.ID_PAIS AS ID_PAIS_DEPARTURE,
     FORWARDKEYS_RESERVAS_PAISES.FLIGHT_LEG_DESTINATION_COUNTRY,
     GEOGRAFIA_ARR.COUNTRY_OR_AREA AS PAIS_ARRIVAL,
+    GEOGRAFIA_ARR.ID_PAIS AS ID_PAIS_ARRIVAL,
     FORWARDKEYS_RESERVAS_PAISES.FLIGHT_LEG_ARRIVAL_DATE,
     FORWARDKEYS_RESERVAS_PAISES.LOS_AT_DESTINATION_CAT,
     FORWARDKEYS_RESERVAS_PAISES.LOS_AT_DESTINATION_NIGHTS,
@@ -339,9 +459,9 @@ FROM FORWARDKEYS.RESERVAS AS FORWARDKEYS_RESERVAS_PAISES
 WHERE FORWARDKEYS_RESERVAS_PAISES.FLIGHT_LEG_DESTINATION_COUNTRY IN ('MX', 'CL', 'PE', 'CR', 'CO')
 GROUP BY 
     FORWARDKEYS_RESERVAS_PAISES.TRIP_ORIGIN_COUNTRY,
-    GEOGRAFIA_DEP.COUNTRY_OR_AREA,
+    GEOGRAFIA_DEP.COUNTRY_OR_AREA, GEOGRAFIA_DEP.ID_PAIS,
     FORWARDKEYS_RESERVAS_PAISES.FLIGHT_LEG_DESTINATION_COUNTRY,
-    GEOGRAFIA_ARR.COUNTRY_OR_AREA,
+    GEOGRAFIA_ARR.COUNTRY_OR_AREA, GEOGRAFIA_ARR.ID_PAIS,
     FORWARDKEYS_RESERVAS_PAISES.FLIGHT_LEG_ARRIVAL_DATE,
     FORWARDKEYS_RESERVAS_PAISES.LOS_AT_DESTINATION_CAT,
     FORWARDKEYS_RESERVAS_PAISES.LOS_AT_DESTINATION_NIGHTS,
@@ -363,8 +483,10 @@ ORDER BY
 CREATE OR REPLACE VIEW VISTAS.FORWARDKEYS_BUSQUEDAS_PAISES AS
 SELECT FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_ORIGIN_COUNTRY,
     GEOGRAFIA_DEP.COUNTRY_OR_AREA AS PAIS_DEPARTURE,
+    GEOGRAFIA_DEP.ID_PAIS AS ID_PAIS_DEPARTURE,
     FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_DESTINATION_COUNTRY,
     GEOGRAFIA_ARR.COUNTRY_OR_AREA AS PAIS_ARRIVAL,
+    GEOGRAFIA_ARR.ID_PAIS AS ID_PAIS_ARRIVAL,
     FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_DATE,
     CAST(SUM(FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_PAX) AS BIGINT) AS BUSQUEDAS
 FROM FORWARDKEYS.BUSQUEDAS AS FORWARDKEYS_BUSQUEDAS_PAISES
@@ -372,9 +494,9 @@ FROM FORWARDKEYS.BUSQUEDAS AS FORWARDKEYS_BUSQUEDAS_PAISES
     LEFT JOIN VISTAS.GEOGRAFIA AS GEOGRAFIA_ARR ON FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_DESTINATION_COUNTRY = GEOGRAFIA_ARR.COUNTRYCODE_FORWARDKEYS
 WHERE FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_DESTINATION_COUNTRY IN ('MX', 'CL', 'PE', 'CR', 'CO')
 GROUP BY FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_ORIGIN_COUNTRY,
-    GEOGRAFIA_DEP.COUNTRY_OR_AREA,
+    GEOGRAFIA_DEP.COUNTRY_OR_AREA, GEOGRAFIA_DEP.ID_PAIS,
     FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_DESTINATION_COUNTRY,
-    GEOGRAFIA_ARR.COUNTRY_OR_AREA,
+    GEOGRAFIA_ARR.COUNTRY_OR_AREA, GEOGRAFIA_ARR.ID_PAIS,
     FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_DATE
 ORDER BY FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_ORIGIN_COUNTRY,
     GEOGRAFIA_DEP.COUNTRY_OR_AREA,
@@ -383,6 +505,50 @@ ORDER BY FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_ORIGIN_COUNTRY,
     FORWARDKEYS_BUSQUEDAS_PAISES.SEARCH_DATE ASC;
 
 
+-- Agregados mensuales de ForwardKeys por par origen/destino (la serie diaria se re-agrega una sola vez en el cargue)
+-- FECHA_USABLE es el inicio del mes (las fechas de ForwardKeys se cargan como DATE).
+
+-- Reservas aéreas por mes
+CREATE OR REPLACE VIEW VISTAS.FORWARDKEYS_RESERVAS_MES AS
+SELECT PAIS_DEPARTURE,
+    ID_PAIS_DEPARTURE,
+    PAIS_ARRIVAL,
+    ID_PAIS_ARRIVAL,
+    DATE_TRUNC('MONTH', FLIGHT_LEG_ARRIVAL_DATE) AS FECHA_USABLE,
+    CAST(SUM(RESERVAS) AS BIGINT) AS RESERVAS
+FROM VISTAS.FORWARDKEYS_RESERVAS_PAISES
+GROUP BY PAIS_DEPARTURE,
+    ID_PAIS_DEPARTURE,
+    PAIS_ARRIVAL,
+    ID_PAIS_ARRIVAL,
+    DATE_TRUNC('MONTH', FLIGHT_LEG_ARRIVAL_DATE);
+
+-- Búsquedas aéreas por mes
+CREATE OR REPLACE VIEW VISTAS.FORWARDKEYS_BUSQUEDAS_MES AS
+SELECT PAIS_DEPARTURE,
+    ID_PAIS_DEPARTURE,
+    PAIS_ARRIVAL,
+    ID_PAIS_ARRIVAL,
+    DATE_TRUNC('MONTH', SEARCH_DATE) AS FECHA_USABLE,
+    CAST(SUM(BUSQUEDAS) AS BIGINT) AS BUSQUEDAS
+FROM VISTAS.FORWARDKEYS_BUSQUEDAS_PAISES
+GROUP BY PAIS_DEPARTURE,
+    ID_PAIS_DEPARTURE,
+    PAIS_ARRIVAL,
+    ID_PAIS_ARRIVAL,
+    DATE_TRUNC('MONTH', SEARCH_DATE);
+
+-- Los gráficos de ForwardKeys son mensuales: los agregados por semana ISO y por día no se consultan
+DROP VIEW IF EXISTS VISTAS.FORWARDKEYS_RESERVAS_SEMANA;
+DROP VIEW IF EXISTS VISTAS.FORWARDKEYS_RESERVAS_DIA;
+DROP VIEW IF EXISTS VISTAS.FORWARDKEYS_BUSQUEDAS_SEMANA;
+DROP VIEW IF EXISTS VISTAS.FORWARDKEYS_BUSQUEDAS_DIA;
+DROP TABLE IF EXISTS SERVICIO.FORWARDKEYS_RESERVAS_SEMANA;
+DROP TABLE IF EXISTS SERVICIO.FORWARDKEYS_RESERVAS_DIA;
+DROP TABLE IF EXISTS SERVICIO.FORWARDKEYS_BUSQUEDAS_SEMANA;
+DROP TABLE IF EXISTS SERVICIO.FORWARDKEYS_BUSQUEDAS_DIA;
+
+
 ----------------
 -- 5. Credibanco
 ----------------
@@ -394,6 +560,7 @@ SELECT
     CREDIBANCO_GASTO.MES,
     CREDIBANCO_GASTO.PAIS_ORIGEN,
     GEOGRAFIA.COUNTRY_OR_AREA AS PAIS,
+    GEOGRAFIA.ID_PAIS AS ID_PAIS,
     INITCAP(CREDIBANCO_GASTO.CATEGORIA) AS CATEGORIA,
     -- Aplicar el CASE para formatear CLASIFICACION_CATEGORIA
     CASE 
@@ -412,7 +579,7 @@ GROUP BY
     CREDIBANCO_GASTO.ANIO,
     CREDIBANCO_GASTO.MES,
     CREDIBANCO_GASTO.PAIS_ORIGEN,
-    GEOGRAFIA.COUNTRY_OR_AREA,
+    GEOGRAFIA.COUNTRY_OR_AREA, GEOGRAFIA.ID_PAIS,
     CREDIBANCO_GASTO.CATEGORIA,
     CREDIBANCO_GASTO.CLASIFICACION_CATEGORIA
 ORDER BY 
@@ -423,6 +590,31 @@ ORDER BY
     CREDIBANCO_GASTO.CATEGORIA,
     CREDIBANCO_GASTO.CLASIFICACION_CATEGORIA ASC;
 
+-- Indicadores de Credibanco de todos los países para las referencias entre países (VISTAS.BENCHMARK_PAISES)
+
+CREATE OR REPLACE VIEW VISTAS.CREDIBANCO_INDICADORES_PAISES AS
+-- Gasto con tarjeta de crédito del país en Colombia (USD)
+SELECT ID_PAIS,
+    'Credibanco' AS FUENTE,
+    'GASTO_USD' AS INDICADOR,
+    CAST(ANIO AS INT) AS YEAR,
+    SUM(FACTURACION_USD)::FLOAT AS VALOR,
+    TRUE AS ADITIVO
+FROM VISTAS.CREDIBANCO_GASTO
+WHERE ID_PAIS IS NOT NULL
+GROUP BY ID_PAIS, ANIO
+UNION ALL
+-- Transacciones con tarjeta de crédito del país en Colombia
+SELECT ID_PAIS,
+    'Credibanco' AS FUENTE,
+    'TRANSACCIONES' AS INDICADOR,
+    CAST(ANIO AS INT) AS YEAR,
+    SUM(TRANSACCIONES)::FLOAT AS VALOR,
+    TRUE AS ADITIVO
+FROM VISTAS.CREDIBANCO_GASTO
+WHERE ID_PAIS IS NOT NULL
+GROUP BY ID_PAIS, ANIO;
+
 --------------
 -- 6. IATA-GAP
 --------------
@@ -432,6 +624,7 @@ CREATE OR REPLACE VIEW VISTAS.IATAGAP_AGENCIAS AS
 SELECT DISTINCT IATAGAP_AGENCIAS.TRAVEL_AGENCY_NAME AS AGENCIAS,
     IATAGAP_AGENCIAS.TRAVEL_AGENCY_COUNTRY,
     GEOGRAFIA_AGENCIA.COUNTRY_OR_AREA AS PAIS_AGENCIA,
+    GEOGRAFIA_AGENCIA.ID_PAIS AS ID_PAIS_AGENCIA,
     IATAGAP_AGENCIAS.TRAVEL_AGENCY_CITY,
     IATAGAP_AGENCIAS.YEAR AS YEAR,
     SUBSTR(IATAGAP_AGENCIAS.YEAR, 1, 4) AS YY
@@ -440,4 +633,89 @@ FROM IATAGAP.AGENCIAS AS IATAGAP_AGENCIAS
 WHERE 
     IATAGAP_AGENCIAS.VALUE > 0
     AND 
-    IATAGAP_AGENCIAS.TRIP_DESTINATION_COUNTRY = 'Colombia';
\ No newline at end of file
+    IATAGAP_AGENCIAS.TRIP_DESTINATION_COUNTRY = 'Colombia';
+
+-- Agencias distintas por país y año (conteo exacto), para la serie de tiempo de agencias de cada país
+CREATE OR REPLACE VIEW VISTAS.IATAGAP_AGENCIAS_PAIS AS
+SELECT PAIS_AGENCIA,
+    ID_PAIS_AGENCIA,
+    YY AS YEAR,
+    COUNT(DISTINCT AGENCIAS) AS AGENCIAS
+FROM VISTAS.IATAGAP_AGENCIAS
+GROUP BY PAIS_AGENCIA,
+    ID_PAIS_AGENCIA,
+    YY;
+
+-- Agencias distintas por país, ciudad y año (conteo exacto). Si el país tiene más de 10 ciudades, se conservan las 15
+-- con más agencias (en todos los años) y las demás se agrupan en "Otros", cuyas agencias se cuentan una sola vez.
+-- Las dos tablas se leen sin funciones propias de Snowflake, por lo que también se consultan en la réplica local.
+CREATE OR REPLACE VIEW VISTAS.IATAGAP_AGENCIAS_CIUDADES AS
+WITH CIUDADES AS (
+    SELECT PAIS_AGENCIA,
+        INITCAP(TRAVEL_AGENCY_CITY) AS TRAVEL_AGENCY_CITY,
+        COUNT(DISTINCT AGENCIAS) AS TOTAL
+    FROM VISTAS.IATAGAP_AGENCIAS
+    GROUP BY PAIS_AGENCIA,
+        INITCAP(TRAVEL_AGENCY_CITY)
+),
+RANKING AS (
+    SELECT PAIS_AGENCIA,
+        TRAVEL_AGENCY_CITY,
+        CASE
+            WHEN COUNT(*) OVER (PARTITION BY PAIS_AGENCIA) <= 10
+                OR ROW_NUMBER() OVER (PARTITION BY PAIS_AGENCIA ORDER BY TOTAL DESC, TRAVEL_AGENCY_CITY) <= 15
+            THEN TRAVEL_AGENCY_CITY
+            ELSE 'Otros'
+        END AS GRUPO_CIUDAD
+    FROM CIUDADES
+)
+SELECT AGENCIAS.PAIS_AGENCIA,
+    AGENCIAS.ID_PAIS_AGENCIA,
+    RANKING.GRUPO_CIUDAD AS TRAVEL_AGENCY_CITY,
+    AGENCIAS.YY AS YEAR,
+    COUNT(DISTINCT AGENCIAS.AGENCIAS) AS AGENCIAS
+FROM VISTAS.IATAGAP_AGENCIAS AS AGENCIAS
+    INNER JOIN RANKING ON AGENCIAS.PAIS_AGENCIA = RANKING.PAIS_AGENCIA
+        AND INITCAP(AGENCIAS.TRAVEL_AGENCY_CITY) = RANKING.TRAVEL_AGENCY_CITY
+GROUP BY AGENCIAS.PAIS_AGENCIA,
+    AGENCIAS.ID_PAIS_AGENCIA,
+    RANKING.GRUPO_CIUDAD,
+    AGENCIAS.YY;
+
+-- Los sketches HyperLogLog de agencias se reemplazaron por las dos tablas anteriores
+DROP VIEW IF EXISTS VISTAS.IATAGAP_AGENCIAS_SKETCH;
+DROP TABLE IF EXISTS SERVICIO.IATAGAP_AGENCIAS_SKETCH;
+
+------------------------------
+-- 7. Referencias entre países
+------------------------------
+
+-- Una fila por país, fuente, indicador y año con su posición frente a todos los países. Une los indicadores de cada
+-- fuente (secciones 2, 3 y 5) y calcula la posición una sola vez. El aplicativo lee la fila del país seleccionado
+-- en lugar de agregar los datos de todos los países en cada consulta.
+CREATE OR REPLACE VIEW VISTAS.BENCHMARK_PAISES AS
+WITH INDICADORES AS (
+    SELECT ID_PAIS, FUENTE, INDICADOR, YEAR, VALOR, ADITIVO FROM VISTAS.GLOBALDATA_INDICADORES_PAISES
+    UNION ALL
+    SELECT ID_PAIS, FUENTE, INDICADOR, YEAR, VALOR, ADITIVO FROM VISTAS.OAG_INDICADORES_PAISES
+    UNION ALL
+    SELECT ID_PAIS, FUENTE, INDICADOR, YEAR, VALOR, ADITIVO FROM VISTAS.CREDIBANCO_INDICADORES_PAISES
+)
+SELECT INDICADORES.ID_PAIS,
+    DIM_PAIS.COUNTRY_OR_AREA AS PAIS,
+    DIM_PAIS.REGION_NAME,
+    INDICADORES.FUENTE,
+    INDICADORES.INDICADOR,
+    INDICADORES.YEAR,
+    INDICADORES.VALOR,
+    -- Posición (1 = mayor valor), número de países comparados y percentil (porcentaje de países con un valor menor)
+    RANK() OVER (PARTITION BY INDICADORES.FUENTE, INDICADORES.INDICADOR, INDICADORES.YEAR ORDER BY INDICADORES.VALOR DESC) AS RANKING,
+    COUNT(*) OVER (PARTITION BY INDICADORES.FUENTE, INDICADORES.INDICADOR, INDICADORES.YEAR) AS PAISES_RANKING,
+    ROUND(PERCENT_RANK() OVER (PARTITION BY INDICADORES.FUENTE, INDICADORES.INDICADOR, INDICADORES.YEAR ORDER BY INDICADORES.VALOR) * 100, 2) AS PERCENTIL,
+    -- Participación en el total de todos los países (solo indicadores aditivos)
+    IFF(INDICADORES.ADITIVO, INDICADORES.VALOR / NULLIF(SUM(INDICADORES.VALOR) OVER (PARTITION BY INDICADORES.FUENTE, INDICADORES.INDICADOR, INDICADORES.YEAR), 0) * 100, NULL) AS PARTICIPACION,
+    AVG(INDICADORES.VALOR) OVER (PARTITION BY INDICADORES.FUENTE, INDICADORES.INDICADOR, INDICADORES.YEAR, DIM_PAIS.REGION_NAME) AS PROMEDIO_REGION,
+    AVG(INDICADORES.VALOR) OVER (PARTITION BY INDICADORES.FUENTE, INDICADORES.INDICADOR, INDICADORES.YEAR) AS PROMEDIO_MUNDO
+FROM INDICADORES
+    INNER JOIN VISTAS.DIM_PAIS AS DIM_PAIS ON INDICADORES.ID_PAIS = DIM_PAIS.ID_PAIS
+WHERE INDICADORES.VALOR IS NOT NULL;
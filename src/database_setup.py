@@ -62,6 +62,7 @@ query_sql_esquemas = """
     CREATE OR REPLACE SCHEMA CORRELATIVAS;
     CREATE OR REPLACE SCHEMA AUDITORIA;
     CREATE OR REPLACE SCHEMA VISTAS;
+    CREATE OR REPLACE SCHEMA SERVICIO;
 """
 snowflake_analitica.ejecutar_script_sql_snowpark(sesion_activa, query_sql_esquemas)
 
@@ -130,12 +131,44 @@ CREATE TABLE AUDITORIA_CARGUES (
     FECHA_CARGUE        TIMESTAMP DEFAULT CURRENT_TIMESTAMP,    -- Fecha y hora del cargue
     RUTA_ARCHIVO        VARCHAR(512) NOT NULL,                  -- Ruta completa o nombre del archivo CSV
     NUMERO_REGISTROS    INTEGER,                                -- Número de registros cargados
-    MENSAJE             VARCHAR(512) NOT NULL                   -- Mensaje de resultado del cargue a Snowflake
+    MENSAJE             VARCHAR(512) NOT NULL,                  -- Mensaje de resultado del cargue a Snowflake
+    REPORTE_VALIDACION  VARCHAR,                                -- Reporte de validación del archivo (JSON, consultable con PARSE_JSON)
+    DETALLE_CARGUE      VARCHAR                                 -- Detalle del cargue, p. ej. resultado de COPY INTO por archivo (JSON)
 );
 """
 # Crear tabla
 sesion_activa.sql(sql_tabla_auditoria_cargue).collect()
 
+# Definir el query para crear la tabla de estado de las fuentes (actualización incremental de vistas)
+sql_tabla_estado_fuentes = """
+CREATE TABLE ESTADO_FUENTES (
+    TABLA               VARCHAR(255),                           -- Tabla de origen (ESQUEMA.TABLA)
+    FIRMA               VARCHAR(255),                           -- HASH_AGG y número de registros en la última actualización
+    FECHA_ACTUALIZACION TIMESTAMP                               -- Fecha y hora de la última actualización
+);
+"""
+# Crear tabla
+sesion_activa.sql(sql_tabla_estado_fuentes).collect()
+
+# Definir el query para crear la tabla del manifiesto de cargues (contenido cargado por hash, por archivo y por lote)
+sql_tabla_manifiesto_cargues = """
+CREATE TABLE MANIFIESTO_CARGUES (
+    NOMBRE_ESQUEMA_DESTINO VARCHAR(255),                        -- Esquema de destino del cargue
+    NOMBRE_TABLA        VARCHAR(255),                           -- Nombre de la tabla de destino
+    RUTA_ARCHIVO        VARCHAR(512),                           -- Ruta del archivo con el que se cargó el contenido
+    HASH_ARCHIVO        VARCHAR(64),                            -- Hash SHA-256 del contenido del archivo
+    TAMANO_BYTES        INTEGER,                                -- Tamaño del archivo en bytes
+    PARTE               INTEGER,                                -- 0 para el archivo completo, 1..n para cada lote
+    HASH_PARTE          VARCHAR(64),                            -- Hash de los datos del lote
+    NUMERO_REGISTROS    INTEGER,                                -- Registros del archivo o del lote
+    FILAS_POR_LOTE      INTEGER,                                -- Filas por lote con que se leyó el archivo
+    ESTADO              VARCHAR(20),                            -- pendiente, cargado o verificado
+    FECHA_ACTUALIZACION TIMESTAMP                               -- Fecha y hora del último cambio de estado
+);
+"""
+# Crear tabla
+sesion_activa.sql(sql_tabla_manifiesto_cargues).collect()
+
 print("Proceso de creación de base de datos y esquemas exitoso.")
 
 # ---------------------------
@@ -1,2 +1,4 @@
 # Importar módulos
-from .procesamiento_datos import obtener_datos_global_data, procesar_datos_global_data, datos_global_data, obtener_datos_oag, procesar_datos_oag, datos_oag, obtener_datos_forward_keys, procesar_datos_forward_keys, datos_forward_keys, obtener_datos_credibanco, procesar_datos_credibanco, datos_credibanco, obtener_datos_iata_gap, procesar_datos_iata_gap, datos_iata_gap, calcular_tasa_variacion, filtrar_df_top_n, global_data_bullets_viajeros_mundo, global_data_bullets_medio_transporte, global_data_bullets_noches_percnotacion, global_data_bullets_rango_edad, global_data_bullets_motivo_viaje, global_data_bullets_forma_viaje, global_data_bullets_destinos_internacionales, global_data_bullets_gasto_promedio, global_data_bullets_gasto_categoria, global_data_bullets_mice, oag_bullets_frecuencias_mundo, oag_bullets_paises_con_frecuencias, oag_bullets_frecuencias_destino_cerrado, fk_mundo_bullets_reservas_aereas_mex_cost_chi_per, fk_mundo_bullets_busquedas_aereas_mex_cost_chi_per, oag_bullets_frecuencias_colombia, oag_bullets_frecuencias_municipio_cerrado, credibanco_bullets_gasto_cerrado_promedio, credibanco_bullets_gasto_directo_indirecto_cerrado, credibanco_bullets_gasto_directo_cerrado, credibanco_bullets_gasto_indirecto_cerrado, fk_colombia_bullets_busquedas_aereas_colombia, fk_colombia_bullets_reservas_aereas_colombia, obtener_bullets
\ No newline at end of file
+from .procesamiento_datos import condicion_paises, condicion_ids, obtener_datos_global_data, procesar_datos_global_data, datos_global_data, obtener_datos_oag, procesar_datos_oag, datos_oag, GRANOS_FORWARD_KEYS, RESOLUCION_GRAFICOS_FORWARD_KEYS, seleccionar_grano_forward_keys, inicio_ventana_busquedas_forward_keys, obtener_datos_forward_keys, procesar_datos_forward_keys, datos_forward_keys, obtener_datos_credibanco, procesar_datos_credibanco, datos_credibanco, obtener_datos_iata_gap, procesar_datos_iata_gap, datos_iata_gap, COLUMNAS_PAIS, separar_por_pais, FUENTES_COMPARACION, datos_comparacion_paises, unir_series_paises, calcular_tasa_variacion, filtrar_df_top_n, global_data_bullets_viajeros_mundo, global_data_bullets_medio_transporte, global_data_bullets_noches_percnotacion, global_data_bullets_rango_edad, global_data_bullets_motivo_viaje, global_data_bullets_forma_viaje, global_data_bullets_destinos_internacionales, global_data_bullets_gasto_promedio, global_data_bullets_gasto_categoria, global_data_bullets_mice, oag_bullets_frecuencias_mundo, oag_bullets_paises_con_frecuencias, oag_bullets_frecuencias_destino_cerrado, fk_mundo_bullets_reservas_aereas_mex_cost_chi_per, fk_mundo_bullets_busquedas_aereas_mex_cost_chi_per, oag_bullets_frecuencias_colombia, oag_bullets_frecuencias_municipio_cerrado, credibanco_bullets_gasto_cerrado_promedio, credibanco_bullets_gasto_directo_indirecto_cerrado, credibanco_bullets_gasto_directo_cerrado, credibanco_bullets_gasto_indirecto_cerrado, fk_colombia_bullets_busquedas_aereas_colombia, fk_colombia_bullets_reservas_aereas_colombia, TABLA_BENCHMARK, obtener_benchmark_pais, fila_benchmark, global_data_bullets_ranking_colombia, oag_bullets_ranking_sillas_colombia, credibanco_bullets_ranking_gasto, obtener_bullets
+from .proyeccion import analizar_uso_columnas, proyecciones_requeridas, verificar_proyecciones
+from .procesamiento_warehouse import MODO_PROCESAMIENTO, consultas_oag_mundo_warehouse, procesar_oag_mundo_dataframes, procesar_oag_mundo_warehouse, obtener_datos_oag_warehouse, procesar_datos_oag_warehouse, datos_oag_warehouse, obtener_datos_forward_keys_warehouse, procesar_datos_forward_keys_warehouse, datos_forward_keys_warehouse, datos_oag_modo, datos_forward_keys_modo, COLUMNAS_PAIS_WAREHOUSE, datos_comparacion_paises_modo, comparar_modos_procesamiento
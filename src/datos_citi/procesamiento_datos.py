@@ -6,6 +6,7 @@
 
 import src.snowflake_analitica as snowflake_analitica
 from src.streamlit_analitica import formato_miles
+from src.formato_analitica import formato_numero, formato_serie, nombre_mes, serie_nombre_mes
 
 # Warnings
 import warnings
@@ -19,9 +20,6 @@ import pandas as pd
 # Prettyprint
 import pprint
 
-# Locale
-import locale
-
 # Suprimir todas las advertencias de tipo UserWarning
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -32,6 +30,53 @@ pd.options.display.float_format = '{:,.10f}'.format
 # Cada columna será tan grande como sea necesario para mostrar todo su contenido
 pd.set_option('display.max_colwidth', 0)
 
+##################################
+# Funciones de filtro por país(es)
+##################################
+
+def condicion_paises(paises):
+    """
+    Construye la condición SQL para filtrar uno o varios países.
+
+    Parámetros:
+    - paises (str o list): Nombre de un país o lista de nombres de países.
+
+    Retorna:
+    - str: Condición SQL lista para anteponer la columna, por ejemplo "= 'Chile'" o "IN ('Chile', 'Perú')".
+      Las comillas simples de los nombres se escapan.
+    """
+    if isinstance(paises, str):
+        paises = [paises]
+
+    # Escapar comillas simples (por ejemplo, "Côte d'Ivoire")
+    paises_escapados = [f"'{str(pais).replace(chr(39), chr(39) * 2)}'" for pais in paises]
+
+    if len(paises_escapados) == 1:
+        return f"= {paises_escapados[0]}"
+    return f"IN ({', '.join(paises_escapados)})"
+
+def condicion_ids(ids):
+    """
+    Construye la condición SQL para filtrar por una o varias llaves enteras de país (ID_PAIS de la dimensión conformada).
+
+    Parámetros:
+    - ids (int o list): Llave de un país o lista de llaves.
+
+    Retorna:
+    - str: Condición SQL lista para anteponer la columna, por ejemplo "= 152" o "IN (152, 604)".
+      Si la lista está vacía retorna "IN (NULL)", que no devuelve registros.
+    """
+    if isinstance(ids, int):
+        ids = [ids]
+
+    ids = [str(int(llave)) for llave in ids]
+
+    if not ids:
+        return "IN (NULL)"
+    if len(ids) == 1:
+        return f"= {ids[0]}"
+    return f"IN ({', '.join(ids)})"
+
 #######################
 # Funciones Global Data
 #######################
@@ -41,12 +86,15 @@ def obtener_datos_global_data(pais_seleccionado, session):
     Ejecuta múltiples consultas relacionadas con Global Data para un país seleccionado y devuelve los resultados.
 
     Parámetros:
-    - pais_seleccionado (str): Nombre del país seleccionado.
+    - pais_seleccionado (str o list): Nombre del país seleccionado o lista de países (modo comparación).
     - session: Objeto de conexión activo a Snowflake.
 
     Retorna:
     - dict: Diccionario donde las claves son los nombres descriptivos de las consultas y los valores son DataFrames con los resultados.
     """
+    # Condición de filtro sobre las llaves enteras de país (ID_PAIS IN (...) en modo comparación)
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
+
     # Diccionario de consultas con el parámetro dinámico `pais_seleccionado`
     consultas = {
         "viajeros_hacia_el_mundo": f"""
@@ -54,16 +102,16 @@ def obtener_datos_global_data(pais_seleccionado, session):
                 MEDIO, 
                 YEAR,
                 VIAJEROS
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_VIAJEROS_MUNDO
-            WHERE PAIS = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_VIAJEROS_MUNDO
+            WHERE ID_PAIS {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026');
         """,
         "noches_pernoctacion_promedio": f"""
             SELECT PAIS, 
                 YEAR,
                 NOCHES
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_NOCHES_PROMEDIO
-            WHERE PAIS = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_NOCHES_PROMEDIO
+            WHERE ID_PAIS {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026');
         """,
         "gasto_categorias": f"""
@@ -71,8 +119,8 @@ def obtener_datos_global_data(pais_seleccionado, session):
                 YEAR,
                 CATEGORIA_GASTO,
                 GASTO
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_CATEGORIAS_GASTO
-            WHERE PAIS = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_CATEGORIAS_GASTO
+            WHERE ID_PAIS {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026');
         """,
         "rango_edad": f"""
@@ -80,8 +128,8 @@ def obtener_datos_global_data(pais_seleccionado, session):
                 YEAR, 
                 RANGO_EDAD,
                 VIAJEROS
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_RANGO_EDAD
-            WHERE PAIS = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_RANGO_EDAD
+            WHERE ID_PAIS {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026');
         """,
         "motivo_viaje": f"""
@@ -89,8 +137,8 @@ def obtener_datos_global_data(pais_seleccionado, session):
                 YEAR,
                 MOTIVO_VIAJE,
                 VIAJEROS
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_MOTIVO_VIAJE
-            WHERE PAIS = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_MOTIVO_VIAJE
+            WHERE ID_PAIS {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026');
         """,
         "forma_viaje": f"""
@@ -98,8 +146,8 @@ def obtener_datos_global_data(pais_seleccionado, session):
                 YEAR,
                 FORMA_VIAJE,
                 VIAJEROS
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_FORMA_VIAJE
-            WHERE PAIS = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_FORMA_VIAJE
+            WHERE ID_PAIS {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026');
         """,
         "destinos_internacionales": f"""
@@ -107,8 +155,8 @@ def obtener_datos_global_data(pais_seleccionado, session):
                 PAIS_DESTINO,
                 YEAR,
                 SUM(VIAJEROS) AS VIAJEROS
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_FLUJOS_VIAJEROS_REGION
-            WHERE PAIS_ORIGEN = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_FLUJOS_VIAJEROS_REGION
+            WHERE ID_PAIS_ORIGEN {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026')
             GROUP BY PAIS_ORIGEN,
                 PAIS_DESTINO,
@@ -119,8 +167,8 @@ def obtener_datos_global_data(pais_seleccionado, session):
                 YEAR,
                 MOTIVO_VIAJE,
                 VIAJEROS
-            FROM REPOSITORIO_TURISMO.VISTAS.GLOBALDATA_MICE
-            WHERE PAIS = '{pais_seleccionado}'
+            FROM REPOSITORIO_TURISMO.SERVICIO.GLOBALDATA_MICE
+            WHERE ID_PAIS {filtro_paises}
             AND YEAR IN ('2022', '2023', '2024', '2025', '2026');
         """
     }
@@ -375,17 +423,21 @@ def datos_global_data(pais_seleccionado, sesion_activa):
 # Funciones OAG
 ###############
 
-def obtener_datos_oag(pais_seleccionado, session):
+def obtener_datos_oag(pais_seleccionado, session, consultas_elegidas=None):
     """
     Ejecuta múltiples consultas relacionadas con OAG para un país seleccionado y devuelve los resultados.
 
     Parámetros:
-    - pais_seleccionado (str): Nombre del país seleccionado.
+    - pais_seleccionado (str o list): Nombre del país seleccionado o lista de países (modo comparación).
     - session: Objeto de conexión activo a Snowflake.
+    - consultas_elegidas (list, opcional): Nombres de las consultas a ejecutar. Por defecto todas.
 
     Retorna:
     - dict: Diccionario donde las claves son los nombres descriptivos de las consultas y los valores son DataFrames con los resultados.
     """
+    # Condición de filtro sobre las llaves enteras de país (ID_PAIS IN (...) en modo comparación)
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
+
     # Diccionario de consultas con el parámetro dinámico `pais_seleccionado`
     consultas = {
         "conectividad_mundo": f"""
@@ -395,24 +447,27 @@ def obtener_datos_oag(pais_seleccionado, session):
                 SUBSTR(TIME_SERIES, 1, 4) AS YEAR,
                 FRECUENCIAS,
                 SILLAS
-            FROM REPOSITORIO_TURISMO.VISTAS.OAG_CONECTIVIDAD_MUNDO
-            WHERE PAIS_DEPARTURE = '{pais_seleccionado}'
-                AND PAIS_ARRIVAL <> '{pais_seleccionado}';
+            FROM REPOSITORIO_TURISMO.SERVICIO.OAG_CONECTIVIDAD_MUNDO
+            WHERE ID_PAIS_DEPARTURE {filtro_paises}
+                AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE;
         """,
         "conectividad_hacia_colombia": f"""
             SELECT PAIS_DEPARTURE,
                 INITCAP(MUNICIPIO_DANE) AS MUNICIPIO_DANE,
-                INITCAP(DEPARTAMENTO_DANE) AS DEPARTAMENTO_DANE,
                 TIME_SERIES,
                 SUBSTR(TIME_SERIES, 1, 4) AS YEAR,
                 FRECUENCIAS,
                 SILLAS
-            FROM REPOSITORIO_TURISMO.VISTAS.OAG_CONECTIVIDAD_COLOMBIA
-            WHERE PAIS_DEPARTURE = '{pais_seleccionado}'
-                AND PAIS_ARRIVAL <> '{pais_seleccionado}';
+            FROM REPOSITORIO_TURISMO.SERVICIO.OAG_CONECTIVIDAD_COLOMBIA
+            WHERE ID_PAIS_DEPARTURE {filtro_paises}
+                AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE;
         """
     }
 
+    # Ejecutar únicamente las consultas elegidas (por ejemplo, en el modo de procesamiento en el warehouse)
+    if consultas_elegidas is not None:
+        consultas = {nombre: query for nombre, query in consultas.items() if nombre in consultas_elegidas}
+
     # Inicializar el objeto para almacenar los resultados
     resultados = {}
 
@@ -537,7 +592,7 @@ def procesar_datos_oag(dataframes):
             df_top_otros['MES'] = df_top_otros['TIME_SERIES'].dt.month
 
             # Obtener nombre de mes
-            df_top_otros['MES_NAME'] = df_top_otros['TIME_SERIES'].dt.month_name(locale='es_ES.UTF-8')
+            df_top_otros['MES_NAME'] = serie_nombre_mes(df_top_otros['TIME_SERIES'])
 
             # Filtrar años de interés
             df_distribucion_corrido = df_top_otros[df_top_otros['FECHA'].isin([2023, 2024])].copy()
@@ -693,7 +748,7 @@ def procesar_datos_oag(dataframes):
             df_top_otros['MES'] = df_top_otros['TIME_SERIES'].dt.month
 
             # Obtener nombre de mes
-            df_top_otros['MES_NAME'] = df_top_otros['TIME_SERIES'].dt.month_name(locale='es_ES.UTF-8')
+            df_top_otros['MES_NAME'] = serie_nombre_mes(df_top_otros['TIME_SERIES'])
 
             # Filtrar años de interés
             df_distribucion_corrido = df_top_otros[df_top_otros['FECHA'].isin([2023, 2024])].copy()
@@ -803,47 +858,102 @@ def datos_oag(pais_seleccionado, sesion_activa):
 # Funciones Forward Keys
 ########################
 
+# Granos disponibles de las tablas agregadas de Forward Keys, del más grueso al más fino. Los gráficos son mensuales,
+# por lo que solo se materializa el grano mensual (un grano más fino se agrega aquí y en creacion_vistas.sql)
+GRANOS_FORWARD_KEYS = ['MES']
+
+# Granos con los que se puede construir cada resolución
+GRANOS_COMPATIBLES_FORWARD_KEYS = {
+    'MES': ('MES',)
+}
+
+# Resolución que necesitan los gráficos de cada consulta de Forward Keys
+RESOLUCION_GRAFICOS_FORWARD_KEYS = {
+    'reservas_aereas': 'MES',
+    'busquedas_aereas': 'MES'
+}
+
+def seleccionar_grano_forward_keys(resolucion):
+    """
+    Selecciona el grano más grueso de las tablas agregadas de Forward Keys que permite construir una resolución.
+
+    Parámetros:
+    - resolucion (str): Resolución requerida por el gráfico (por ahora solo 'MES').
+
+    Retorna:
+    - str: Grano de la tabla a consultar.
+
+    Excepciones:
+    - ValueError: Si ninguna tabla agregada permite construir la resolución.
+    """
+    compatibles = GRANOS_COMPATIBLES_FORWARD_KEYS.get(resolucion, ())
+    for grano in GRANOS_FORWARD_KEYS:
+        if grano in compatibles:
+            return grano
+    raise ValueError(f"No hay una tabla agregada de Forward Keys para la resolución '{resolucion}'.")
+
+def inicio_ventana_busquedas_forward_keys(grano):
+    """
+    Retorna la expresión SQL del inicio de la ventana de búsquedas (últimos 14 meses).
+    Si el grano es mensual, la ventana empieza al inicio del mes para no traer un mes parcial.
+
+    Parámetros:
+    - grano (str): Grano de la tabla consultada (ver GRANOS_FORWARD_KEYS).
+
+    Retorna:
+    - str: Expresión SQL de la fecha de inicio.
+    """
+    inicio_ventana = "DATEADD(MONTH, -14, CURRENT_DATE())"
+    if grano == 'MES':
+        inicio_ventana = f"DATE_TRUNC('MONTH', {inicio_ventana})"
+    return inicio_ventana
+
 def obtener_datos_forward_keys(pais_seleccionado, session):
     """
     Ejecuta múltiples consultas relacionadas con Forward Keys para un país seleccionado y devuelve los resultados.
+    Cada consulta lee la tabla agregada más gruesa que satisface la resolución de sus gráficos
+    (ver RESOLUCION_GRAFICOS_FORWARD_KEYS), en lugar de la serie diaria con todas las dimensiones.
 
     Parámetros:
-    - pais_seleccionado (str): Nombre del país seleccionado.
+    - pais_seleccionado (str o list): Nombre del país seleccionado o lista de países (modo comparación).
     - session: Objeto de conexión activo a Snowflake.
 
     Retorna:
     - dict: Diccionario donde las claves son los nombres descriptivos de las consultas y los valores son DataFrames con los resultados.
     """
 
-    # Diccionario de consultas con el parámetro `pais_seleccionado`
+    # Condición de filtro sobre las llaves enteras de país (ID_PAIS IN (...) en modo comparación)
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
+
+    # Grano de cada consulta
+    grano_reservas = seleccionar_grano_forward_keys(RESOLUCION_GRAFICOS_FORWARD_KEYS['reservas_aereas'])
+    grano_busquedas = seleccionar_grano_forward_keys(RESOLUCION_GRAFICOS_FORWARD_KEYS['busquedas_aereas'])
 
+    # Ventana de búsquedas de los últimos 14 meses
+    inicio_ventana_busquedas = inicio_ventana_busquedas_forward_keys(grano_busquedas)
+
+    # Diccionario de consultas con el parámetro `pais_seleccionado`
     consultas = {
         "reservas_aereas": f"""
             SELECT 
                 PAIS_DEPARTURE, 
                 PAIS_ARRIVAL,
-                FLIGHT_LEG_ARRIVAL_DATE,
-                DATE_TRUNC('MONTH', TO_DATE(FLIGHT_LEG_ARRIVAL_DATE, 'YYYY-MM-DD')) AS FECHA_USABLE,
-                LOS_AT_DESTINATION_NIGHTS,
-                CLASE_CABINA,
-                PERFIL_PASAJERO,
+                FECHA_USABLE,
                 RESERVAS
-            FROM REPOSITORIO_TURISMO.VISTAS.FORWARDKEYS_RESERVAS_PAISES
-            WHERE PAIS_DEPARTURE = '{pais_seleccionado}'
-            ORDER BY TO_DATE(FLIGHT_LEG_ARRIVAL_DATE, 'YYYY-MM-DD') ASC
-            ;
+            FROM REPOSITORIO_TURISMO.SERVICIO.FORWARDKEYS_RESERVAS_{grano_reservas}
+            WHERE ID_PAIS_DEPARTURE {filtro_paises}
+            ORDER BY FECHA_USABLE ASC;
         """,
         "busquedas_aereas": f"""
             SELECT 
                 PAIS_DEPARTURE,
                 PAIS_ARRIVAL,
-                SEARCH_DATE,
-                DATE_TRUNC('MONTH', TO_DATE(SEARCH_DATE, 'YYYY-MM-DD')) AS FECHA_USABLE,
+                FECHA_USABLE,
                 BUSQUEDAS
-            FROM REPOSITORIO_TURISMO.VISTAS.FORWARDKEYS_BUSQUEDAS_PAISES
-            WHERE TO_DATE(SEARCH_DATE, 'YYYY-MM-DD') BETWEEN DATEADD(MONTH, -14, CURRENT_DATE()) AND CURRENT_DATE()
-            AND PAIS_DEPARTURE = '{pais_seleccionado}'
-            ORDER BY TO_DATE(SEARCH_DATE, 'YYYY-MM-DD') ASC;
+            FROM REPOSITORIO_TURISMO.SERVICIO.FORWARDKEYS_BUSQUEDAS_{grano_busquedas}
+            WHERE FECHA_USABLE BETWEEN {inicio_ventana_busquedas} AND CURRENT_DATE()
+            AND ID_PAIS_DEPARTURE {filtro_paises}
+            ORDER BY FECHA_USABLE ASC;
         """
     }
 
@@ -883,8 +993,8 @@ def procesar_datos_forward_keys(dataframes):
         df_reservas = dataframes.get('reservas_aereas', pd.DataFrame())
         if not df_reservas.empty:
 
-            # Crear una fecha con formato date
-            df_reservas["FECHA_USABLE"] = pd.to_datetime(df_reservas["FECHA_USABLE"])
+            # Crear una fecha con formato date (inicio de mes)
+            df_reservas["FECHA_USABLE"] = pd.to_datetime(df_reservas["FECHA_USABLE"]).dt.to_period('M').dt.to_timestamp()
 
             # Cambiar nombre de la columna
             df_reservas = df_reservas.rename(columns={'FECHA_USABLE' : 'MES_ANIO'})
@@ -925,8 +1035,8 @@ def procesar_datos_forward_keys(dataframes):
         df_busquedas = dataframes.get('busquedas_aereas', pd.DataFrame())
         if not df_busquedas.empty:
 
-            # Crear una fecha con formato date
-            df_busquedas["FECHA_USABLE"] = pd.to_datetime(df_busquedas["FECHA_USABLE"])
+            # Crear una fecha con formato date (inicio de mes)
+            df_busquedas["FECHA_USABLE"] = pd.to_datetime(df_busquedas["FECHA_USABLE"]).dt.to_period('M').dt.to_timestamp()
 
             # Cambiar nombre de la columna
             df_busquedas = df_busquedas.rename(columns={'FECHA_USABLE' : 'MES_ANIO'})
@@ -1018,27 +1128,28 @@ def obtener_datos_credibanco(pais_seleccionado, session):
     Ejecuta múltiples consultas relacionadas con Credibanco para un país seleccionado y devuelve los resultados.
 
     Parámetros:
-    - pais_seleccionado (str): Nombre del país seleccionado.
+    - pais_seleccionado (str o list): Nombre del país seleccionado o lista de países (modo comparación).
     - session: Objeto de conexión activo a Snowflake.
 
     Retorna:
     - dict: Diccionario donde las claves son los nombres descriptivos de las consultas y los valores son DataFrames con los resultados.
     """
 
-    # Diccionario de consultas con el parámetro `pais_seleccionado`
+    # Condición de filtro sobre las llaves enteras de país (ID_PAIS IN (...) en modo comparación)
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
 
+    # Diccionario de consultas con el parámetro `pais_seleccionado`
     consultas = {
         "gasto_tarjeta_credito": f"""
             SELECT ANIO AS YEAR,
                 PAIS,
                 CATEGORIA,
                 CLASIFICACION_CATEGORIA_FORMATADA,
-                FACTURACION_COP,
                 FACTURACION_USD,
                 TURISTAS AS VIAJEROS,
                 TRANSACCIONES
-            FROM REPOSITORIO_TURISMO.VISTAS.CREDIBANCO_GASTO
-            WHERE PAIS = '{pais_seleccionado}';
+            FROM REPOSITORIO_TURISMO.SERVICIO.CREDIBANCO_GASTO
+            WHERE ID_PAIS {filtro_paises};
         """
     }
 
@@ -1242,33 +1353,37 @@ def datos_credibanco(pais_seleccionado, sesion_activa):
 def obtener_datos_iata_gap(pais_seleccionado, session):
     """
     Ejecuta múltiples consultas relacionadas con IATA-GAP para un país seleccionado y devuelve los resultados.
+    Los conteos exactos de agencias por año (SERVICIO.IATAGAP_AGENCIAS_PAIS) y por ciudad y año, con el top de
+    ciudades y el grupo "Otros" (SERVICIO.IATAGAP_AGENCIAS_CIUDADES), se calculan al materializar la capa de servicio,
+    por lo que las consultas solo filtran por país y también se responden desde la réplica local.
 
     Parámetros:
-    - pais_seleccionado (str): Nombre del país seleccionado.
+    - pais_seleccionado (str o list): Nombre del país seleccionado o lista de países (modo comparación).
     - session: Objeto de conexión activo a Snowflake.
 
     Retorna:
     - dict: Diccionario donde las claves son los nombres descriptivos de las consultas y los valores son DataFrames con los resultados.
     """
 
-    # Diccionario de consultas con el parámetro `pais_seleccionado`
+    # Condición de filtro sobre las llaves enteras de país (ID_PAIS IN (...) en modo comparación)
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
 
+    # Diccionario de consultas con el parámetro `pais_seleccionado`
     consultas = {
         "indicadores_agencias": f"""
             SELECT PAIS_AGENCIA,
-                YY AS YEAR,
-                COUNT(DISTINCT AGENCIAS) AS AGENCIAS 
-            FROM REPOSITORIO_TURISMO.VISTAS.IATAGAP_AGENCIAS
-            WHERE PAIS_AGENCIA = '{pais_seleccionado}'
-            GROUP BY PAIS_AGENCIA, YY;
+                YEAR,
+                AGENCIAS
+            FROM REPOSITORIO_TURISMO.SERVICIO.IATAGAP_AGENCIAS_PAIS
+            WHERE ID_PAIS_AGENCIA {filtro_paises};
         """,
         "ciudades_agencias": f"""
-            SELECT INITCAP(TRAVEL_AGENCY_CITY) AS TRAVEL_AGENCY_CITY,
-                YY AS YEAR,
-                COUNT(DISTINCT AGENCIAS) AS AGENCIAS
-            FROM REPOSITORIO_TURISMO.VISTAS.IATAGAP_AGENCIAS
-            WHERE PAIS_AGENCIA = '{pais_seleccionado}'
-            GROUP BY TRAVEL_AGENCY_CITY, YY;
+            SELECT PAIS_AGENCIA,
+                TRAVEL_AGENCY_CITY,
+                YEAR,
+                AGENCIAS
+            FROM REPOSITORIO_TURISMO.SERVICIO.IATAGAP_AGENCIAS_CIUDADES
+            WHERE ID_PAIS_AGENCIA {filtro_paises};
         """
     }
 
@@ -1323,32 +1438,14 @@ def procesar_datos_iata_gap(dataframes):
         df_ciudades = dataframes.get('ciudades_agencias', pd.DataFrame())
         if not df_ciudades.empty:
 
-            # Obtener el top 10 de ciudades con más agencias
-            
-            # Distribución agregada de agencias por ciudad
-            df_agencias_total = pd.DataFrame(df_ciudades.groupby('TRAVEL_AGENCY_CITY')[['AGENCIAS']].sum()).reset_index()
-
-            # Seleccionar el top 5 de agencias por ciudad
-            top_5_agencias = df_agencias_total.nlargest(15, 'AGENCIAS')['TRAVEL_AGENCY_CITY']
-
-            # Obtener el número de ciudades
-            num_ciudades = len(df_agencias_total['TRAVEL_AGENCY_CITY'].unique())
-
-            # Crear el nuevo DataFrame con top 10 y agrupar los demás bajo "Otros"
-            if num_ciudades <= 10:
-                # Si hay 10 ciudades o menos, no se agrupan bajo "Otros"
-                df_top_otros = df_ciudades.copy()
-            else:
-                # Si hay más de 10 ciudades, agrupar los demás como "Otros"
-                df_top_otros = df_ciudades.copy()
-                df_top_otros['TRAVEL_AGENCY_CITY'] = df_top_otros['TRAVEL_AGENCY_CITY'].apply(
-                    lambda ciudad: ciudad if ciudad in top_5_agencias.values else 'Otros'
-                )
+            # El país de la agencia solo se usa para separar los resultados en el modo comparación
+            df_ciudades = df_ciudades.drop(columns=['PAIS_AGENCIA'], errors='ignore')
 
-                # Agrupar por año y ciudad, sumando USD
-                df_top_otros = df_top_otros.groupby(['YEAR', 'TRAVEL_AGENCY_CITY'], as_index=False).agg({
-                    'AGENCIAS': 'sum'
-                })
+            # El top de ciudades y el grupo "Otros" ya vienen calculados en SERVICIO.IATAGAP_AGENCIAS_CIUDADES,
+            # por lo que aquí solo se asegura una fila por año y ciudad
+            df_top_otros = df_ciudades.groupby(['YEAR', 'TRAVEL_AGENCY_CITY'], as_index=False).agg({
+                'AGENCIAS': 'sum'
+            })
             
             # Participación
             df_top_otros['TOTAL_ANUAL'] = df_top_otros.groupby('YEAR')['AGENCIAS'].transform('sum')
@@ -1408,6 +1505,140 @@ def datos_iata_gap(pais_seleccionado, sesion_activa):
         print(f"Error al obtener o procesar datos de IATA GAP para el país {pais_seleccionado}: {str(e)}")
         return {}
 
+######################################
+# Funciones de comparación entre países
+######################################
+
+# Columna que identifica el país en el resultado de cada consulta, por fuente
+COLUMNAS_PAIS = {
+    'df_global_data': {
+        'viajeros_hacia_el_mundo': 'PAIS',
+        'noches_pernoctacion_promedio': 'PAIS',
+        'gasto_categorias': 'PAIS',
+        'rango_edad': 'PAIS',
+        'motivo_viaje': 'PAIS',
+        'forma_viaje': 'PAIS',
+        'destinos_internacionales': 'PAIS_ORIGEN',
+        'flujos_negocios': 'PAIS'
+    },
+    'df_oag': {
+        'conectividad_mundo': 'PAIS_DEPARTURE',
+        'conectividad_hacia_colombia': 'PAIS_DEPARTURE'
+    },
+    'df_fk': {
+        'reservas_aereas': 'PAIS_DEPARTURE',
+        'busquedas_aereas': 'PAIS_DEPARTURE'
+    },
+    'df_credibanco': {
+        'gasto_tarjeta_credito': 'PAIS'
+    },
+    'df_iata': {
+        'indicadores_agencias': 'PAIS_AGENCIA',
+        'ciudades_agencias': 'PAIS_AGENCIA'
+    }
+}
+
+def separar_por_pais(dataframes, columnas_pais, paises):
+    """
+    Separa los resultados de consultas de varios países en un diccionario por país, con un único groupby por DataFrame.
+
+    Parámetros:
+    - dataframes (dict): Diccionario {nombre_consulta: DataFrame} con los datos de todos los países.
+    - columnas_pais (dict): Diccionario {nombre_consulta: columna} con la columna que identifica el país.
+    - paises (list): Lista de países a separar.
+
+    Retorna:
+    - dict: Diccionario {pais: {nombre_consulta: DataFrame}}. Los países sin datos reciben DataFrames vacíos.
+    """
+    resultados = {pais: {} for pais in paises}
+
+    for nombre_consulta, df in dataframes.items():
+        columna = columnas_pais.get(nombre_consulta)
+
+        # Sin datos o sin columna de país: DataFrame vacío para todos los países
+        if df.empty or columna not in df.columns:
+            for pais in paises:
+                resultados[pais][nombre_consulta] = pd.DataFrame()
+            continue
+
+        grupos = {pais: df_pais.reset_index(drop=True) for pais, df_pais in df.groupby(columna, sort=False)}
+        for pais in paises:
+            resultados[pais][nombre_consulta] = grupos.get(pais, pd.DataFrame())
+
+    return resultados
+
+# Fuentes del modo comparación: llave de resultado, función de consulta, función de procesamiento y columna de país por consulta
+FUENTES_COMPARACION = [
+    ('df_global_data', obtener_datos_global_data, procesar_datos_global_data, COLUMNAS_PAIS['df_global_data']),
+    ('df_oag', obtener_datos_oag, procesar_datos_oag, COLUMNAS_PAIS['df_oag']),
+    ('df_fk', obtener_datos_forward_keys, procesar_datos_forward_keys, COLUMNAS_PAIS['df_fk']),
+    ('df_credibanco', obtener_datos_credibanco, procesar_datos_credibanco, COLUMNAS_PAIS['df_credibanco']),
+    ('df_iata', obtener_datos_iata_gap, procesar_datos_iata_gap, COLUMNAS_PAIS['df_iata'])
+]
+
+def datos_comparacion_paises(paises, sesion_activa, fuentes=None):
+    """
+    Obtiene y procesa los datos de todas las fuentes para varios países a la vez.
+    Se ejecuta una sola consulta por fuente con `PAIS IN (...)` y el resultado se separa por país
+    antes de aplicar el mismo procesamiento que en la vista de un solo país.
+
+    Parámetros:
+    - paises (list): Lista de países a comparar.
+    - sesion_activa: Objeto de conexión activo a Snowflake.
+    - fuentes (list, opcional): Fuentes a procesar (por defecto FUENTES_COMPARACION). El modo warehouse
+      reemplaza las funciones de OAG y Forward Keys (datos_comparacion_paises_modo).
+
+    Retorna:
+    - dict: Diccionario {pais: {'df_global_data', 'df_oag', 'df_fk', 'df_credibanco', 'df_iata'}}
+      con los mismos diccionarios de DataFrames procesados que retornan las funciones datos_*.
+    """
+    fuentes = fuentes or FUENTES_COMPARACION
+
+    resultados = {pais: {} for pais in paises}
+
+    for llave, obtener, procesar, columnas_pais in fuentes:
+        try:
+            # Paso 1: Obtener los datos de todos los países en una sola consulta por fuente
+            print(f"Obteniendo datos de {llave} para los países: {', '.join(paises)}...")
+            datos_obtenidos = obtener(paises, sesion_activa)
+
+            # Paso 2: Separar por país y procesar cada grupo
+            datos_por_pais = separar_por_pais(datos_obtenidos, columnas_pais, paises)
+            for pais in paises:
+                resultados[pais][llave] = procesar(datos_por_pais[pais])
+
+        except Exception as e:
+            # Manejo de errores: la fuente queda vacía para todos los países
+            print(f"Error al obtener o procesar datos de {llave} para los países {paises}: {str(e)}")
+            for pais in paises:
+                resultados[pais][llave] = {}
+
+    return resultados
+
+def unir_series_paises(datos_comparacion, fuente, llave, columna_pais='País de origen'):
+    """
+    Une en un solo DataFrame un mismo resultado procesado de varios países, agregando una columna con el país.
+
+    Parámetros:
+    - datos_comparacion (dict): Resultado de datos_comparacion_paises.
+    - fuente (str): Llave de la fuente (por ejemplo, 'df_global_data').
+    - llave (str): Llave del DataFrame procesado (por ejemplo, 'viajeros_serie_tiempo').
+    - columna_pais (str): Nombre de la columna con el país. Por defecto 'País de origen'.
+
+    Retorna:
+    - pd.DataFrame: DataFrame con los datos de todos los países (vacío si ningún país tiene datos).
+    """
+    partes = []
+    for pais, datos_pais in datos_comparacion.items():
+        df = datos_pais.get(fuente, {}).get(llave, pd.DataFrame())
+        if not df.empty:
+            partes.append(df.assign(**{columna_pais: pais}))
+
+    if not partes:
+        return pd.DataFrame()
+
+    return pd.concat(partes, ignore_index=True)
+
 def calcular_tasa_variacion(valor_actual, valor_anterior):
     """
     Calcula la tasa de variación entre dos valores y la devuelve con dos decimales en formato numérico con coma decimal.
@@ -1442,7 +1673,7 @@ def calcular_tasa_variacion(valor_actual, valor_anterior):
         tasa_variacion = ((valor_actual - valor_anterior) / valor_anterior) * 100
 
         # Retornar el resultado formateado con dos decimales y coma decimal
-        return f"{tasa_variacion:,.2f}".replace(".", ",") + " %"
+        return formato_numero(tasa_variacion, decimales=2, sufijo=" %")
     
     except (ValueError, TypeError):
         return None
@@ -1493,9 +1724,7 @@ def filtrar_df_top_n(df: pd.DataFrame, year: int, categoria: str, top_n: int) ->
     df_copy = df_copy.nlargest(top_n, "Participación (%)")
 
     # 5) Formatear la columna "Participación (%)" usando la función formato_miles
-    df_copy["Participación (%)"] = df_copy["Participación (%)"].apply(
-        lambda x: formato_miles(valor=x, decimales=2)
-    )
+    df_copy["Participación (%)"] = formato_serie(df_copy["Participación (%)"], decimales=2)
 
     # 6) Transformar la columna de categoria
     df_copy[categoria] = df_copy[categoria].str.lower()
@@ -2198,20 +2427,21 @@ def oag_bullets_paises_con_frecuencias(year_oag_t, pais_elegido, sesion_activa):
         en el año analizado. Si no hay datos disponibles, retorna None.
     """
 
-    # Número de países con frecuencias
-
-    # Constuir consulta
-    query_paises_con_frecuencias = f"""
-    SELECT COUNT(DISTINCT PAIS_ARRIVAL) AS PAISES
-    FROM REPOSITORIO_TURISMO.VISTAS.OAG_CONECTIVIDAD_MUNDO
-    WHERE PAIS_DEPARTURE = '{pais_elegido}'
-        AND PAIS_ARRIVAL <> '{pais_elegido}'
-        AND SUBSTR(TIME_SERIES, 1, 4) = {year_oag_t}
-    """
+    # Número de países con frecuencias (precalculado en el cargue en la tabla de referencias entre países)
 
     # Ejecutar
     try:
-        df_paises_con_frecuencias = pd.DataFrame(sesion_activa.sql(query_paises_con_frecuencias).collect())
+        # Constuir consulta sobre la llave entera del país
+        filtro_pais = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_elegido, sesion_activa))
+        query_paises_con_frecuencias = f"""
+        SELECT VALOR AS PAISES
+        FROM REPOSITORIO_TURISMO.SERVICIO.{TABLA_BENCHMARK}
+        WHERE ID_PAIS {filtro_pais}
+            AND FUENTE = 'OAG'
+            AND INDICADOR = 'PAISES_CONECTADOS'
+            AND YEAR = {int(year_oag_t)}
+        """
+        df_paises_con_frecuencias = snowflake_analitica.ejecutar_consulta_segura(query_paises_con_frecuencias, sesion_activa)
     except:
         df_paises_con_frecuencias = pd.DataFrame()
 
@@ -2329,12 +2559,9 @@ def fk_mundo_bullets_reservas_aereas_mex_cost_chi_per(df_fk, pais_elegido):
     # Procesar si no llegan vacíos
     if not df_reservas_aereas_mex_cost_chi_per.empty:
 
-        # En español:
-        locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-
         # Extraer meses
-        mes_min = df_reservas_aereas_mex_cost_chi_per["Fecha"].min().strftime("%B")
-        mes_max = df_reservas_aereas_mex_cost_chi_per["Fecha"].max().strftime("%B")
+        mes_min = nombre_mes(df_reservas_aereas_mex_cost_chi_per["Fecha"].min())
+        mes_max = nombre_mes(df_reservas_aereas_mex_cost_chi_per["Fecha"].max())
         year = df_reservas_aereas_mex_cost_chi_per["Fecha"].max().strftime("%Y")
 
         # Calcular reservas
@@ -2346,7 +2573,7 @@ def fk_mundo_bullets_reservas_aereas_mex_cost_chi_per(df_fk, pais_elegido):
             df_reservas_agrupadas['Participación (%)'] = (df_reservas_agrupadas['Reservas'] / total_reservas) * 100
 
             # Formatear la columna "Participación (%)" usando la función formato_miles
-            df_reservas_agrupadas["Participación (%)"] = df_reservas_agrupadas["Participación (%)"].apply(lambda x: formato_miles(valor=x, decimales=2))
+            df_reservas_agrupadas["Participación (%)"] = formato_serie(df_reservas_agrupadas["Participación (%)"], decimales=2)
 
             # Ordenar de mayor a menor por la columna 'Reservas'
             df_reservas_agrupadas = df_reservas_agrupadas.sort_values(by='Reservas', ascending=False)
@@ -2403,14 +2630,11 @@ def fk_mundo_bullets_busquedas_aereas_mex_cost_chi_per(df_fk, pais_elegido):
     # Procesar si no llegan vacíos
     if not df_busquedas_aereas_mex_cost_chi_per.empty:
 
-        # En español:
-        locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-
         # Extraer meses
         year_min = df_busquedas_aereas_mex_cost_chi_per["Fecha"].min().strftime("%Y")
-        mes_min = df_busquedas_aereas_mex_cost_chi_per["Fecha"].min().strftime("%B")
+        mes_min = nombre_mes(df_busquedas_aereas_mex_cost_chi_per["Fecha"].min())
 
-        mes_max = df_busquedas_aereas_mex_cost_chi_per["Fecha"].max().strftime("%B")
+        mes_max = nombre_mes(df_busquedas_aereas_mex_cost_chi_per["Fecha"].max())
         year_max = df_busquedas_aereas_mex_cost_chi_per["Fecha"].max().strftime("%Y")
 
         # Calcular busquedas
@@ -2422,7 +2646,7 @@ def fk_mundo_bullets_busquedas_aereas_mex_cost_chi_per(df_fk, pais_elegido):
             df_busquedas_agrupadas['Participación (%)'] = (df_busquedas_agrupadas['Búsquedas'] / total_busquedas) * 100
 
             # Formatear la columna "Participación (%)" usando la función formato_miles
-            df_busquedas_agrupadas["Participación (%)"] = df_busquedas_agrupadas["Participación (%)"].apply(lambda x: formato_miles(valor=x, decimales=2))
+            df_busquedas_agrupadas["Participación (%)"] = formato_serie(df_busquedas_agrupadas["Participación (%)"], decimales=2)
 
             # Ordenar de mayor a menor por la columna 'Reservas'
             df_busquedas_agrupadas = df_busquedas_agrupadas.sort_values(by='Búsquedas', ascending=False)
@@ -2852,12 +3076,9 @@ def fk_colombia_bullets_reservas_aereas_colombia(df_fk, pais_elegido):
     # Procesar si no llegan vacíos
     if not df_reservas_aereas_colombia.empty:
 
-        # En español:
-        locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-
         # Extraer meses
-        mes_min = df_reservas_aereas_colombia["Fecha"].min().strftime("%B")
-        mes_max = df_reservas_aereas_colombia["Fecha"].max().strftime("%B")
+        mes_min = nombre_mes(df_reservas_aereas_colombia["Fecha"].min())
+        mes_max = nombre_mes(df_reservas_aereas_colombia["Fecha"].max())
         year = df_reservas_aereas_colombia["Fecha"].max().strftime("%Y")
 
         # Calcular reservas
@@ -2905,14 +3126,11 @@ def fk_colombia_bullets_busquedas_aereas_colombia(df_fk, pais_elegido):
     # Procesar si no llegan vacíos
     if not df_busquedas_aereas_colombia.empty:
 
-        # En español:
-        locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-
         # Extraer meses
         year_min = df_busquedas_aereas_colombia["Fecha"].min().strftime("%Y")
-        mes_min = df_busquedas_aereas_colombia["Fecha"].min().strftime("%B")
+        mes_min = nombre_mes(df_busquedas_aereas_colombia["Fecha"].min())
 
-        mes_max = df_busquedas_aereas_colombia["Fecha"].max().strftime("%B")
+        mes_max = nombre_mes(df_busquedas_aereas_colombia["Fecha"].max())
         year_max = df_busquedas_aereas_colombia["Fecha"].max().strftime("%Y")
 
         # Calcular busquedas
@@ -2933,6 +3151,156 @@ def fk_colombia_bullets_busquedas_aereas_colombia(df_fk, pais_elegido):
     return bullet_busquedas_aereas_colombia
 
 
+###################################################
+# Funciones de referencias entre países (benchmark)
+###################################################
+
+# Tabla de referencias entre países calculada en el cargue (una fila por país, fuente, indicador y año)
+TABLA_BENCHMARK = 'BENCHMARK_PAISES'
+
+def obtener_benchmark_pais(pais_seleccionado, session):
+    """
+    Obtiene en una sola consulta las filas precalculadas de referencias entre países (posición, número de países,
+    percentil, participación en el total y promedios regional y mundial) del país seleccionado para todos los
+    indicadores y años. Evita agregar los datos de todos los países cada vez que se consulta un país.
+
+    Parámetros:
+    - pais_seleccionado (str o list): Nombre del país o lista de países.
+    - session: Objeto de conexión activo a Snowflake.
+
+    Retorna:
+    - pd.DataFrame: Columnas FUENTE, INDICADOR, YEAR, VALOR, RANKING, PAISES_RANKING, PERCENTIL, PARTICIPACION,
+      PROMEDIO_REGION y PROMEDIO_MUNDO. Vacío si no hay datos o si ocurre un error.
+    """
+    try:
+        filtro_pais = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
+        query = f"""
+            SELECT FUENTE, INDICADOR, YEAR, VALOR, RANKING, PAISES_RANKING, PERCENTIL, PARTICIPACION, PROMEDIO_REGION, PROMEDIO_MUNDO
+            FROM REPOSITORIO_TURISMO.SERVICIO.{TABLA_BENCHMARK}
+            WHERE ID_PAIS {filtro_pais}
+        """
+        return snowflake_analitica.ejecutar_consulta_segura(query, session)
+    except Exception as e:
+        print(f"No fue posible obtener las referencias entre países de {pais_seleccionado}: {str(e)}")
+        return pd.DataFrame()
+
+def fila_benchmark(df_benchmark, indicador, year):
+    """
+    Retorna la fila de un indicador y año de las referencias entre países, o None si no existe.
+    """
+    if df_benchmark is None or df_benchmark.empty or year is None:
+        return None
+
+    df_fila = df_benchmark[(df_benchmark['INDICADOR'] == indicador) & (df_benchmark['YEAR'].astype(int) == int(year))]
+    if df_fila.empty:
+        return None
+    return df_fila.iloc[0]
+
+def global_data_bullets_ranking_colombia(df_benchmark, year_global_data_t, pais_elegido):
+
+    """
+    Genera un texto en formato bullet con la posición del país entre los mercados emisores de viajeros hacia Colombia
+    y la participación de Colombia en los viajeros del país hacia la región, a partir de las referencias precalculadas.
+
+    Parámetros:
+    -----------
+    df_benchmark : pd.DataFrame
+        Referencias entre países del país seleccionado (obtener_benchmark_pais).
+    year_global_data_t : int
+        Año de análisis.
+    pais_elegido : str
+        Nombre del país seleccionado.
+
+    Retorna:
+    --------
+    str o None
+        El texto del bullet, o None si no hay datos.
+    """
+
+    fila_viajeros = fila_benchmark(df_benchmark, 'VIAJEROS_COLOMBIA', year_global_data_t)
+    fila_participacion = fila_benchmark(df_benchmark, 'PARTICIPACION_COLOMBIA', year_global_data_t)
+
+    if fila_viajeros is None:
+        return None
+
+    # Posición entre los mercados emisores
+    bullet_ranking_colombia = (
+        f"En {year_global_data_t}, {pais_elegido} ocupó el puesto {int(fila_viajeros['RANKING'])} entre {int(fila_viajeros['PAISES_RANKING'])} "
+        f"mercados emisores de viajeros hacia Colombia, con {formato_miles(valor=fila_viajeros['VALOR'], decimales=0)} viajeros "
+        f"({formato_miles(valor=fila_viajeros['PARTICIPACION'], decimales=2)}% del total)."
+    )
+
+    # Peso de Colombia en los viajeros del país frente al promedio de su región
+    if fila_participacion is not None:
+        bullet_ranking_colombia += (
+            f" Colombia recibió el {formato_miles(valor=fila_participacion['VALOR'], decimales=2)}% de sus viajeros hacia la región, "
+            f"frente a un promedio regional de {formato_miles(valor=fila_participacion['PROMEDIO_REGION'], decimales=2)}%."
+        )
+
+    return bullet_ranking_colombia
+
+def oag_bullets_ranking_sillas_colombia(df_benchmark, year_oag_t, pais_elegido):
+
+    """
+    Genera un texto en formato bullet con la posición del país entre los mercados de origen por sillas aéreas
+    directas hacia Colombia, a partir de las referencias precalculadas.
+
+    Parámetros:
+    -----------
+    df_benchmark : pd.DataFrame
+        Referencias entre países del país seleccionado (obtener_benchmark_pais).
+    year_oag_t : int
+        Año de análisis.
+    pais_elegido : str
+        Nombre del país seleccionado.
+
+    Retorna:
+    --------
+    str o None
+        El texto del bullet, o None si no hay datos.
+    """
+
+    fila_sillas = fila_benchmark(df_benchmark, 'SILLAS_COLOMBIA', year_oag_t)
+
+    if fila_sillas is None:
+        return None
+
+    return (
+        f"En {year_oag_t}, {pais_elegido} ocupó el puesto {int(fila_sillas['RANKING'])} entre {int(fila_sillas['PAISES_RANKING'])} "
+        f"países de origen por sillas aéreas directas hacia Colombia, con el {formato_miles(valor=fila_sillas['PARTICIPACION'], decimales=2)}% del total."
+    )
+
+def credibanco_bullets_ranking_gasto(df_benchmark, year_credibanco_t, pais_elegido):
+
+    """
+    Genera un texto en formato bullet con la posición del país por gasto con tarjeta de crédito en Colombia
+    frente a todos los países de origen, a partir de las referencias precalculadas.
+
+    Parámetros:
+    -----------
+    df_benchmark : pd.DataFrame
+        Referencias entre países del país seleccionado (obtener_benchmark_pais).
+    year_credibanco_t : int
+        Año de análisis.
+    pais_elegido : str
+        Nombre del país seleccionado.
+
+    Retorna:
+    --------
+    str o None
+        El texto del bullet, o None si no hay datos.
+    """
+
+    fila_gasto = fila_benchmark(df_benchmark, 'GASTO_USD', year_credibanco_t)
+
+    if fila_gasto is None:
+        return None
+
+    return (
+        f"En {year_credibanco_t}, {pais_elegido} ocupó el puesto {int(fila_gasto['RANKING'])} entre {int(fila_gasto['PAISES_RANKING'])} "
+        f"países de origen por gasto con tarjeta de crédito en Colombia ({formato_miles(valor=fila_gasto['PARTICIPACION'], decimales=2)}% del total)."
+    )
+
 def obtener_bullets(df_global_data, year_global_data_t_1, year_global_data_t, pais_elegido, df_oag, year_oag_t_1, year_oag_t, sesion_activa, df_fk, df_credibanco, year_credibanco_t_1, year_credibanco_t):
 
     """
@@ -2977,6 +3345,12 @@ def obtener_bullets(df_global_data, year_global_data_t_1, year_global_data_t, pa
         si no hubo datos disponibles.
     """
 
+    #########################################
+    # Referencias entre países (una consulta)
+    #########################################
+
+    df_benchmark = obtener_benchmark_pais(pais_elegido, sesion_activa)
+
     ############
     # GlobalData
     ############
@@ -2991,6 +3365,7 @@ def obtener_bullets(df_global_data, year_global_data_t_1, year_global_data_t, pa
     bullet_gasto_promedio = global_data_bullets_gasto_promedio(df_global_data, year_global_data_t_1, year_global_data_t, pais_elegido)
     bullet_gasto_categoria = global_data_bullets_gasto_categoria(df_global_data, year_global_data_t, pais_elegido)
     bullet_mice = global_data_bullets_mice(df_global_data, year_global_data_t_1, year_global_data_t, pais_elegido)
+    bullet_ranking_viajeros_colombia = global_data_bullets_ranking_colombia(df_benchmark, year_global_data_t, pais_elegido)
 
     ###########
     # OAG Mundo
@@ -3013,6 +3388,7 @@ def obtener_bullets(df_global_data, year_global_data_t_1, year_global_data_t, pa
 
     bullet_frecuencias_colombia = oag_bullets_frecuencias_colombia(df_oag, year_oag_t_1, year_oag_t, pais_elegido)
     bullet_frecuencias_municipio_cerrado_t = oag_bullets_frecuencias_municipio_cerrado(df_oag, year_oag_t_1, pais_elegido)
+    bullet_ranking_sillas_colombia = oag_bullets_ranking_sillas_colombia(df_benchmark, year_oag_t, pais_elegido)
 
     ############
     # Credibanco
@@ -3022,6 +3398,7 @@ def obtener_bullets(df_global_data, year_global_data_t_1, year_global_data_t, pa
     bullet_gasto_directo_indirecto_credibanco_cerrado = credibanco_bullets_gasto_directo_indirecto_cerrado(df_credibanco, year_credibanco_t, pais_elegido)
     bullet_gasto_directo_cerrado = credibanco_bullets_gasto_directo_cerrado(df_credibanco, year_credibanco_t, pais_elegido)
     bullet_gasto_indirecto_cerrado = credibanco_bullets_gasto_indirecto_cerrado(df_credibanco, year_credibanco_t, pais_elegido)
+    bullet_ranking_gasto_credibanco = credibanco_bullets_ranking_gasto(df_benchmark, year_credibanco_t, pais_elegido)
 
     #############
     # FK Colombia
@@ -3043,6 +3420,7 @@ def obtener_bullets(df_global_data, year_global_data_t_1, year_global_data_t, pa
         "bullet_gasto_promedio": bullet_gasto_promedio,
         "bullet_gasto_categoria": bullet_gasto_categoria,
         "bullet_mice": bullet_mice,
+        "bullet_ranking_viajeros_colombia": bullet_ranking_viajeros_colombia,
         "bullet_frecuencias_mundo": bullet_frecuencias_mundo,
         "bullet_paises_con_frecuencias": bullet_paises_con_frecuencias,
         "bullet_frecuencias_destino_cerrado_t": bullet_frecuencias_destino_cerrado_t,
@@ -3050,10 +3428,12 @@ def obtener_bullets(df_global_data, year_global_data_t_1, year_global_data_t, pa
         "bullet_busquedas_aereas_mex_cost_chi_per": bullet_busquedas_aereas_mex_cost_chi_per,
         "bullet_frecuencias_colombia": bullet_frecuencias_colombia,
         "bullet_frecuencias_municipio_cerrado_t": bullet_frecuencias_municipio_cerrado_t,
+        "bullet_ranking_sillas_colombia": bullet_ranking_sillas_colombia,
         "bullet_gasto_credibanco_cerrado_promedio": bullet_gasto_credibanco_cerrado_promedio,
         "bullet_gasto_directo_indirecto_credibanco_cerrado": bullet_gasto_directo_indirecto_credibanco_cerrado,
         "bullet_gasto_directo_cerrado": bullet_gasto_directo_cerrado,
         "bullet_gasto_indirecto_cerrado": bullet_gasto_indirecto_cerrado,
+        "bullet_ranking_gasto_credibanco": bullet_ranking_gasto_credibanco,
         "bullet_reservas_aereas_colombia": bullet_reservas_aereas_colombia,
         "bullet_busquedas_aereas_colombia": bullet_busquedas_aereas_colombia
     }
\ No newline at end of file
@@ -0,0 +1,435 @@
+# Procesamiento en el warehouse
+
+# Este modulo contiene una alternativa al procesamiento en pandas para las fuentes con más registros por país
+# (OAG conectividad con el mundo y Forward Keys): las agregaciones, el top de destinos y las participaciones
+# se ejecutan en Snowflake y al cliente solo llegan las tablas finales que usan los gráficos.
+
+# Importar módulos necesarios
+import os
+
+import src.snowflake_analitica as snowflake_analitica
+from src.formato_analitica import nombre_mes
+from .procesamiento_datos import (condicion_ids, obtener_datos_oag, procesar_datos_oag, datos_forward_keys, datos_oag,
+                                  seleccionar_grano_forward_keys, inicio_ventana_busquedas_forward_keys, RESOLUCION_GRAFICOS_FORWARD_KEYS,
+                                  FUENTES_COMPARACION, datos_comparacion_paises)
+
+# Importar pandas
+import pandas as pd
+
+# Modo de procesamiento del aplicativo: 'pandas' (por defecto) o 'warehouse' (configurable por variable de entorno)
+MODO_PROCESAMIENTO = os.getenv('CITI_MODO_PROCESAMIENTO', 'pandas')
+
+# Número de destinos que se muestran por separado antes de agrupar el resto en "Otros" (igual que en pandas)
+TOP_DESTINOS_OAG = 10
+
+#########################
+# OAG conectividad mundo
+#########################
+
+def consultas_oag_mundo_warehouse(filtro_paises):
+    """
+    Construye las consultas de conectividad con el mundo que se agregan en Snowflake. Cada consulta se calcula por
+    país de origen (PAIS_DEPARTURE), de modo que sirve para un país o para varios países en una sola ejecución
+    (modo comparación): el top 10 de destinos del último año, el mes máximo de 2024 y las participaciones se
+    calculan dentro de cada país.
+
+    Parámetros:
+    - filtro_paises (str): Condición sobre ID_PAIS_DEPARTURE (condicion_ids).
+
+    Retorna:
+    - dict: Diccionario {nombre_consulta: query} con 'serie_tiempo', 'destino_cerrado' y 'destino_corrido'.
+    """
+    # Registros de cada país agrupados por destino (top 10 del último año del país y "Otros") y mes
+    cte_agrupado = f"""
+        WITH BASE AS (
+            SELECT PAIS_DEPARTURE,
+                PAIS_ARRIVAL,
+                TO_DATE(TIME_SERIES, 'YYYY-MM') AS FECHA_MES,
+                FRECUENCIAS,
+                SILLAS
+            FROM REPOSITORIO_TURISMO.SERVICIO.OAG_CONECTIVIDAD_MUNDO
+            WHERE ID_PAIS_DEPARTURE {filtro_paises}
+                AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE
+        ),
+        ULTIMO_ANIO AS (
+            SELECT PAIS_DEPARTURE,
+                MAX(YEAR(FECHA_MES)) AS ANIO
+            FROM BASE
+            GROUP BY PAIS_DEPARTURE
+        ),
+        RANKING AS (
+            SELECT B.PAIS_DEPARTURE,
+                B.PAIS_ARRIVAL,
+                ROW_NUMBER() OVER (PARTITION BY B.PAIS_DEPARTURE ORDER BY SUM(B.FRECUENCIAS) DESC, B.PAIS_ARRIVAL) AS POSICION
+            FROM BASE AS B
+                INNER JOIN ULTIMO_ANIO AS U ON B.PAIS_DEPARTURE = U.PAIS_DEPARTURE AND YEAR(B.FECHA_MES) = U.ANIO
+            GROUP BY B.PAIS_DEPARTURE, B.PAIS_ARRIVAL
+        ),
+        NUMERO_DESTINOS AS (
+            SELECT PAIS_DEPARTURE,
+                COUNT(*) AS DESTINOS
+            FROM RANKING
+            GROUP BY PAIS_DEPARTURE
+        ),
+        AGRUPADO AS (
+            SELECT B.PAIS_DEPARTURE,
+                CASE
+                    WHEN N.DESTINOS <= {TOP_DESTINOS_OAG} OR R.POSICION <= {TOP_DESTINOS_OAG} THEN B.PAIS_ARRIVAL
+                    ELSE 'Otros'
+                END AS PAIS_ARRIVAL,
+                YEAR(B.FECHA_MES) AS FECHA,
+                MONTH(B.FECHA_MES) AS MES,
+                B.FRECUENCIAS,
+                B.SILLAS
+            FROM BASE AS B
+                LEFT JOIN RANKING AS R ON B.PAIS_DEPARTURE = R.PAIS_DEPARTURE AND B.PAIS_ARRIVAL = R.PAIS_ARRIVAL
+                LEFT JOIN NUMERO_DESTINOS AS N ON B.PAIS_DEPARTURE = N.PAIS_DEPARTURE
+        )
+    """
+
+    return {
+        "serie_tiempo": f"""
+            SELECT PAIS_DEPARTURE,
+                SUBSTR(TIME_SERIES, 1, 4) AS YEAR,
+                SUM(FRECUENCIAS) AS FRECUENCIAS,
+                SUM(SILLAS) AS SILLAS
+            FROM REPOSITORIO_TURISMO.SERVICIO.OAG_CONECTIVIDAD_MUNDO
+            WHERE ID_PAIS_DEPARTURE {filtro_paises}
+                AND ID_PAIS_ARRIVAL <> ID_PAIS_DEPARTURE
+            GROUP BY PAIS_DEPARTURE, SUBSTR(TIME_SERIES, 1, 4)
+            ORDER BY PAIS_DEPARTURE, YEAR;
+        """,
+        "destino_cerrado": f"""
+            {cte_agrupado}
+            SELECT PAIS_DEPARTURE,
+                TO_VARCHAR(FECHA) AS FECHA,
+                PAIS_ARRIVAL,
+                SUM(FRECUENCIAS) AS FRECUENCIAS,
+                SUM(SILLAS) AS SILLAS,
+                (SUM(FRECUENCIAS)::DOUBLE / SUM(SUM(FRECUENCIAS)) OVER (PARTITION BY PAIS_DEPARTURE, FECHA) * 100) AS PARTICIPACION_FRECUENCIAS,
+                (SUM(SILLAS)::DOUBLE / SUM(SUM(SILLAS)) OVER (PARTITION BY PAIS_DEPARTURE, FECHA) * 100) AS PARTICIPACION_SILLAS
+            FROM AGRUPADO
+            WHERE FECHA IN (2022, 2023)
+            GROUP BY PAIS_DEPARTURE, FECHA, PAIS_ARRIVAL;
+        """,
+        "destino_corrido": f"""
+            {cte_agrupado},
+            MES_MAXIMO AS (
+                SELECT PAIS_DEPARTURE,
+                    MAX(MES) AS MES
+                FROM AGRUPADO
+                WHERE FECHA = 2024
+                GROUP BY PAIS_DEPARTURE
+            )
+            SELECT A.PAIS_DEPARTURE,
+                A.FECHA,
+                M.MES AS MES_MAXIMO,
+                A.PAIS_ARRIVAL,
+                SUM(A.FRECUENCIAS) AS FRECUENCIAS,
+                SUM(A.SILLAS) AS SILLAS,
+                (SUM(A.FRECUENCIAS)::DOUBLE / SUM(SUM(A.FRECUENCIAS)) OVER (PARTITION BY A.PAIS_DEPARTURE, A.FECHA) * 100) AS PARTICIPACION_FRECUENCIAS,
+                (SUM(A.SILLAS)::DOUBLE / SUM(SUM(A.SILLAS)) OVER (PARTITION BY A.PAIS_DEPARTURE, A.FECHA) * 100) AS PARTICIPACION_SILLAS
+            FROM AGRUPADO AS A
+                INNER JOIN MES_MAXIMO AS M ON A.PAIS_DEPARTURE = M.PAIS_DEPARTURE AND A.MES <= M.MES
+            WHERE A.FECHA IN (2023, 2024)
+            GROUP BY A.PAIS_DEPARTURE, A.FECHA, M.MES, A.PAIS_ARRIVAL;
+        """
+    }
+
+def procesar_oag_mundo_dataframes(dataframes):
+    """
+    Da el formato final (nombres de columnas, orden y etiqueta del periodo corrido) a las tablas de conectividad
+    con el mundo calculadas en Snowflake para un país (consultas_oag_mundo_warehouse).
+
+    Parámetros:
+    - dataframes (dict): Diccionario con los DataFrames 'serie_tiempo', 'destino_cerrado' y 'destino_corrido' de un país.
+
+    Retorna:
+    - dict: Diccionario con 'conectividad_mundo_serie_tiempo', 'conectividad_mundo_destino_cerrado' y
+      'conectividad_mundo_destino_corrido'.
+    """
+    resultados_procesados = {}
+
+    # Serie de tiempo anual
+    df_serie_tiempo = dataframes.get('serie_tiempo', pd.DataFrame())
+    if not df_serie_tiempo.empty:
+        df_serie_tiempo = df_serie_tiempo[['YEAR', 'FRECUENCIAS', 'SILLAS']].sort_values(by='YEAR').reset_index(drop=True)
+        df_serie_tiempo = df_serie_tiempo.rename(columns={'YEAR': 'Año', 'FRECUENCIAS': 'Frecuencias', 'SILLAS': 'Sillas'})
+    resultados_procesados['conectividad_mundo_serie_tiempo'] = df_serie_tiempo
+
+    # Periodo cerrado
+    df_cerrado = dataframes.get('destino_cerrado', pd.DataFrame())
+    if not df_cerrado.empty:
+        df_cerrado = df_cerrado[['FECHA', 'PAIS_ARRIVAL', 'FRECUENCIAS', 'SILLAS', 'PARTICIPACION_FRECUENCIAS', 'PARTICIPACION_SILLAS']]
+        df_cerrado = df_cerrado.sort_values(by=['FECHA', 'PAIS_ARRIVAL']).reset_index(drop=True)
+        df_cerrado = df_cerrado.rename(columns={'FECHA': 'Año', 'PAIS_ARRIVAL': 'País Destino', 'FRECUENCIAS': 'Frecuencias', 'SILLAS': 'Sillas', 'PARTICIPACION_FRECUENCIAS': 'Participación Frecuencias (%)', 'PARTICIPACION_SILLAS': 'Participación Sillas (%)'})
+    resultados_procesados['conectividad_mundo_destino_cerrado'] = df_cerrado
+
+    # Periodo corrido: la etiqueta del periodo usa el nombre del último mes disponible de 2024
+    df_corrido = dataframes.get('destino_corrido', pd.DataFrame())
+    if not df_corrido.empty:
+        df_corrido = df_corrido.copy()
+        mes_maximo_nombre = nombre_mes(int(df_corrido['MES_MAXIMO'].iloc[0]), capitalizar=True)
+        df_corrido['FECHA_CORRIDA'] = 'Enero - ' + mes_maximo_nombre + ' ' + df_corrido['FECHA'].astype(str)
+        df_corrido = df_corrido.sort_values(by=['FECHA_CORRIDA', 'PAIS_ARRIVAL']).reset_index(drop=True)
+        df_corrido = df_corrido[['FECHA_CORRIDA', 'PAIS_ARRIVAL', 'FRECUENCIAS', 'SILLAS', 'PARTICIPACION_FRECUENCIAS', 'PARTICIPACION_SILLAS']]
+        df_corrido = df_corrido.rename(columns={'FECHA_CORRIDA': 'Periodo', 'PAIS_ARRIVAL': 'País Destino', 'FRECUENCIAS': 'Frecuencias', 'SILLAS': 'Sillas', 'PARTICIPACION_FRECUENCIAS': 'Participación Frecuencias (%)', 'PARTICIPACION_SILLAS': 'Participación Sillas (%)'})
+    resultados_procesados['conectividad_mundo_destino_corrido'] = df_corrido
+
+    return resultados_procesados
+
+def procesar_oag_mundo_warehouse(pais_seleccionado, session):
+    """
+    Calcula en Snowflake las tablas de conectividad del país con el mundo que procesar_datos_oag calcula en pandas:
+    serie de tiempo anual, participación por destino en el periodo cerrado (2022 - 2023) y en el periodo corrido
+    (2023 - 2024, hasta el último mes disponible de 2024). Los destinos fuera del top 10 del último año se agrupan en "Otros".
+
+    Parámetros:
+    - pais_seleccionado (str): Nombre del país seleccionado.
+    - session: Objeto de conexión activo a Snowflake.
+
+    Retorna:
+    - dict: Diccionario con 'conectividad_mundo_serie_tiempo', 'conectividad_mundo_destino_cerrado' y
+      'conectividad_mundo_destino_corrido'.
+    """
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
+    dataframes = snowflake_analitica.ejecutar_multiples_consultas(consultas_oag_mundo_warehouse(filtro_paises), session, pais_seleccionado)
+    return procesar_oag_mundo_dataframes(dataframes)
+
+def obtener_datos_oag_warehouse(pais_seleccionado, session):
+    """
+    Equivalente de obtener_datos_oag en modo warehouse: la conectividad con el mundo llega agregada desde Snowflake
+    y la conectividad hacia Colombia (pocos registros por país) llega sin procesar, como en pandas.
+
+    Parámetros:
+    - pais_seleccionado (str o list): Nombre del país seleccionado o lista de países (modo comparación).
+    - session: Objeto de conexión activo a Snowflake.
+
+    Retorna:
+    - dict: Diccionario con 'conectividad_hacia_colombia', 'serie_tiempo', 'destino_cerrado' y 'destino_corrido',
+      todos con la columna PAIS_DEPARTURE.
+    """
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
+    datos_obtenidos = obtener_datos_oag(pais_seleccionado, session, consultas_elegidas=['conectividad_hacia_colombia'])
+    datos_obtenidos.update(snowflake_analitica.ejecutar_multiples_consultas(consultas_oag_mundo_warehouse(filtro_paises), session, pais_seleccionado))
+    return datos_obtenidos
+
+def procesar_datos_oag_warehouse(dataframes):
+    """
+    Equivalente de procesar_datos_oag en modo warehouse para los datos de un país (obtener_datos_oag_warehouse).
+
+    Retorna:
+    - dict: Diccionario con los DataFrames procesados (mismas llaves que procesar_datos_oag).
+    """
+    datos_procesados = procesar_datos_oag({'conectividad_hacia_colombia': dataframes.get('conectividad_hacia_colombia', pd.DataFrame())})
+    datos_procesados.update(procesar_oag_mundo_dataframes(dataframes))
+    return datos_procesados
+
+def datos_oag_warehouse(pais_seleccionado, sesion_activa):
+    """
+    Equivalente de datos_oag en modo warehouse: la conectividad con el mundo se procesa en Snowflake y la
+    conectividad hacia Colombia (pocos registros por país) se sigue procesando en pandas.
+
+    Parámetros:
+    - pais_seleccionado (str): Nombre del país seleccionado.
+    - sesion_activa: Objeto de conexión activo a Snowflake.
+
+    Retorna:
+    - dict: Diccionario con los DataFrames procesados (mismas llaves que datos_oag).
+    """
+    try:
+        print(f"Obteniendo datos de OAG (procesamiento en el warehouse) para el país: {pais_seleccionado}...")
+        return procesar_datos_oag_warehouse(obtener_datos_oag_warehouse(pais_seleccionado, sesion_activa))
+
+    except Exception as e:
+        print(f"Error al obtener y procesar datos de OAG en el warehouse para el país: {pais_seleccionado}. Detalles: {str(e)}")
+        return {}
+
+###############
+# Forward Keys
+###############
+
+def obtener_datos_forward_keys_warehouse(pais_seleccionado, session):
+    """
+    Equivalente de obtener_datos_forward_keys en modo warehouse: las reservas y búsquedas llegan agregadas por país
+    de origen, país de destino y mes desde Snowflake.
+
+    Parámetros:
+    - pais_seleccionado (str o list): Nombre del país seleccionado o lista de países (modo comparación).
+    - session: Objeto de conexión activo a Snowflake.
+
+    Retorna:
+    - dict: Diccionario con 'reservas' y 'busquedas' (PAIS_DEPARTURE, PAIS_ARRIVAL, FECHA y VALOR).
+    """
+    filtro_paises = condicion_ids(snowflake_analitica.obtener_ids_paises(pais_seleccionado, session))
+    grano_reservas = seleccionar_grano_forward_keys(RESOLUCION_GRAFICOS_FORWARD_KEYS['reservas_aereas'])
+    grano_busquedas = seleccionar_grano_forward_keys(RESOLUCION_GRAFICOS_FORWARD_KEYS['busquedas_aereas'])
+
+    consultas = {
+        "reservas": f"""
+            SELECT PAIS_DEPARTURE,
+                PAIS_ARRIVAL,
+                DATE_TRUNC('MONTH', FECHA_USABLE) AS FECHA,
+                SUM(RESERVAS) AS VALOR
+            FROM REPOSITORIO_TURISMO.SERVICIO.FORWARDKEYS_RESERVAS_{grano_reservas}
+            WHERE ID_PAIS_DEPARTURE {filtro_paises}
+            GROUP BY PAIS_DEPARTURE, PAIS_ARRIVAL, DATE_TRUNC('MONTH', FECHA_USABLE);
+        """,
+        "busquedas": f"""
+            SELECT PAIS_DEPARTURE,
+                PAIS_ARRIVAL,
+                DATE_TRUNC('MONTH', FECHA_USABLE) AS FECHA,
+                SUM(BUSQUEDAS) AS VALOR
+            FROM REPOSITORIO_TURISMO.SERVICIO.FORWARDKEYS_BUSQUEDAS_{grano_busquedas}
+            WHERE FECHA_USABLE BETWEEN {inicio_ventana_busquedas_forward_keys(grano_busquedas)} AND CURRENT_DATE()
+            AND ID_PAIS_DEPARTURE {filtro_paises}
+            GROUP BY PAIS_DEPARTURE, PAIS_ARRIVAL, DATE_TRUNC('MONTH', FECHA_USABLE);
+        """
+    }
+
+    return snowflake_analitica.ejecutar_multiples_consultas(consultas, session, pais_seleccionado)
+
+def procesar_datos_forward_keys_warehouse(dataframes):
+    """
+    Equivalente de procesar_datos_forward_keys en modo warehouse para los datos de un país
+    (obtener_datos_forward_keys_warehouse): separa Colombia del resto de destinos.
+
+    Retorna:
+    - dict: Diccionario con los DataFrames procesados (mismas llaves que procesar_datos_forward_keys).
+    """
+    resultados_procesados = {}
+    for consulta, llave, columna_valor in [('reservas', 'reservas', 'Reservas'), ('busquedas', 'busquedas', 'Búsquedas')]:
+        df = dataframes.get(consulta, pd.DataFrame())
+        if df.empty:
+            resultados_procesados[f'{llave}_serie_tiempo'] = pd.DataFrame()
+            resultados_procesados[f'{llave}_serie_tiempo_colombia'] = pd.DataFrame()
+            continue
+
+        df = df[['PAIS_ARRIVAL', 'FECHA', 'VALOR']].copy()
+        df['FECHA'] = pd.to_datetime(df['FECHA'])
+        df = df.sort_values(by=['PAIS_ARRIVAL', 'FECHA']).reset_index(drop=True)
+        df = df.rename(columns={'PAIS_ARRIVAL': 'País', 'FECHA': 'Fecha', 'VALOR': columna_valor})
+
+        resultados_procesados[f'{llave}_serie_tiempo'] = df[df['País'] != 'Colombia']
+        resultados_procesados[f'{llave}_serie_tiempo_colombia'] = df[df['País'] == 'Colombia']
+
+    return resultados_procesados
+
+def datos_forward_keys_warehouse(pais_seleccionado, sesion_activa):
+    """
+    Equivalente de datos_forward_keys en modo warehouse: las reservas y búsquedas se agregan por país de destino
+    y mes en Snowflake y se separan en Colombia y el resto de destinos.
+
+    Parámetros:
+    - pais_seleccionado (str): Nombre del país seleccionado.
+    - sesion_activa: Objeto de conexión activo a Snowflake.
+
+    Retorna:
+    - dict: Diccionario con los DataFrames procesados (mismas llaves que datos_forward_keys).
+    """
+    try:
+        print(f"Obteniendo datos de Forward Keys (procesamiento en el warehouse) para el país: {pais_seleccionado}...")
+        return procesar_datos_forward_keys_warehouse(obtener_datos_forward_keys_warehouse(pais_seleccionado, sesion_activa))
+
+    except Exception as e:
+        print(f"Error al obtener y procesar datos de Forward Keys en el warehouse para el país {pais_seleccionado}: {str(e)}")
+        return {}
+
+############################
+# Selección y paridad de modos
+############################
+
+def datos_oag_modo(pais_seleccionado, sesion_activa, modo=None):
+    """
+    Obtiene los datos de OAG con el modo de procesamiento indicado ('pandas' o 'warehouse'). Por defecto MODO_PROCESAMIENTO.
+    """
+    modo = modo or MODO_PROCESAMIENTO
+    return datos_oag_warehouse(pais_seleccionado, sesion_activa) if modo == 'warehouse' else datos_oag(pais_seleccionado, sesion_activa)
+
+def datos_forward_keys_modo(pais_seleccionado, sesion_activa, modo=None):
+    """
+    Obtiene los datos de Forward Keys con el modo de procesamiento indicado ('pandas' o 'warehouse'). Por defecto MODO_PROCESAMIENTO.
+    """
+    modo = modo or MODO_PROCESAMIENTO
+    return datos_forward_keys_warehouse(pais_seleccionado, sesion_activa) if modo == 'warehouse' else datos_forward_keys(pais_seleccionado, sesion_activa)
+
+# Columna de país de las consultas en modo warehouse, para separar los resultados en el modo comparación
+COLUMNAS_PAIS_WAREHOUSE = {
+    'df_oag': {
+        'conectividad_hacia_colombia': 'PAIS_DEPARTURE',
+        'serie_tiempo': 'PAIS_DEPARTURE',
+        'destino_cerrado': 'PAIS_DEPARTURE',
+        'destino_corrido': 'PAIS_DEPARTURE'
+    },
+    'df_fk': {
+        'reservas': 'PAIS_DEPARTURE',
+        'busquedas': 'PAIS_DEPARTURE'
+    }
+}
+
+def datos_comparacion_paises_modo(paises, sesion_activa, modo=None):
+    """
+    Obtiene los datos de comparación de varios países (datos_comparacion_paises) con el modo de procesamiento
+    indicado ('pandas' o 'warehouse'). En modo warehouse, OAG y Forward Keys se agregan en Snowflake con una sola
+    consulta por tabla para todos los países y el resultado se separa por país. Por defecto MODO_PROCESAMIENTO.
+    """
+    modo = modo or MODO_PROCESAMIENTO
+    if modo != 'warehouse':
+        return datos_comparacion_paises(paises, sesion_activa)
+
+    fuentes = [
+        fuente if fuente[0] not in ('df_oag', 'df_fk') else
+        ('df_oag', obtener_datos_oag_warehouse, procesar_datos_oag_warehouse, COLUMNAS_PAIS_WAREHOUSE['df_oag']) if fuente[0] == 'df_oag' else
+        ('df_fk', obtener_datos_forward_keys_warehouse, procesar_datos_forward_keys_warehouse, COLUMNAS_PAIS_WAREHOUSE['df_fk'])
+        for fuente in FUENTES_COMPARACION
+    ]
+    return datos_comparacion_paises(paises, sesion_activa, fuentes=fuentes)
+
+def _normalizar_para_comparar(df):
+    """
+    Prepara un DataFrame para comparar ambos modos: índice reiniciado, orden por todas las columnas no numéricas
+    y columnas numéricas como float (Snowflake puede devolver Decimal).
+    """
+    df = df.reset_index(drop=True).copy()
+    for columna in df.columns:
+        convertida = pd.to_numeric(df[columna], errors='coerce')
+        if convertida.notna().sum() == df[columna].notna().sum() and not pd.api.types.is_datetime64_any_dtype(df[columna]):
+            df[columna] = convertida.astype(float)
+    orden = [columna for columna in df.columns if not pd.api.types.is_float_dtype(df[columna])]
+    if orden:
+        df = df.sort_values(by=orden)
+    return df.reset_index(drop=True)
+
+def comparar_modos_procesamiento(pais_seleccionado, sesion_activa, tolerancia=1e-6):
+    """
+    Verifica la paridad entre el procesamiento en pandas y en el warehouse para un país: ejecuta ambos modos
+    y compara cada DataFrame resultante (columnas, número de filas y valores con la tolerancia indicada).
+
+    Parámetros:
+    - pais_seleccionado (str): Nombre del país a verificar.
+    - sesion_activa: Objeto de conexión activo a Snowflake.
+    - tolerancia (float): Tolerancia relativa para los valores numéricos.
+
+    Retorna:
+    - pd.DataFrame: Una fila por DataFrame con Fuente, Llave, Filas pandas, Filas warehouse, Coincide y Detalle.
+    """
+    filas = []
+    for fuente, funcion in [('OAG', datos_oag_modo), ('Forward Keys', datos_forward_keys_modo)]:
+        resultados_pandas = funcion(pais_seleccionado, sesion_activa, modo='pandas')
+        resultados_warehouse = funcion(pais_seleccionado, sesion_activa, modo='warehouse')
+
+        for llave in sorted(set(resultados_pandas) | set(resultados_warehouse)):
+            df_pandas = resultados_pandas.get(llave, pd.DataFrame())
+            df_warehouse = resultados_warehouse.get(llave, pd.DataFrame())
+            detalle = ''
+            try:
+                pd.testing.assert_frame_equal(_normalizar_para_comparar(df_pandas), _normalizar_para_comparar(df_warehouse),
+                                              check_dtype=False, check_exact=False, rtol=tolerancia)
+                coincide = True
+            except AssertionError as e:
+                coincide = False
+                detalle = str(e).replace('\n', ' ')[:300]
+
+            filas.append({'Fuente': fuente, 'Llave': llave, 'Filas pandas': len(df_pandas), 'Filas warehouse': len(df_warehouse), 'Coincide': coincide, 'Detalle': detalle})
+
+    return pd.DataFrame(filas, columns=['Fuente', 'Llave', 'Filas pandas', 'Filas warehouse', 'Coincide', 'Detalle'])
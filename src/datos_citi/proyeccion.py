@@ -0,0 +1,261 @@
+# Proyección de columnas
+
+# Este modulo analiza qué columnas de cada consulta del aplicativo se usan realmente en el procesamiento
+# y verifica que las consultas traigan únicamente esas columnas (menos bytes escaneados, transferidos y en memoria).
+
+# Importar módulos necesarios
+import ast
+import os
+import re
+import sys
+
+# Importar pandas
+import pandas as pd
+
+# Módulo analizado
+RUTA_PROCESAMIENTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'procesamiento_datos.py')
+
+# Fuente -> (función que construye las consultas, función que procesa los resultados, llave en COLUMNAS_PAIS)
+CONSUMIDORES_CONSULTAS = {
+    'GlobalData': ('obtener_datos_global_data', 'procesar_datos_global_data', 'df_global_data'),
+    'OAG': ('obtener_datos_oag', 'procesar_datos_oag', 'df_oag'),
+    'ForwardKeys': ('obtener_datos_forward_keys', 'procesar_datos_forward_keys', 'df_fk'),
+    'Credibanco': ('obtener_datos_credibanco', 'procesar_datos_credibanco', 'df_credibanco'),
+    'IATA-GAP': ('obtener_datos_iata_gap', 'procesar_datos_iata_gap', 'df_iata')
+}
+
+def _texto_consulta(nodo, constantes=None):
+    """
+    Reconstruye el texto de una consulta definida como f-string. Las expresiones que son constantes de texto del
+    módulo (por ejemplo fragmentos SQL compartidos) se sustituyen por su valor; el resto se reemplaza por '{}'.
+    """
+    constantes = constantes or {}
+    if isinstance(nodo, ast.Constant) and isinstance(nodo.value, str):
+        return nodo.value
+    if isinstance(nodo, ast.JoinedStr):
+        partes = []
+        for parte in nodo.values:
+            if isinstance(parte, ast.Constant):
+                partes.append(parte.value)
+            elif isinstance(parte, ast.FormattedValue) and isinstance(parte.value, ast.Name) and parte.value.id in constantes:
+                partes.append(constantes[parte.value.id])
+            else:
+                partes.append('{}')
+        return ''.join(partes)
+    return ''
+
+def _dividir_nivel_cero(texto, separador=','):
+    """
+    Divide un texto SQL por un separador que esté fuera de paréntesis.
+    """
+    partes, actual, profundidad = [], [], 0
+    for caracter in texto:
+        if caracter == '(':
+            profundidad += 1
+        elif caracter == ')':
+            profundidad -= 1
+        if caracter == separador and profundidad == 0:
+            partes.append(''.join(actual))
+            actual = []
+        else:
+            actual.append(caracter)
+    partes.append(''.join(actual))
+    return partes
+
+def columnas_seleccionadas(query):
+    """
+    Retorna los nombres de las columnas que devuelve una consulta (lista del SELECT externo).
+    En consultas con CTE se analiza el SELECT final.
+
+    Parámetros:
+    - query (str): Consulta SQL.
+
+    Retorna:
+    - list: Nombres de columna en mayúsculas, en el orden de la consulta.
+    """
+    texto = re.sub(r'--.*', '', query)
+    texto = re.sub(r"'(?:[^']|'')*'", "''", texto)
+
+    # Ubicar el último SELECT y su FROM a nivel cero de paréntesis
+    profundidad = 0
+    inicio_select, inicio_from = None, None
+    for coincidencia in re.finditer(r"\(|\)|\bSELECT\b|\bFROM\b", texto, flags=re.IGNORECASE):
+        token = coincidencia.group(0).upper()
+        if token == '(':
+            profundidad += 1
+        elif token == ')':
+            profundidad -= 1
+        elif profundidad == 0 and token == 'SELECT':
+            inicio_select, inicio_from = coincidencia.end(), None
+        elif profundidad == 0 and token == 'FROM' and inicio_select is not None and inicio_from is None:
+            inicio_from = coincidencia.start()
+
+    if inicio_select is None or inicio_from is None:
+        return []
+
+    lista_select = re.sub(r'^\s*DISTINCT\b', '', texto[inicio_select:inicio_from], flags=re.IGNORECASE)
+
+    columnas = []
+    for expresion in _dividir_nivel_cero(lista_select):
+        expresion = expresion.strip()
+        if not expresion:
+            continue
+        alias = re.search(r'\bAS\s+"?([\w$]+)"?\s*$', expresion, flags=re.IGNORECASE)
+        nombre = alias.group(1) if alias else re.split(r'[.\s]', expresion)[-1]
+        columnas.append(nombre.strip('"').upper())
+    return columnas
+
+def _funciones_modulo(ruta):
+    """
+    Retorna las funciones de primer nivel del módulo ({nombre: nodo}), el valor de COLUMNAS_PAIS y las constantes
+    de texto de primer nivel ({nombre: valor}).
+    """
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        arbol = ast.parse(archivo.read())
+
+    funciones, columnas_pais, constantes = {}, {}, {}
+    for nodo in arbol.body:
+        if isinstance(nodo, ast.FunctionDef):
+            funciones[nodo.name] = nodo
+        elif isinstance(nodo, ast.Assign) and any(isinstance(t, ast.Name) and t.id == 'COLUMNAS_PAIS' for t in nodo.targets):
+            columnas_pais = ast.literal_eval(nodo.value)
+        elif isinstance(nodo, ast.Assign) and isinstance(nodo.value, ast.Constant) and isinstance(nodo.value.value, str):
+            constantes.update({t.id: nodo.value.value for t in nodo.targets if isinstance(t, ast.Name)})
+    return funciones, columnas_pais, constantes
+
+def consultas_funcion(nodo_funcion, constantes=None):
+    """
+    Extrae el diccionario `consultas = {...}` de una función obtener_datos_*.
+
+    Parámetros:
+    - nodo_funcion (ast.FunctionDef): Función que construye las consultas.
+    - constantes (dict): Constantes de texto del módulo que se interpolan en las consultas. Por defecto ninguna.
+
+    Retorna:
+    - dict: {nombre_consulta: texto de la consulta}.
+    """
+    for nodo in ast.walk(nodo_funcion):
+        if isinstance(nodo, ast.Assign) and isinstance(nodo.value, ast.Dict) and any(isinstance(t, ast.Name) and t.id == 'consultas' for t in nodo.targets):
+            return {llave.value: _texto_consulta(valor, constantes) for llave, valor in zip(nodo.value.keys, nodo.value.values) if isinstance(llave, ast.Constant)}
+    return {}
+
+def _unidades_funcion(nodo_funcion):
+    """
+    Retorna las unidades de análisis de una función en orden de aparición: las sentencias simples y, de las
+    sentencias compuestas (if, for, while, with), solo su encabezado (condición, iterable, contexto).
+    """
+    unidades = []
+    for nodo in ast.walk(nodo_funcion):
+        if nodo is nodo_funcion or not isinstance(nodo, ast.stmt):
+            continue
+        if isinstance(nodo, (ast.If, ast.While)):
+            unidades.append(nodo.test)
+        elif isinstance(nodo, (ast.For, ast.AsyncFor)):
+            unidades.append(ast.Tuple(elts=[nodo.target, nodo.iter], ctx=ast.Load(), lineno=nodo.lineno))
+        elif isinstance(nodo, (ast.With, ast.AsyncWith)):
+            unidades.extend(item.context_expr for item in nodo.items)
+        elif not hasattr(nodo, 'body'):
+            unidades.append(nodo)
+    return sorted(unidades, key=lambda unidad: unidad.lineno)
+
+def literales_por_consulta(nodo_funcion):
+    """
+    Asocia a cada consulta los literales de texto que la función de procesamiento usa sobre su DataFrame.
+    Sigue las variables que salen de `dataframes.get('consulta')` (o `dataframes['consulta']`) y las que se derivan
+    de ellas por asignación; los literales de cada sentencia que usa una de esas variables se atribuyen a su consulta.
+
+    Parámetros:
+    - nodo_funcion (ast.FunctionDef): Función procesar_datos_* (el primer argumento es el diccionario de resultados).
+
+    Retorna:
+    - dict: {nombre_consulta: conjunto de literales en mayúsculas}.
+    """
+    parametro = nodo_funcion.args.args[0].arg if nodo_funcion.args.args else 'dataframes'
+    unidades = _unidades_funcion(nodo_funcion)
+
+    origenes, literales = {}, {}
+    # Dos pasadas para propagar las variables reasignadas dentro de ciclos
+    for _ in range(2):
+        for unidad in unidades:
+            consultas = set()
+            for nodo in ast.walk(unidad):
+                if isinstance(nodo, ast.Name) and isinstance(nodo.ctx, ast.Load):
+                    consultas |= origenes.get(nodo.id, set())
+                llave = None
+                if isinstance(nodo, ast.Call) and isinstance(nodo.func, ast.Attribute) and nodo.func.attr == 'get' and nodo.args:
+                    objeto, llave = nodo.func.value, nodo.args[0]
+                elif isinstance(nodo, ast.Subscript):
+                    objeto, llave = nodo.value, nodo.slice
+                if llave is not None and isinstance(objeto, ast.Name) and objeto.id == parametro and isinstance(llave, ast.Constant):
+                    consultas.add(llave.value)
+            if not consultas:
+                continue
+
+            textos = {nodo.value.upper() for nodo in ast.walk(unidad) if isinstance(nodo, ast.Constant) and isinstance(nodo.value, str)}
+            for consulta in consultas:
+                literales.setdefault(consulta, set()).update(textos)
+            for nodo in ast.walk(unidad):
+                if isinstance(nodo, ast.Name) and isinstance(nodo.ctx, ast.Store):
+                    origenes.setdefault(nodo.id, set()).update(consultas)
+
+    return literales
+
+def analizar_uso_columnas(ruta=RUTA_PROCESAMIENTO):
+    """
+    Analiza estáticamente el módulo de procesamiento: para cada consulta de cada fuente, compara las columnas que
+    devuelve con las que su función de procesamiento (procesar_datos_*) lee sobre el DataFrame de esa consulta
+    (ver literales_por_consulta) y con la separación por país del modo comparación (COLUMNAS_PAIS).
+
+    Parámetros:
+    - ruta (str): Ruta del módulo a analizar. Por defecto procesamiento_datos.py.
+
+    Retorna:
+    - pd.DataFrame: Una fila por columna con Fuente, Consulta, Columna y Usada (bool).
+    """
+    funciones, columnas_pais, constantes = _funciones_modulo(ruta)
+
+    filas = []
+    for fuente, (funcion_consultas, funcion_proceso, llave_pais) in CONSUMIDORES_CONSULTAS.items():
+        literales = literales_por_consulta(funciones[funcion_proceso])
+        for nombre_consulta, query in consultas_funcion(funciones[funcion_consultas], constantes).items():
+            usadas = literales.get(nombre_consulta, set())
+            columna_pais = columnas_pais.get(llave_pais, {}).get(nombre_consulta)
+            for columna in columnas_seleccionadas(query):
+                filas.append({
+                    'Fuente': fuente,
+                    'Consulta': nombre_consulta,
+                    'Columna': columna,
+                    'Usada': columna in usadas or columna == columna_pais
+                })
+
+    return pd.DataFrame(filas, columns=['Fuente', 'Consulta', 'Columna', 'Usada'])
+
+def proyecciones_requeridas(ruta=RUTA_PROCESAMIENTO):
+    """
+    Retorna la lista de proyección de cada consulta: las columnas que algún consumidor lee.
+
+    Retorna:
+    - dict: {consulta: [columnas usadas]}.
+    """
+    reporte = analizar_uso_columnas(ruta)
+    return {consulta: df['Columna'][df['Usada']].tolist() for consulta, df in reporte.groupby('Consulta', sort=False)}
+
+def verificar_proyecciones(ruta=RUTA_PROCESAMIENTO):
+    """
+    Verifica que ninguna consulta traiga columnas que no se usan.
+
+    Retorna:
+    - pd.DataFrame: Columnas seleccionadas y no usadas (vacío si todas las consultas cumplen su proyección).
+    """
+    reporte = analizar_uso_columnas(ruta)
+    return reporte[~reporte['Usada']].reset_index(drop=True)
+
+# Ejecución directa: imprime el reporte y falla si alguna consulta trae columnas sin uso
+if __name__ == '__main__':
+    print(analizar_uso_columnas().to_string(index=False))
+    sobrantes = verificar_proyecciones()
+    if not sobrantes.empty:
+        print("\nColumnas seleccionadas que ningún consumidor usa:")
+        print(sobrantes.to_string(index=False))
+        sys.exit(1)
+    print("\nTodas las consultas seleccionan únicamente columnas usadas.")
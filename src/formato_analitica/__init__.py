@@ -0,0 +1,2 @@
+# Importar módulos
+from .formato import MESES, MESES_ABREVIADOS, formato_numero, formato_serie, nombre_mes, serie_nombre_mes, serie_mes_anio
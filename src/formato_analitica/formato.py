@@ -0,0 +1,180 @@
+# Librerías
+import pandas as pd
+
+# Este módulo no usa el paquete 'locale': las tablas de meses y los separadores están
+# definidos aquí para que el formato sea el mismo en cualquier servidor y no dependa
+# del estado global del proceso (que se comparte entre los hilos de Streamlit).
+
+##################
+# Tablas de meses
+##################
+
+MESES = {
+    1: 'enero', 2: 'febrero', 3: 'marzo', 4: 'abril', 5: 'mayo', 6: 'junio',
+    7: 'julio', 8: 'agosto', 9: 'septiembre', 10: 'octubre', 11: 'noviembre', 12: 'diciembre'
+}
+
+MESES_ABREVIADOS = {
+    1: 'ene', 2: 'feb', 3: 'mar', 4: 'abr', 5: 'may', 6: 'jun',
+    7: 'jul', 8: 'ago', 9: 'sep', 10: 'oct', 11: 'nov', 12: 'dic'
+}
+
+# Tabla de traducción para intercambiar separadores: ',' (miles) <-> '.' (decimales)
+_TABLA_SEPARADORES = str.maketrans(',.', '.,')
+
+####################
+# Formato de números
+####################
+
+def formato_numero(valor, decimales=0, prefijo='', sufijo=''):
+    """
+    Formatea un número con punto como separador de miles y coma como separador decimal.
+
+    Parámetros:
+    -----------
+    valor : int o float
+        Número a formatear.
+    decimales : int, opcional
+        Número de decimales (por defecto 0).
+    prefijo : str, opcional
+        Texto a anteponer (por ejemplo, 'USD ').
+    sufijo : str, opcional
+        Texto a agregar al final (por ejemplo, '%').
+
+    Retorna:
+    --------
+    str o None
+        Cadena formateada, por ejemplo 1234567.891 -> '1.234.567,89'. Si el valor es nulo retorna None.
+
+    Ejemplo de uso:
+    ---------------
+    formato_numero(1234.5, decimales=1, sufijo='%')  # '1.234,5%'
+    """
+
+    if valor is None or pd.isna(valor):
+        return None
+    return f"{prefijo}{f'{valor:,.{decimales}f}'.translate(_TABLA_SEPARADORES)}{sufijo}"
+
+def formato_serie(serie, decimales=0, prefijo='', sufijo=''):
+    """
+    Formatea una Serie completa con punto como separador de miles y coma como separador decimal.
+    El formato base se aplica con un único método de formato por elemento y el intercambio de
+    separadores se hace de forma vectorizada sobre toda la Serie (sin funciones lambda ni
+    reemplazos encadenados por valor).
+
+    Parámetros:
+    -----------
+    serie : pandas.Series o iterable
+        Valores numéricos a formatear.
+    decimales : int, opcional
+        Número de decimales (por defecto 0).
+    prefijo : str, opcional
+        Texto a anteponer a cada valor.
+    sufijo : str, opcional
+        Texto a agregar al final de cada valor.
+
+    Retorna:
+    --------
+    pandas.Series
+        Serie de cadenas formateadas con el mismo índice de la entrada. Los valores nulos quedan como None
+        (una Serie vacía retorna una Serie vacía).
+
+    Ejemplo de uso:
+    ---------------
+    formato_serie(pd.Series([1234.5, None]), decimales=1, sufijo='%')  # ['1.234,5%', None]
+    """
+
+    if not isinstance(serie, pd.Series):
+        serie = pd.Series(serie)
+
+    # Convertir a numérico y marcar nulos
+    valores = pd.to_numeric(serie, errors='coerce')
+    nulos = valores.isna()
+
+    # Formato base con separador de miles ',' y decimal '.' (como objeto, para que el accesor .str
+    # funcione también con Series vacías o sin valores, que map deja con tipo numérico)
+    texto = valores.map(f"{{:,.{decimales}f}}".format, na_action='ignore').astype(object)
+
+    # Intercambio vectorizado de separadores y afijos
+    texto = texto.str.translate(_TABLA_SEPARADORES)
+    if prefijo or sufijo:
+        texto = prefijo + texto + sufijo
+
+    return texto.astype(object).where(~nulos, None)
+
+####################
+# Formato de fechas
+####################
+
+def nombre_mes(mes, capitalizar=False, abreviado=False):
+    """
+    Retorna el nombre en español de un mes.
+
+    Parámetros:
+    -----------
+    mes : int, datetime o pandas.Timestamp
+        Número del mes (1-12) o fecha de la cual se toma el mes.
+    capitalizar : bool, opcional
+        Si es True, retorna la primera letra en mayúscula (por ejemplo 'Enero').
+    abreviado : bool, opcional
+        Si es True, retorna el nombre abreviado (por ejemplo 'ene').
+
+    Retorna:
+    --------
+    str
+        Nombre del mes en español.
+    """
+
+    numero = mes if isinstance(mes, int) else mes.month
+    nombre = (MESES_ABREVIADOS if abreviado else MESES)[numero]
+    return nombre.capitalize() if capitalizar else nombre
+
+def serie_nombre_mes(serie_fechas, capitalizar=True, abreviado=False):
+    """
+    Equivalente vectorizado de `Series.dt.month_name(locale='es_ES.UTF-8')` sin depender del locale.
+
+    Parámetros:
+    -----------
+    serie_fechas : pandas.Series
+        Serie de fechas (o convertible a fechas).
+    capitalizar : bool, opcional
+        Si es True (por defecto, igual que pandas), retorna 'Enero', 'Febrero', etc.
+    abreviado : bool, opcional
+        Si es True, retorna los nombres abreviados.
+
+    Retorna:
+    --------
+    pandas.Series
+        Serie con el nombre del mes en español.
+    """
+
+    tabla = MESES_ABREVIADOS if abreviado else MESES
+    if capitalizar:
+        tabla = {k: v.capitalize() for k, v in tabla.items()}
+    return pd.to_datetime(serie_fechas).dt.month.map(tabla)
+
+def serie_mes_anio(serie_fechas, separador='-', capitalizar=False, abreviado=False):
+    """
+    Construye etiquetas 'mes-año' en español para una serie de fechas (por ejemplo 'enero-2024'),
+    equivalente a `strftime('%B-%Y')` con locale español, de forma vectorizada.
+
+    Parámetros:
+    -----------
+    serie_fechas : pandas.Series, pandas.DatetimeIndex o iterable
+        Fechas a formatear.
+    separador : str, opcional
+        Separador entre mes y año (por defecto '-').
+    capitalizar : bool, opcional
+        Si es True, el mes inicia en mayúscula.
+    abreviado : bool, opcional
+        Si es True, usa el nombre abreviado del mes.
+
+    Retorna:
+    --------
+    list
+        Lista de etiquetas en el mismo orden de las fechas.
+    """
+
+    fechas = pd.Series(pd.to_datetime(serie_fechas))
+    meses = serie_nombre_mes(fechas, capitalizar=capitalizar, abreviado=abreviado)
+    return (meses + separador + fechas.dt.year.astype(str)).tolist()
@@ -1,2 +1,4 @@
 # Importar módulos
-from .graphs import plot_single_time_series, plot_multiple_time_series, plot_stacked_bar_chart_h, plot_stacked_bar_chart_v, plot_single_bar_chart, plot_side_by_side_bars, plot_treemap
\ No newline at end of file
+from .graphs import plot_single_time_series, plot_multiple_time_series, plot_stacked_bar_chart_h, plot_stacked_bar_chart_v, plot_single_bar_chart, plot_side_by_side_bars, plot_treemap
+from .cache import figura_en_cache, hash_dataframe, llave_de_figura, estadisticas_cache_figuras, limpiar_cache_figuras
+from .optimizacion import lttb, indices_submuestreo, optimizar_figura, tamano_payload, preparar_figura, reporte_payload
@@ -0,0 +1,180 @@
+# Librerías
+import os
+import json
+import hashlib
+import inspect
+import weakref
+import threading
+import functools
+from collections import OrderedDict
+import pandas as pd
+import plotly.graph_objects as go
+
+#####################################
+# Caché de figuras direccionada por contenido
+#####################################
+
+# Tamaño máximo de la caché (MB) compartida por todas las sesiones del proceso
+LIMITE_CACHE_FIGURAS_MB = float(os.getenv('CITI_CACHE_FIGURAS_MB', 256))
+
+# Estado de la caché: llave -> (JSON de la figura, tamaño en bytes) (orden LRU)
+_CACHE_FIGURAS = OrderedDict()
+_CANDADO_CACHE = threading.Lock()
+_ESTADISTICAS = {'aciertos': 0, 'fallos': 0, 'bytes': 0, 'desalojos': 0}
+
+# Llave de contenido de cada figura retornada por figura_en_cache: id(figura) -> (referencia débil, llave)
+_LLAVES_RETORNADAS = {}
+
+def hash_dataframe(df):
+    """
+    Calcula un hash estable del contenido de un DataFrame (valores, índice, nombres y tipos de columnas).
+
+    Parámetros:
+        df (pd.DataFrame): DataFrame a resumir.
+
+    Retorna:
+        str: Hash hexadecimal del contenido del DataFrame.
+    """
+    resumen = hashlib.blake2b(digest_size=16)
+    resumen.update(repr([(str(col), str(tipo)) for col, tipo in df.dtypes.items()]).encode('utf-8'))
+    if not df.empty:
+        resumen.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return resumen.hexdigest()
+
+def llave_figura(nombre_funcion, df, parametros):
+    """
+    Construye la llave de caché de una figura a partir de la función, el DataFrame de entrada y los parámetros de graficación.
+
+    Parámetros:
+        nombre_funcion (str): Nombre de la función de graficación.
+        df (pd.DataFrame): DataFrame de entrada.
+        parametros (dict): Resto de parámetros de la función (deben ser serializables con repr).
+
+    Retorna:
+        str: Llave de caché.
+    """
+    parametros_txt = json.dumps(parametros, sort_keys=True, default=repr, ensure_ascii=False)
+    return f"{nombre_funcion}:{hash_dataframe(df)}:{hashlib.blake2b(parametros_txt.encode('utf-8'), digest_size=16).hexdigest()}"
+
+def _guardar(llave, figura):
+    """
+    Guarda el JSON de la figura en la caché y desaloja las entradas menos usadas si se supera el límite. El JSON es
+    inmutable (los cambios del llamador en su figura no alteran la entrada) y su longitud es el tamaño de la entrada.
+    """
+    limite = LIMITE_CACHE_FIGURAS_MB * 1024 ** 2
+    figura_json = figura.to_json()
+    tamano = len(figura_json)
+    if tamano > limite:
+        return
+    with _CANDADO_CACHE:
+        if llave in _CACHE_FIGURAS:
+            _ESTADISTICAS['bytes'] -= _CACHE_FIGURAS.pop(llave)[1]
+        _CACHE_FIGURAS[llave] = (figura_json, tamano)
+        _ESTADISTICAS['bytes'] += tamano
+        while _ESTADISTICAS['bytes'] > limite and _CACHE_FIGURAS:
+            _, (_, tamano_desalojado) = _CACHE_FIGURAS.popitem(last=False)
+            _ESTADISTICAS['bytes'] -= tamano_desalojado
+            _ESTADISTICAS['desalojos'] += 1
+
+def _obtener(llave):
+    """
+    Retorna una figura nueva construida desde el JSON en caché (o None) y actualiza el orden LRU y las estadísticas.
+    Cada llamador recibe su propia figura, por lo que sus cambios (update_layout, etc.) no alteran la entrada.
+    """
+    with _CANDADO_CACHE:
+        entrada = _CACHE_FIGURAS.get(llave)
+        if entrada is None:
+            _ESTADISTICAS['fallos'] += 1
+            return None
+        _CACHE_FIGURAS.move_to_end(llave)
+        _ESTADISTICAS['aciertos'] += 1
+    return go.Figure(json.loads(entrada[0]))
+
+def _marcar_figura(figura, llave):
+    """
+    Asocia una figura retornada con su llave de contenido (la entrada se elimina cuando la figura se libera).
+    """
+    identificador = id(figura)
+    _LLAVES_RETORNADAS[identificador] = (weakref.ref(figura, lambda _: _LLAVES_RETORNADAS.pop(identificador, None)), llave)
+    return figura
+
+def llave_de_figura(figura):
+    """
+    Retorna la llave de contenido de una figura construida por una función con figura_en_cache, o None si la figura
+    no proviene de la caché. La llave describe la figura tal como se retornó (las páginas no la modifican). Permite que otras etapas (por ejemplo preparar_figura) reutilicen su trabajo por
+    contenido sin volver a serializar la figura.
+    """
+    entrada = _LLAVES_RETORNADAS.get(id(figura))
+    if entrada is not None and entrada[0]() is figura:
+        return entrada[1]
+    return None
+
+def figura_en_cache(funcion):
+    """
+    Decorador para las funciones de graficación: si ya existe una figura construida con el mismo DataFrame
+    (por contenido) y los mismos parámetros, se retorna desde la caché sin volver a construirla.
+    Solo se guardan en caché los resultados que son figuras de Plotly (no los mensajes de error).
+
+    Ejemplo de uso:
+        @figura_en_cache
+        def plot_single_time_series(df, date_col, value_col, ...):
+            ...
+    """
+    firma = inspect.signature(funcion)
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        argumentos = firma.bind(*args, **kwargs)
+        argumentos.apply_defaults()
+        parametros = dict(argumentos.arguments)
+        df = parametros.pop('df', None)
+
+        # Si no es un DataFrame no se puede direccionar por contenido
+        if not isinstance(df, pd.DataFrame):
+            return funcion(*args, **kwargs)
+
+        try:
+            llave = llave_figura(funcion.__name__, df, parametros)
+        except Exception as e:
+            print(f"No fue posible calcular la llave de caché de la figura: {e}")
+            return funcion(*args, **kwargs)
+
+        figura = _obtener(llave)
+        if figura is not None:
+            return _marcar_figura(figura, llave)
+
+        # Algunas funciones de graficación modifican el DataFrame de entrada: se grafica una copia para que el
+        # DataFrame del llamador (y por lo tanto la llave de la siguiente ejecución) no cambie
+        argumentos.arguments['df'] = df.copy()
+        resultado = funcion(*argumentos.args, **argumentos.kwargs)
+        if isinstance(resultado, go.Figure):
+            _guardar(llave, resultado)
+            _marcar_figura(resultado, llave)
+        return resultado
+
+    return envoltura
+
+def estadisticas_cache_figuras():
+    """
+    Retorna las estadísticas de la caché de figuras del proceso.
+
+    Retorna:
+        dict: Número de entradas, aciertos, fallos, desalojos y memoria usada (MB).
+    """
+    with _CANDADO_CACHE:
+        return {
+            'entradas': len(_CACHE_FIGURAS),
+            'aciertos': _ESTADISTICAS['aciertos'],
+            'fallos': _ESTADISTICAS['fallos'],
+            'desalojos': _ESTADISTICAS['desalojos'],
+            'memoria_mb': _ESTADISTICAS['bytes'] / 1024 ** 2,
+            'limite_mb': LIMITE_CACHE_FIGURAS_MB
+        }
+
+def limpiar_cache_figuras():
+    """
+    Elimina todas las figuras de la caché (por ejemplo, después de un nuevo cargue de datos).
+    """
+    with _CANDADO_CACHE:
+        _CACHE_FIGURAS.clear()
+        _ESTADISTICAS['bytes'] = 0
@@ -3,9 +3,11 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import locale
+from src.formato_analitica import formato_serie, serie_mes_anio
+from .cache import figura_en_cache
 
 # Single time series
+@figura_en_cache
 def plot_single_time_series(df, date_col, value_col, title=None, 
                             x_label="", y_label="", y_units=None, 
                             show_labels=False, decimal_places=0,
@@ -39,10 +41,8 @@ def plot_single_time_series(df, date_col, value_col, title=None,
         if df.empty:
             return "No hay datos disponibles."
         
-        # Cambiar el gráfico para manejar meses en español:
+        # Cambiar el gráfico para manejar meses:
         if mensual == True:   
-            # Establecer la configuración regional para español (España)
-            locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')  # Puedes cambiar 'es_ES.UTF-8' según tu entorno
             # Asegurarse de que la columna de fecha esté en formato datetime
             df[date_col] = pd.to_datetime(df[date_col])
          
@@ -83,10 +83,7 @@ def plot_single_time_series(df, date_col, value_col, title=None,
         if show_labels:
             # Formatear las etiquetas con separadores de miles y decimales en estilo español
             fig.update_traces(
-                text=df[value_col].apply(lambda x: f"{x:,.{decimal_places}f}"
-                                         .replace(",", "X")
-                                         .replace(".", ",")
-                                         .replace("X", ".")),
+                text=formato_serie(df[value_col], decimales=decimal_places),
                 textposition="top center"  # Posicionar las etiquetas sobre la línea
             )
 
@@ -97,9 +94,10 @@ def plot_single_time_series(df, date_col, value_col, title=None,
         return f"Error generando el gráfico: {e}"
 
 # Multiple time series
+@figura_en_cache
 def plot_multiple_time_series(df, date_col, value_col, group_col,
                                title=None, x_label="", y_label="", y_units=None,
-                               show_labels=False, decimal_places=0, legend_title=None):
+                               show_labels=False, decimal_places=0, legend_title=None, mensual=True):
     """
     Genera un gráfico de líneas para varias series de tiempo, ofreciendo un menú (dropdown) para filtrar qué series se ven en el gráfico.
    
@@ -115,6 +113,7 @@ def plot_multiple_time_series(df, date_col, value_col, group_col,
         show_labels (bool): Si es True, muestra etiquetas de valores sobre las líneas.
         decimal_places (int): Número de decimales para formatear los valores.
         legend_title (str): Encabezado de la leyenda.
+        mensual (bool): Si es True, el eje X muestra mes y año; si es False (series anuales), solo el año.
  
     Retorna:
         plotly.graph_objs.Figure: Gráfico interactivo de Plotly con menú de filtrado.
@@ -123,10 +122,7 @@ def plot_multiple_time_series(df, date_col, value_col, group_col,
     try:
         if df.empty:
             return "No hay datos disponibles."
- 
-        # Establecer la configuración regional para español (España)
-        locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')  # Puedes cambiar 'es_ES.UTF-8' según tu entorno
- 
+
         # Asegurarse de que la columna de fecha esté en formato datetime
         df[date_col] = pd.to_datetime(df[date_col])
  
@@ -147,17 +143,7 @@ def plot_multiple_time_series(df, date_col, value_col, group_col,
            
             # Si show_labels=True, se formatean los valores de acuerdo con el estilo español.
             if show_labels:
-                text_values = []
-                for val in y_values:
-                    if pd.notnull(val):
-                        val_str = f"{val:,.{decimal_places}f}"  
-                        val_str = (val_str
-                                   .replace(",", "X")   # "1X234.56"
-                                   .replace(".", ",")   # "1X234,56"
-                                   .replace("X", "."))  # "1.234,56"
-                        text_values.append(val_str)
-                    else:
-                        text_values.append(None)
+                text_values = formato_serie(y_values, decimales=decimal_places).tolist()
             else:
                 text_values = None
  
@@ -180,7 +166,7 @@ def plot_multiple_time_series(df, date_col, value_col, group_col,
             xaxis=dict(
                 tickmode='array',
                 tickvals=df_pivoted.index,  # Usar el índice (mes-año) para los ticks
-                ticktext=[date.strftime('%B-%Y') for date in df_pivoted.index]  # Formato Mes-Año en español
+                ticktext=serie_mes_anio(df_pivoted.index) if mensual else [str(fecha.year) for fecha in df_pivoted.index]  # Mes-Año en español o solo el año
             ),
             # Leyenda en la parte inferior
             legend=dict(
@@ -241,6 +227,7 @@ def plot_multiple_time_series(df, date_col, value_col, group_col,
         return f"Error generando el gráfico: {e}"
     
 # Stacked bar chart Horizontal
+@figura_en_cache
 def plot_stacked_bar_chart_h(df, date_col, group_col, share_col, 
                             decimal_places=0, title=None, y_label=None, legend_title=None):
     """
@@ -282,12 +269,7 @@ def plot_stacked_bar_chart_h(df, date_col, group_col, share_col,
         )       
 
         # Crear la columna de texto con formato español (punto para miles, coma para decimales)
-        df["Valor"] = df[share_col].apply(
-            lambda val: (
-                f"{val:,.{decimal_places}f}".replace(",", "X").replace(".", ",").replace("X", ".") + "%"
-            )
-            if pd.notnull(val) else None
-        )
+        df["Valor"] = formato_serie(df[share_col], decimales=decimal_places, sufijo="%")
 
         # Crear el gráfico de barras apiladas horizontales
         fig = px.bar(
@@ -332,6 +314,7 @@ def plot_stacked_bar_chart_h(df, date_col, group_col, share_col,
         return f"Error generando el gráfico: {e}"
     
 # Stacked bar chart Vertical
+@figura_en_cache
 def plot_stacked_bar_chart_v(df, date_col, group_col, share_col,
                             decimal_places=0, title=None, y_label=None, legend_title=None):
     """
@@ -372,12 +355,7 @@ def plot_stacked_bar_chart_v(df, date_col, group_col, share_col,
         )      
  
         # Crear la columna de texto con formato español (punto para miles, coma para decimales)
-        df["Valor"] = df[share_col].apply(
-            lambda val: (
-                f"{val:,.{decimal_places}f}".replace(",", "X").replace(".", ",").replace("X", ".") + "%"
-            )
-            if pd.notnull(val) else None
-        )
+        df["Valor"] = formato_serie(df[share_col], decimales=decimal_places, sufijo="%")
  
         # Ordenar el DataFrame por la columna de fechas
         df = df.sort_values(by=date_col)
@@ -425,6 +403,7 @@ def plot_stacked_bar_chart_v(df, date_col, group_col, share_col,
     
 
 # Single bar chart
+@figura_en_cache
 def plot_single_bar_chart(df, date_col, value_col, 
                           title=None, x_label="", y_label="", y_units=None,
                           show_labels=False, decimal_places=0):
@@ -489,15 +468,7 @@ def plot_single_bar_chart(df, date_col, value_col,
         # Si show_labels, formatear en estilo español y posicionar etiquetas
         if show_labels:
             fig.update_traces(
-                text=df[value_col].apply(
-                    lambda x: (
-                        f"{x:,.{decimal_places}f}"
-                        .replace(",", "X")
-                        .replace(".", ",")
-                        .replace("X", ".")
-                    )
-                    if pd.notnull(x) else None
-                ),
+                text=formato_serie(df[value_col], decimales=decimal_places),
                 textposition="outside"  # Ubicar el texto encima de las barras
             )
 
@@ -508,6 +479,7 @@ def plot_single_bar_chart(df, date_col, value_col,
 
 # Side by side bars
 
+@figura_en_cache
 def plot_side_by_side_bars(df,date_col, var1_col, var2_col, title=None, x_label="",
     y_label="", y_units=None, show_labels=False, decimal_places=0,
     legend_title=None, legend_labels=None):
@@ -594,15 +566,7 @@ def plot_side_by_side_bars(df,date_col, var1_col, var2_col, title=None, x_label=
                 # 'trace.name' coincide con el nombre de la columna
                 col_name = trace.name  
                 # Asignar el texto con formateo “español”
-                text_values = df_pivoted[col_name].apply(
-                    lambda x: (
-                        f"{x:,.{decimal_places}f}"
-                         .replace(",", "X")
-                         .replace(".", ",")
-                         .replace("X", ".")
-                    )
-                    if pd.notnull(x) else None
-                )
+                text_values = formato_serie(df_pivoted[col_name], decimales=decimal_places)
                 trace.text = text_values
                 trace.textposition = "outside"
 
@@ -619,6 +583,7 @@ def plot_side_by_side_bars(df,date_col, var1_col, var2_col, title=None, x_label=
     
 # Treemap
 
+@figura_en_cache
 def plot_treemap(df, date_col, value_col, group_col, share_col,
         decimal_places=0, title=None, group_label="Grupo",
         value_label="Valor", share_label="Participación"):
@@ -661,36 +626,16 @@ def plot_treemap(df, date_col, value_col, group_col, share_col,
             subdf = df[df[date_col] == date_val].copy()
 
             # Formatear el porcentaje (share_col) con coma para decimales y punto para miles + '%'
-            subdf["formatted_share"] = subdf[share_col].apply(
-                lambda val: (
-                    f"{val:,.{decimal_places}f}"
-                    .replace(",", "X")
-                    .replace(".", ",")
-                    .replace("X", ".")
-                    + "%"
-                )
-                if pd.notnull(val) else None
-            )
+            subdf["formatted_share"] = formato_serie(subdf[share_col], decimales=decimal_places, sufijo="%")
 
             # Formatear la columna de valores (value_col) también al estilo “español”
-            subdf["formatted_value"] = subdf[value_col].apply(
-                lambda val: (
-                    f"{val:,.0f}"
-                    .replace(",", "X")
-                    .replace(".", ",")
-                    .replace("X", ".")
-                )
-                if pd.notnull(val) else None
-            )
+            subdf["formatted_value"] = formato_serie(subdf[value_col], decimales=0)
 
             # Crear etiquetas personalizadas con los parámetros de texto
-            subdf["custom_label"] = subdf.apply(
-                lambda row: (
-                    f"{group_label}: {row[group_col]}"
-                    + f"<br>{value_label}: {row['formatted_value']}"
-                    + f"<br>{share_label}: {row['formatted_share']}"
-                ),
-                axis=1
+            subdf["custom_label"] = (
+                f"{group_label}: " + subdf[group_col].astype(str)
+                + f"<br>{value_label}: " + subdf["formatted_value"].astype(str)
+                + f"<br>{share_label}: " + subdf["formatted_share"].astype(str)
             )
 
             # Crear la figura de Treemap para este subset
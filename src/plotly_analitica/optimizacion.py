@@ -0,0 +1,267 @@
+# Librerías
+import os
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from .cache import llave_de_figura
+
+#######################################
+# Optimización del payload de gráficos
+#######################################
+
+# Máximo de puntos por serie que se envían al navegador (configurable por variable de entorno)
+MAX_PUNTOS_SERIE = int(os.getenv('CITI_MAX_PUNTOS_SERIE', 600))
+
+# A partir de este número de puntos por serie se usa WebGL (Scattergl) en lugar de SVG
+UMBRAL_WEBGL = int(os.getenv('CITI_UMBRAL_WEBGL', 1000))
+
+# Máximo de marcas en el eje X cuando se usan tickvals/ticktext explícitos
+MAX_MARCAS_EJE = 24
+
+# Máximo de figuras optimizadas que se conservan entre ejecuciones (configurable por variable de entorno)
+MAX_FIGURAS_OPTIMIZADAS = int(os.getenv('CITI_MAX_FIGURAS_OPTIMIZADAS', 256))
+
+# Reporte del tamaño de payload por gráfico: llave -> dict
+_REPORTE_PAYLOAD = {}
+_CANDADO_REPORTE = threading.Lock()
+
+# Figuras optimizadas: (llave del gráfico, huella de la figura original) -> figura optimizada (orden LRU)
+_FIGURAS_OPTIMIZADAS = OrderedDict()
+
+def lttb(x, y, n_salida):
+    """
+    Submuestreo Largest-Triangle-Three-Buckets: selecciona n_salida puntos que preservan la forma de la serie.
+
+    Parámetros:
+        x (np.ndarray): Valores numéricos del eje X (ordenados).
+        y (np.ndarray): Valores del eje Y.
+        n_salida (int): Número de puntos a conservar (incluye el primero y el último).
+
+    Retorna:
+        np.ndarray: Índices de los puntos seleccionados.
+    """
+    n = len(x)
+    if n_salida >= n or n_salida < 3:
+        return np.arange(n)
+
+    indices = np.empty(n_salida, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    # Límites de los buckets (se excluyen el primer y el último punto)
+    limites = np.linspace(1, n - 1, n_salida - 1).astype(np.int64)
+    anterior = 0
+
+    for i in range(n_salida - 2):
+        inicio, fin = limites[i], limites[i + 1]
+
+        # Promedio del siguiente bucket (o el último punto)
+        sig_inicio, sig_fin = limites[i + 1], (limites[i + 2] if i + 2 < len(limites) else n)
+        x_prom = x[sig_inicio:sig_fin].mean()
+        y_prom = y[sig_inicio:sig_fin].mean()
+
+        # Punto del bucket actual que forma el triángulo de mayor área
+        areas = np.abs(
+            (x[anterior] - x_prom) * (y[inicio:fin] - y[anterior])
+            - (x[anterior] - x[inicio:fin]) * (y_prom - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(areas))
+        indices[i + 1] = anterior
+
+    return indices
+
+def indices_submuestreo(x, y, n_salida):
+    """
+    Índices de submuestreo LTTB de una serie con valores nulos: cada tramo continuo de valores válidos se submuestrea
+    por separado (con una cuota de puntos proporcional a su longitud) y se conserva un punto nulo por cada corte,
+    para que la línea mantenga sus interrupciones.
+
+    Parámetros:
+        x (np.ndarray): Valores numéricos del eje X (ordenados).
+        y (np.ndarray): Valores del eje Y (pueden incluir NaN).
+        n_salida (int): Número aproximado de puntos a conservar.
+
+    Retorna:
+        np.ndarray: Índices de los puntos seleccionados, en orden.
+    """
+    validos = ~(np.isnan(x) | np.isnan(y))
+    if validos.all():
+        return lttb(x, y, n_salida)
+    if not validos.any():
+        return np.arange(len(y))
+
+    # Límites de los tramos continuos (válidos o nulos)
+    limites = np.concatenate(([0], np.flatnonzero(np.diff(validos.astype(np.int8))) + 1, [len(y)]))
+    total_validos = int(validos.sum())
+
+    indices = []
+    for inicio, fin in zip(limites[:-1], limites[1:]):
+        if not validos[inicio]:
+            indices.append(np.array([inicio]))
+            continue
+        cuota = max(3, int(round(n_salida * (fin - inicio) / total_validos)))
+        indices.append(inicio + lttb(x[inicio:fin], y[inicio:fin], cuota))
+    return np.concatenate(indices)
+
+def _eje_numerico(valores):
+    """
+    Convierte los valores del eje X a numéricos (fechas a nanosegundos). Retorna None si no es posible.
+    """
+    serie = pd.Series(valores)
+    if pd.api.types.is_numeric_dtype(serie):
+        return serie.to_numpy(dtype=float)
+    try:
+        return pd.to_datetime(serie).astype('int64').to_numpy(dtype=float)
+    except Exception:
+        return None
+
+def optimizar_figura(fig, max_puntos=None, umbral_webgl=None):
+    """
+    Reduce el payload de una figura de Plotly antes de enviarla al navegador, sin modificar la figura original:
+    1. Submuestrea con LTTB las series de tipo Scatter con más de `max_puntos` puntos.
+    2. Usa trazas WebGL (Scattergl) cuando una serie supera `umbral_webgl` puntos.
+    3. Elimina el texto por punto cuando las etiquetas no se muestran (modo sin 'text').
+    4. Limita las marcas explícitas del eje X a un máximo de MAX_MARCAS_EJE.
+
+    Parámetros:
+        fig (go.Figure): Figura a optimizar.
+        max_puntos (int): Máximo de puntos por serie. Por defecto MAX_PUNTOS_SERIE.
+        umbral_webgl (int): Puntos a partir de los cuales se usa WebGL. Por defecto UMBRAL_WEBGL.
+
+    Retorna:
+        go.Figure: Nueva figura optimizada.
+    """
+    max_puntos = max_puntos or MAX_PUNTOS_SERIE
+    umbral_webgl = umbral_webgl or UMBRAL_WEBGL
+
+    trazas = []
+    for traza in fig.data:
+        if traza.type != 'scatter' or traza.x is None or traza.y is None:
+            trazas.append(traza)
+            continue
+
+        propiedades = traza.to_plotly_json()
+        propiedades.pop('type', None)
+        n_puntos = len(traza.x)
+        modo = propiedades.get('mode') or ''
+
+        # Texto por punto redundante si no se muestran etiquetas
+        if 'text' not in modo:
+            propiedades.pop('text', None)
+            propiedades.pop('textposition', None)
+
+        # Submuestreo LTTB preservando la forma
+        if n_puntos > max_puntos:
+            x_num = _eje_numerico(traza.x)
+            y_num = pd.to_numeric(pd.Series(traza.y), errors='coerce').to_numpy(dtype=float)
+            if x_num is not None:
+                indices = indices_submuestreo(x_num, y_num, max_puntos)
+                for atributo in ['x', 'y', 'text', 'customdata', 'hovertext']:
+                    valores = propiedades.get(atributo)
+                    if valores is not None and not isinstance(valores, str) and len(valores) == n_puntos:
+                        propiedades[atributo] = np.asarray(valores, dtype=object)[indices] if atributo != 'y' else np.asarray(valores)[indices]
+
+        # WebGL para series largas
+        if n_puntos > umbral_webgl:
+            trazas.append(go.Scattergl(**propiedades))
+        else:
+            trazas.append(go.Scatter(**propiedades))
+
+    fig_optimizada = go.Figure(data=trazas, layout=fig.layout)
+
+    # Limitar las marcas explícitas del eje X
+    eje_x = fig_optimizada.layout.xaxis
+    if eje_x.tickvals is not None and len(eje_x.tickvals) > MAX_MARCAS_EJE:
+        paso = int(np.ceil(len(eje_x.tickvals) / MAX_MARCAS_EJE))
+        fig_optimizada.update_xaxes(
+            tickvals=list(eje_x.tickvals)[::paso],
+            ticktext=list(eje_x.ticktext)[::paso] if eje_x.ticktext is not None else None
+        )
+
+    return fig_optimizada
+
+def tamano_payload(fig):
+    """
+    Calcula el tamaño en bytes del JSON que se envía al navegador para una figura.
+
+    Parámetros:
+        fig (go.Figure): Figura de Plotly.
+
+    Retorna:
+        int: Tamaño del JSON en bytes.
+    """
+    return len(fig.to_json().encode('utf-8'))
+
+def registrar_payload(llave, bytes_original, bytes_optimizado, puntos):
+    """
+    Registra el tamaño de payload de un gráfico para el reporte por gráfico.
+    """
+    with _CANDADO_REPORTE:
+        _REPORTE_PAYLOAD[llave] = {
+            'Gráfico': llave,
+            'Puntos': puntos,
+            'Payload original (KB)': round(bytes_original / 1024, 1),
+            'Payload optimizado (KB)': round(bytes_optimizado / 1024, 1),
+            'Reducción (%)': round(100 * (1 - bytes_optimizado / bytes_original), 1) if bytes_original else 0.0
+        }
+
+def reporte_payload():
+    """
+    Retorna el reporte de tamaño de payload por gráfico.
+
+    Retorna:
+        pd.DataFrame: Una fila por gráfico, ordenado de mayor a menor payload optimizado.
+    """
+    with _CANDADO_REPORTE:
+        filas = list(_REPORTE_PAYLOAD.values())
+    columnas = ['Gráfico', 'Puntos', 'Payload original (KB)', 'Payload optimizado (KB)', 'Reducción (%)']
+    df = pd.DataFrame(filas, columns=columnas)
+    return df.sort_values('Payload optimizado (KB)', ascending=False).reset_index(drop=True)
+
+def _huella_figura(fig):
+    """
+    Identifica el contenido de una figura: la llave de figura_en_cache si la figura proviene de la caché o, si no,
+    un hash de su representación. Retorna None si no es posible calcularla.
+    """
+    llave = llave_de_figura(fig)
+    if llave is not None:
+        return llave
+    try:
+        return hashlib.blake2b(pickle.dumps(fig.to_plotly_json()), digest_size=16).hexdigest()
+    except Exception:
+        return None
+
+def preparar_figura(fig, llave):
+    """
+    Optimiza una figura para su envío al navegador y registra su payload antes y después. La figura optimizada se
+    conserva por llave y contenido: en las siguientes ejecuciones con la misma figura se retorna sin volver a
+    optimizarla ni a medir su payload (el payload se mide una sola vez por figura).
+
+    Parámetros:
+        fig (go.Figure): Figura original (no se modifica).
+        llave (str): Identificador del gráfico en la página.
+
+    Retorna:
+        go.Figure: Figura optimizada. Es compartida entre ejecuciones: se envía al navegador y no se debe modificar.
+    """
+    huella = _huella_figura(fig)
+    if huella is not None:
+        with _CANDADO_REPORTE:
+            fig_optimizada = _FIGURAS_OPTIMIZADAS.get((llave, huella))
+            if fig_optimizada is not None:
+                _FIGURAS_OPTIMIZADAS.move_to_end((llave, huella))
+                return fig_optimizada
+
+    fig_optimizada = optimizar_figura(fig)
+    puntos = sum(len(t.x) for t in fig.data if getattr(t, 'x', None) is not None)
+    registrar_payload(llave, tamano_payload(fig), tamano_payload(fig_optimizada), puntos)
+
+    if huella is not None:
+        with _CANDADO_REPORTE:
+            _FIGURAS_OPTIMIZADAS[(llave, huella)] = fig_optimizada
+            while len(_FIGURAS_OPTIMIZADAS) > MAX_FIGURAS_OPTIMIZADAS:
+                _FIGURAS_OPTIMIZADAS.popitem(last=False)
+    return fig_optimizada
@@ -1,6 +1,18 @@
 # Importar módulos
 from .config import create_session_from_json, create_session_from_toml
-from .helpers import get_session_info, update_session_params, clean_column_name, ejecutar_script_sql_snowpark
-from .ddl import generate_create_table_script, upload_dataframe_to_snowflake
-from .dml import registrar_evento_auditoria, validador_cargue, validador_cargue_path, obtener_selector, obtener_regiones_disponibles, obtener_paises_por_region, ejecutar_consulta_segura, ejecutar_multiples_consultas, obtener_iso_code
-from .streamlit_snowflake import create_session, check_session, update_last_activity, flujo_snowflake, registrar_evento
\ No newline at end of file
+from .helpers import MAX_CONCURRENCIA_SQL, get_session_info, update_session_params, clean_column_name, dividir_sentencias_sql, objetos_sentencia, construir_grafo_dependencias, ejecutar_script_sql_paralelo, ejecutar_script_sql_snowpark
+from .ddl import TAMANO_ARCHIVO_CARGUE_MB, PARALELO_WRITE_PANDAS, generate_create_table_script, calcular_chunk_size, upload_dataframe_to_snowflake, inferir_tipo_snowflake, inferir_tipos_snowflake, columnas_decimales_enteras, consultar_columnas_tabla, generar_script_evolucion, evolucionar_tabla, validar_esquema_tablas
+from .dml import registrar_evento_auditoria, validador_cargue, validador_cargue_path, obtener_selector, obtener_regiones_disponibles, obtener_paises_por_region, ejecutar_consulta_segura, ejecutar_multiples_consultas, obtener_iso_code, obtener_ids_paises
+from .streamlit_snowflake import SesionDiferida, create_session, check_session, update_last_activity, flujo_snowflake, registrar_evento
+from .servicio import ESQUEMA_SERVICIO, TABLAS_SERVICIO, materializar_tabla_servicio, materializar_tablas_servicio
+from .actualizacion import TABLA_ESTADO, FUENTES, calcular_firma_tabla, obtener_estado_registrado, planificar_actualizacion, filtrar_script_por_secciones, ajustar_plan_por_errores, registrar_estado
+from .replica import RUTA_REPLICA, MODO_LECTURA, TABLAS_REPLICA, exportar_replica, traducir_consulta_replica, consultar_replica, replica_disponible, version_replica, consultar_filas, estado_replica
+from .ingesta import MAX_PROCESOS_INGESTA, MAX_CARGAS_INGESTA, MAX_ARCHIVOS_EN_MEMORIA, tabla_existe, ejecutar_ingesta
+from .transformaciones import convertir_columnas, validar_columnas, ESQUEMAS_GLOBAL_DATA, transformar_archivo_global_data, HOJA_OAG, COLUMNAS_ENTERAS_OAG, transformar_lote_oag, transformar_archivo_oag, transformar_archivo_iata, transformar_archivo_credibanco, ESQUEMA_CREDIBANCO, ESQUEMA_FORWARD_KEYS_RESERVAS, ESQUEMA_FORWARD_KEYS_BUSQUEDAS, PATH_ERRORES_CREDIBANCO, REGLAS_GLOBAL_DATA, REGLAS_OAG, REGLAS_IATA, REGLAS_CREDIBANCO, REGLAS_FORWARD_KEYS_RESERVAS, REGLAS_FORWARD_KEYS_BUSQUEDAS
+from .carga_por_lotes import MEMORIA_MAXIMA_INGESTA_MB, leer_csv_por_lotes, leer_excel_por_lotes, contar_registros_csv, contar_registros_excel, contar_registros_csv_tipado, estimar_filas_por_lote, consultar_control_tabla, cargar_archivo_por_lotes
+from .lectura_tipada import VALORES_NULOS, TIPOS_SNOWFLAKE, columnas_tipo, tipos_snowflake_esquema, leer_csv_tipado, leer_csv_tipado_por_lotes, leer_parquet_tipado_por_lotes, contar_registros_parquet, diagnosticar_csv
+from .validacion import evaluar_reglas, validar_datos, cargar_referencias, consultar_registros_anteriores, combinar_reportes, exportar_errores
+from .carga_copy import STAGE_CARGUE, MAX_HILOS_PUT, MAX_REINTENTOS_COPY, crear_stage, crear_tabla_copy, evolucionar_tabla_copy, escribir_parquet, subir_lotes_stage, copiar_desde_stage, limpiar_stage
+from .manifiesto import TABLA_MANIFIESTO, ESTADOS_MANIFIESTO, COLUMNA_LINAJE, crear_tabla_manifiesto, calcular_hash_archivo, calcular_hash_lote, registrar_manifiesto, actualizar_estado_manifiesto, reiniciar_manifiesto, contenidos_reemplazados, eliminar_contenidos, consultar_manifiesto, validador_cargue_manifiesto
+from .extraccion import RUTA_DATOS, MAX_HILOS_EXTRACCION, EXTRACCION_FORWARD_KEYS_BUSQUEDAS, EXTRACCION_FORWARD_KEYS_RESERVAS, consultar_firmas_particiones, extraer_particion, extraer_particiones
+from .cache_excel import RUTA_CACHE_EXCEL, convertir_libro_excel, tabla_a_pandas, leer_hojas_excel, leer_hoja_excel, ruta_hoja_excel
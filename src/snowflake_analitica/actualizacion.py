@@ -0,0 +1,282 @@
+# Librerías
+import re
+from .helpers import dividir_sentencias_sql
+from .servicio import TABLAS_SERVICIO
+
+############################################################
+# Actualización incremental de las vistas y tablas de servicio
+############################################################
+
+# Tabla donde se registra la firma de cada tabla de origen en la última actualización exitosa
+TABLA_ESTADO = 'AUDITORIA.ESTADO_FUENTES'
+
+# Tablas de origen de cada fuente. Las correlativas alimentan la vista de geografía y, por lo tanto, todas las demás.
+FUENTES = {
+    'CORRELATIVAS': [
+        'CORRELATIVAS.PAISES',
+        'CORRELATIVAS.CONTINENTES',
+        'CORRELATIVAS.REGIONES',
+        'CORRELATIVAS.PAISES_MIGRACION',
+        'CORRELATIVAS.PAISES_GLOBALDATA',
+        'CORRELATIVAS.PAISES_OAG',
+        'CORRELATIVAS.PAISES_CREDIBANCO',
+        'CORRELATIVAS.PAISES_IATAGAP',
+        'CORRELATIVAS.PAISES_FORWARDKEYS',
+        'CORRELATIVAS.DIVIPOLA_AEROPUERTOS'
+    ],
+    'GLOBALDATA': [
+        'GLOBALDATA.FLUJO_VIAJEROS_MUNDO',
+        'GLOBALDATA.NOCHES_PROMEDIO',
+        'GLOBALDATA.CATEGORIAS_GASTO',
+        'GLOBALDATA.RANGO_EDAD',
+        'GLOBALDATA.MOTIVO_VIAJE',
+        'GLOBALDATA.FORMA_VIAJE',
+        'GLOBALDATA.FLUJO_VIAJEROS_REGION',
+        'GLOBALDATA.FLUJO_MICE'
+    ],
+    'OAG': ['OAG.CONECTIVIDAD_DIRECTA'],
+    'FORWARDKEYS': ['FORWARDKEYS.RESERVAS', 'FORWARDKEYS.BUSQUEDAS'],
+    'CREDIBANCO': ['CREDIBANCO.GASTO'],
+    'IATAGAP': ['IATAGAP.AGENCIAS']
+}
+
+# Sección de creacion_vistas.sql que depende de cada fuente (encabezados "-- N. Nombre")
+SECCIONES_SQL = {
+    'CORRELATIVAS': 'Geografía',
+    'GLOBALDATA': 'GlobalData',
+    'OAG': 'OAG',
+    'FORWARDKEYS': 'ForwardKeys',
+    'CREDIBANCO': 'Credibanco',
+    'IATAGAP': 'IATA-GAP'
+}
+
+# Tablas de servicio que no siguen el prefijo <FUENTE>_
+TABLAS_SERVICIO_CORRELATIVAS = ['DIM_PAIS']
+
+# Secciones de creacion_vistas.sql que combinan varias fuentes: sección -> (fuentes de las que depende, tablas de servicio).
+# Se reconstruyen si cambia cualquiera de sus fuentes y solo se publican si sus fuentes se reconstruyeron sin errores.
+SECCIONES_COMPARTIDAS = {
+    'Referencias entre países': (['GLOBALDATA', 'OAG', 'CREDIBANCO'], ['BENCHMARK_PAISES'])
+}
+
+def calcular_firma_tabla(sesion_activa, tabla):
+    """
+    Calcula la firma de contenido de una tabla con HASH_AGG(*), que cambia si cambia cualquier registro
+    (a diferencia de la fecha de modificación, que cambia aunque se recargue el mismo archivo).
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - tabla (str): Nombre de la tabla en formato ESQUEMA.TABLA.
+
+    Retorna:
+    - str: Firma de la tabla (HASH_AGG y número de registros). None si la tabla no existe o no se puede leer.
+    """
+    try:
+        resultado = sesion_activa.sql(f"SELECT HASH_AGG(*) AS FIRMA, COUNT(*) AS REGISTROS FROM {tabla}").collect()[0]
+        return f"{resultado['FIRMA']}-{resultado['REGISTROS']}"
+    except Exception as e:
+        print(f"No fue posible calcular la firma de {tabla}: {str(e)}")
+        return None
+
+def obtener_estado_registrado(sesion_activa):
+    """
+    Lee las firmas registradas en la última actualización exitosa. Crea la tabla de estado si no existe.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+
+    Retorna:
+    - dict: Diccionario {tabla: firma}.
+    """
+    sesion_activa.sql(f"""
+        CREATE TABLE IF NOT EXISTS {TABLA_ESTADO} (
+            TABLA VARCHAR(255),
+            FIRMA VARCHAR(255),
+            FECHA_ACTUALIZACION TIMESTAMP
+        )
+    """).collect()
+
+    resultados = sesion_activa.sql(f"SELECT TABLA, FIRMA FROM {TABLA_ESTADO}").collect()
+    return {row['TABLA']: row['FIRMA'] for row in resultados}
+
+def planificar_actualizacion(sesion_activa, forzar=False):
+    """
+    Compara la firma actual de cada tabla de origen con la registrada en la última actualización y determina
+    qué fuentes cambiaron y qué objetos deben reconstruirse.
+
+    Una fuente se considera modificada si alguna de sus tablas cambió de firma, no tiene firma registrada
+    o no se pudo leer. Si cambian las correlativas se reconstruye todo, porque todas las vistas usan la geografía.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - forzar (bool): Si es True, marca todas las fuentes como modificadas (actualización completa).
+
+    Retorna:
+    - dict: Plan con las llaves:
+        - 'fuentes' (list): Fuentes modificadas, en el orden de FUENTES.
+        - 'secciones_sql' (list): Secciones de creacion_vistas.sql a ejecutar.
+        - 'tablas_servicio' (dict): Subconjunto de TABLAS_SERVICIO a materializar.
+        - 'firmas' (dict): Firmas actuales {tabla: firma} de las fuentes modificadas, para registrar al final.
+    """
+    estado_registrado = {} if forzar else obtener_estado_registrado(sesion_activa)
+
+    fuentes_modificadas = []
+    firmas = {}
+    for fuente, tablas in FUENTES.items():
+        firmas_fuente = {tabla: calcular_firma_tabla(sesion_activa, tabla) for tabla in tablas}
+        cambios = [tabla for tabla, firma in firmas_fuente.items() if firma is None or estado_registrado.get(tabla) != firma]
+        if forzar or cambios:
+            fuentes_modificadas.append(fuente)
+            firmas.update({tabla: firma for tabla, firma in firmas_fuente.items() if firma is not None})
+            print(f"Fuente {fuente}: {'actualización completa' if forzar else 'cambios en ' + ', '.join(cambios)}.")
+        else:
+            print(f"Fuente {fuente}: sin cambios desde la última actualización.")
+
+    # Las correlativas alimentan la geografía, de la que dependen todas las vistas
+    fuentes_a_reconstruir = list(FUENTES) if 'CORRELATIVAS' in fuentes_modificadas else fuentes_modificadas
+
+    secciones_compartidas = _secciones_compartidas(fuentes_a_reconstruir)
+
+    return {
+        'fuentes': fuentes_modificadas,
+        'secciones_sql': [SECCIONES_SQL[fuente] for fuente in fuentes_a_reconstruir] + secciones_compartidas,
+        'tablas_servicio': _tablas_servicio_fuentes(fuentes_a_reconstruir, secciones_compartidas),
+        'firmas': firmas
+    }
+
+def _secciones_compartidas(fuentes):
+    """
+    Retorna las secciones de SECCIONES_COMPARTIDAS que dependen de alguna de las fuentes indicadas.
+    """
+    return [seccion for seccion, (dependencias, _) in SECCIONES_COMPARTIDAS.items() if any(fuente in fuentes for fuente in dependencias)]
+
+def _tablas_servicio_fuentes(fuentes, secciones_compartidas=()):
+    """
+    Retorna el subconjunto de TABLAS_SERVICIO que se construye a partir de las fuentes y secciones compartidas indicadas.
+    """
+    tablas_compartidas = {tabla for seccion in secciones_compartidas for tabla in SECCIONES_COMPARTIDAS[seccion][1]}
+    return {
+        nombre: llaves for nombre, llaves in TABLAS_SERVICIO.items()
+        if any(nombre.startswith(f"{fuente}_") for fuente in fuentes)
+        or ('CORRELATIVAS' in fuentes and nombre in TABLAS_SERVICIO_CORRELATIVAS)
+        or nombre in tablas_compartidas
+    }
+
+def _dividir_secciones(sql_script):
+    """
+    Divide el script de vistas en bloques que empiezan en cada encabezado "-- N. Nombre".
+
+    Retorna:
+    - list: Lista de tuplas (numero, nombre, bloque). El preámbulo sin encabezado tiene número y nombre None.
+    """
+    secciones = []
+    for bloque in re.split(r'(?m)^(?=-+\n-- \d+\. )', sql_script):
+        encabezado = re.match(r'-+\n-- (\d+)\. (.+)\n', bloque)
+        if encabezado is None:
+            secciones.append((None, None, bloque))
+        else:
+            secciones.append((encabezado.group(1), encabezado.group(2).strip(), bloque))
+    return secciones
+
+def filtrar_script_por_secciones(sql_script, secciones):
+    """
+    Conserva del script de vistas únicamente las variables de contexto y las secciones indicadas.
+    Las secciones se identifican por sus encabezados de la forma "-- N. Nombre".
+
+    Parámetros:
+    - sql_script (str): Contenido de creacion_vistas.sql.
+    - secciones (list): Nombres de las secciones a conservar (por ejemplo ['ForwardKeys']).
+
+    Retorna:
+    - str: Script con las variables de contexto y las secciones seleccionadas.
+    """
+    script_filtrado = []
+    for numero, nombre, bloque in _dividir_secciones(sql_script):
+        # Conservar el preámbulo y la sección 0 (variables de contexto)
+        if numero is None or numero == '0' or nombre in secciones:
+            script_filtrado.append(bloque)
+
+    return ''.join(script_filtrado)
+
+def ajustar_plan_por_errores(plan, sql_script, errores):
+    """
+    Restringe el plan de actualización a las secciones cuyas sentencias se ejecutaron todas con éxito, para que
+    solo se materialicen sus tablas de servicio y solo se registren las firmas de sus fuentes. Las fuentes de una
+    sección con errores conservan la firma anterior y se reconstruyen en la siguiente ejecución.
+
+    Un error en el preámbulo o en la sección 0 (variables de contexto) invalida todas las secciones. Las firmas de
+    las correlativas solo se registran si todas las secciones reconstruidas terminaron sin errores, porque todas
+    las vistas dependen de la geografía. Una sección compartida (SECCIONES_COMPARTIDAS) solo se publica si ella y
+    las secciones de sus fuentes terminaron sin errores; si la sección compartida falla, tampoco se registran las
+    firmas de sus fuentes, para que se reconstruya en la siguiente ejecución.
+
+    Parámetros:
+    - plan (dict): Plan retornado por planificar_actualizacion.
+    - sql_script (str): Script ejecutado (filtrado con filtrar_script_por_secciones).
+    - errores (list): Errores retornados por ejecutar_script_sql_paralelo ({'sentencia': str, 'error': str}).
+
+    Retorna:
+    - dict: Plan con las mismas llaves de planificar_actualizacion, limitado a las secciones exitosas, y la llave
+      adicional 'secciones_fallidas' (list) con las secciones que tuvieron errores.
+    """
+    sentencias_fallidas = {error['sentencia'] for error in errores}
+
+    secciones_fallidas = []
+    for numero, nombre, bloque in _dividir_secciones(sql_script):
+        if any(sentencia in sentencias_fallidas for sentencia in dividir_sentencias_sql(bloque)):
+            # Un error fuera de las secciones de fuentes afecta a todo el script
+            if numero is None or numero == '0':
+                secciones_fallidas = list(plan['secciones_sql'])
+                break
+            secciones_fallidas.append(nombre)
+
+    fuentes_reconstruidas = [fuente for fuente, seccion in SECCIONES_SQL.items() if seccion in plan['secciones_sql']]
+    fuentes_exitosas = [fuente for fuente in fuentes_reconstruidas if SECCIONES_SQL[fuente] not in secciones_fallidas]
+
+    # Secciones compartidas: se publican si ni ellas ni las secciones de sus fuentes fallaron
+    compartidas_reconstruidas = [seccion for seccion in SECCIONES_COMPARTIDAS if seccion in plan['secciones_sql']]
+    compartidas_exitosas = [
+        seccion for seccion in compartidas_reconstruidas
+        if seccion not in secciones_fallidas
+        and not any(SECCIONES_SQL[fuente] in secciones_fallidas for fuente in SECCIONES_COMPARTIDAS[seccion][0])
+    ]
+    fuentes_compartidas_fallidas = {fuente for seccion in compartidas_reconstruidas if seccion in secciones_fallidas
+                                    for fuente in SECCIONES_COMPARTIDAS[seccion][0]}
+
+    # Las correlativas solo se dan por actualizadas si todas las vistas que dependen de ellas se reconstruyeron
+    fuentes_registrables = [fuente for fuente in fuentes_exitosas
+                            if (fuente != 'CORRELATIVAS' or not secciones_fallidas) and fuente not in fuentes_compartidas_fallidas]
+    tablas_registrables = {tabla for fuente in fuentes_registrables for tabla in FUENTES[fuente]}
+
+    return {
+        'fuentes': [fuente for fuente in plan['fuentes'] if fuente in fuentes_registrables],
+        'secciones_sql': [SECCIONES_SQL[fuente] for fuente in fuentes_exitosas] + compartidas_exitosas,
+        'tablas_servicio': _tablas_servicio_fuentes(fuentes_exitosas, compartidas_exitosas),
+        'firmas': {tabla: firma for tabla, firma in plan['firmas'].items() if tabla in tablas_registrables},
+        'secciones_fallidas': secciones_fallidas
+    }
+
+def registrar_estado(sesion_activa, firmas):
+    """
+    Registra las firmas de las tablas de origen después de una actualización exitosa.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - firmas (dict): Diccionario {tabla: firma}.
+    """
+    if not firmas:
+        return
+
+    valores = ',\n'.join(f"('{tabla}', '{firma}')" for tabla, firma in firmas.items())
+    sesion_activa.sql(f"""
+        MERGE INTO {TABLA_ESTADO} AS ESTADO
+        USING (SELECT COLUMN1 AS TABLA, COLUMN2 AS FIRMA FROM VALUES {valores}) AS NUEVO
+            ON ESTADO.TABLA = NUEVO.TABLA
+        WHEN MATCHED THEN UPDATE SET
+            FIRMA = NUEVO.FIRMA,
+            FECHA_ACTUALIZACION = CONVERT_TIMEZONE('America/Los_Angeles', 'America/Bogota', CURRENT_TIMESTAMP)
+        WHEN NOT MATCHED THEN INSERT (TABLA, FIRMA, FECHA_ACTUALIZACION)
+            VALUES (NUEVO.TABLA, NUEVO.FIRMA, CONVERT_TIMEZONE('America/Los_Angeles', 'America/Bogota', CURRENT_TIMESTAMP))
+    """).collect()
+
+    print(f"Estado de {len(firmas)} tabla(s) de origen registrado.")
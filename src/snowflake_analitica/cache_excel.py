@@ -0,0 +1,318 @@
+# Librerías
+import os
+import re
+import shutil
+import json
+import datetime
+import pandas as pd
+from .manifiesto import calcular_hash_archivo
+from .lectura_tipada import VALORES_NULOS
+from .extraccion import RUTA_DATOS
+
+# pyarrow es opcional: sin la librería no es posible la caché de Excel en Parquet
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# python-calamine es opcional: si está instalada se usa para leer los libros (más rápida que openpyxl)
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# openpyxl es opcional: lectura de los libros en modo de solo lectura cuando no está python-calamine
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+#########################################
+# Caché en Parquet de los libros de Excel
+#########################################
+
+# Cada hoja de un libro se convierte una sola vez a Parquet en {RUTA_CACHE_EXCEL}/{hash del libro}/. Un libro con el
+# mismo contenido (aunque cambie de nombre o de carpeta) reutiliza la caché; un libro modificado genera otra.
+RUTA_CACHE_EXCEL = os.getenv('CITI_RUTA_CACHE_EXCEL', os.path.join(RUTA_DATOS, 'CACHE_EXCEL'))
+
+# Índice de las hojas convertidas de un libro ({hoja|skiprows: archivo Parquet})
+ARCHIVO_INDICE_CACHE = 'indice.json'
+
+# Filas que se acumulan antes de convertirlas a columnas de Arrow (memoria de la conversión)
+FILAS_POR_BLOQUE_EXCEL = 50000
+
+def _valor_celda(valor):
+    """
+    Normaliza el valor de una celda como lo hace pd.read_excel: los números enteros guardados como decimales quedan
+    enteros y las celdas vacías quedan nulas.
+    """
+    if valor == '' or valor is None:
+        return None
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    return valor
+
+def _texto_celda(valor):
+    """
+    Representación en texto de una celda (la misma de pd.read_excel con dtype=str).
+    """
+    if isinstance(valor, (datetime.datetime, datetime.date)):
+        return str(pd.Timestamp(valor))
+    return str(valor)
+
+def _columna_arrow(valores):
+    """
+    Convierte los valores de una columna a un arreglo de Arrow con el tipo que pandas inferiría: booleano, entero,
+    decimal, fecha o texto (las columnas con valores de varios tipos quedan como texto).
+    """
+    tipos = {type(valor) for valor in valores if valor is not None}
+    if not tipos:
+        return pa.nulls(len(valores))
+    if tipos == {bool}:
+        return pa.array(valores, pa.bool_())
+    if tipos == {int}:
+        return pa.array(valores, pa.int64())
+    if tipos <= {int, float}:
+        return pa.array(valores, pa.float64())
+    if tipos <= {datetime.datetime, datetime.date}:
+        return pa.array([pd.Timestamp(valor).to_pydatetime() if valor is not None else None for valor in valores], pa.timestamp('us'))
+    return pa.array([_texto_celda(valor) if valor is not None else None for valor in valores], pa.string())
+
+def _tipo_unificado(tipos):
+    """
+    Tipo de una columna a partir de los tipos de sus bloques: enteros y decimales quedan decimales, y si hay bloques
+    de tipos distintos la columna queda como texto.
+    """
+    tipos = {tipo for tipo in tipos if tipo != pa.null()}
+    if not tipos:
+        return pa.null()
+    if len(tipos) == 1:
+        return tipos.pop()
+    if tipos <= {pa.int64(), pa.float64()}:
+        return pa.float64()
+    return pa.string()
+
+def _convertir_columna(columna, tipo):
+    """
+    Convierte un bloque de una columna al tipo unificado (los valores que no son texto se escriben como en
+    pd.read_excel con dtype=str).
+    """
+    if tipo == pa.string() and columna.type not in (pa.string(), pa.null()):
+        return pa.array([_texto_celda(valor) if valor is not None else None for valor in columna.to_pylist()], pa.string())
+    return columna.cast(tipo)
+
+def _nombres_columnas(encabezado):
+    """
+    Nombres de columna de una hoja como los asigna pd.read_excel ('Unnamed: i' y sufijos .1, .2 para repetidos).
+    """
+    nombres, vistos = [], {}
+    for i, valor in enumerate(encabezado):
+        nombre = str(_valor_celda(valor)) if _valor_celda(valor) is not None else f'Unnamed: {i}'
+        if nombre in vistos:
+            vistos[nombre] += 1
+            nombre = f"{nombre}.{vistos[nombre]}"
+        else:
+            vistos[nombre] = 0
+        nombres.append(nombre)
+    return nombres
+
+def _filas_libro(ruta_archivo):
+    """
+    Abre el libro una sola vez y retorna (nombres de las hojas, función hoja -> generador de filas).
+    Usa python-calamine si está instalada y, si no, openpyxl en modo de solo lectura.
+    """
+    if CalamineWorkbook is not None:
+        libro = CalamineWorkbook.from_path(ruta_archivo)
+        return libro.sheet_names, lambda hoja: iter(libro.get_sheet_by_name(hoja).to_python(skip_empty_area=False)), None
+    if load_workbook is None:
+        raise Exception("La lectura de Excel requiere la librería python-calamine u openpyxl (pip install openpyxl).")
+    libro = load_workbook(ruta_archivo, read_only=True, data_only=True)
+    return libro.sheetnames, lambda hoja: libro[hoja].iter_rows(values_only=True), libro
+
+def _convertir_hoja(filas, skiprows, ruta_parquet):
+    """
+    Convierte las filas de una hoja a un archivo Parquet por bloques: la primera fila no vacía después de `skiprows`
+    es el encabezado y las filas vacías se omiten, igual que con pd.read_excel. Las celdas con datos más allá del
+    encabezado agregan columnas 'Unnamed: i', como en pandas.
+
+    Cada bloque se escribe en un Parquet temporal con los tipos de sus valores; al final los bloques se reescriben uno
+    a uno (pq.ParquetWriter) con el tipo unificado de cada columna, sin tener la hoja completa en memoria.
+
+    Retorna:
+    - int: Registros convertidos.
+    """
+    nombres, tipos, bloque, registros = None, [], [], 0
+    directorio_bloques = f"{ruta_parquet}.bloques"
+    shutil.rmtree(directorio_bloques, ignore_errors=True)
+    os.makedirs(directorio_bloques)
+    rutas_bloques = []
+
+    def cerrar_bloque():
+        columnas = [_columna_arrow(list(columna)) for columna in zip(*(fila + [None] * (len(nombres) - len(fila)) for fila in bloque))]
+        for i, columna in enumerate(columnas):
+            tipos[i].add(columna.type)
+        rutas_bloques.append(os.path.join(directorio_bloques, f"{len(rutas_bloques)}.parquet"))
+        pq.write_table(pa.table(columnas, names=list(nombres)), rutas_bloques[-1])
+        bloque.clear()
+
+    try:
+        for numero, fila in enumerate(filas):
+            if numero < skiprows:
+                continue
+            fila = [_valor_celda(valor) for valor in fila]
+            if all(valor is None for valor in fila):
+                continue
+            while fila[-1] is None:
+                fila.pop()
+            if nombres is None:
+                nombres = _nombres_columnas(fila)
+                tipos = [set() for _ in nombres]
+                continue
+            # Columnas sin encabezado: nulas en los bloques anteriores
+            for i in range(len(nombres), len(fila)):
+                nombres.append(f'Unnamed: {i}')
+                tipos.append(set())
+            bloque.append(fila)
+            registros += 1
+            if len(bloque) >= FILAS_POR_BLOQUE_EXCEL:
+                cerrar_bloque()
+        if nombres is None:
+            nombres = []
+        if bloque:
+            cerrar_bloque()
+
+        # Reescribir los bloques con el tipo unificado de cada columna
+        esquema = pa.schema([(nombre, _tipo_unificado(tipos_columna)) for nombre, tipos_columna in zip(nombres, tipos)])
+        with pq.ParquetWriter(f"{ruta_parquet}.parcial", esquema) as escritor:
+            if not rutas_bloques:
+                escritor.write_table(esquema.empty_table())
+            for ruta_bloque in rutas_bloques:
+                tabla = pq.read_table(ruta_bloque)
+                columnas = [_convertir_columna(tabla.column(campo.name), campo.type) if campo.name in tabla.column_names
+                            else pa.nulls(tabla.num_rows, campo.type) for campo in esquema]
+                escritor.write_table(pa.Table.from_arrays(columnas, schema=esquema))
+                del tabla, columnas
+        os.replace(f"{ruta_parquet}.parcial", ruta_parquet)
+    finally:
+        shutil.rmtree(directorio_bloques, ignore_errors=True)
+    return registros
+
+def _llave_hoja(hoja, skiprows):
+    """
+    Llave de una hoja en el índice de la caché.
+    """
+    return f"{hoja}|{skiprows}"
+
+def convertir_libro_excel(ruta_archivo, hojas, skiprows=0):
+    """
+    Convierte las hojas de un libro de Excel a archivos Parquet (una sola vez por contenido del libro). Las hojas que
+    no están en la caché se extraen con una sola apertura del libro.
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del libro.
+    - hojas (list): Nombres (o posiciones) de las hojas.
+    - skiprows (int): Filas que se omiten antes del encabezado en todas las hojas.
+
+    Retorna:
+    - dict: {hoja: ruta del archivo Parquet}.
+
+    Excepciones:
+    - Exception: Si no están instaladas las librerías requeridas.
+    - ValueError: Si una hoja no existe en el libro.
+    """
+    if pa is None:
+        raise Exception("La caché de Excel requiere la librería pyarrow (pip install pyarrow).")
+
+    directorio = os.path.join(RUTA_CACHE_EXCEL, calcular_hash_archivo(ruta_archivo)['hash'])
+    ruta_indice = os.path.join(directorio, ARCHIVO_INDICE_CACHE)
+    indice = {}
+    if os.path.exists(ruta_indice):
+        with open(ruta_indice, 'r', encoding='utf-8') as archivo:
+            indice = json.load(archivo)
+
+    rutas = {hoja: os.path.join(directorio, indice[_llave_hoja(hoja, skiprows)]) for hoja in hojas
+             if _llave_hoja(hoja, skiprows) in indice and os.path.exists(os.path.join(directorio, indice[_llave_hoja(hoja, skiprows)]))}
+    pendientes = [hoja for hoja in hojas if hoja not in rutas]
+    if not pendientes:
+        return rutas
+
+    # Extraer las hojas pendientes con una sola apertura del libro
+    os.makedirs(directorio, exist_ok=True)
+    nombres_hojas, filas_hoja, libro = _filas_libro(ruta_archivo)
+    try:
+        for hoja in pendientes:
+            nombre_hoja = nombres_hojas[hoja] if isinstance(hoja, int) else hoja
+            if nombre_hoja not in nombres_hojas:
+                raise ValueError(f"La hoja '{hoja}' no existe en el libro {os.path.basename(ruta_archivo)}.")
+            archivo_parquet = f"{re.sub(r'[^0-9A-Za-z_]', '_', str(nombre_hoja))}__{skiprows}.parquet"
+            registros = _convertir_hoja(filas_hoja(nombre_hoja), skiprows, os.path.join(directorio, archivo_parquet))
+            indice[_llave_hoja(hoja, skiprows)] = archivo_parquet
+            rutas[hoja] = os.path.join(directorio, archivo_parquet)
+            print(f"Hoja '{nombre_hoja}' de {os.path.basename(ruta_archivo)} convertida a Parquet ({registros} registros).")
+    finally:
+        if libro is not None:
+            libro.close()
+
+    with open(f"{ruta_indice}.parcial", 'w', encoding='utf-8') as archivo:
+        json.dump(indice, archivo, indent=2, ensure_ascii=False)
+    os.replace(f"{ruta_indice}.parcial", ruta_indice)
+    return rutas
+
+def tabla_a_pandas(tabla, dtype=None, na_filter=True):
+    """
+    Convierte una hoja (o un lote) de la caché a pandas con la semántica de pd.read_excel.
+
+    Parámetros:
+    - tabla (pyarrow.Table): Datos de la caché.
+    - dtype (type, opcional): str para leer todas las columnas como texto (igual que dtype=str).
+    - na_filter (bool): Si es True, los textos como 'NA', 'N/A' o 'NULL' quedan nulos (igual que pd.read_excel).
+
+    Retorna:
+    - pandas.DataFrame: Datos de la hoja.
+    """
+    columnas = {}
+    for nombre, columna in zip(tabla.column_names, tabla.columns):
+        if na_filter and columna.type == pa.string():
+            columna = pc.if_else(pc.is_in(columna, value_set=pa.array(VALORES_NULOS)), pa.scalar(None, pa.string()), columna)
+        if dtype is str and columna.type != pa.string():
+            columna = pa.array([_texto_celda(valor) if valor is not None else None for valor in columna.to_pylist()], pa.string())
+        columnas[nombre] = columna.to_pandas()
+    df = pd.DataFrame(columnas, columns=tabla.column_names)
+    columnas_texto = [nombre for nombre in df.columns if df[nombre].dtype == object]
+    df[columnas_texto] = df[columnas_texto].where(df[columnas_texto].notna(), float('nan'))
+    return df
+
+def leer_hojas_excel(ruta_archivo, hojas, skiprows=0, dtype=None, na_filter=True):
+    """
+    Lee varias hojas de un libro de Excel desde la caché en Parquet (el libro se abre una sola vez, solo si alguna hoja
+    no está en la caché). Reemplaza varias llamadas a pd.read_excel sobre el mismo libro.
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del libro.
+    - hojas (list): Nombres (o posiciones) de las hojas.
+    - skiprows (int): Filas que se omiten antes del encabezado.
+    - dtype (type, opcional): str para leer todas las columnas como texto.
+    - na_filter (bool): Si es True, los textos como 'NA' o 'NULL' quedan nulos.
+
+    Retorna:
+    - dict: {hoja: pandas.DataFrame}.
+    """
+    rutas = convertir_libro_excel(ruta_archivo, hojas, skiprows)
+    return {hoja: tabla_a_pandas(pq.read_table(rutas[hoja]), dtype, na_filter) for hoja in hojas}
+
+def leer_hoja_excel(ruta_archivo, hoja=0, skiprows=0, dtype=None, na_filter=True):
+    """
+    Lee una hoja de un libro de Excel desde la caché en Parquet (ver leer_hojas_excel).
+
+    Retorna:
+    - pandas.DataFrame: Datos de la hoja.
+    """
+    return leer_hojas_excel(ruta_archivo, [hoja], skiprows, dtype, na_filter)[hoja]
+
+def ruta_hoja_excel(ruta_archivo, hoja=0, skiprows=0):
+    """
+    Retorna la ruta del archivo Parquet de una hoja en la caché (convirtiéndola si no está).
+    """
+    return convertir_libro_excel(ruta_archivo, [hoja], skiprows)[hoja]
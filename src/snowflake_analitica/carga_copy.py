@@ -0,0 +1,165 @@
+# Librerías
+import os
+import re
+import time
+from .ddl import generate_create_table_script, inferir_tipos_snowflake, columnas_decimales_enteras, evolucionar_tabla
+
+# pyarrow es opcional: solo se requiere para escribir los lotes en Parquet
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+#############################################
+# Carga masiva con Parquet, stage y COPY INTO
+#############################################
+
+# Stage interno temporal (uno por esquema y sesión) donde se suben los archivos Parquet
+STAGE_CARGUE = 'CARGUE_PARQUET'
+
+# Archivos que el PUT sube en paralelo y reintentos del PUT y de cada archivo del COPY
+MAX_HILOS_PUT = int(os.getenv('CITI_MAX_HILOS_PUT', 4))
+MAX_REINTENTOS_COPY = int(os.getenv('CITI_MAX_REINTENTOS_COPY', 3))
+
+# Compresión de los archivos Parquet (Snowflake la detecta al leer)
+COMPRESION_PARQUET = 'snappy'
+
+def crear_stage(sesion_activa, esquema, nombre_tabla, ruta_archivo):
+    """
+    Crea (si no existe) el stage temporal del esquema y retorna la ubicación del archivo dentro del stage
+    (@stage/TABLA/ARCHIVO/), de modo que los lotes de archivos distintos no se mezclen.
+    """
+    sesion_activa.sql(f"CREATE TEMPORARY STAGE IF NOT EXISTS REPOSITORIO_TURISMO.{esquema}.{STAGE_CARGUE} FILE_FORMAT = (TYPE = PARQUET);").collect()
+    nombre_base = re.sub(r'[^0-9A-Za-z_]', '_', os.path.splitext(os.path.basename(ruta_archivo))[0])
+    return f"@REPOSITORIO_TURISMO.{esquema}.{STAGE_CARGUE}/{nombre_tabla}/{nombre_base}/"
+
+def crear_tabla_copy(sesion_activa, nombre_tabla, df, tipos=None):
+    """
+    Crea (o reemplaza) la tabla que recibe el COPY INTO con las columnas y tipos de un lote (los tipos declarados en
+    `tipos` tienen prioridad sobre los inferidos). Retorna {columna: tipo} de la tabla creada.
+    """
+    tipos_tabla = inferir_tipos_snowflake(df, tipos)
+    sesion_activa.sql(generate_create_table_script(nombre_tabla, df, tipos_tabla)).collect()
+    return {columna: tipo or 'VARCHAR' for columna, tipo in tipos_tabla.items()}
+
+def evolucionar_tabla_copy(sesion_activa, nombre_tabla, df, columnas_tabla=None, tipos=None):
+    """
+    Ajusta la tabla que recibe el COPY INTO a un nuevo lote antes de escribirlo en Parquet: agrega sus columnas nuevas
+    y amplía las columnas enteras cuyos valores ya no caben (ver evolucionar_tabla). Retorna {columna: tipo} de la tabla.
+    """
+    columnas_tabla, _ = evolucionar_tabla(sesion_activa, nombre_tabla, inferir_tipos_snowflake(df, tipos), columnas_tabla,
+                                          enteras=columnas_decimales_enteras(df))
+    return columnas_tabla
+
+def escribir_parquet(df, directorio, numero_lote):
+    """
+    Escribe un lote en un archivo Parquet comprimido con los tipos del DataFrame.
+
+    Retorna:
+    - str: Ruta del archivo escrito.
+    """
+    if pa is None:
+        raise Exception("La carga con COPY INTO requiere la librería pyarrow (pip install pyarrow).")
+
+    ruta = os.path.join(directorio, f"lote_{numero_lote:05d}.parquet")
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), ruta, compression=COMPRESION_PARQUET)
+    return ruta
+
+def subir_lotes_stage(sesion_activa, directorio, ubicacion, reintentos=None):
+    """
+    Sube al stage todos los archivos Parquet de un directorio con un solo PUT (PARALLEL = MAX_HILOS_PUT) y lo reintenta
+    si falla. El conector sube los archivos en paralelo dentro de la misma sentencia, por lo que la sesión (que no es
+    segura entre hilos) la usa un solo hilo; los archivos ya subidos se sobrescriben al reintentar.
+
+    Retorna:
+    - list: Nombres de los archivos en el stage.
+
+    Excepciones:
+    - Exception: Si los archivos no se pudieron subir después de los reintentos.
+    """
+    reintentos = reintentos or MAX_REINTENTOS_COPY
+    patron = os.path.join(os.path.abspath(directorio), '*.parquet')
+    for intento in range(1, reintentos + 1):
+        try:
+            resultados = sesion_activa.file.put(patron, ubicacion, parallel=MAX_HILOS_PUT, auto_compress=False, overwrite=True)
+            fallidos = [resultado.source for resultado in resultados if resultado.status not in ('UPLOADED', 'SKIPPED')]
+            if fallidos:
+                raise Exception(f"archivos no subidos: {fallidos}")
+            return sorted(resultado.target for resultado in resultados)
+        except Exception as e:
+            if intento == reintentos:
+                raise Exception(f"No fue posible subir los archivos de {directorio} al stage después de {reintentos} intentos: {e}")
+            print(f"Reintentando PUT de {directorio} (intento {intento + 1} de {reintentos}): {e}")
+            time.sleep(2 ** intento)
+
+def copiar_desde_stage(sesion_activa, nombre_tabla, ubicacion, archivos, reintentos=None):
+    """
+    Carga los archivos Parquet del stage en la tabla con un solo COPY INTO (MATCH_BY_COLUMN_NAME). Snowflake carga
+    los archivos en paralelo según el tamaño del warehouse. Un archivo con errores de datos se omite (ON_ERROR =
+    SKIP_FILE) y se reporta sin reintentarlo, porque el mismo archivo fallaría de nuevo. Solo se reintentan los fallos
+    transitorios: la sentencia que falla (conexión, warehouse) y los archivos que el COPY no reportó; los archivos ya
+    cargados no se vuelven a cargar (metadatos de carga de la tabla).
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake.
+    - nombre_tabla (str): Tabla de destino del COPY.
+    - ubicacion (str): Ubicación de los archivos en el stage (crear_stage).
+    - archivos (list): Nombres de los archivos en el stage.
+    - reintentos (int): Intentos ante fallos transitorios. Por defecto MAX_REINTENTOS_COPY.
+
+    Retorna:
+    - list: Resultado de cada archivo: 'archivo', 'estado' (LOADED, LOAD_FAILED, ...), 'registros', 'errores',
+      'primer_error' e 'intentos'.
+    """
+    reintentos = reintentos or MAX_REINTENTOS_COPY
+    resultados = {}
+    pendientes = list(archivos)
+
+    for intento in range(1, reintentos + 1):
+        lista_archivos = ', '.join(f"'{archivo}'" for archivo in pendientes)
+        try:
+            filas = sesion_activa.sql(f"""COPY INTO {nombre_tabla}
+                                          FROM {ubicacion}
+                                          FILES = ({lista_archivos})
+                                          FILE_FORMAT = (TYPE = PARQUET)
+                                          MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+                                          ON_ERROR = SKIP_FILE;""").collect()
+        except Exception as e:
+            if intento == reintentos:
+                raise
+            print(f"Reintentando COPY INTO {nombre_tabla} (intento {intento + 1} de {reintentos}): {e}")
+            time.sleep(2 ** intento)
+            continue
+
+        for fila in filas:
+            valores = {llave.lower(): valor for llave, valor in fila.asDict().items()}
+            if 'file' not in valores:
+                continue
+            archivo = valores['file'].split('/')[-1]
+            resultados[archivo] = {'archivo': archivo,
+                                   'estado': valores.get('status'),
+                                   'registros': int(valores.get('rows_loaded') or 0),
+                                   'errores': int(valores.get('errors_seen') or 0),
+                                   'primer_error': valores.get('first_error'),
+                                   'intentos': intento}
+
+        # Los archivos con errores de datos (LOAD_FAILED, PARTIALLY_LOADED) ya tienen su resultado y no se reintentan
+        pendientes = [archivo for archivo in pendientes if archivo not in resultados]
+        if not pendientes:
+            break
+        if intento < reintentos:
+            print(f"Reintentando COPY INTO {nombre_tabla} de {len(pendientes)} archivos (intento {intento + 1} de {reintentos}).")
+            time.sleep(2 ** intento)
+
+    return [resultados.get(archivo, {'archivo': archivo, 'estado': 'NO_PROCESADO', 'registros': 0, 'errores': 0,
+                                     'primer_error': None, 'intentos': reintentos}) for archivo in archivos]
+
+def limpiar_stage(sesion_activa, ubicacion):
+    """
+    Elimina los archivos de una ubicación del stage (sin fallar si no es posible).
+    """
+    try:
+        sesion_activa.sql(f"REMOVE {ubicacion};").collect()
+    except Exception as e:
+        print(f"Advertencia: No se pudieron eliminar los archivos de {ubicacion}. Detalles: {e}")
@@ -0,0 +1,408 @@
+# Librerías
+import os
+import csv
+import json
+import time
+import shutil
+import tempfile
+import pandas as pd
+from .helpers import update_session_params
+from .ddl import upload_dataframe_to_snowflake, consultar_columnas_tabla, evolucionar_tabla
+from .dml import registrar_evento_auditoria
+from .ingesta import tabla_existe
+from .lectura_tipada import leer_csv_tipado_por_lotes, leer_parquet_tipado_por_lotes, contar_registros_parquet, tipos_snowflake_esquema
+from .cache_excel import ruta_hoja_excel, tabla_a_pandas
+from .carga_copy import (crear_stage, crear_tabla_copy, evolucionar_tabla_copy, escribir_parquet, subir_lotes_stage,
+                         copiar_desde_stage, limpiar_stage)
+from .validacion import (cargar_referencias, consultar_registros_anteriores, validar_datos, combinar_reportes,
+                         evaluar_variacion_registros, resumen_reporte, mensaje_validacion, reporte_json)
+from .manifiesto import (crear_tabla_manifiesto, calcular_hash_archivo, calcular_hash_lote, registrar_manifiesto,
+                         actualizar_estado_manifiesto, reiniciar_manifiesto, consultar_manifiesto, partes_cargadas)
+
+# pyarrow es opcional: solo se requiere para leer Excel desde su caché en Parquet
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+####################################################
+# Carga por lotes con memoria acotada y conciliación
+####################################################
+
+# Memoria máxima (MB) que usa la carga de un archivo, independiente del tamaño del archivo
+MEMORIA_MAXIMA_INGESTA_MB = int(os.getenv('CITI_MEMORIA_MAXIMA_INGESTA_MB', 512))
+
+# Copias de un lote que coexisten en memoria (texto leído, columnas convertidas y archivo temporal de write_pandas)
+COPIAS_POR_LOTE = 3
+
+# Filas de la muestra con la que se estima el tamaño del lote y mínimo de filas por lote
+FILAS_MUESTRA = 1000
+MIN_FILAS_POR_LOTE = 1000
+
+# Diferencia relativa máxima entre las sumas de control del archivo y de la tabla cargada
+TOLERANCIA_CONCILIACION = 1e-9
+
+def leer_csv_por_lotes(ruta_archivo, filas_por_lote, sep=',', encoding='utf-8'):
+    """
+    Lee un archivo CSV por lotes (todas las columnas como texto).
+
+    Retorna:
+    - generator: DataFrames de máximo `filas_por_lote` filas.
+    """
+    yield from pd.read_csv(ruta_archivo, sep=sep, decimal='.', dtype=str, encoding=encoding, chunksize=filas_por_lote)
+
+def contar_registros_csv(ruta_archivo, sep=',', encoding='utf-8'):
+    """
+    Cuenta los registros de un archivo CSV (sin encabezado ni líneas vacías) con una lectura independiente de pandas.
+    """
+    with open(ruta_archivo, 'r', encoding=encoding, newline='') as archivo:
+        filas = sum(1 for fila in csv.reader(archivo, delimiter=sep) if fila)
+    return max(filas - 1, 0)
+
+def leer_excel_por_lotes(ruta_archivo, filas_por_lote, hoja=0, skiprows=0):
+    """
+    Lee una hoja de Excel por lotes desde su caché en Parquet (el libro se convierte una sola vez por contenido, ver
+    cache_excel). Las celdas vacías quedan como nulos, igual que con pd.read_excel.
+
+    Retorna:
+    - generator: DataFrames de máximo `filas_por_lote` filas.
+    """
+    archivo = pq.ParquetFile(ruta_hoja_excel(ruta_archivo, hoja, skiprows))
+    for lote in archivo.iter_batches(batch_size=filas_por_lote):
+        yield tabla_a_pandas(pa.Table.from_batches([lote]), na_filter=False)
+
+def contar_registros_excel(ruta_archivo, hoja=0, skiprows=0):
+    """
+    Cuenta los registros de una hoja de Excel (sin encabezado ni filas vacías) con los metadatos de su caché en Parquet.
+    """
+    return pq.ParquetFile(ruta_hoja_excel(ruta_archivo, hoja, skiprows)).metadata.num_rows
+
+def contar_registros_csv_tipado(ruta_archivo, esquema):
+    """
+    Cuenta los registros de un archivo CSV con el separador y la codificación de su esquema declarado.
+    """
+    return contar_registros_csv(ruta_archivo, sep=esquema.get('sep', ','), encoding=esquema.get('encoding', 'utf-8'))
+
+# Formato -> (lector por lotes, conteo independiente de registros)
+LECTORES_POR_LOTES = {
+    'csv': (leer_csv_por_lotes, contar_registros_csv),
+    'csv_tipado': (leer_csv_tipado_por_lotes, contar_registros_csv_tipado),
+    'parquet': (leer_parquet_tipado_por_lotes, contar_registros_parquet),
+    'excel': (leer_excel_por_lotes, contar_registros_excel)
+}
+
+def estimar_filas_por_lote(ruta_archivo, formato='csv', opciones_lectura=None, memoria_mb=None):
+    """
+    Estima cuántas filas caben en un lote para no superar la memoria máxima, a partir de una muestra del archivo.
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del archivo.
+    - formato (str): 'csv', 'csv_tipado', 'parquet' o 'excel'.
+    - opciones_lectura (dict): Opciones del lector (sep, encoding, esquema, hoja, skiprows).
+    - memoria_mb (int): Memoria máxima en MB. Por defecto MEMORIA_MAXIMA_INGESTA_MB.
+
+    Retorna:
+    - int: Filas por lote.
+    """
+    memoria_mb = memoria_mb or MEMORIA_MAXIMA_INGESTA_MB
+    lector, _ = LECTORES_POR_LOTES[formato]
+
+    lotes = lector(ruta_archivo, FILAS_MUESTRA, **(opciones_lectura or {}))
+    try:
+        muestra = next(lotes, None)
+    finally:
+        lotes.close()
+
+    if muestra is None or muestra.empty:
+        return MIN_FILAS_POR_LOTE
+
+    bytes_por_fila = muestra.memory_usage(deep=True).sum() / len(muestra)
+    return max(MIN_FILAS_POR_LOTE, int(memoria_mb * 1024 ** 2 // (bytes_por_fila * COPIAS_POR_LOTE)))
+
+def consultar_control_tabla(sesion_activa, nombre_tabla, columnas_control):
+    """
+    Retorna el número de registros y las sumas de control de una tabla.
+
+    Retorna:
+    - dict: {'REGISTROS': n, columna: suma, ...}.
+    """
+    sumas = ''.join(f", SUM({columna}) AS {columna}" for columna in columnas_control)
+    fila = sesion_activa.sql(f"SELECT COUNT(*) AS REGISTROS{sumas} FROM {nombre_tabla};").collect()[0].asDict()
+    return {llave: float(valor or 0) for llave, valor in fila.items()}
+
+def _diferencias_conciliacion(control_archivo, control_tabla):
+    """
+    Compara los controles del archivo y de la tabla. Retorna la lista de diferencias (vacía si concilian).
+    """
+    diferencias = []
+    for llave, valor_archivo in control_archivo.items():
+        valor_tabla = control_tabla.get(llave, 0.0)
+        if abs(valor_archivo - valor_tabla) > TOLERANCIA_CONCILIACION * max(1.0, abs(valor_archivo)):
+            diferencias.append(f"{llave}: archivo {valor_archivo}, tabla {valor_tabla}")
+    return diferencias
+
+def cargar_archivo_por_lotes(sesion_activa, ruta_archivo, nombre_tabla, esquema, transformar_lote=None, formato='csv',
+                             opciones_lectura=None, columnas_control=None, validar_lote=None, reemplazar=False,
+                             memoria_mb=None, auditar=True, reglas=None, path_errores=None, metodo='write_pandas',
+                             manifiesto=False):
+    """
+    Lee, transforma, valida y carga un archivo a Snowflake por lotes, sin tener el archivo completo en memoria:
+
+    - El tamaño del lote se calcula con una muestra del archivo para no superar `memoria_mb`.
+    - Cada lote se convierte, se valida y se sube a una tabla de cargue ({nombre_tabla}__CARGUE) antes de leer el siguiente.
+      Con `metodo='copy'` cada lote se escribe en un archivo Parquet local; al final los archivos se suben al stage con
+      un solo PUT en paralelo y la tabla de cargue se llena con un solo COPY INTO. Los archivos
+      que fallan se reintentan sin recargar los demás y el resultado de cada archivo se guarda con la auditoría.
+    - Al final se concilian el número de registros (conteo independiente del archivo, registros leídos y registros
+      en la tabla de cargue) y las sumas de las columnas de control. Si no concilian, la tabla de destino no cambia.
+    - La tabla de cargue se crea con los tipos declarados en el esquema de la fuente (si lo hay) o inferidos del primer
+      lote, y se amplía con las columnas o enteros de los lotes siguientes (ver ddl.evolucionar_tabla).
+    - La tabla de cargue se publica en la tabla de destino (SWAP si `reemplazar`, INSERT si se agregan los datos, después
+      de agregar a la tabla de destino las columnas nuevas).
+    - Si se entregan `reglas`, cada lote se valida con validar_datos y los reportes de los lotes se combinan en el
+      reporte del archivo, que se guarda con el registro de auditoría. Las llaves únicas se verifican dentro de cada
+      lote y la variación de registros se evalúa con el total del archivo.
+    - Con `manifiesto`, el archivo y cada lote cargado se registran en el manifiesto por el hash de su contenido. Si un
+      cargue anterior del mismo contenido quedó pendiente (por ejemplo, por una caída de la conexión), el cargue se
+      reanuda: la tabla de cargue se conserva y los lotes ya cargados se omiten (sus sumas de control y validaciones
+      se calculan de nuevo). Los errores de datos, validación o conciliación (ValueError) reinician el cargue; un
+      archivo Parquet que el COPY INTO no carga conserva los lotes ya cargados.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - ruta_archivo (str): Ruta del archivo.
+    - nombre_tabla (str): Tabla de destino.
+    - esquema (str): Esquema de destino.
+    - transformar_lote (callable, opcional): Función DataFrame -> DataFrame que limpia, convierte y valida las columnas
+      de un lote. No se requiere con 'csv_tipado' ni 'parquet', cuyos lectores ya entregan los tipos declarados.
+    - formato (str): 'csv', 'csv_tipado' (pyarrow con esquema declarado), 'parquet' (con esquema declarado) o 'excel'.
+    - opciones_lectura (dict): Opciones del lector (sep y encoding para CSV; esquema para CSV tipado y Parquet; hoja y
+      skiprows para Excel).
+    - columnas_control (list): Columnas numéricas cuya suma se concilia. Por defecto, las columnas numéricas del primer lote.
+    - validar_lote (callable, opcional): Función (df, ruta_archivo) -> None que lanza una excepción si el lote no se debe cargar.
+    - reemplazar (bool): Si es True, el archivo reemplaza los datos de la tabla. Si es False, se agregan.
+    - memoria_mb (int): Memoria máxima en MB. Por defecto MEMORIA_MAXIMA_INGESTA_MB.
+    - auditar (bool): Si es True, registra el cargue exitoso en la auditoría.
+    - reglas (dict, opcional): Reglas de validación de la fuente (ver validacion).
+    - path_errores (str, opcional): Carpeta donde se exportan los registros que incumplen las reglas.
+    - metodo (str): 'write_pandas' (por defecto) o 'copy' (Parquet, stage interno y COPY INTO).
+    - manifiesto (bool): Si es True, registra el cargue en el manifiesto y reanuda los cargues pendientes.
+
+    Retorna:
+    - dict: 'nombre_tabla', 'df' (ruta del archivo), 'mensajes', 'registros', 'estado' ('cargado' o 'error'),
+      'conciliacion', 'validacion' (reporte de validación o None) y 'archivos_copy' (resultado de COPY por archivo).
+    """
+    memoria_mb = memoria_mb or MEMORIA_MAXIMA_INGESTA_MB
+    opciones_lectura = opciones_lectura or {}
+    lector, contador = LECTORES_POR_LOTES[formato]
+    tabla_cargue = f"{nombre_tabla}__CARGUE"
+    inicio = time.time()
+    mensajes = []
+    conciliacion = {}
+    reportes, reporte = [], None
+    directorio_parquet, ubicacion, resultados_copy = None, None, []
+    huella, cargadas, lotes_parquet, reanudar = None, {}, {}, False
+    tipos = tipos_snowflake_esquema(opciones_lectura['esquema']) if 'esquema' in opciones_lectura else None
+    columnas_cargue = None
+
+    update_session_params(sesion_activa, database='REPOSITORIO_TURISMO', schema=esquema)
+
+    # Referencias y registros del último cargue de la tabla para las reglas de validación
+    referencias = cargar_referencias(sesion_activa, reglas) if reglas else {}
+    registros_anteriores = None
+    if reglas and reglas.get('variacion_registros') is not None:
+        registros_anteriores = consultar_registros_anteriores(sesion_activa, esquema, nombre_tabla)
+
+    try:
+        # Cargue pendiente del mismo contenido: se reanuda con los mismos lotes sobre la tabla de cargue existente
+        if manifiesto:
+            crear_tabla_manifiesto(sesion_activa)
+            huella = calcular_hash_archivo(ruta_archivo)
+            entradas = consultar_manifiesto(sesion_activa, esquema, nombre_tabla, huella['hash'])
+            entrada_archivo = next((entrada for entrada in entradas if entrada['PARTE'] == 0), None)
+            reanudar = (entrada_archivo is not None and entrada_archivo['ESTADO'] == 'pendiente'
+                        and bool(entrada_archivo['FILAS_POR_LOTE']) and tabla_existe(sesion_activa, esquema, tabla_cargue))
+            if reanudar:
+                filas_por_lote = int(entrada_archivo['FILAS_POR_LOTE'])
+                cargadas = partes_cargadas(entradas)
+                mensajes.append(f"Cargue reanudado: {len(cargadas)} lotes ya cargados según el manifiesto.")
+            else:
+                reiniciar_manifiesto(sesion_activa, esquema, nombre_tabla, huella['hash'])
+
+        if not reanudar:
+            filas_por_lote = estimar_filas_por_lote(ruta_archivo, formato, opciones_lectura, memoria_mb)
+            sesion_activa.sql(f"DROP TABLE IF EXISTS {tabla_cargue};").collect()
+        mensajes.append(f"Lectura por lotes de {filas_por_lote} filas (memoria máxima {memoria_mb} MB).")
+        if manifiesto:
+            registrar_manifiesto(sesion_activa, esquema, nombre_tabla, ruta_archivo, huella['hash'], huella['tamano'],
+                                 'pendiente', filas_por_lote=filas_por_lote)
+        if metodo == 'copy':
+            directorio_parquet = tempfile.mkdtemp(prefix=f"cargue_{nombre_tabla.lower()}_")
+            ubicacion = crear_stage(sesion_activa, esquema, nombre_tabla, ruta_archivo)
+            limpiar_stage(sesion_activa, ubicacion)
+
+        # 1. Leer, transformar, validar y subir cada lote
+        filas_leidas, columnas, control_archivo, numero_lote = 0, None, {}, 0
+        tabla_cargue_creada, lotes_omitidos = reanudar, 0
+        for lote in lector(ruta_archivo, filas_por_lote, **opciones_lectura):
+            filas_leidas += len(lote)
+            df = transformar_lote(lote) if transformar_lote is not None else lote
+            del lote
+            if reglas:
+                reportes.append(validar_datos(df, reglas, ruta_archivo, referencias, path_errores=path_errores))
+            if validar_lote is not None:
+                validar_lote(df, ruta_archivo)
+            if df.empty:
+                continue
+
+            if columnas is None:
+                columnas = list(df.columns)
+                if columnas_control is None:
+                    columnas_control = list(df.select_dtypes(include='number').columns)
+                control_archivo = {'REGISTROS': 0.0, **{columna: 0.0 for columna in columnas_control}}
+
+            control_archivo['REGISTROS'] += len(df)
+            for columna in columnas_control:
+                control_archivo[columna] += float(pd.to_numeric(df[columna], errors='coerce').sum())
+
+            numero_lote += 1
+            hash_lote = calcular_hash_lote(df) if manifiesto else None
+            if cargadas.get(numero_lote) == (hash_lote, len(df)):
+                lotes_omitidos += 1
+                print(f"{ruta_archivo}: lote {numero_lote} ya cargado según el manifiesto, se omite.")
+                del df
+                continue
+
+            if metodo == 'copy':
+                if not tabla_cargue_creada:
+                    columnas_cargue = crear_tabla_copy(sesion_activa, tabla_cargue, df, tipos)
+                    tabla_cargue_creada = True
+                else:
+                    columnas_cargue = evolucionar_tabla_copy(sesion_activa, tabla_cargue, df, columnas_cargue, tipos)
+                ruta_parquet = escribir_parquet(df, directorio_parquet, numero_lote)
+                lotes_parquet[os.path.basename(ruta_parquet)] = (numero_lote, hash_lote, len(df))
+                print(f"{ruta_archivo}: lote {numero_lote} escrito en Parquet ({int(control_archivo['REGISTROS'])} registros acumulados).")
+                del df
+                continue
+
+            resultado_lote = upload_dataframe_to_snowflake(sesion_activa=sesion_activa, df=df, nombre_tabla=tabla_cargue,
+                                                           create_table=not tabla_cargue_creada,
+                                                           overwrite=not tabla_cargue_creada, ram_gb=memoria_mb / 1024,
+                                                           tipos=tipos)
+            if any('error' in mensaje.lower() for mensaje in resultado_lote):
+                raise Exception(f"Error en el lote {numero_lote}: {' '.join(resultado_lote)}")
+            tabla_cargue_creada = True
+            if manifiesto:
+                registrar_manifiesto(sesion_activa, esquema, nombre_tabla, ruta_archivo, huella['hash'], huella['tamano'],
+                                     'cargado', parte=numero_lote, registros=len(df), hash_parte=hash_lote)
+            print(f"{ruta_archivo}: lote {numero_lote} cargado ({int(control_archivo['REGISTROS'])} registros acumulados).")
+            del df
+
+        if columnas is None:
+            raise ValueError("El archivo no tiene registros para cargar.")
+
+        # Subir los archivos al stage con un solo PUT y cargarlos con un solo COPY INTO
+        if metodo == 'copy':
+            archivos_stage = subir_lotes_stage(sesion_activa, directorio_parquet, ubicacion) if lotes_parquet else []
+            resultados_copy = copiar_desde_stage(sesion_activa, tabla_cargue, ubicacion, archivos_stage) if archivos_stage else []
+            if manifiesto:
+                for resultado in resultados_copy:
+                    if resultado['estado'] == 'LOADED':
+                        parte, hash_lote, registros_lote = lotes_parquet[resultado['archivo']]
+                        registrar_manifiesto(sesion_activa, esquema, nombre_tabla, ruta_archivo, huella['hash'],
+                                             huella['tamano'], 'cargado', parte=parte, registros=registros_lote,
+                                             hash_parte=hash_lote)
+            fallidos = [resultado for resultado in resultados_copy if resultado['estado'] != 'LOADED']
+            if fallidos:
+                detalle = '; '.join(f"{resultado['archivo']} {resultado['estado']} ({resultado['primer_error']})" for resultado in fallidos)
+                # Los lotes cargados quedan en la tabla de cargue y en el manifiesto: al reanudar solo se suben los fallidos
+                raise Exception(f"COPY INTO no cargó {len(fallidos)} de {len(resultados_copy)} archivos: {detalle}")
+            reintentos = sum(resultado['intentos'] - 1 for resultado in resultados_copy)
+            mensajes.append(f"COPY INTO: {len(resultados_copy)} archivos Parquet cargados desde el stage ({reintentos} reintentos).")
+
+        # Reporte de validación del archivo y variación de registros frente al cargue anterior
+        if reglas:
+            reporte = combinar_reportes(reportes)
+            hallazgo = evaluar_variacion_registros(reglas, int(control_archivo['REGISTROS']), registros_anteriores)
+            if hallazgo:
+                reporte['hallazgos'].append(hallazgo)
+                reporte['valido'] = reporte['valido'] and hallazgo['severidad'] != 'error'
+            if not reporte['valido']:
+                raise ValueError(f"El archivo no cumple las reglas de validación: {resumen_reporte(reporte)}")
+            mensajes.append(mensaje_validacion(reporte))
+
+        # 2. Conciliar registros y sumas de control contra el archivo
+        registros_fuente = contador(ruta_archivo, **opciones_lectura)
+        control_tabla = consultar_control_tabla(sesion_activa, tabla_cargue, columnas_control)
+        conciliacion = {'registros_fuente': registros_fuente, 'registros_leidos': filas_leidas,
+                        'control_archivo': control_archivo, 'control_tabla': control_tabla}
+
+        diferencias = _diferencias_conciliacion(control_archivo, control_tabla)
+        if registros_fuente != filas_leidas:
+            diferencias.append(f"REGISTROS_FUENTE: archivo {registros_fuente}, leídos {filas_leidas}")
+        if diferencias:
+            raise ValueError(f"La carga no concilia con el archivo: {'; '.join(diferencias)}")
+        mensajes.append(f"Conciliación exitosa: {registros_fuente} registros en el archivo, {int(control_tabla['REGISTROS'])} registros cargados, sumas de control {columnas_control} iguales.")
+
+        # 3. Publicar la tabla de cargue en la tabla de destino
+        if not tabla_existe(sesion_activa, esquema, nombre_tabla):
+            sesion_activa.sql(f"ALTER TABLE {tabla_cargue} RENAME TO {nombre_tabla};").collect()
+        elif reemplazar:
+            sesion_activa.sql(f"ALTER TABLE {nombre_tabla} SWAP WITH {tabla_cargue};").collect()
+        else:
+            columnas_destino = consultar_columnas_tabla(sesion_activa, nombre_tabla)
+            columnas_nuevas = {columna: tipo for columna, tipo in consultar_columnas_tabla(sesion_activa, tabla_cargue).items()
+                               if columna not in columnas_destino}
+            if columnas_nuevas:
+                evolucionar_tabla(sesion_activa, nombre_tabla, columnas_nuevas, columnas_destino)
+                mensajes.append(f"Columnas agregadas a la tabla '{nombre_tabla}': {sorted(columnas_nuevas)}.")
+            lista_columnas = ', '.join(columnas)
+            sesion_activa.sql(f"INSERT INTO {nombre_tabla} ({lista_columnas}) SELECT {lista_columnas} FROM {tabla_cargue};").collect()
+        sesion_activa.sql(f"DROP TABLE IF EXISTS {tabla_cargue};").collect()
+
+        registros = int(control_archivo['REGISTROS'])
+        if manifiesto:
+            actualizar_estado_manifiesto(sesion_activa, esquema, nombre_tabla, huella['hash'], 'verificado', registros)
+        if lotes_omitidos:
+            mensajes.append(f"{lotes_omitidos} lotes cargados en un intento anterior no se volvieron a subir.")
+        mensajes.append(f"DataFrame cargado exitosamente en la tabla '{nombre_tabla}' en {numero_lote} lotes.")
+        mensajes.append(f"Tiempo de carga: {time.time() - inicio:.2f} segundos.")
+    except Exception as e:
+        # Con manifiesto, un fallo que no es de validación (conexión, PUT, write_pandas, archivos del COPY) conserva la
+        # tabla de cargue y los lotes registrados para reanudar el cargue en la siguiente ejecución
+        if manifiesto and huella is not None and not isinstance(e, ValueError):
+            mensajes.append("La tabla de cargue y el manifiesto se conservan para reanudar el cargue.")
+        else:
+            try:
+                sesion_activa.sql(f"DROP TABLE IF EXISTS {tabla_cargue};").collect()
+                if manifiesto and huella is not None:
+                    reiniciar_manifiesto(sesion_activa, esquema, nombre_tabla, huella['hash'])
+            except Exception:
+                pass
+        mensajes.append(f"Se produjo un error durante la carga por lotes: {e}")
+        print(f"Error en {ruta_archivo}: {e}")
+        return {'nombre_tabla': nombre_tabla, 'df': ruta_archivo, 'mensajes': '\n'.join(mensajes), 'registros': 0,
+                'estado': 'error', 'conciliacion': conciliacion, 'validacion': reporte, 'archivos_copy': resultados_copy}
+    finally:
+        # Archivos Parquet locales y del stage (solo con metodo='copy')
+        if directorio_parquet is not None:
+            shutil.rmtree(directorio_parquet, ignore_errors=True)
+        if ubicacion is not None:
+            limpiar_stage(sesion_activa, ubicacion)
+
+    # Registrar evento de cargue
+    resultado_str = '\n'.join(mensajes)
+    if auditar:
+        registrar_evento_auditoria(sesion_activa=sesion_activa,
+                                   nombre_esquema_destino=esquema,
+                                   nombre_tabla=nombre_tabla,
+                                   ruta_archivo=ruta_archivo,
+                                   numero_registros=registros,
+                                   mensaje=resultado_str,
+                                   reporte_validacion=reporte_json(reporte) if reporte is not None else None,
+                                   detalle_cargue=json.dumps(resultados_copy, ensure_ascii=False, default=str) if resultados_copy else None)
+    print(f"{ruta_archivo} cargado y auditado.")
+
+    return {'nombre_tabla': nombre_tabla, 'df': ruta_archivo, 'mensajes': resultado_str, 'registros': registros,
+            'estado': 'cargado', 'conciliacion': conciliacion, 'validacion': reporte, 'archivos_copy': resultados_copy}
@@ -12,18 +12,134 @@
 from .helpers import get_session_info, update_session_params, clean_column_name
 
 # Liberías
+import io
+import os
+import re
+import datetime
 import pandas as pd
 import time
 from snowflake.snowpark import Session
 
-def generate_create_table_script(nombre_tabla, df):
+# Tamaño objetivo (MB comprimidos) de cada archivo que write_pandas sube al stage, hilos de subida y compresión
+TAMANO_ARCHIVO_CARGUE_MB = int(os.getenv('CITI_TAMANO_ARCHIVO_CARGUE_MB', 64))
+PARALELO_WRITE_PANDAS = int(os.getenv('CITI_PARALELO_WRITE_PANDAS', 4))
+COMPRESION_WRITE_PANDAS = 'snappy'
+
+# Filas de la muestra con la que se mide el tamaño comprimido por fila y mínimo de filas por archivo
+FILAS_MUESTRA_COMPRESION = 10000
+MIN_FILAS_POR_ARCHIVO = 10000
+
+# Precisiones de los NUMBER enteros: la menor que cubre los dígitos observados (Snowflake no almacena más bytes por
+# una precisión mayor; la precisión limita los valores que la columna admite y se amplía con ALTER si hace falta)
+PRECISIONES_ENTERAS = (9, 18, 38)
+
+# Filas de la muestra con la que se descarta una columna de texto como fecha antes de revisar la columna completa
+FILAS_MUESTRA_FECHAS = 1000
+
+# Fechas ISO (AAAA-MM-DD) que se detectan en columnas de texto
+PATRON_FECHA_ISO = r'\d{4}-\d{2}-\d{2}'
+
+def _precision_entera(serie):
+    """
+    Precisión NUMBER(p,0) para los valores observados de una columna entera.
+    """
+    valores = serie.dropna()
+    digitos = len(str(max(abs(int(valores.min())), abs(int(valores.max())))))
+    return next((precision for precision in PRECISIONES_ENTERAS if digitos <= precision), PRECISIONES_ENTERAS[-1])
+
+def _es_fecha_iso(valores):
+    """
+    Indica si todos los valores (texto, sin nulos) son fechas AAAA-MM-DD válidas.
+    """
+    muestra = valores.head(FILAS_MUESTRA_FECHAS)
+    if not muestra.str.fullmatch(PATRON_FECHA_ISO).all():
+        return False
+    if not valores.str.fullmatch(PATRON_FECHA_ISO).all():
+        return False
+    return pd.to_datetime(valores, format='%Y-%m-%d', errors='coerce').notna().all()
+
+def inferir_tipo_snowflake(serie):
+    """
+    Infiere el tipo de Snowflake de una columna de pandas a partir de su tipo y de los valores observados:
+
+    - Enteros: NUMBER(p,0) con la menor precisión de PRECISIONES_ENTERAS que cubre los valores.
+    - Decimales: FLOAT (una escala observada en un lote podría redondear los valores de los lotes siguientes).
+    - Fechas: DATE para objetos date y textos AAAA-MM-DD, TIMESTAMP_NTZ para datetime64 y objetos datetime.
+    - Booleanos: BOOLEAN. Bytes: BINARY. Listas y diccionarios: VARIANT. Texto y demás: VARCHAR.
+
+    Retorna None si la columna no tiene valores (sus nulos caben en cualquier tipo).
+    """
+    valores = serie.dropna()
+    if valores.empty:
+        return None
+
+    dtype = serie.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'BOOLEAN'
+    if pd.api.types.is_integer_dtype(dtype):
+        return f"NUMBER({_precision_entera(serie)},0)"
+    if pd.api.types.is_float_dtype(dtype):
+        return 'FLOAT'
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return 'TIMESTAMP_TZ'
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return 'TIMESTAMP_NTZ'
+
+    primero = valores.iloc[0]
+    if isinstance(primero, str):
+        return 'DATE' if _es_fecha_iso(valores.astype(str)) else 'VARCHAR'
+    if isinstance(primero, datetime.datetime):
+        return 'TIMESTAMP_NTZ'
+    if isinstance(primero, datetime.date):
+        return 'DATE'
+    if isinstance(primero, bool):
+        return 'BOOLEAN'
+    if isinstance(primero, bytes):
+        return 'BINARY'
+    if isinstance(primero, (list, tuple, set, dict)):
+        return 'VARIANT'
+    return 'VARCHAR'
+
+def columnas_decimales_enteras(df):
+    """
+    Retorna {columna limpia: 'NUMBER(p,0)'} de las columnas decimales cuyos valores no nulos son todos enteros, por
+    ejemplo una columna entera de un lote con nulos, que pandas convierte a float64. Permite que generar_script_evolucion
+    acepte ese lote en una columna NUMBER(p,0) creada con un lote anterior sin nulos.
+    """
+    enteras = {}
+    for col in df.columns:
+        if not pd.api.types.is_float_dtype(df[col].dtype):
+            continue
+        valores = df[col].dropna()
+        # Los infinitos no son enteros (su residuo es nulo)
+        if not valores.empty and valores.mod(1).eq(0).all():
+            enteras[clean_column_name(col)] = f"NUMBER({_precision_entera(valores)},0)"
+    return enteras
+
+def inferir_tipos_snowflake(df, tipos=None):
+    """
+    Retorna {columna limpia: tipo de Snowflake} para las columnas de un DataFrame. Los tipos declarados en `tipos`
+    ({columna limpia: tipo}, por ejemplo los de tipos_snowflake_esquema) tienen prioridad sobre los inferidos, y las
+    columnas sin valores ni tipo declarado quedan con None.
+    """
+    tipos = tipos or {}
+    resultado = {}
+    for col in df.columns:
+        col_limpio = clean_column_name(col)
+        resultado[col_limpio] = tipos.get(col_limpio) or inferir_tipo_snowflake(df[col])
+    return resultado
+
+def generate_create_table_script(nombre_tabla, df, tipos=None, reemplazar=True):
     """
     Genera un script SQL para crear una tabla en Snowflake basado en el DataFrame dado.
-    Los nombres de las columnas se limpian de caracteres especiales y se convierten a mayúsculas.
+    Los nombres de las columnas se limpian de caracteres especiales y se convierten a mayúsculas, y los tipos se
+    infieren de los valores con inferir_tipos_snowflake (NUMBER(p,0), FLOAT, DATE, TIMESTAMP_NTZ, BOOLEAN o VARCHAR).
 
     Parámetros:
     - nombre_tabla (str): Nombre de la tabla a crear.
     - df (pandas.DataFrame): DataFrame de Pandas que contiene las columnas y tipos de datos.
+    - tipos (dict, opcional): Tipos declarados {columna limpia: tipo de Snowflake}, con prioridad sobre los inferidos.
+    - reemplazar (bool): Si es True, genera CREATE OR REPLACE TABLE. Si es False, CREATE TABLE (falla si la tabla existe).
 
     Retorna:
     - str: Script SQL para crear la tabla en Snowflake.
@@ -42,60 +158,221 @@ def generate_create_table_script(nombre_tabla, df):
     print(script_sql)
     """
 
-    # Mapeo de tipos de datos Python/Numpy/Pandas a SQL (Snowflake)
-    tipo_datos_map = {
-        # Tipos numéricos
-        'float64': 'FLOAT',    # Numpy/Pandas float
-        'int64': 'FLOAT',      # Numpy/Pandas integer
-        'float': 'FLOAT',      # Python float
-        'int': 'FLOAT',        # Python int
-
-        # Tipos de cadenas
-        'object': 'STRING',    # Pandas object, usualmente strings
-        'str': 'STRING',       # Python string
-
-        # Tipos booleanos
-        'bool': 'BOOLEAN',     # Python boolean
-        'bool_': 'BOOLEAN',    # Numpy boolean
-
-        # Tipos de fecha y tiempo
-        'datetime64': 'DATETIME',        # Numpy/Pandas datetime
-        'datetime64[ns]': 'DATETIME',    # Numpy/Pandas datetime con precisión de nanosegundos
-        'datetime.date': 'DATE',         # Python date
-        'datetime.datetime': 'DATETIME', # Python datetime
-
-        # Tipos de datos estructurados (más complejos)
-        'list': 'ARRAY',       # Listas podrían mapearse a arrays en SQL
-        'dict': 'JSON',        # Diccionarios podrían mapearse a JSON en SQL
-        'tuple': 'ARRAY',      # Tuplas podrían mapearse a arrays en SQL
-        'set': 'ARRAY',        # Sets podrían mapearse a arrays en SQL
-
-        # Tipos de datos binarios
-        'bytes': 'BLOB'        # Python bytes
-    }
-
     # Iniciar la sentencia SQL para crear la tabla
-    create_table_query = f'CREATE OR REPLACE TABLE {nombre_tabla} (\n'
+    create_table_query = f"{'CREATE OR REPLACE TABLE' if reemplazar else 'CREATE TABLE'} {nombre_tabla} (\n"
     
-    # Añadir las columnas y sus tipos basándose en el DataFrame y el diccionario de tipos
-    for col, dtype in df.dtypes.items():
-        # Limpiar el nombre de la columna
-        col_limpio = clean_column_name(col)
-        
-        # Obtener el tipo de datos correspondiente en SQL, o usar 'STRING' por defecto
-        snowflake_type = tipo_datos_map.get(str(dtype), 'STRING')
-        create_table_query += f"  {col_limpio} {snowflake_type},\n"
+    # Añadir las columnas con sus tipos declarados o inferidos
+    for col_limpio, snowflake_type in inferir_tipos_snowflake(df, tipos).items():
+        create_table_query += f"  {col_limpio} {snowflake_type or 'VARCHAR'},\n"
     
     # Remover la última coma, cerrar el paréntesis y agregar el punto y coma final
     create_table_query = create_table_query.rstrip(',\n') + "\n);"
 
     return create_table_query
 
+def _partes_tipo(tipo):
+    """
+    Separa un tipo de Snowflake en su nombre base y sus argumentos: 'NUMBER(18,0)' -> ('NUMBER', [18, 0]).
+    Los sinónimos se llevan al nombre que reporta DESCRIBE TABLE (TEXT y STRING a VARCHAR, DATETIME a TIMESTAMP_NTZ).
+    """
+    coincidencia = re.match(r'\s*(\w+)\s*(?:\((.*)\))?', tipo.upper())
+    base = coincidencia.group(1)
+    argumentos = [int(argumento) for argumento in re.findall(r'\d+', coincidencia.group(2) or '')]
+    base = {'TEXT': 'VARCHAR', 'STRING': 'VARCHAR', 'DATETIME': 'TIMESTAMP_NTZ', 'DECIMAL': 'NUMBER',
+            'NUMERIC': 'NUMBER', 'INTEGER': 'NUMBER', 'INT': 'NUMBER', 'BIGINT': 'NUMBER', 'DOUBLE': 'FLOAT'}.get(base, base)
+    if base == 'NUMBER' and not argumentos:
+        argumentos = [38, 0]
+    return base, argumentos
+
+def consultar_columnas_tabla(sesion_activa, nombre_tabla):
+    """
+    Retorna {columna: tipo} de una tabla existente con DESCRIBE TABLE, o un diccionario vacío si la tabla no existe.
+    """
+    try:
+        filas = sesion_activa.sql(f"DESCRIBE TABLE {nombre_tabla};").collect()
+    except Exception:
+        return {}
+    return {fila['name']: fila['type'] for fila in filas}
+
+def generar_script_evolucion(nombre_tabla, columnas_tabla, tipos, enteras=None):
+    """
+    Genera las sentencias de evolución aditiva del esquema de una tabla para recibir columnas con los tipos `tipos`:
+
+    - Las columnas nuevas se agregan con ALTER TABLE ... ADD COLUMN (VARCHAR si no tienen valores).
+    - Las columnas NUMBER(p,0) se amplían a la precisión requerida (ALTER COLUMN ... SET DATA TYPE).
+    - Las columnas NUMBER(p,0) reciben columnas FLOAT cuyos valores son todos enteros (`enteras`), como las columnas
+      enteras de un lote con nulos.
+    - Las columnas existentes con tipos compatibles no cambian (FLOAT recibe números, VARCHAR recibe cualquier valor,
+      TIMESTAMP recibe fechas). Las columnas no se eliminan ni se reducen.
+
+    Parámetros:
+    - nombre_tabla (str): Tabla existente.
+    - columnas_tabla (dict): {columna: tipo} de la tabla (consultar_columnas_tabla).
+    - tipos (dict): {columna: tipo} de los datos a cargar (inferir_tipos_snowflake).
+    - enteras (dict, opcional): {columna: 'NUMBER(p,0)'} de las columnas decimales de los datos con valores enteros
+      (columnas_decimales_enteras).
+
+    Retorna:
+    - list: Sentencias SQL (vacía si la tabla ya recibe los datos).
+
+    Lanza ValueError si una columna existente no puede recibir los datos (por ejemplo, decimales en un NUMBER entero o
+    texto en una columna DATE), para no redondear ni perder valores.
+    """
+    enteras = enteras or {}
+    sentencias, incompatibles = [], []
+    for columna, tipo in tipos.items():
+        if columna not in columnas_tabla:
+            sentencias.append(f"ALTER TABLE {nombre_tabla} ADD COLUMN {columna} {tipo or 'VARCHAR'};")
+            continue
+        if tipo is None:
+            continue
+
+        base_tabla, argumentos_tabla = _partes_tipo(columnas_tabla[columna])
+        base_nueva, argumentos_nuevos = _partes_tipo(tipo)
+        if base_tabla == 'NUMBER' and base_nueva == 'FLOAT' and columna in enteras:
+            base_nueva, argumentos_nuevos = _partes_tipo(enteras[columna])
+        if base_tabla == 'VARCHAR' or base_tabla == base_nueva == 'FLOAT':
+            continue
+        if base_tabla == 'FLOAT' and base_nueva == 'NUMBER':
+            continue
+        if base_tabla.startswith('TIMESTAMP') and base_nueva in ('DATE', base_tabla):
+            continue
+        if base_tabla == base_nueva == 'NUMBER':
+            if argumentos_nuevos[1] > argumentos_tabla[1]:
+                incompatibles.append(f"{columna} ({columnas_tabla[columna]} no recibe {tipo})")
+            elif argumentos_nuevos[0] - argumentos_nuevos[1] > argumentos_tabla[0] - argumentos_tabla[1]:
+                precision = argumentos_nuevos[0] - argumentos_nuevos[1] + argumentos_tabla[1]
+                sentencias.append(f"ALTER TABLE {nombre_tabla} ALTER COLUMN {columna} SET DATA TYPE NUMBER({precision},{argumentos_tabla[1]});")
+            continue
+        if base_tabla != base_nueva:
+            incompatibles.append(f"{columna} ({columnas_tabla[columna]} no recibe {tipo})")
+
+    if incompatibles:
+        raise ValueError(f"Las columnas de la tabla '{nombre_tabla}' no son compatibles con los datos: {'; '.join(incompatibles)}")
+    return sentencias
+
+def evolucionar_tabla(sesion_activa, nombre_tabla, tipos, columnas_tabla=None, enteras=None):
+    """
+    Agrega a una tabla existente las columnas nuevas de los datos a cargar y amplía sus columnas enteras, en lugar de
+    recrearla (ver generar_script_evolucion).
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake.
+    - nombre_tabla (str): Tabla existente.
+    - tipos (dict): {columna: tipo} de los datos a cargar (inferir_tipos_snowflake).
+    - columnas_tabla (dict, opcional): {columna: tipo} conocido de la tabla. Si no se entrega, se consulta.
+    - enteras (dict, opcional): Columnas decimales con valores enteros (columnas_decimales_enteras).
+
+    Retorna:
+    - tuple: ({columna: tipo} de la tabla después de la evolución, lista de sentencias ejecutadas).
+    """
+    if columnas_tabla is None:
+        columnas_tabla = consultar_columnas_tabla(sesion_activa, nombre_tabla)
+    sentencias = generar_script_evolucion(nombre_tabla, columnas_tabla, tipos, enteras)
+    for sentencia in sentencias:
+        sesion_activa.sql(sentencia).collect()
+    if sentencias:
+        columnas_tabla = consultar_columnas_tabla(sesion_activa, nombre_tabla)
+    return columnas_tabla, sentencias
 
-def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, warehouse=None, database=None, schema=None, create_table=True, overwrite=False, ram_gb=32):
+def validar_esquema_tablas(sesion_activa, esquema, tablas_esperadas):
+    """
+    Compara las columnas y tipos de las tablas cargadas (INFORMATION_SCHEMA.COLUMNS) con los esperados. Los tipos
+    se comparan por su nombre base (_partes_tipo), de modo que VARCHAR y TEXT o DOUBLE y FLOAT son equivalentes.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake.
+    - esquema (str): Esquema de las tablas en REPOSITORIO_TURISMO.
+    - tablas_esperadas (dict): {tabla: {columna: tipo}}, por ejemplo tipos_snowflake_esquema del esquema declarado.
+
+    Retorna:
+    - list: Diferencias críticas, un diccionario por tabla con 'table' y 'differences' ('missing_in_real',
+      'missing_columns' o 'dtype_differences'). Las columnas adicionales se reportan pero no son críticas.
+    """
+    nombres = ', '.join(f"'{tabla}'" for tabla in tablas_esperadas)
+    filas = sesion_activa.sql(f"""SELECT A.TABLE_NAME, A.COLUMN_NAME, A.DATA_TYPE
+                                  FROM REPOSITORIO_TURISMO.INFORMATION_SCHEMA.COLUMNS AS A
+                                  WHERE A.TABLE_SCHEMA = '{esquema}' AND A.TABLE_NAME IN ({nombres})
+                                  ORDER BY A.TABLE_NAME, A.COLUMN_NAME ASC""").collect()
+    tablas_reales = {}
+    for fila in filas:
+        tablas_reales.setdefault(fila['TABLE_NAME'], {})[fila['COLUMN_NAME']] = fila['DATA_TYPE']
+
+    diferencias_criticas = []
+    for tabla, columnas_esperadas in tablas_esperadas.items():
+        if tabla not in tablas_reales:
+            print(f"Tabla '{tabla}' está en el esquema esperado pero falta en el esquema real")
+            diferencias_criticas.append({'table': tabla, 'differences': {'missing_in_real': True}})
+            continue
+
+        columnas_reales = tablas_reales[tabla]
+        diferencias = {}
+        faltantes = sorted(set(columnas_esperadas) - set(columnas_reales))
+        adicionales = sorted(set(columnas_reales) - set(columnas_esperadas))
+        if faltantes:
+            diferencias['missing_columns'] = faltantes
+            print(f"Tabla '{tabla}': Columnas faltantes en el esquema real: {faltantes}")
+        if adicionales:
+            print(f"Tabla '{tabla}': Columnas adicionales en el esquema real: {adicionales}")
+
+        tipos_distintos = {columna: {'expected': tipo, 'real': columnas_reales[columna]}
+                           for columna, tipo in columnas_esperadas.items()
+                           if columna in columnas_reales and _partes_tipo(tipo)[0] != _partes_tipo(columnas_reales[columna])[0]}
+        for columna, tipos in tipos_distintos.items():
+            print(f"Tabla '{tabla}', Columna '{columna}': Tipo de dato esperado '{tipos['expected']}', tipo de dato real '{tipos['real']}'")
+        if tipos_distintos:
+            diferencias['dtype_differences'] = tipos_distintos
+
+        if diferencias:
+            diferencias_criticas.append({'table': tabla, 'differences': diferencias})
+
+    if diferencias_criticas:
+        print(f"\nSe encontraron diferencias críticas en {len(diferencias_criticas)} tabla(s) de {esquema}.")
+    else:
+        print("\nNo se encontraron diferencias críticas entre los esquemas.")
+    return diferencias_criticas
+
+
+def calcular_chunk_size(df, ram_gb=32, tamano_archivo_mb=None, paralelo=None):
+    """
+    Calcula el número de filas de cada archivo que write_pandas escribe y sube al stage, para que cada archivo pese
+    aproximadamente `tamano_archivo_mb` comprimido. El tamaño comprimido por fila se mide escribiendo una muestra del
+    DataFrame en Parquet. El resultado nunca supera la memoria asignada (`ram_gb`) repartida entre los hilos de subida.
+
+    Parámetros:
+    - df (pandas.DataFrame): DataFrame a cargar.
+    - ram_gb (float): Memoria asignada a la carga en GB.
+    - tamano_archivo_mb (int): Tamaño objetivo comprimido por archivo. Por defecto TAMANO_ARCHIVO_CARGUE_MB.
+    - paralelo (int): Hilos de subida. Por defecto PARALELO_WRITE_PANDAS.
+
+    Retorna:
+    - tuple: (filas por archivo, bytes en memoria por fila, bytes comprimidos por fila).
+    """
+    tamano_archivo_mb = tamano_archivo_mb or TAMANO_ARCHIVO_CARGUE_MB
+    paralelo = paralelo or PARALELO_WRITE_PANDAS
+
+    memoria_por_fila = max(1.0, df.memory_usage(deep=True).sum() / max(1, len(df)))
+
+    # Tamaño comprimido por fila con una muestra (si no se puede medir, se asume una compresión de 4 a 1)
+    try:
+        muestra = df.head(FILAS_MUESTRA_COMPRESION)
+        buffer = io.BytesIO()
+        muestra.to_parquet(buffer, compression=COMPRESION_WRITE_PANDAS, index=False)
+        comprimido_por_fila = max(1.0, buffer.tell() / max(1, len(muestra)))
+    except Exception:
+        comprimido_por_fila = memoria_por_fila / 4
+
+    filas_objetivo = int(tamano_archivo_mb * 1024 ** 2 // comprimido_por_fila)
+    filas_memoria = int(ram_gb * 1024 ** 3 // (memoria_por_fila * paralelo))
+    chunk_size = max(MIN_FILAS_POR_ARCHIVO, min(filas_objetivo, filas_memoria))
+    return min(chunk_size, max(1, len(df))), memoria_por_fila, comprimido_por_fila
+
+def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, warehouse=None, database=None, schema=None, create_table=True, overwrite=False, ram_gb=32, tipos=None):
     """
     Carga un DataFrame de Pandas a Snowflake.
     El proceso incluye crear la tabla basada en la estructura del DataFrame (opcional), cambiar la sesión si es necesario, y luego cargar los datos.
+    Cuando se agregan datos a una tabla existente, su esquema evoluciona de forma aditiva (columnas nuevas y enteros
+    más amplios, ver evolucionar_tabla) en lugar de recrearla.
 
     Parámetros:
     - sesion_activa: Objeto de sesión de Snowflake activo.
@@ -107,7 +384,9 @@ def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, wa
     - schema (str, opcional): Nuevo esquema a utilizar. Si no se especifica, no se cambia.
     - create_table (bool, opcional): Si es True, se crea la tabla desde cero. Si es False, se hace un append de los datos.
     - overwrite (bool, opcional): Si es True, reemplaza los datos existentes en la tabla. Si es False, los datos se añaden.
-    - ram_gb (int, opcional): Cantidad de RAM en GB asignada al proceso de carga (por defecto 32 GB).
+    - ram_gb (int, opcional): Cantidad de RAM en GB asignada al proceso de carga (por defecto 32 GB). Es el límite
+      de memoria de los chunks; el tamaño de cada chunk se calcula con calcular_chunk_size.
+    - tipos (dict, opcional): Tipos declarados {columna limpia: tipo de Snowflake}, con prioridad sobre los inferidos.
 
     Retorna:
     - mensajes (list): Lista de mensajes que describen el proceso de carga.
@@ -115,7 +394,8 @@ def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, wa
     Combinaciones de `create_table` y `overwrite`:
     ---------------------------------------------
     - `create_table=True`, `overwrite=False`: Crea la tabla desde cero y añade datos. Si la tabla existe, lanzará un error.
-    - `create_table=False`, `overwrite=False`: Hace append de los datos a la tabla existente, sin sobrescribir los anteriores.
+    - `create_table=False`, `overwrite=False`: Hace append de los datos a la tabla existente, sin sobrescribir los anteriores
+      (agregando las columnas nuevas del DataFrame).
     - `create_table=True`, `overwrite=True`: Crea la tabla desde cero, sobrescribiendo cualquier dato anterior.
     - `create_table=False`, `overwrite=True`: Hace append de los datos, pero sobrescribe cualquier dato existente en la tabla.
     """
@@ -127,7 +407,7 @@ def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, wa
     # Verificar si se debe crear la tabla desde cero
     if create_table:
         # Generar el script para crear la tabla
-        create_table_sql = generate_create_table_script(nombre_tabla, df)
+        create_table_sql = generate_create_table_script(nombre_tabla, df, tipos, reemplazar=overwrite)
 
         try:
             # Ejecutar el script para crear la tabla en Snowflake
@@ -139,10 +419,19 @@ def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, wa
     else:
         mensajes.append(f"Realizando append de los datos a la tabla existente '{nombre_tabla}'.")
 
-    # Calcular el tamaño recomendado de chunk basado en la memoria asignada
-    memory_per_row = df.memory_usage(deep=True).sum() / len(df)
-    memory_allocated = ram_gb * 1024 ** 3  # RAM asignada en bytes
-    chunk_size_recomendado = int(memory_allocated // memory_per_row)
+        # Agregar las columnas nuevas y ampliar las columnas enteras de la tabla existente
+        try:
+            _, sentencias = evolucionar_tabla(sesion_activa, nombre_tabla, inferir_tipos_snowflake(df, tipos),
+                                              enteras=columnas_decimales_enteras(df))
+            if sentencias:
+                mensajes.append(f"Esquema de la tabla '{nombre_tabla}' actualizado: {' '.join(sentencias)}")
+        except Exception as e:
+            mensajes.append(f"Error al actualizar el esquema de la tabla '{nombre_tabla}': {e}")
+            return mensajes
+
+    # Calcular el tamaño de chunk para archivos de tamaño comprimido acotado, sin superar la memoria asignada
+    chunk_size_recomendado, memoria_por_fila, comprimido_por_fila = calcular_chunk_size(df, ram_gb)
+    numero_archivos = -(-len(df) // chunk_size_recomendado)
 
     # Cargar el DataFrame a Snowflake
     try:
@@ -157,7 +446,9 @@ def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, wa
             database=database, 
             schema=schema, 
             auto_create_table=False,  # No se crea automáticamente
-            overwrite=overwrite        # Permite overwrite si se desea
+            overwrite=overwrite,       # Permite overwrite si se desea
+            compression=COMPRESION_WRITE_PANDAS,
+            parallel=PARALELO_WRITE_PANDAS
         )
 
         end_time = time.time()
@@ -166,6 +457,13 @@ def upload_dataframe_to_snowflake(sesion_activa, df, nombre_tabla, role=None, wa
         if snowpark_df:
             mensajes.append(f"DataFrame cargado exitosamente en la tabla '{nombre_tabla}'.")
             mensajes.append(f"Tiempo de carga: {end_time - start_time:.2f} segundos.")
+
+            # Rendimiento alcanzado
+            segundos = max(end_time - start_time, 1e-6)
+            mensajes.append(f"Rendimiento: {len(df) / segundos:,.0f} filas/s, "
+                            f"{len(df) * memoria_por_fila / segundos / 1024 ** 2:,.2f} MB/s en memoria, "
+                            f"{len(df) * comprimido_por_fila / segundos / 1024 ** 2:,.2f} MB/s comprimidos "
+                            f"({numero_archivos} archivos de {chunk_size_recomendado} filas, parallel={PARALELO_WRITE_PANDAS}).")
         else:
             mensajes.append(f"Error al cargar el DataFrame en la tabla '{nombre_tabla}'.")
     except Exception as e:
@@ -9,11 +9,13 @@
 
 # Librerías
 import os
+import time
 from snowflake.snowpark import Session
 import pandas as pd
+from .replica import consultar_filas, version_replica
 
 # Función para insertar datos en la tabla de auditoria
-def registrar_evento_auditoria(sesion_activa, nombre_esquema_destino, nombre_tabla, ruta_archivo, numero_registros, mensaje):
+def registrar_evento_auditoria(sesion_activa, nombre_esquema_destino, nombre_tabla, ruta_archivo, numero_registros, mensaje, reporte_validacion=None, detalle_cargue=None):
     """
     Registra un evento en la base de datos Snowflake en la tabla de auditoría.
 
@@ -24,6 +26,10 @@ def registrar_evento_auditoria(sesion_activa, nombre_esquema_destino, nombre_tab
     - ruta_archivo (str): Ruta completa o nombre del archivo CSV cargado.
     - numero_registros (int): Número de registros cargados en la tabla.
     - mensaje (str): Mensaje de carga de Snowflake. 
+    - reporte_validacion (str, opcional): Reporte de validación del archivo en JSON (validacion.reporte_json), que se
+      guarda en la columna REPORTE_VALIDACION.
+    - detalle_cargue (str, opcional): Detalle del cargue en JSON (por ejemplo, el resultado de COPY INTO por archivo),
+      que se guarda en la columna DETALLE_CARGUE.
 
     Raises:
     - Exception: Si ocurre algún error al ejecutar la consulta SQL.
@@ -32,6 +38,13 @@ def registrar_evento_auditoria(sesion_activa, nombre_esquema_destino, nombre_tab
         # Eliminar comillas simples en el mensaje para evitar errores SQL
         mensaje = mensaje.replace("'", "")
 
+        # Columnas y valores JSON opcionales (solo los que se entregan). Las barras invertidas se duplican para
+        # que Snowflake conserve los escapes del JSON
+        columnas_json = {'REPORTE_VALIDACION': reporte_validacion, 'DETALLE_CARGUE': detalle_cargue}
+        columnas_json = {columna: valor.replace("'", "").replace("\\", "\\\\") for columna, valor in columnas_json.items() if valor is not None}
+        columnas_adicionales = ''.join(f",\n            {columna}" for columna in columnas_json)
+        valores_adicionales = ''.join(f",\n            '{valor}'" for valor in columnas_json.values())
+
         # Obtener el próximo ID llamando al procedimiento almacenado
         resultado_id = sesion_activa.sql("CALL AUDITORIA.GET_NEXT_ID();").collect()
 
@@ -47,7 +60,7 @@ def registrar_evento_auditoria(sesion_activa, nombre_esquema_destino, nombre_tab
             FECHA_CARGUE, 
             RUTA_ARCHIVO, 
             NUMERO_REGISTROS,
-            MENSAJE
+            MENSAJE{columnas_adicionales}
         ) 
         VALUES (
             {id_auditoria},
@@ -56,7 +69,7 @@ def registrar_evento_auditoria(sesion_activa, nombre_esquema_destino, nombre_tab
             CONVERT_TIMEZONE('America/Los_Angeles', 'America/Bogota', CURRENT_TIMESTAMP), 
             '{ruta_archivo}', 
             {numero_registros},
-            '{mensaje}'
+            '{mensaje}'{valores_adicionales}
         );
         """
         
@@ -198,10 +211,10 @@ def obtener_selector(query, columna, session):
     """
     try:
         # Ejecutar la consulta SQL y recoger resultados
-        resultados = session.sql(query).collect()
+        resultados = consultar_filas(query, session)
 
         # Verificar que los resultados contengan la columna solicitada
-        if not resultados or columna not in resultados[0].asDict():
+        if not resultados or columna not in resultados[0]:
             raise ValueError(f"La columna '{columna}' no se encontró en los resultados de la consulta.")
 
         # Extraer valores únicos de la columna y ordenarlos
@@ -235,7 +248,7 @@ def obtener_regiones_disponibles(session):
         """
 
         # Ejecutar la consulta SQL y recoger resultados
-        resultados = session.sql(query).collect()
+        resultados = consultar_filas(query, session)
 
         # Extraer los nombres de las regiones y ordenarlos
         regiones = sorted({row['REGION_NAME'] for row in resultados})
@@ -275,7 +288,7 @@ def obtener_paises_por_region(region_seleccionada, session):
         """
 
         # Ejecutar la consulta SQL y recoger resultados
-        resultados = session.sql(query).collect()
+        resultados = consultar_filas(query, session)
 
         # Extraer los nombres de los países y ordenarlos
         paises = sorted({row['COUNTRY_OR_AREA'] for row in resultados})
@@ -315,7 +328,7 @@ def obtener_iso_code(pais_seleccionado, session):
         """
 
         # Ejecutar la consulta SQL y recoger resultados
-        resultados = session.sql(query).collect()
+        resultados = consultar_filas(query, session)
 
         # Extraer los iso code y ordenarlos
         iso_code = sorted({row['ISO_ALPHA2_CODE'] for row in resultados})
@@ -325,7 +338,63 @@ def obtener_iso_code(pais_seleccionado, session):
         # Manejo de errores con mensaje detallado
         raise Exception(f"Error al ejecutar la consulta o procesar resultados: {str(e)}")   
 
+# Caché de llaves sustitutas de país: nombre (COUNTRY_OR_AREA) -> ID_PAIS. La dimensión solo cambia con un nuevo cargue
+# de la capa de servicio: la caché se descarta cuando se publica otra versión de la réplica o, al leer de Snowflake
+# (donde la publicación no se detecta), cuando vence su vigencia en segundos.
+VIGENCIA_CACHE_IDS_PAISES_S = int(os.getenv('CITI_VIGENCIA_CACHE_IDS_PAISES_S', 3600))
+_CACHE_IDS_PAISES = {}
+_VERSION_CACHE_IDS_PAISES = {'version': None, 'inicio': 0.0}
+
+def obtener_ids_paises(paises, session):
+    """
+    Resuelve los nombres de país a sus llaves sustitutas enteras (ID_PAIS) de la dimensión conformada SERVICIO.DIM_PAIS.
+    Cada nombre se resuelve una sola vez por versión de la capa de servicio (ver VIGENCIA_CACHE_IDS_PAISES_S): los
+    nombres que no están en caché se consultan en una sola consulta y los demás se toman de la caché.
+
+    Parámetros:
+    - paises (str o list): Nombre del país o lista de nombres de países.
+    - session: Objeto de conexión activo a Snowflake.
+
+    Retorna:
+    - ids (list): Lista de llaves ID_PAIS (int) de los países encontrados, en el orden recibido.
 
+    Excepciones:
+    - ValueError: Si no se proporciona ningún país.
+    - Exception: Si ocurre un error al ejecutar la consulta.
+    """
+    try:
+        # Verificar que el parámetro no esté vacío o nulo
+        if not paises:
+            raise ValueError("Debe proporcionar al menos un país para resolver sus llaves.")
+
+        paises = [paises] if isinstance(paises, str) else list(paises)
+
+        # Descartar la caché si cambió la versión publicada o venció su vigencia
+        version = version_replica()
+        if version != _VERSION_CACHE_IDS_PAISES['version'] or time.monotonic() - _VERSION_CACHE_IDS_PAISES['inicio'] > VIGENCIA_CACHE_IDS_PAISES_S:
+            _CACHE_IDS_PAISES.clear()
+            _VERSION_CACHE_IDS_PAISES.update({'version': version, 'inicio': time.monotonic()})
+
+        # Consultar únicamente los países que no están en caché
+        faltantes = [pais for pais in paises if pais not in _CACHE_IDS_PAISES]
+        if faltantes:
+            nombres = ', '.join("'" + str(pais).replace("'", "''") + "'" for pais in faltantes)
+            query = f"""
+            SELECT COUNTRY_OR_AREA, ID_PAIS
+            FROM REPOSITORIO_TURISMO.SERVICIO.DIM_PAIS
+            WHERE COUNTRY_OR_AREA IN ({nombres})
+            """
+            resultados = consultar_filas(query, session)
+            for row in resultados:
+                _CACHE_IDS_PAISES[row['COUNTRY_OR_AREA']] = int(row['ID_PAIS'])
+
+        # Retornar las llaves en el orden recibido (se omiten los países sin llave)
+        ids = [_CACHE_IDS_PAISES[pais] for pais in paises if pais in _CACHE_IDS_PAISES]
+
+        return ids
+    except Exception as e:
+        # Manejo de errores con mensaje detallado
+        raise Exception(f"Error al resolver las llaves de país: {str(e)}")
     
 def ejecutar_consulta_segura(query, session):
     """
@@ -344,8 +413,8 @@ def ejecutar_consulta_segura(query, session):
     - Exception: Si ocurre un error durante la ejecución de la consulta.
     """
     try:
-        # Ejecutar la consulta y recoger resultados
-        resultados = session.sql(query).collect()
+        # Ejecutar la consulta (réplica local o Snowflake, según el modo de lectura) y recoger resultados
+        resultados = consultar_filas(query, session)
 
         # Verificar si hay datos en los resultados
         if resultados:
@@ -0,0 +1,241 @@
+# Librerías
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# pyarrow es opcional: solo se requiere para escribir las particiones en Parquet
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+##########################################################
+# Extracción de fuentes externas por particiones mensuales
+##########################################################
+
+# Carpeta raíz de los archivos de datos locales y consultas simultáneas contra la cuenta de origen
+RUTA_DATOS = os.getenv('CITI_RUTA_DATOS', './data')
+MAX_HILOS_EXTRACCION = int(os.getenv('CITI_MAX_HILOS_EXTRACCION', 6))
+
+# Archivo (dentro de la carpeta de cada extracción) con la firma de cada partición extraída
+ARCHIVO_FIRMAS = '_firmas_particiones.json'
+
+# Compresión de los archivos Parquet de las particiones
+COMPRESION_EXTRACCION = 'snappy'
+
+# Una extracción declara la tabla de origen, las columnas, la columna de fecha con la que se particiona por mes,
+# la carpeta de destino (dentro de RUTA_DATOS) y el prefijo de los archivos ({prefijo}_{año}_{mes}.parquet).
+EXTRACCION_FORWARD_KEYS_BUSQUEDAS = {'tabla': 'CUSTOM_SPACE.PUBLIC.PROYECTO_TURISMO_BUSQUEDAS',
+                                     'columnas': ['A.SEARCH_DATE',
+                                                  'A.SEARCH_INTERNATIONAL',
+                                                  'A.SEARCH_ORIGIN_CITY',
+                                                  'A.SEARCH_ORIGIN_COUNTRY',
+                                                  'A.SEARCH_DESTINATION_CITY',
+                                                  'A.SEARCH_DESTINATION_COUNTRY',
+                                                  'A.SEGMENT_TYPE',
+                                                  'A.TRIP_TYPE',
+                                                  'A.SEARCH_DEPARTURE_DATE',
+                                                  'A.LOS_AT_DESTINATION_CAT',
+                                                  'A.SEARCH_PAX',
+                                                  'YEAR(A.SEARCH_DATE) AS YEAR',
+                                                  'MONTH(A.SEARCH_DATE) AS MONTH'],
+                                     'columna_fecha': 'SEARCH_DATE',
+                                     'carpeta': 'FORWARDKEYS_BUSQUEDAS/Meses',
+                                     'prefijo': 'forward_keys'}
+EXTRACCION_FORWARD_KEYS_RESERVAS = {'tabla': 'CUSTOM_SPACE.PUBLIC.PROYECTO_CIFRAS_RESERVAS',
+                                    'columnas': ['A.FLIGHT_TICKET_ISSUE_DATE',
+                                                 'A.FLIGHT_LEG_LEAD_TIME',
+                                                 'A.TRIP_ORIGIN_CITY',
+                                                 'A.TRIP_ORIGIN_COUNTRY',
+                                                 'A.FLIGHT_LEG_ORIGIN_AIRPORT',
+                                                 'A.FLIGHT_LEG_ORIGIN_CITY',
+                                                 'A.FLIGHT_LEG_ORIGIN_COUNTRY',
+                                                 'A.FLIGHT_LEG_DESTINATION_AIRPORT',
+                                                 'A.FLIGHT_LEG_DESTINATION_CITY',
+                                                 'A.FLIGHT_LEG_DESTINATION_COUNTRY',
+                                                 'A.FLIGHT_LEG_DEPARTURE_DATE',
+                                                 'A.FLIGHT_LEG_ARRIVAL_DATE',
+                                                 'A.EXTRACTION_DATE',
+                                                 'A.LOS_AT_DESTINATION_CAT',
+                                                 'A.LOS_AT_DESTINATION_NIGHTS',
+                                                 'A.TRIP_CABIN_CLASS',
+                                                 'A.TRIP_INTERNATIONAL',
+                                                 'A.TRIP_ORIGIN_AIRPORT',
+                                                 'A.TRUE_ORIGIN_AIRPORT',
+                                                 'A.TRUE_ORIGIN_CITY',
+                                                 'A.PAX_PROFILE',
+                                                 'A.PAX'],
+                                    'columna_fecha': 'FLIGHT_LEG_ARRIVAL_DATE',
+                                    'carpeta': 'FORWARDKEYS_RESERVAS/Meses',
+                                    'prefijo': 'forward_keys_reservas'}
+
+def consultar_firmas_particiones(sesion_origen, extraccion, filtro):
+    """
+    Calcula en una sola consulta el número de registros y la firma (HASH_AGG) de cada mes de la fuente.
+
+    Retorna:
+    - dict: {'AAAA-MM': {'registros': n, 'firma': str}}, solo con los meses que tienen datos.
+    """
+    columna = f"A.{extraccion['columna_fecha']}"
+    filas = sesion_origen.sql(f"""SELECT TO_CHAR(DATE_TRUNC('MONTH', {columna}), 'YYYY-MM') AS PARTICION,
+                                         COUNT(*) AS REGISTROS,
+                                         HASH_AGG(*) AS FIRMA
+                                  FROM {extraccion['tabla']} AS A
+                                  WHERE {filtro}
+                                  GROUP BY 1
+                                  ORDER BY 1;""").collect()
+    return {fila['PARTICION']: {'registros': int(fila['REGISTROS']), 'firma': str(fila['FIRMA'])} for fila in filas}
+
+def _consulta_particion(extraccion, filtro, particion):
+    """
+    Consulta de un mes de la fuente (rango de fechas, para que Snowflake descarte las micro-particiones de otros meses).
+    """
+    columna = f"A.{extraccion['columna_fecha']}"
+    inicio = f"'{particion}-01'::DATE"
+    return f"""SELECT {', '.join(extraccion['columnas'])}
+               FROM {extraccion['tabla']} AS A
+               WHERE ({filtro})
+                 AND {columna} >= {inicio}
+                 AND {columna} < DATEADD(MONTH, 1, {inicio});"""
+
+def _normalizar_lote(lote):
+    """
+    Unifica los tipos de un lote de Arrow de Snowflake: los enteros llegan con el ancho mínimo de cada lote
+    (int8, int16, ...) y los NUMBER con decimales como decimal128, por lo que se llevan a int64 y float64.
+    """
+    campos = []
+    for campo in lote.schema:
+        if pa.types.is_integer(campo.type) or (pa.types.is_decimal(campo.type) and campo.type.scale == 0):
+            campos.append(pa.field(campo.name, pa.int64()))
+        elif pa.types.is_decimal(campo.type):
+            campos.append(pa.field(campo.name, pa.float64()))
+        else:
+            campos.append(campo)
+    return lote.cast(pa.schema(campos))
+
+def extraer_particion(conexion_origen, consulta, ruta):
+    """
+    Ejecuta la consulta de una partición y escribe los lotes de Arrow del resultado directamente en un archivo
+    Parquet, sin pasar por pandas ni por CSV. El archivo se escribe aparte y reemplaza al anterior al final.
+
+    Retorna:
+    - int: Registros escritos.
+    """
+    ruta_parcial = f"{ruta}.parcial"
+    escritor, registros = None, 0
+    try:
+        with conexion_origen.cursor() as cursor:
+            cursor.execute(consulta)
+            for lote in cursor.fetch_arrow_batches():
+                lote = _normalizar_lote(lote)
+                if escritor is None:
+                    escritor = pq.ParquetWriter(ruta_parcial, lote.schema, compression=COMPRESION_EXTRACCION)
+                escritor.write_table(lote.cast(escritor.schema))
+                registros += lote.num_rows
+    except Exception:
+        if escritor is not None:
+            escritor.close()
+            escritor = None
+        if os.path.exists(ruta_parcial):
+            os.remove(ruta_parcial)
+        raise
+    if escritor is not None:
+        escritor.close()
+
+    if escritor is None:
+        return 0
+    os.replace(ruta_parcial, ruta)
+    return registros
+
+def extraer_particiones(sesion_origen, extraccion, filtro, ruta_datos=None, max_hilos=None, forzar=False):
+    """
+    Extrae una fuente externa por meses de forma concurrente a archivos Parquet:
+
+    - Las firmas (registros y HASH_AGG) de todos los meses se calculan con una sola consulta. Los meses cuya firma no
+      cambió desde la última extracción y cuyo archivo existe no se vuelven a consultar.
+    - Los meses que cambiaron se consultan en paralelo (`max_hilos` consultas simultáneas sobre la misma conexión) y
+      cada resultado se escribe como lotes de Arrow en {ruta_datos}/{carpeta}/{prefijo}_{año}_{mes}.parquet.
+    - Un mes que falla se reporta y no detiene a los demás; su firma no se registra, de modo que se vuelve a extraer.
+
+    Parámetros:
+    - sesion_origen (snowflake.snowpark.Session): Sesión activa en la cuenta de origen.
+    - extraccion (dict): Definición de la extracción (p. ej. EXTRACCION_FORWARD_KEYS_BUSQUEDAS).
+    - filtro (str): Condición SQL sobre la tabla de origen (alias A) que delimita los datos a extraer.
+    - ruta_datos (str): Carpeta raíz de los datos. Por defecto RUTA_DATOS.
+    - max_hilos (int): Consultas simultáneas. Por defecto MAX_HILOS_EXTRACCION.
+    - forzar (bool): Si es True, extrae todos los meses aunque su firma no haya cambiado.
+
+    Retorna:
+    - list: Resultado de cada mes, en orden: 'particion', 'archivo', 'registros', 'firma', 'estado'
+      ('extraido', 'sin_cambios' o 'error'), 'segundos' y 'mensaje'.
+
+    Excepciones:
+    - Exception: Si pyarrow no está instalado.
+    """
+    if pa is None:
+        raise Exception("La extracción a Parquet requiere la librería pyarrow (pip install pyarrow).")
+
+    ruta_datos = ruta_datos or RUTA_DATOS
+    max_hilos = max_hilos or MAX_HILOS_EXTRACCION
+    directorio = os.path.join(ruta_datos, extraccion['carpeta'])
+    os.makedirs(directorio, exist_ok=True)
+    ruta_firmas = os.path.join(directorio, ARCHIVO_FIRMAS)
+    inicio = time.time()
+
+    # Firmas registradas en la última extracción y firmas actuales de la fuente
+    firmas_registradas = {}
+    if os.path.exists(ruta_firmas):
+        with open(ruta_firmas, 'r', encoding='utf-8') as archivo:
+            firmas_registradas = json.load(archivo)
+    firmas = consultar_firmas_particiones(sesion_origen, extraccion, filtro)
+    print(f"{extraccion['tabla']}: {len(firmas)} meses con datos.")
+
+    resultados, por_extraer = {}, []
+    for particion, firma in firmas.items():
+        ruta = os.path.join(directorio, f"{extraccion['prefijo']}_{particion.replace('-', '_')}.parquet")
+        if not forzar and firmas_registradas.get(particion) == firma and os.path.exists(ruta):
+            resultados[particion] = {'particion': particion, 'archivo': ruta, 'registros': firma['registros'],
+                                     'firma': firma['firma'], 'estado': 'sin_cambios', 'segundos': 0.0,
+                                     'mensaje': f"{particion}: sin cambios en la fuente."}
+        else:
+            por_extraer.append((particion, ruta))
+
+    # Registro de firmas compartido por los hilos (se guarda después de cada mes extraído)
+    candado = threading.Lock()
+
+    def extraer(particion, ruta):
+        inicio_particion = time.time()
+        registros = extraer_particion(sesion_origen.connection, _consulta_particion(extraccion, filtro, particion), ruta)
+        if registros != firmas[particion]['registros']:
+            raise ValueError(f"Se esperaban {firmas[particion]['registros']} registros y se extrajeron {registros}.")
+        with candado:
+            firmas_registradas[particion] = firmas[particion]
+            with open(f"{ruta_firmas}.parcial", 'w', encoding='utf-8') as archivo:
+                json.dump(firmas_registradas, archivo, indent=2)
+            os.replace(f"{ruta_firmas}.parcial", ruta_firmas)
+        return registros, time.time() - inicio_particion
+
+    with ThreadPoolExecutor(max_workers=max_hilos) as hilos:
+        futuros = {hilos.submit(extraer, particion, ruta): (particion, ruta) for particion, ruta in por_extraer}
+        for futuro in as_completed(futuros):
+            particion, ruta = futuros[futuro]
+            try:
+                registros, segundos = futuro.result()
+                resultados[particion] = {'particion': particion, 'archivo': ruta, 'registros': registros,
+                                         'firma': firmas[particion]['firma'], 'estado': 'extraido',
+                                         'segundos': round(segundos, 1),
+                                         'mensaje': f"{particion}: {registros} registros extraídos en {segundos:.1f} s."}
+            except Exception as e:
+                resultados[particion] = {'particion': particion, 'archivo': None, 'registros': 0,
+                                         'firma': firmas[particion]['firma'], 'estado': 'error', 'segundos': 0.0,
+                                         'mensaje': f"{particion}: error en la extracción. Detalles: {e}"}
+            print(resultados[particion]['mensaje'])
+
+    extraidos = sum(1 for resultado in resultados.values() if resultado['estado'] == 'extraido')
+    print(f"Extracción {extraccion['tabla']}: {extraidos} meses extraídos, {len(resultados) - extraidos} sin cambios o con error, "
+          f"en {round(time.time() - inicio, 1)} s.")
+
+    return [resultados[particion] for particion in sorted(resultados)]
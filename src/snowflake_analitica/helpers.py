@@ -1,8 +1,13 @@
 # Librerías
 from snowflake.snowpark import Session
+import os
 import re
+import time
 import unicodedata
 
+# Máximo de sentencias SQL ejecutándose al mismo tiempo en Snowflake (configurable por variable de entorno)
+MAX_CONCURRENCIA_SQL = int(os.getenv('CITI_MAX_CONCURRENCIA_SQL', 8))
+
 def get_session_info(sesion_activa):
     """
     Retorna la ubicación actual de la sesión de Snowflake en un diccionario descriptivo.
@@ -173,6 +178,247 @@ def clean_column_name(nombre_col):
     return nombre_col
 
 
+def dividir_sentencias_sql(sql_script):
+    """
+    Elimina los comentarios de un script SQL y lo divide en sentencias individuales.
+    A diferencia de dividir por ';' directamente, respeta los punto y coma y los '--' que aparecen dentro de
+    cadenas ('...'), identificadores entre comillas ("...") y bloques $$...$$ (procedimientos).
+
+    Parámetros:
+    - sql_script (str): El script SQL a dividir.
+
+    Retorna:
+    - sentencias (list): Lista de sentencias sin comentarios ni el ';' final.
+    """
+    sentencias = []
+    actual = []
+    i = 0
+    n = len(sql_script)
+
+    while i < n:
+        caracter = sql_script[i]
+        siguiente = sql_script[i:i + 2]
+
+        # Comentario de línea
+        if siguiente == '--':
+            fin = sql_script.find('\n', i)
+            i = n if fin == -1 else fin
+            continue
+
+        # Comentario de bloque
+        if siguiente == '/*':
+            fin = sql_script.find('*/', i + 2)
+            i = n if fin == -1 else fin + 2
+            actual.append(' ')
+            continue
+
+        # Bloque $$...$$
+        if siguiente == '$$':
+            fin = sql_script.find('$$', i + 2)
+            fin = n if fin == -1 else fin + 2
+            actual.append(sql_script[i:fin])
+            i = fin
+            continue
+
+        # Cadenas e identificadores entre comillas (la comilla duplicada es un escape)
+        if caracter in ("'", '"'):
+            j = i + 1
+            while j < n:
+                if sql_script[j] == caracter:
+                    if sql_script[j + 1:j + 2] == caracter:
+                        j += 2
+                        continue
+                    break
+                j += 1
+            actual.append(sql_script[i:j + 1])
+            i = j + 1
+            continue
+
+        # Fin de sentencia
+        if caracter == ';':
+            sentencia = ''.join(actual).strip()
+            if sentencia:
+                sentencias.append(sentencia)
+            actual = []
+            i += 1
+            continue
+
+        actual.append(caracter)
+        i += 1
+
+    sentencia = ''.join(actual).strip()
+    if sentencia:
+        sentencias.append(sentencia)
+
+    return sentencias
+
+def _normalizar_objeto(nombre):
+    """
+    Normaliza el nombre de un objeto a ESQUEMA.OBJETO en mayúsculas (sin base de datos ni comillas).
+    """
+    partes = nombre.replace('"', '').upper().split('.')
+    return '.'.join(partes[-2:])
+
+def objetos_sentencia(sentencia):
+    """
+    Identifica los objetos que una sentencia SQL escribe y lee, para construir el grafo de dependencias.
+
+    Parámetros:
+    - sentencia (str): Sentencia SQL sin comentarios.
+
+    Retorna:
+    - tuple: (escribe (set), lee (set), barrera (bool)). Una barrera es una sentencia que cambia el contexto
+      de la sesión o cuyo efecto no se puede identificar (por ejemplo USE WAREHOUSE): se ejecuta sola, después
+      de todas las anteriores y antes de todas las siguientes.
+    """
+    # Eliminar cadenas para no confundir su contenido con nombres de objetos
+    texto = re.sub(r"'(?:[^']|'')*'", "''", sentencia)
+    texto = re.sub(r'\s+', ' ', texto).strip()
+
+    patron_nombre = r'((?:"[^"]+"|[A-Za-z_][\w$]*)(?:\.(?:"[^"]+"|[A-Za-z_][\w$]*)){1,2})'
+
+    escribe = set()
+    ddl = re.match(r'(?i)^(?:CREATE|ALTER|DROP)\b.*?\b(?:VIEW|TABLE|PROCEDURE|FUNCTION)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?' + patron_nombre, texto)
+    dml = re.match(r'(?i)^(?:INSERT\s+(?:OVERWRITE\s+)?INTO|MERGE\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE\s+(?:TABLE\s+)?(?:IF\s+EXISTS\s+)?)\s*' + patron_nombre, texto)
+    for coincidencia in (ddl, dml):
+        if coincidencia:
+            escribe.add(_normalizar_objeto(coincidencia.group(1)))
+
+    # ALTER TABLE ... SWAP WITH ... escribe ambas tablas
+    intercambio = re.search(r'(?i)\bSWAP\s+WITH\s+' + patron_nombre, texto)
+    if intercambio:
+        escribe.add(_normalizar_objeto(intercambio.group(1)))
+
+    lee = {_normalizar_objeto(nombre) for nombre in re.findall(r'(?i)\b(?:FROM|JOIN|USING|LIKE)\s+' + patron_nombre, texto)}
+    lee -= escribe
+
+    # Consultas de solo lectura no son barreras; cualquier otra sentencia sin escritura identificada sí
+    solo_lectura = re.match(r'(?i)^(?:SELECT|WITH|SHOW|DESCRIBE|DESC)\b', texto) is not None
+    barrera = not escribe and not solo_lectura
+
+    return escribe, lee, barrera
+
+def construir_grafo_dependencias(sentencias):
+    """
+    Construye el grafo de dependencias entre sentencias a partir de los objetos que cada una escribe y lee.
+    Una sentencia depende de una anterior si lee lo que esta escribe, si escribe lo que esta lee o escribe,
+    o si alguna de las dos es una barrera. El orden del script se respeta en cada dependencia.
+
+    Parámetros:
+    - sentencias (list): Lista de sentencias SQL.
+
+    Retorna:
+    - dependencias (list): Lista de conjuntos; dependencias[i] contiene los índices de las sentencias
+      que deben terminar antes de ejecutar la sentencia i.
+    """
+    objetos = [objetos_sentencia(sentencia) for sentencia in sentencias]
+    dependencias = []
+
+    for i, (escribe_i, lee_i, barrera_i) in enumerate(objetos):
+        previas = set()
+        for j in range(i):
+            escribe_j, lee_j, barrera_j = objetos[j]
+            if barrera_i or barrera_j or (lee_i & escribe_j) or (escribe_i & (escribe_j | lee_j)):
+                previas.add(j)
+        dependencias.append(previas)
+
+    return dependencias
+
+def ejecutar_script_sql_paralelo(session_activa, sql_script, max_concurrencia=None, intervalo=0.2):
+    """
+    Ejecuta un script SQL respetando las dependencias entre sentencias y enviando en paralelo (de forma
+    asíncrona, con collect_nowait) las que son independientes. Por ejemplo, VISTAS.GEOGRAFIA se crea antes
+    que las vistas que la usan, y las vistas de fuentes distintas se crean al mismo tiempo.
+
+    Si una sentencia falla, se informa el error, se omiten las sentencias que dependen de ella y se continúa
+    con las demás. Las sentencias fallidas y omitidas se retornan para que quien llama decida cómo proceder.
+
+    Parámetros:
+    - session_activa (snowflake.snowpark.Session): La sesión activa de Snowflake.
+    - sql_script (str): El script SQL a ejecutar.
+    - max_concurrencia (int): Máximo de sentencias en ejecución simultánea. Por defecto MAX_CONCURRENCIA_SQL.
+    - intervalo (float): Segundos entre revisiones del estado de las sentencias en ejecución.
+
+    Retorna:
+    - resultados (list): Lista de resultados de cada comando ejecutado exitosamente, en el orden del script.
+    - errores (list): Lista de diccionarios {'sentencia': str, 'error': str} con las sentencias que fallaron o que se
+      omitieron por el error de una dependencia, en el orden del script. Vacía si todo se ejecutó correctamente.
+    """
+    max_concurrencia = max_concurrencia or MAX_CONCURRENCIA_SQL
+
+    sentencias = dividir_sentencias_sql(sql_script)
+    dependencias = construir_grafo_dependencias(sentencias)
+    barreras = [objetos_sentencia(sentencia)[2] for sentencia in sentencias]
+
+    pendientes = list(range(len(sentencias)))
+    en_curso = {}
+    completadas = set()
+    fallidas = set()
+    errores = {}
+    resultados = {}
+    duraciones = {}
+    inicio_total = time.time()
+
+    while pendientes or en_curso:
+        # Enviar las sentencias cuyas dependencias ya terminaron
+        for i in list(pendientes):
+            comando = re.sub(r'\s+', ' ', sentencias[i])
+
+            if dependencias[i] & fallidas:
+                pendientes.remove(i)
+                fallidas.add(i)
+                errores[i] = 'Omitida por error en una dependencia'
+                print(f"Omitido por error en una dependencia: {comando[:100]}...")
+                continue
+
+            if not dependencias[i] <= completadas or len(en_curso) >= max_concurrencia:
+                continue
+
+            pendientes.remove(i)
+            inicio = time.time()
+            try:
+                if barreras[i]:
+                    # Los cambios de contexto se ejecutan de forma síncrona
+                    resultados[i] = session_activa.sql(sentencias[i]).collect()
+                    duraciones[i] = time.time() - inicio
+                    completadas.add(i)
+                    print(f"Ejecutado con éxito: {comando[:100]}...")
+                else:
+                    en_curso[i] = (session_activa.sql(sentencias[i]).collect_nowait(), inicio)
+            except Exception as e:
+                fallidas.add(i)
+                errores[i] = str(e)
+                print(f"Error al ejecutar: {comando[:100]}...")
+                print(f"Error: {e}")
+
+        # Revisar las sentencias en ejecución
+        for i, (trabajo, inicio) in list(en_curso.items()):
+            if not trabajo.is_done():
+                continue
+            del en_curso[i]
+            comando = re.sub(r'\s+', ' ', sentencias[i])
+            try:
+                resultados[i] = trabajo.result()
+                duraciones[i] = time.time() - inicio
+                completadas.add(i)
+                print(f"Ejecutado con éxito: {comando[:100]}...")
+            except Exception as e:
+                fallidas.add(i)
+                errores[i] = str(e)
+                print(f"Error al ejecutar: {comando[:100]}...")
+                print(f"Error: {e}")
+
+        if en_curso:
+            time.sleep(intervalo)
+
+    print(f"Script ejecutado: {len(completadas)}/{len(sentencias)} sentencias en {round(time.time() - inicio_total, 1)} s "
+          f"(suma de las sentencias: {round(sum(duraciones.values()), 1)} s).")
+
+    if errores:
+        print(f"{len(errores)} sentencia(s) fallaron o se omitieron.")
+
+    return [resultados[i] for i in sorted(resultados)], [{'sentencia': sentencias[i], 'error': errores[i]} for i in sorted(errores)]
+
 def ejecutar_script_sql_snowpark(session_activa, sql_script):
     """
     Elimina comentarios y líneas en blanco de un script SQL, lo divide en comandos individuales
@@ -187,27 +433,22 @@ def ejecutar_script_sql_snowpark(session_activa, sql_script):
     """
     resultados = []
 
-    # Eliminar los comentarios y las líneas en blanco
-    sql_script = re.sub(r'--.*', '', sql_script)  # Elimina comentarios
-    sql_script = re.sub(r'\s+', ' ', sql_script)  # Elimina líneas en blanco y múltiples espacios
-    
-    # Dividir el script en comandos individuales
-    sql_commands = sql_script.split(';')
+    # Dividir el script en comandos individuales (sin comentarios, respetando cadenas y bloques $$)
+    sql_commands = dividir_sentencias_sql(sql_script)
     
     # Ejecuta cada comando y almacena los resultados
     for command in sql_commands:
-        command = command.strip()
-        if command:
+        # El comando se ejecuta sin cambios (cadenas y bloques $$ conservan sus espacios); los espacios solo se
+        # normalizan para el mensaje
+        comando_log = re.sub(r'\s+', ' ', command).strip()
+        if comando_log:
             try:
                 # Ejecutar el comando SQL utilizando Snowpark Session
                 result_df = session_activa.sql(command).collect()  # Ejecuta y recoge los resultados
                 resultados.append(result_df)
-                print(f"Ejecutado con éxito: {command[:100]}...")  # Muestra los primeros 100 caracteres del comando
+                print(f"Ejecutado con éxito: {comando_log[:100]}...")  # Muestra los primeros 100 caracteres del comando
             except Exception as e:
-                print(f"Error al ejecutar: {command[:100]}...")
+                print(f"Error al ejecutar: {comando_log[:100]}...")
                 print(f"Error: {e}")
     
     return resultados
-
-
-
@@ -0,0 +1,297 @@
+# Librerías
+import os
+import time
+import tempfile
+import threading
+import pandas as pd
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from .helpers import update_session_params
+from .ddl import upload_dataframe_to_snowflake
+from .dml import registrar_evento_auditoria
+from .validacion import cargar_referencias, consultar_registros_anteriores, validar_datos, mensaje_validacion, reporte_json
+from .manifiesto import COLUMNA_LINAJE, crear_tabla_manifiesto, calcular_hash_archivo, registrar_manifiesto, contenidos_reemplazados, eliminar_contenidos
+
+#########################################################
+# Ingesta concurrente de archivos para los scripts cargue_*
+#########################################################
+
+# Procesos que leen y validan archivos, cargas simultáneas a Snowflake y máximo de archivos leídos en memoria a la vez
+MAX_PROCESOS_INGESTA = int(os.getenv('CITI_MAX_PROCESOS_INGESTA', max(1, min(4, (os.cpu_count() or 2) - 1))))
+MAX_CARGAS_INGESTA = int(os.getenv('CITI_MAX_CARGAS_INGESTA', 4))
+MAX_ARCHIVOS_EN_MEMORIA = int(os.getenv('CITI_MAX_ARCHIVOS_EN_MEMORIA', 4))
+
+def tabla_existe(sesion_activa, esquema, nombre_tabla):
+    """
+    Verifica si una tabla existe en el esquema indicado de REPOSITORIO_TURISMO.
+
+    Retorna:
+    - bool: True si la tabla existe.
+    """
+    try:
+        sesion_activa.sql(f"SELECT 1 FROM REPOSITORIO_TURISMO.{esquema}.{nombre_tabla} LIMIT 1;").collect()
+        return True
+    except Exception:
+        return False
+
+def _mensajes_con_error(mensajes):
+    """
+    Indica si los mensajes de upload_dataframe_to_snowflake reportan un error.
+    """
+    return any('error' in mensaje.lower() for mensaje in mensajes)
+
+def _leer_archivo_parquet(transformar, ruta_archivo, ruta_parquet, reglas=None, referencias=None, registros_anteriores=None,
+                          path_errores=None):
+    """
+    Lee y transforma un archivo en un proceso de lectura, lo valida con las reglas de la fuente y lo escribe en
+    Parquet. Al proceso principal solo regresan la ruta del Parquet, el número de registros y el reporte de validación,
+    en lugar del DataFrame serializado.
+
+    Retorna:
+    - tuple: (ruta_parquet, registros, reporte de validación o None).
+    """
+    df = transformar(ruta_archivo)
+    reporte = validar_datos(df, reglas, ruta_archivo, referencias, registros_anteriores, path_errores) if reglas else None
+    df.to_parquet(ruta_parquet, index=False)
+    return ruta_parquet, len(df), reporte
+
+def _ejecutar_en_linea(funcion, *args):
+    """
+    Ejecuta una función en el hilo actual y retorna un Future ya resuelto, para tratar igual las cargas en línea
+    y las cargas en hilos.
+    """
+    futuro = Future()
+    try:
+        futuro.set_result(funcion(*args))
+    except Exception as e:
+        futuro.set_exception(e)
+    return futuro
+
+def ejecutar_ingesta(sesion_activa, archivos, transformar, esquema, validar=None, reemplazar=False,
+                     max_procesos=None, max_cargas=None, max_en_memoria=None, ram_gb=32, reglas=None, path_errores=None,
+                     manifiesto=False, crear_sesion=None, tipos=None, linaje=False):
+    """
+    Lee, valida y carga a Snowflake una lista de archivos de forma concurrente:
+
+    - La lectura, transformación y validación de cada archivo (`transformar` y `reglas`) se ejecutan en un grupo de
+      procesos, que escriben el resultado en un Parquet temporal y retornan su ruta (los DataFrames no se serializan
+      entre procesos).
+    - Las cargas (upload_dataframe_to_snowflake) se ejecutan mientras se siguen leyendo otros archivos. Una sesión de
+      Snowpark no admite uso concurrente: con `crear_sesion` cada hilo de carga usa su propia sesión y las tablas
+      distintas se cargan en paralelo; sin `crear_sesion` las cargas se ejecutan de a una con `sesion_activa`.
+    - Memoria acotada: nunca hay más de `max_en_memoria` archivos leídos y pendientes de carga.
+    - Orden por tabla: los archivos de una misma tabla se cargan de a uno y en el orden recibido; tablas distintas
+      se cargan en paralelo.
+    - Validación declarativa: si se entregan `reglas`, cada archivo leído se valida con validar_datos (todas las reglas
+      en una sola pasada) y el reporte se guarda con el registro de auditoría. Las referencias a CORRELATIVAS y los
+      registros del último cargue de cada tabla se consultan una sola vez por ejecución.
+    - Aislamiento de errores: un archivo que falla (lectura, validación o carga) se reporta y no detiene a los demás.
+      Solo los archivos cargados sin errores se registran en la auditoría, de modo que validador_cargue los vuelva
+      a proponer en el siguiente cargue.
+    - Manifiesto: con `manifiesto`, cada archivo se registra por el hash de su contenido como 'pendiente' antes de
+      cargarlo y como 'cargado' después de auditarlo, de modo que validador_cargue_manifiesto omita el contenido ya
+      cargado y vuelva a proponer los cargues que no terminaron.
+    - Linaje: con `manifiesto` y `linaje`, cada registro se carga con el hash del contenido de su archivo (columna
+      COLUMNA_LINAJE). Un archivo corregido (la misma ruta con otro contenido) elimina antes de agregarse los registros
+      del contenido que reemplaza, en lugar de duplicarlos.
+
+    La función `transformar` debe estar definida en un módulo importable (no en el script que se ejecuta), porque
+    los procesos hijos la importan. Por la misma razón, los scripts que usan esta función deben ejecutar su lógica
+    dentro de `if __name__ == '__main__':`.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - archivos (list): Lista de tuplas (ruta_archivo, nombre_tabla) en el orden de carga.
+    - transformar (callable): Función ruta_archivo -> pandas.DataFrame. Lanza una excepción si el archivo no es válido.
+    - esquema (str): Esquema de destino de las tablas.
+    - validar (callable, opcional): Función (df, ruta_archivo) -> None que se ejecuta en el proceso principal antes de
+      cargar (por ejemplo, validaciones contra la base de datos). Lanza una excepción si el archivo no se debe cargar.
+    - reemplazar (bool): Si es True, cada tabla se recrea con su primer archivo (create_table y overwrite). Si es False,
+      los archivos se agregan a la tabla, que se crea con el primer archivo si no existe.
+    - max_procesos (int): Procesos de lectura. Por defecto MAX_PROCESOS_INGESTA.
+    - max_cargas (int): Cargas simultáneas. Por defecto MAX_CARGAS_INGESTA.
+    - max_en_memoria (int): Máximo de archivos leídos en memoria a la vez. Por defecto MAX_ARCHIVOS_EN_MEMORIA.
+    - ram_gb (int): Memoria asignada a cada carga (parámetro de upload_dataframe_to_snowflake).
+    - reglas (dict, opcional): Reglas de validación de la fuente (ver validacion).
+    - path_errores (str, opcional): Carpeta donde se exportan los registros que incumplen las reglas.
+    - manifiesto (bool): Si es True, registra cada archivo en el manifiesto de cargues.
+    - crear_sesion (callable, opcional): Función sin argumentos que crea una sesión de Snowflake para cada hilo de carga.
+    - tipos (dict, opcional): {columna: tipo de Snowflake} declarado de las tablas (tipos_snowflake_esquema).
+    - linaje (bool): Si es True (requiere `manifiesto`), carga la columna de linaje y reemplaza los contenidos anteriores.
+
+    Retorna:
+    - list: Un diccionario por archivo, en el orden recibido, con las llaves 'nombre_tabla', 'df' (ruta del archivo),
+      'mensajes', 'registros', 'estado' ('cargado' o 'error') y 'validacion' (reporte de validación o None).
+    """
+    max_procesos = max_procesos or MAX_PROCESOS_INGESTA
+    max_cargas = (max_cargas or MAX_CARGAS_INGESTA) if crear_sesion is not None else 1
+    max_en_memoria = max(1, max_en_memoria or MAX_ARCHIVOS_EN_MEMORIA)
+    linaje = linaje and manifiesto
+    inicio = time.time()
+
+    # La sesión queda en el esquema de destino durante toda la ingesta (no se cambia entre cargas concurrentes)
+    update_session_params(sesion_activa, database='REPOSITORIO_TURISMO', schema=esquema)
+
+    # Referencias y registros del último cargue de cada tabla para las reglas de validación
+    referencias = cargar_referencias(sesion_activa, reglas) if reglas else {}
+    registros_anteriores = {}
+    if reglas and reglas.get('variacion_registros') is not None:
+        registros_anteriores = {nombre_tabla: consultar_registros_anteriores(sesion_activa, esquema, nombre_tabla)
+                                for nombre_tabla in {nombre_tabla for _, nombre_tabla in archivos}}
+    reportes = {}
+
+    # Hash del contenido de cada archivo leído para el manifiesto de cargues
+    if manifiesto:
+        crear_tabla_manifiesto(sesion_activa)
+    huellas = {}
+
+    resultados = [None] * len(archivos)
+    por_leer = deque(range(len(archivos)))
+    cola_tabla = {}
+    for index, (_, nombre_tabla) in enumerate(archivos):
+        cola_tabla.setdefault(nombre_tabla, deque()).append(index)
+    tablas_iniciadas = set()
+    tablas_cargando = set()
+    leyendo, listos, cargando = {}, {}, {}
+
+    def registrar_error(index, mensaje):
+        ruta, nombre_tabla = archivos[index]
+        resultados[index] = {'nombre_tabla': nombre_tabla, 'df': ruta, 'mensajes': mensaje, 'registros': 0, 'estado': 'error',
+                             'validacion': reportes.get(index)}
+        print(f"Error en {ruta}: {mensaje}")
+        cola_tabla[nombre_tabla].remove(index)
+
+    # Sesión propia de cada hilo de carga (solo con crear_sesion)
+    sesiones_hilo = threading.local()
+    sesiones_carga = []
+    candado_sesiones = threading.Lock()
+
+    def sesion_carga():
+        if crear_sesion is None:
+            return sesion_activa
+        if getattr(sesiones_hilo, 'sesion', None) is None:
+            sesiones_hilo.sesion = crear_sesion()
+            update_session_params(sesiones_hilo.sesion, database='REPOSITORIO_TURISMO', schema=esquema)
+            with candado_sesiones:
+                sesiones_carga.append(sesiones_hilo.sesion)
+        return sesiones_hilo.sesion
+
+    def cargar(index, ruta_parquet, create_table, overwrite):
+        _, nombre_tabla = archivos[index]
+        try:
+            df = pd.read_parquet(ruta_parquet)
+            if linaje:
+                df[COLUMNA_LINAJE] = huellas[index]['hash']
+            return upload_dataframe_to_snowflake(sesion_activa=sesion_carga(), df=df, nombre_tabla=nombre_tabla,
+                                                 create_table=create_table, overwrite=overwrite, ram_gb=ram_gb, tipos=tipos)
+        finally:
+            os.remove(ruta_parquet)
+
+    with tempfile.TemporaryDirectory(prefix='citi_ingesta_') as directorio, \
+            ProcessPoolExecutor(max_workers=max_procesos) as lectores, ThreadPoolExecutor(max_workers=max_cargas) as cargadores:
+        enviar_carga = cargadores.submit if crear_sesion is not None else _ejecutar_en_linea
+        while por_leer or leyendo or listos or cargando:
+
+            # 1. Leer archivos en orden mientras haya espacio en memoria (en disco, como Parquet temporal)
+            while por_leer and len(leyendo) + len(listos) + len(cargando) < max_en_memoria:
+                index = por_leer.popleft()
+                ruta, nombre_tabla = archivos[index]
+                leyendo[lectores.submit(_leer_archivo_parquet, transformar, ruta, os.path.join(directorio, f'{index}.parquet'),
+                                        reglas, referencias, registros_anteriores.get(nombre_tabla), path_errores)] = index
+
+            # 2. Iniciar la carga del siguiente archivo de cada tabla que no tenga una carga en curso
+            for nombre_tabla, cola in cola_tabla.items():
+                if len(cargando) >= max_cargas:
+                    break
+                if not cola or nombre_tabla in tablas_cargando or cola[0] not in listos:
+                    continue
+                index = cola[0]
+                if nombre_tabla in tablas_iniciadas:
+                    create_table, overwrite = False, False
+                elif reemplazar:
+                    create_table, overwrite = True, True
+                else:
+                    create_table = not tabla_existe(sesion_activa, esquema, nombre_tabla)
+                    overwrite = create_table
+                tablas_iniciadas.add(nombre_tabla)
+                tablas_cargando.add(nombre_tabla)
+                ruta_parquet, registros = listos.pop(index)
+                if manifiesto:
+                    huellas[index] = calcular_hash_archivo(archivos[index][0])
+                    registrar_manifiesto(sesion_activa, esquema, nombre_tabla, archivos[index][0], huellas[index]['hash'],
+                                         huellas[index]['tamano'], 'pendiente', registros=registros)
+                # Registros del contenido anterior del mismo archivo (corregido), antes de agregar el nuevo contenido
+                if linaje and not create_table:
+                    reemplazados = contenidos_reemplazados(sesion_activa, esquema, nombre_tabla, archivos[index][0], huellas[index]['hash'])
+                    if reemplazados:
+                        if eliminar_contenidos(sesion_activa, esquema, nombre_tabla, reemplazados):
+                            print(f"Registros del contenido anterior de {archivos[index][0]} eliminados de {esquema}.{nombre_tabla}.")
+                        else:
+                            print(f"Advertencia: {esquema}.{nombre_tabla} no tiene la columna {COLUMNA_LINAJE}; los registros del contenido anterior de {archivos[index][0]} se conservan.")
+                print(f"Cargando {archivos[index][0]} en {esquema}.{nombre_tabla} ({registros} registros)...")
+                cargando[enviar_carga(cargar, index, ruta_parquet, create_table, overwrite)] = (index, registros)
+
+            # 3. Esperar a que termine una lectura o una carga
+            if not leyendo and not cargando:
+                continue
+            terminados, _ = wait(list(leyendo) + list(cargando), return_when=FIRST_COMPLETED)
+
+            for futuro in terminados:
+                if futuro in leyendo:
+                    index = leyendo.pop(futuro)
+                    ruta, nombre_tabla = archivos[index]
+                    ruta_parquet = os.path.join(directorio, f'{index}.parquet')
+                    try:
+                        ruta_parquet, registros, reportes[index] = futuro.result()
+                        if validar is not None:
+                            validar(pd.read_parquet(ruta_parquet), ruta)
+                        listos[index] = (ruta_parquet, registros)
+                        print(f"Archivo {ruta} leído y validado ({registros} registros).")
+                    except Exception as e:
+                        if os.path.exists(ruta_parquet):
+                            os.remove(ruta_parquet)
+                        registrar_error(index, f"Error en la lectura o validación: {e}")
+                    continue
+
+                index, registros = cargando.pop(futuro)
+                ruta, nombre_tabla = archivos[index]
+                tablas_cargando.discard(nombre_tabla)
+                try:
+                    mensajes = futuro.result()
+                except Exception as e:
+                    mensajes = [f"Se produjo un error durante la carga: {e}"]
+
+                if _mensajes_con_error(mensajes):
+                    # Si falló la creación de la tabla, el siguiente archivo vuelve a intentarla
+                    if not tabla_existe(sesion_activa, esquema, nombre_tabla):
+                        tablas_iniciadas.discard(nombre_tabla)
+                    registrar_error(index, '\n'.join(mensajes))
+                    continue
+
+                # Registrar evento de cargue con el reporte de validación (en el proceso principal, un evento a la vez)
+                reporte = reportes.get(index)
+                if reporte is not None:
+                    mensajes = mensajes + [mensaje_validacion(reporte)]
+                resultado_str = '\n'.join(mensajes)
+                registrar_evento_auditoria(sesion_activa=sesion_activa,
+                                           nombre_esquema_destino=esquema,
+                                           nombre_tabla=nombre_tabla,
+                                           ruta_archivo=ruta,
+                                           numero_registros=registros,
+                                           mensaje=resultado_str,
+                                           reporte_validacion=reporte_json(reporte) if reporte is not None else None)
+                if manifiesto:
+                    registrar_manifiesto(sesion_activa, esquema, nombre_tabla, ruta, huellas[index]['hash'],
+                                         huellas[index]['tamano'], 'cargado', registros=registros)
+                resultados[index] = {'nombre_tabla': nombre_tabla, 'df': ruta, 'mensajes': resultado_str, 'registros': registros,
+                                     'estado': 'cargado', 'validacion': reporte}
+                cola_tabla[nombre_tabla].remove(index)
+                print(f"{ruta} cargado y auditado.")
+
+    for sesion in sesiones_carga:
+        sesion.close()
+
+    cargados = sum(1 for resultado in resultados if resultado['estado'] == 'cargado')
+    print(f"Ingesta {esquema}: {cargados}/{len(archivos)} archivos cargados en {round(time.time() - inicio, 1)} s.")
+
+    return resultados
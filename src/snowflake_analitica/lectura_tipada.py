@@ -0,0 +1,299 @@
+# Librerías
+import os
+import csv
+import pandas as pd
+from .helpers import clean_column_name
+
+# pyarrow es opcional: sin la librería no es posible la lectura tipada de CSV
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+##################################################
+# Lectura tipada de CSV con esquemas de las fuentes
+##################################################
+
+# Un esquema de fuente declara el formato del archivo y el tipo de cada columna:
+# {'sep': '|', 'decimal': '.', 'encoding': 'utf-8',
+#  'columnas': {'COLUMNA': {'tipo': 'texto' | 'float' | 'entero' | 'decimal' | 'fecha', 'nulos': True, 'formato': '%Y-%m-%d', 'escala': 2}}}
+# Las columnas de texto con nulos se cargan como 'nan' (igual que la lectura con dtype=str seguida de astype(str)),
+# y las columnas de fecha se validan con su formato y se cargan como DATE (TIMESTAMP_NTZ si el formato tiene hora).
+# Las columnas enteras se cargan como Int64 de pandas (también con nulos) y las decimales (montos) se redondean a su
+# 'escala' y se cargan como NUMBER(38,escala), para que las sumas en Snowflake sean exactas.
+
+# Valores que se leen como nulos (los mismos de pandas.read_csv)
+VALORES_NULOS = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                 '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+# Ejemplos de valores mal formados que se reportan por columna
+EJEMPLOS_POR_COLUMNA = 5
+
+# Tipos de Snowflake de los tipos declarados (ver tipos_snowflake_esquema)
+TIPOS_SNOWFLAKE = {'texto': 'VARCHAR', 'float': 'FLOAT', 'entero': 'NUMBER(38,0)', 'decimal': 'NUMBER(38,{escala})', 'fecha': 'DATE'}
+
+def columnas_tipo(esquema, tipo):
+    """
+    Retorna las columnas de un esquema de fuente con el tipo indicado.
+    """
+    return [columna for columna, definicion in esquema['columnas'].items() if definicion['tipo'] == tipo]
+
+def _fecha_con_hora(definicion):
+    """
+    Indica si el formato de una columna de fecha incluye la hora.
+    """
+    return any(directiva in definicion['formato'] for directiva in ('%H', '%I', '%M', '%S'))
+
+def tipos_snowflake_esquema(esquema):
+    """
+    Retorna {columna: tipo de Snowflake} de las columnas declaradas en un esquema de fuente, para crear las tablas
+    con los tipos declarados en lugar de los inferidos de un lote.
+    """
+    tipos = {}
+    for columna, definicion in esquema['columnas'].items():
+        if definicion['tipo'] == 'fecha' and _fecha_con_hora(definicion):
+            tipos[columna] = 'TIMESTAMP_NTZ'
+        else:
+            tipos[columna] = TIPOS_SNOWFLAKE[definicion['tipo']].format(escala=definicion.get('escala', 0))
+    return tipos
+
+def _encabezado_csv(ruta_archivo, esquema):
+    """
+    Lee el encabezado del archivo y retorna {nombre original: nombre limpio}.
+    """
+    with open(ruta_archivo, 'r', encoding=esquema.get('encoding', 'utf-8'), newline='') as archivo:
+        encabezado = next(csv.reader(archivo, delimiter=esquema.get('sep', ',')), [])
+    return {columna: clean_column_name(columna) for columna in encabezado}
+
+def _tipo_arrow(definicion):
+    """
+    Tipo de pyarrow con el que se lee una columna declarada.
+    """
+    return {'texto': pa.string(), 'float': pa.float64(), 'entero': pa.int64(), 'decimal': pa.float64(), 'fecha': pa.timestamp('s')}[definicion['tipo']]
+
+def _opciones_arrow(ruta_archivo, esquema, columnas_texto=False):
+    """
+    Construye las opciones de lectura de pyarrow para un archivo y su esquema.
+    Con `columnas_texto=True` todas las columnas se leen como texto (diagnóstico de valores mal formados).
+    """
+    nombres = _encabezado_csv(ruta_archivo, esquema)
+    tipos = {}
+    for original, limpio in nombres.items():
+        definicion = esquema['columnas'].get(limpio)
+        tipos[original] = pa.string() if columnas_texto or definicion is None else _tipo_arrow(definicion)
+
+    formatos = sorted({definicion['formato'] for definicion in esquema['columnas'].values() if definicion['tipo'] == 'fecha'})
+    opciones_conversion = pa_csv.ConvertOptions(column_types=tipos,
+                                                null_values=VALORES_NULOS,
+                                                strings_can_be_null=True,
+                                                decimal_point=esquema.get('decimal', '.'),
+                                                timestamp_parsers=formatos or None)
+    opciones_lectura = pa_csv.ReadOptions(use_threads=True, encoding=esquema.get('encoding', 'utf-8'))
+    opciones_formato = pa_csv.ParseOptions(delimiter=esquema.get('sep', ','))
+    return nombres, opciones_lectura, opciones_formato, opciones_conversion
+
+def _a_pandas(tabla, nombres, esquema):
+    """
+    Convierte una tabla (o lote) de pyarrow a pandas con los nombres limpios y el contrato de tipos de la fuente.
+    """
+    columnas = {}
+    for original, limpio in nombres.items():
+        columna = tabla.column(original)
+        definicion = esquema['columnas'].get(limpio, {'tipo': 'texto'})
+        if definicion['tipo'] == 'fecha' and not _fecha_con_hora(definicion):
+            columna = pc.cast(columna, pa.date32())
+        if definicion['tipo'] == 'texto':
+            columna = pc.fill_null(columna, 'nan')
+        if definicion['tipo'] == 'decimal':
+            columna = pc.round(columna, definicion.get('escala', 0))
+        # Las columnas enteras con nulos no pasan a float64
+        columnas[limpio] = columna.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    return pd.DataFrame(columnas)
+
+def _validar_encabezado(nombres, esquema, ruta_archivo):
+    """
+    Verifica que el archivo tenga exactamente las columnas declaradas en el esquema.
+    """
+    faltantes = set(esquema['columnas']) - set(nombres.values())
+    extras = set(nombres.values()) - set(esquema['columnas'])
+    if faltantes or extras:
+        raise ValueError(f"Validación de columnas del archivo {os.path.basename(ruta_archivo)}: "
+                         f"columnas faltantes {sorted(faltantes)}, columnas adicionales no esperadas {sorted(extras)}")
+
+def _errores_lote(df_texto, esquema):
+    """
+    Retorna {columna: [número de valores mal formados, ejemplos]} para un lote leído como texto.
+    """
+    errores = {}
+    for columna, definicion in esquema['columnas'].items():
+        if columna not in df_texto.columns:
+            continue
+        serie = df_texto[columna]
+        nulos = serie.isna() | serie.isin(VALORES_NULOS)
+
+        if definicion['tipo'] in ('float', 'decimal'):
+            convertida = pd.to_numeric(serie.str.replace(esquema.get('decimal', '.'), '.', regex=False), errors='coerce')
+        elif definicion['tipo'] == 'entero':
+            # Misma regla que el lector de Arrow (int64): dígitos con signo '-' opcional y espacios alrededor
+            # ('3.0', '+3' o '1e3' no son enteros), dentro del rango de int64
+            texto = serie.str.strip().where(lambda valores: valores.str.fullmatch(r'-?\d+', na=False))
+            convertida = texto.where(texto.map(lambda valor: isinstance(valor, str) and -2 ** 63 <= int(valor) < 2 ** 63))
+        elif definicion['tipo'] == 'fecha':
+            convertida = pd.to_datetime(serie, format=definicion['formato'], errors='coerce')
+        else:
+            convertida = serie
+
+        mask_errores = (~nulos & convertida.isna()) | (nulos & (not definicion.get('nulos', True)))
+        if mask_errores.any():
+            errores[columna] = [int(mask_errores.sum()), serie[mask_errores].fillna('<nulo>').unique()[:EJEMPLOS_POR_COLUMNA].tolist()]
+    return errores
+
+def diagnosticar_csv(ruta_archivo, esquema):
+    """
+    Recorre el archivo como texto (por bloques) y reporta, por columna, los valores que no cumplen el esquema:
+    valores que no se pueden convertir al tipo declarado y nulos en columnas que no los admiten.
+
+    Retorna:
+    - dict: {columna: {'errores': n, 'ejemplos': [...]}} (vacío si el archivo cumple el esquema).
+    """
+    nombres, opciones_lectura, opciones_formato, opciones_conversion = _opciones_arrow(ruta_archivo, esquema, columnas_texto=True)
+    opciones_conversion.strings_can_be_null = False
+
+    reporte = {}
+    with pa_csv.open_csv(ruta_archivo, read_options=opciones_lectura, parse_options=opciones_formato, convert_options=opciones_conversion) as lector:
+        for lote in lector:
+            df_texto = lote.to_pandas().rename(columns=nombres)
+            for columna, (errores, ejemplos) in _errores_lote(df_texto, esquema).items():
+                resumen = reporte.setdefault(columna, {'errores': 0, 'ejemplos': []})
+                resumen['errores'] += errores
+                resumen['ejemplos'] = (resumen['ejemplos'] + [e for e in ejemplos if e not in resumen['ejemplos']])[:EJEMPLOS_POR_COLUMNA]
+    return reporte
+
+def _error_esquema(ruta_archivo, esquema, error):
+    """
+    Construye el error de un archivo que no cumple el esquema, con el reporte de valores mal formados por columna.
+    """
+    reporte = diagnosticar_csv(ruta_archivo, esquema)
+    detalle = '; '.join(f"{columna}: {resumen['errores']} valores (ej. {resumen['ejemplos']})" for columna, resumen in reporte.items())
+    return ValueError(f"El archivo {os.path.basename(ruta_archivo)} no cumple el esquema declarado. {detalle or error}")
+
+def _validar_nulos(df, esquema, ruta_archivo):
+    """
+    Verifica que las columnas que no admiten nulos no los tengan.
+    """
+    for columna, definicion in esquema['columnas'].items():
+        if definicion.get('nulos', True):
+            continue
+        serie = df[columna]
+        nulos = serie.isna() | (serie == 'nan') if definicion['tipo'] == 'texto' else serie.isna()
+        if nulos.any():
+            raise _error_esquema(ruta_archivo, esquema, f"{columna}: {int(nulos.sum())} valores nulos")
+
+def leer_csv_tipado(ruta_archivo, esquema):
+    """
+    Lee un archivo CSV completo con pyarrow (decodificación en varios hilos) directamente en los tipos declarados
+    en el esquema de la fuente. Reemplaza la lectura con dtype=str seguida de conversiones columna por columna.
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del archivo.
+    - esquema (dict): Esquema de la fuente (separador, decimal, codificación y columnas con tipo, nulos y formato).
+
+    Retorna:
+    - pandas.DataFrame: Datos con los nombres de columna limpios y los tipos declarados.
+
+    Excepciones:
+    - ValueError: Si faltan columnas o hay adicionales, o si hay valores mal formados (reportados por columna).
+    """
+    if pa is None:
+        raise Exception("La lectura tipada de CSV requiere la librería pyarrow (pip install pyarrow).")
+
+    nombres, opciones_lectura, opciones_formato, opciones_conversion = _opciones_arrow(ruta_archivo, esquema)
+    _validar_encabezado(nombres, esquema, ruta_archivo)
+
+    try:
+        tabla = pa_csv.read_csv(ruta_archivo, read_options=opciones_lectura, parse_options=opciones_formato, convert_options=opciones_conversion)
+    except pa.ArrowInvalid as e:
+        raise _error_esquema(ruta_archivo, esquema, e)
+
+    df = _a_pandas(tabla, nombres, esquema)
+    _validar_nulos(df, esquema, ruta_archivo)
+    return df
+
+def leer_csv_tipado_por_lotes(ruta_archivo, filas_por_lote, esquema):
+    """
+    Lee un archivo CSV por lotes con pyarrow en los tipos declarados (lector de carga_por_lotes con formato 'csv_tipado').
+    El tamaño de bloque se calcula con el tamaño promedio de una línea del archivo.
+
+    Retorna:
+    - generator: DataFrames de aproximadamente `filas_por_lote` filas.
+    """
+    if pa is None:
+        raise Exception("La lectura tipada de CSV requiere la librería pyarrow (pip install pyarrow).")
+
+    nombres, opciones_lectura, opciones_formato, opciones_conversion = _opciones_arrow(ruta_archivo, esquema)
+    _validar_encabezado(nombres, esquema, ruta_archivo)
+
+    # Tamaño promedio de una línea con el primer MB del archivo
+    with open(ruta_archivo, 'rb') as archivo:
+        muestra = archivo.read(1024 ** 2)
+    bytes_por_linea = max(1, len(muestra) // max(1, muestra.count(b'\n')))
+    opciones_lectura.block_size = max(1024 ** 2, filas_por_lote * bytes_por_linea)
+
+    try:
+        with pa_csv.open_csv(ruta_archivo, read_options=opciones_lectura, parse_options=opciones_formato, convert_options=opciones_conversion) as lector:
+            for lote in lector:
+                df = _a_pandas(lote, nombres, esquema)
+                _validar_nulos(df, esquema, ruta_archivo)
+                yield df
+    except pa.ArrowInvalid as e:
+        raise _error_esquema(ruta_archivo, esquema, e)
+
+def _tipar_lote_parquet(tabla, nombres, esquema, ruta_archivo):
+    """
+    Convierte las columnas de un lote de Parquet a los tipos declarados en el esquema de la fuente (las fechas de
+    Snowflake llegan como date32, que se conserva, y los números como enteros o decimales).
+    """
+    columnas = {}
+    for original, limpio in nombres.items():
+        columna = tabla.column(original)
+        definicion = esquema['columnas'].get(limpio, {'tipo': 'texto'})
+        tipo = _tipo_arrow(definicion)
+        if definicion['tipo'] == 'fecha' and not _fecha_con_hora(definicion):
+            tipo = pa.date32()
+        try:
+            columnas[original] = columna if columna.type == tipo else pc.cast(columna, tipo)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(f"El archivo {os.path.basename(ruta_archivo)} no cumple el esquema declarado. {limpio}: {e}")
+    return pa.table(columnas)
+
+def leer_parquet_tipado_por_lotes(ruta_archivo, filas_por_lote, esquema):
+    """
+    Lee un archivo Parquet por lotes en los tipos declarados en el esquema de la fuente (lector de carga_por_lotes con
+    formato 'parquet'). Los DataFrames resultantes son iguales a los de leer_csv_tipado_por_lotes.
+
+    Retorna:
+    - generator: DataFrames de máximo `filas_por_lote` filas.
+    """
+    if pa is None:
+        raise Exception("La lectura de Parquet requiere la librería pyarrow (pip install pyarrow).")
+
+    archivo = pq.ParquetFile(ruta_archivo)
+    nombres = {columna: clean_column_name(columna) for columna in archivo.schema_arrow.names}
+    _validar_encabezado(nombres, esquema, ruta_archivo)
+
+    for lote in archivo.iter_batches(batch_size=filas_por_lote):
+        tabla = _tipar_lote_parquet(pa.Table.from_batches([lote]), nombres, esquema, ruta_archivo)
+        df = _a_pandas(tabla, nombres, esquema)
+        _validar_nulos(df, esquema, ruta_archivo)
+        yield df
+
+def contar_registros_parquet(ruta_archivo, esquema=None):
+    """
+    Cuenta los registros de un archivo Parquet con sus metadatos (sin leer los datos).
+    """
+    if pa is None:
+        raise Exception("La lectura de Parquet requiere la librería pyarrow (pip install pyarrow).")
+    return pq.ParquetFile(ruta_archivo).metadata.num_rows
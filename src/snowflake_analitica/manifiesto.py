@@ -0,0 +1,253 @@
+# Librerías
+import os
+import hashlib
+import pandas as pd
+from .ddl import consultar_columnas_tabla
+
+#############################################
+# Manifiesto de cargues por hash de contenido
+#############################################
+
+# Cada archivo cargado se registra por el hash SHA-256 de su contenido, su tamaño y su número de registros
+# (PARTE = 0), y cada lote de los archivos grandes se registra aparte (PARTE = 1..n) con el hash de sus datos.
+# Estados: 'pendiente' (cargue iniciado), 'cargado' (datos en Snowflake) y 'verificado' (conciliado y publicado).
+TABLA_MANIFIESTO = 'REPOSITORIO_TURISMO.AUDITORIA.MANIFIESTO_CARGUES'
+ESTADOS_MANIFIESTO = ['pendiente', 'cargado', 'verificado']
+
+# Columna de linaje de las tablas cargadas con ejecutar_ingesta(linaje=True): hash del contenido del archivo del que
+# proviene cada registro. Permite eliminar los registros de un contenido reemplazado por un archivo corregido.
+COLUMNA_LINAJE = 'HASH_ARCHIVO'
+
+# Tamaño de bloque con el que se lee un archivo para calcular su hash
+BLOQUE_HASH_BYTES = 8 * 1024 ** 2
+
+# Hashes ya calculados en el proceso: (ruta, fecha de modificación, tamaño) -> hash
+_CACHE_HASHES = {}
+
+def crear_tabla_manifiesto(sesion_activa):
+    """
+    Crea la tabla del manifiesto de cargues si no existe.
+    """
+    sesion_activa.sql(f"""CREATE TABLE IF NOT EXISTS {TABLA_MANIFIESTO} (
+                              NOMBRE_ESQUEMA_DESTINO VARCHAR(255),
+                              NOMBRE_TABLA        VARCHAR(255),
+                              RUTA_ARCHIVO        VARCHAR(512),
+                              HASH_ARCHIVO        VARCHAR(64),
+                              TAMANO_BYTES        INTEGER,
+                              PARTE               INTEGER,
+                              HASH_PARTE          VARCHAR(64),
+                              NUMERO_REGISTROS    INTEGER,
+                              FILAS_POR_LOTE      INTEGER,
+                              ESTADO              VARCHAR(20),
+                              FECHA_ACTUALIZACION TIMESTAMP
+                          );""").collect()
+
+def calcular_hash_archivo(ruta_archivo):
+    """
+    Calcula el hash SHA-256 del contenido de un archivo (por bloques, sin cargarlo en memoria).
+
+    Retorna:
+    - dict: {'hash': hash hexadecimal, 'tamano': tamaño en bytes}.
+    """
+    estado = os.stat(ruta_archivo)
+    llave = (os.path.abspath(ruta_archivo), estado.st_mtime, estado.st_size)
+    if llave not in _CACHE_HASHES:
+        sha = hashlib.sha256()
+        with open(ruta_archivo, 'rb') as archivo:
+            for bloque in iter(lambda: archivo.read(BLOQUE_HASH_BYTES), b''):
+                sha.update(bloque)
+        _CACHE_HASHES[llave] = sha.hexdigest()
+    return {'hash': _CACHE_HASHES[llave], 'tamano': estado.st_size}
+
+def calcular_hash_lote(df):
+    """
+    Calcula un hash de los datos de un lote (valores y orden de las filas), para reconocer un lote ya cargado al
+    reanudar un cargue.
+    """
+    sha = hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    sha.update(','.join(df.columns).encode('utf-8'))
+    return sha.hexdigest()
+
+def _valor_sql(valor):
+    """
+    Representa un valor en SQL (NULL, número o texto entre comillas).
+    """
+    if valor is None:
+        return 'NULL'
+    if isinstance(valor, (int, float)):
+        return str(int(valor))
+    return "'" + str(valor).replace("'", "''") + "'"
+
+def registrar_manifiesto(sesion_activa, esquema, nombre_tabla, ruta_archivo, hash_archivo, tamano, estado, parte=0,
+                         registros=None, hash_parte=None, filas_por_lote=None):
+    """
+    Crea o actualiza la entrada del manifiesto de un archivo (parte 0) o de uno de sus lotes (parte 1..n).
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake.
+    - esquema (str): Esquema de destino.
+    - nombre_tabla (str): Tabla de destino.
+    - ruta_archivo (str): Ruta del archivo.
+    - hash_archivo (str): Hash del contenido del archivo (calcular_hash_archivo).
+    - tamano (int): Tamaño del archivo en bytes.
+    - estado (str): 'pendiente', 'cargado' o 'verificado'.
+    - parte (int): 0 para el archivo completo, o el número del lote.
+    - registros (int, opcional): Registros del archivo o del lote.
+    - hash_parte (str, opcional): Hash de los datos del lote (calcular_hash_lote).
+    - filas_por_lote (int, opcional): Filas por lote con que se leyó el archivo (para reanudar con los mismos lotes).
+    """
+    if estado not in ESTADOS_MANIFIESTO:
+        raise ValueError(f"Estado de manifiesto no válido: {estado}. Estados válidos: {ESTADOS_MANIFIESTO}")
+
+    valores = {'NOMBRE_ESQUEMA_DESTINO': esquema, 'NOMBRE_TABLA': nombre_tabla, 'RUTA_ARCHIVO': ruta_archivo,
+               'HASH_ARCHIVO': hash_archivo, 'TAMANO_BYTES': tamano, 'PARTE': parte, 'HASH_PARTE': hash_parte,
+               'NUMERO_REGISTROS': registros, 'FILAS_POR_LOTE': filas_por_lote, 'ESTADO': estado}
+    origen = ', '.join(f"{_valor_sql(valor)} AS {columna}" for columna, valor in valores.items())
+    columnas = ', '.join(valores) + ', FECHA_ACTUALIZACION'
+    insertar = ', '.join(f"S.{columna}" for columna in valores) + ', CURRENT_TIMESTAMP'
+
+    sesion_activa.sql(f"""MERGE INTO {TABLA_MANIFIESTO} AS T
+                          USING (SELECT {origen}) AS S
+                          ON T.NOMBRE_ESQUEMA_DESTINO = S.NOMBRE_ESQUEMA_DESTINO AND T.NOMBRE_TABLA = S.NOMBRE_TABLA
+                             AND T.HASH_ARCHIVO = S.HASH_ARCHIVO AND T.PARTE = S.PARTE
+                          WHEN MATCHED THEN UPDATE SET T.RUTA_ARCHIVO = S.RUTA_ARCHIVO,
+                                                       T.ESTADO = S.ESTADO,
+                                                       T.HASH_PARTE = COALESCE(S.HASH_PARTE, T.HASH_PARTE),
+                                                       T.NUMERO_REGISTROS = COALESCE(S.NUMERO_REGISTROS, T.NUMERO_REGISTROS),
+                                                       T.FILAS_POR_LOTE = COALESCE(S.FILAS_POR_LOTE, T.FILAS_POR_LOTE),
+                                                       T.FECHA_ACTUALIZACION = CURRENT_TIMESTAMP
+                          WHEN NOT MATCHED THEN INSERT ({columnas}) VALUES ({insertar});""").collect()
+
+def actualizar_estado_manifiesto(sesion_activa, esquema, nombre_tabla, hash_archivo, estado, registros=None):
+    """
+    Actualiza el estado de todas las entradas (archivo y lotes) de un contenido y, si se indica, los registros del archivo.
+    """
+    sesion_activa.sql(f"""UPDATE {TABLA_MANIFIESTO}
+                          SET ESTADO = '{estado}',
+                              NUMERO_REGISTROS = IFF(PARTE = 0, COALESCE({_valor_sql(registros)}, NUMERO_REGISTROS), NUMERO_REGISTROS),
+                              FECHA_ACTUALIZACION = CURRENT_TIMESTAMP
+                          WHERE NOMBRE_ESQUEMA_DESTINO = '{esquema}' AND NOMBRE_TABLA = '{nombre_tabla}'
+                            AND HASH_ARCHIVO = '{hash_archivo}';""").collect()
+
+def reiniciar_manifiesto(sesion_activa, esquema, nombre_tabla, hash_archivo, desde_parte=0):
+    """
+    Elimina las entradas de un contenido a partir de una parte (0 elimina también la entrada del archivo).
+    """
+    sesion_activa.sql(f"""DELETE FROM {TABLA_MANIFIESTO}
+                          WHERE NOMBRE_ESQUEMA_DESTINO = '{esquema}' AND NOMBRE_TABLA = '{nombre_tabla}'
+                            AND HASH_ARCHIVO = '{hash_archivo}' AND PARTE >= {desde_parte};""").collect()
+
+def contenidos_reemplazados(sesion_activa, esquema, nombre_tabla, ruta_archivo, hash_archivo):
+    """
+    Retorna los hashes de los contenidos anteriores de un archivo (la misma ruta con otro contenido) ya cargados en la
+    tabla, que el nuevo contenido reemplaza.
+    """
+    filas = sesion_activa.sql(f"""SELECT DISTINCT A.HASH_ARCHIVO
+                                  FROM {TABLA_MANIFIESTO} AS A
+                                  WHERE A.NOMBRE_ESQUEMA_DESTINO = '{esquema}' AND A.NOMBRE_TABLA = '{nombre_tabla}'
+                                    AND A.RUTA_ARCHIVO = {_valor_sql(ruta_archivo)} AND A.PARTE = 0
+                                    AND A.HASH_ARCHIVO <> '{hash_archivo}'
+                                    AND A.ESTADO IN ('cargado', 'verificado');""").collect()
+    return [fila['HASH_ARCHIVO'] for fila in filas]
+
+def eliminar_contenidos(sesion_activa, esquema, nombre_tabla, hashes):
+    """
+    Elimina de la tabla los registros de los contenidos indicados (por la columna de linaje) y sus entradas del
+    manifiesto, de modo que el mismo contenido se pueda volver a cargar. Los registros cargados antes de la columna
+    de linaje no se pueden identificar y se conservan.
+
+    Retorna:
+    - bool: True si se eliminaron los registros, False si la tabla no tiene la columna de linaje.
+    """
+    if COLUMNA_LINAJE not in consultar_columnas_tabla(sesion_activa, f"REPOSITORIO_TURISMO.{esquema}.{nombre_tabla}"):
+        return False
+    lista_hashes = ', '.join(f"'{hash_archivo}'" for hash_archivo in hashes)
+    sesion_activa.sql(f"""DELETE FROM REPOSITORIO_TURISMO.{esquema}.{nombre_tabla}
+                          WHERE {COLUMNA_LINAJE} IN ({lista_hashes});""").collect()
+    for hash_archivo in hashes:
+        reiniciar_manifiesto(sesion_activa, esquema, nombre_tabla, hash_archivo)
+    return True
+
+def consultar_manifiesto(sesion_activa, esquema, nombre_tabla=None, hash_archivo=None):
+    """
+    Consulta las entradas del manifiesto de un esquema (opcionalmente de una tabla y un contenido).
+
+    Retorna:
+    - list: Entradas (dict columna -> valor).
+    """
+    filtros = [f"NOMBRE_ESQUEMA_DESTINO = '{esquema}'"]
+    if nombre_tabla:
+        filtros.append(f"NOMBRE_TABLA = '{nombre_tabla}'")
+    if hash_archivo:
+        filtros.append(f"HASH_ARCHIVO = '{hash_archivo}'")
+    filas = sesion_activa.sql(f"SELECT * FROM {TABLA_MANIFIESTO} WHERE {' AND '.join(filtros)} ORDER BY PARTE;").collect()
+    return [fila.asDict() for fila in filas]
+
+def partes_cargadas(entradas):
+    """
+    Retorna los lotes ya cargados de un contenido: {parte: (hash del lote, registros)}.
+    """
+    return {entrada['PARTE']: (entrada['HASH_PARTE'], entrada['NUMERO_REGISTROS'])
+            for entrada in entradas if entrada['PARTE'] > 0 and entrada['ESTADO'] in ('cargado', 'verificado')}
+
+def validador_cargue_manifiesto(sesion_activa, rutas_archivos, esquema, adoptar_auditoria=True):
+    """
+    Selecciona los archivos que se deben cargar comparando el hash de su contenido con el manifiesto, en lugar del
+    nombre del archivo:
+
+    - Un contenido ya cargado o verificado no se vuelve a cargar, aunque el archivo tenga otro nombre (copia renombrada).
+    - Un contenido con un cargue pendiente (interrumpido) se vuelve a proponer para reanudarlo.
+    - Un archivo cuyo contenido cambió se vuelve a cargar aunque conserve el nombre.
+    - Con `adoptar_auditoria`, los archivos cargados antes de existir el manifiesto (su ruta está en AUDITORIA_CARGUES)
+      se registran como verificados con su contenido actual y no se vuelven a cargar.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake.
+    - rutas_archivos (list): Rutas de los archivos candidatos.
+    - esquema (str): Esquema de destino.
+    - adoptar_auditoria (bool): Si es True, adopta en el manifiesto los cargues anteriores registrados en la auditoría.
+
+    Retorna:
+    - list: Rutas de los archivos que se deben cargar, en el orden recibido.
+    """
+    crear_tabla_manifiesto(sesion_activa)
+    entradas = [entrada for entrada in consultar_manifiesto(sesion_activa, esquema) if entrada['PARTE'] == 0]
+    estado_por_hash = {}
+    for entrada in entradas:
+        if estado_por_hash.get(entrada['HASH_ARCHIVO']) not in ('cargado', 'verificado'):
+            estado_por_hash[entrada['HASH_ARCHIVO']] = entrada['ESTADO']
+    rutas_manifiesto = {entrada['RUTA_ARCHIVO'] for entrada in entradas}
+
+    auditados = {}
+    if adoptar_auditoria:
+        filas = sesion_activa.sql(f"""SELECT A.RUTA_ARCHIVO, A.NOMBRE_TABLA, A.NUMERO_REGISTROS
+                                      FROM REPOSITORIO_TURISMO.AUDITORIA.AUDITORIA_CARGUES AS A
+                                      WHERE A.NOMBRE_ESQUEMA_DESTINO = '{esquema}';""").collect()
+        auditados = {fila['RUTA_ARCHIVO']: fila for fila in filas}
+
+    por_cargar, hashes_seleccionados = [], set()
+    for ruta in rutas_archivos:
+        huella = calcular_hash_archivo(ruta)
+        estado = estado_por_hash.get(huella['hash'])
+
+        if estado in ('cargado', 'verificado'):
+            print(f"Contenido ya cargado, se omite: {ruta}")
+        elif huella['hash'] in hashes_seleccionados:
+            print(f"Contenido repetido en esta ejecución, se omite: {ruta}")
+        elif estado == 'pendiente':
+            print(f"Cargue pendiente, se reanuda: {ruta}")
+            por_cargar.append(ruta)
+        elif ruta in rutas_manifiesto:
+            print(f"Contenido modificado, se vuelve a cargar: {ruta}")
+            por_cargar.append(ruta)
+        elif ruta in auditados:
+            fila = auditados[ruta]
+            registrar_manifiesto(sesion_activa, esquema, fila['NOMBRE_TABLA'], ruta, huella['hash'], huella['tamano'],
+                                 'verificado', registros=fila['NUMERO_REGISTROS'])
+            print(f"Cargue anterior al manifiesto, registrado como verificado: {ruta}")
+        else:
+            print(f"Archivo nuevo: {ruta}")
+            por_cargar.append(ruta)
+        hashes_seleccionados.add(huella['hash'])
+
+    return por_cargar
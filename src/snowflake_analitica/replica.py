@@ -0,0 +1,346 @@
+# Librerías
+import os
+import re
+import threading
+from datetime import datetime
+from .servicio import TABLAS_SERVICIO
+
+# DuckDB es opcional: sin la librería el aplicativo consulta siempre Snowflake
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+##############################################
+# Réplica local de lectura de la capa de servicio
+##############################################
+
+# Archivo DuckDB con la réplica y modo de lectura del aplicativo ('snowflake' o 'replica')
+RUTA_REPLICA = os.getenv('CITI_RUTA_REPLICA', './replica/repositorio_turismo.duckdb')
+MODO_LECTURA = os.getenv('CITI_MODO_LECTURA', 'snowflake')
+
+# Tablas que se replican: las tablas de servicio y las tablas de apoyo de los selectores
+TABLAS_REPLICA = {
+    **{f"SERVICIO.{tabla}": llaves for tabla, llaves in TABLAS_SERVICIO.items()},
+    'VISTAS.GEOGRAFIA': ['COUNTRY_OR_AREA'],
+    'CORRELATIVAS.CONTINENTES': ['REGION_NAME']
+}
+
+# Delimitadores por defecto de INITCAP en Snowflake (espacios en blanco y signos de puntuación)
+DELIMITADORES_INITCAP = set(' \t\n\r\f\v!?@"^#$&~_,.:;+-*%/|\\[](){}<>')
+
+# Conexión de solo lectura a la réplica, compartida por el proceso y renovada cuando se publica una nueva versión.
+# Cada conexión lleva la cuenta de las consultas en curso: la conexión reemplazada se cierra cuando termina la última
+_CONEXION_REPLICA = {'conexion': None, 'ruta': None}
+_LECTORES_REPLICA = {}
+_CANDADO_REPLICA = threading.Lock()
+
+def _ruta_puntero(ruta):
+    """
+    Archivo de texto con el nombre de la versión publicada de la réplica.
+    """
+    return f"{ruta}.actual"
+
+def _ruta_vigente(ruta=RUTA_REPLICA):
+    """
+    Retorna la ruta de la versión publicada de la réplica (indicada en el archivo puntero), la ruta base si la réplica
+    se exportó sin versiones, o None si no hay réplica.
+    """
+    puntero = _ruta_puntero(ruta)
+    if os.path.exists(puntero):
+        with open(puntero, 'r', encoding='utf-8') as archivo:
+            ruta_version = os.path.join(os.path.dirname(os.path.abspath(ruta)), archivo.read().strip())
+        if os.path.exists(ruta_version):
+            return ruta_version
+    return ruta if os.path.exists(ruta) else None
+
+def _limpiar_versiones(ruta, conservar):
+    """
+    Elimina las versiones anteriores de la réplica, excepto las indicadas en `conservar`. Las versiones que algún
+    proceso todavía tiene abiertas (Windows no permite eliminarlas) se eliminan en una exportación posterior.
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    base, extension = os.path.splitext(os.path.basename(ruta))
+    patron = re.compile(rf"{re.escape(base)}\.\d{{14}}{re.escape(extension)}")
+    for nombre in os.listdir(directorio):
+        if patron.fullmatch(nombre) and nombre not in conservar:
+            try:
+                os.remove(os.path.join(directorio, nombre))
+            except OSError:
+                pass
+
+def exportar_replica(sesion_activa, tablas=None, ruta=RUTA_REPLICA):
+    """
+    Exporta las tablas de servicio a un archivo DuckDB local. Cada tabla se escribe ordenada por sus llaves de
+    clustering (los mínimos y máximos por bloque de DuckDB permiten descartar bloques al filtrar por país).
+    Cada exportación escribe una versión nueva (<ruta sin extensión>.AAAAMMDDHHMMSS.duckdb) y al final actualiza el
+    archivo puntero <ruta>.actual, de modo que el aplicativo nunca lee una réplica a medias y la publicación no
+    reemplaza un archivo que el aplicativo tiene abierto (Windows no lo permite).
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - tablas (dict): Diccionario {ESQUEMA.TABLA: llaves de orden}. Por defecto TABLAS_REPLICA.
+    - ruta (str): Ruta del archivo DuckDB. Por defecto RUTA_REPLICA.
+
+    Retorna:
+    - list: Resumen (dict) de cada tabla exportada.
+
+    Excepciones:
+    - Exception: Si DuckDB no está instalado o si no se pudo exportar ninguna tabla.
+    """
+    if duckdb is None:
+        raise Exception("La réplica local requiere la librería duckdb (pip install duckdb).")
+
+    tablas = tablas or TABLAS_REPLICA
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    base, extension = os.path.splitext(ruta)
+    ruta_nueva = f"{base}.{datetime.now().strftime('%Y%m%d%H%M%S')}{extension}"
+    if os.path.exists(ruta_nueva):
+        os.remove(ruta_nueva)
+
+    resumenes = []
+    conexion = duckdb.connect(ruta_nueva)
+    try:
+        for tabla, llaves in tablas.items():
+            esquema = tabla.split('.')[0]
+            try:
+                conexion.execute(f"CREATE SCHEMA IF NOT EXISTS {esquema}")
+
+                # Descargar por lotes para no cargar la tabla completa en memoria
+                registros = 0
+                for index, lote in enumerate(sesion_activa.sql(f"SELECT * FROM {tabla}").to_pandas_batches()):
+                    conexion.register('lote_exportado', lote)
+                    if index == 0:
+                        conexion.execute(f"CREATE OR REPLACE TABLE {tabla}__CARGUE AS SELECT * FROM lote_exportado")
+                    else:
+                        conexion.execute(f"INSERT INTO {tabla}__CARGUE SELECT * FROM lote_exportado")
+                    conexion.unregister('lote_exportado')
+                    registros += len(lote)
+
+                if registros == 0:
+                    raise ValueError("la tabla no devolvió registros")
+
+                # Tabla definitiva ordenada por las llaves
+                orden = f" ORDER BY {', '.join(llaves)}" if llaves else ''
+                conexion.execute(f"CREATE OR REPLACE TABLE {tabla} AS SELECT * FROM {tabla}__CARGUE{orden}")
+                conexion.execute(f"DROP TABLE {tabla}__CARGUE")
+
+                resumenes.append({'tabla': tabla, 'registros': registros})
+                print(f"Tabla {tabla} replicada: {registros} registros.")
+            except Exception as e:
+                print(f"No fue posible replicar la tabla {tabla}: {str(e)}")
+
+        # Metadatos de la réplica
+        conexion.execute("CREATE OR REPLACE TABLE REPLICA_METADATOS (TABLA VARCHAR, REGISTROS BIGINT, FECHA_EXPORTACION TIMESTAMP)")
+        fecha = datetime.now()
+        for resumen in resumenes:
+            conexion.execute("INSERT INTO REPLICA_METADATOS VALUES (?, ?, ?)", [resumen['tabla'], resumen['registros'], fecha])
+    finally:
+        conexion.close()
+
+    if not resumenes:
+        os.remove(ruta_nueva)
+        raise Exception("No fue posible replicar ninguna tabla; se conserva la réplica anterior.")
+
+    # Publicar la réplica nueva: el puntero se escribe aparte y se reemplaza (los lectores solo lo abren para leerlo)
+    ruta_anterior = _ruta_vigente(ruta)
+    puntero = _ruta_puntero(ruta)
+    with open(f"{puntero}.nuevo", 'w', encoding='utf-8') as archivo:
+        archivo.write(os.path.basename(ruta_nueva))
+    os.replace(f"{puntero}.nuevo", puntero)
+    print(f"Réplica local publicada en {ruta_nueva}: {len(resumenes)}/{len(tablas)} tablas.")
+
+    # Conservar la versión anterior, que el aplicativo puede tener abierta hasta su siguiente consulta
+    _limpiar_versiones(ruta, {os.path.basename(ruta_nueva), os.path.basename(ruta_anterior or '')})
+
+    return resumenes
+
+def _initcap(texto):
+    """
+    Equivalente de INITCAP de Snowflake para la réplica: cada letra que sigue a un delimitador (DELIMITADORES_INITCAP)
+    va en mayúscula y las demás en minúscula. A diferencia de str.title(), los apóstrofes y los dígitos no son
+    delimitadores ("o'neil" -> "O'neil", "1st" -> "1st").
+    """
+    if texto is None:
+        return None
+
+    caracteres, inicio_palabra = [], True
+    for caracter in texto:
+        caracteres.append(caracter.upper() if inicio_palabra else caracter.lower())
+        inicio_palabra = caracter in DELIMITADORES_INITCAP
+    return ''.join(caracteres)
+
+def _abrir_cursor_replica(ruta=RUTA_REPLICA):
+    """
+    Retorna la conexión de solo lectura a la versión publicada de la réplica y un cursor nuevo sobre ella, o None si
+    no hay réplica. La conexión se renueva cuando el puntero indica una versión nueva (nueva exportación); la conexión
+    anterior se cierra cuando terminan las consultas que la están usando. Cada llamada se cierra con
+    _liberar_cursor_replica.
+    """
+    ruta_version = _ruta_vigente(ruta) if duckdb is not None else None
+    if ruta_version is None:
+        return None
+
+    with _CANDADO_REPLICA:
+        if _CONEXION_REPLICA['conexion'] is None or _CONEXION_REPLICA['ruta'] != ruta_version:
+            anterior = _CONEXION_REPLICA['conexion']
+            conexion = duckdb.connect(ruta_version, read_only=True)
+            conexion.create_function('INITCAP', _initcap, ['VARCHAR'], 'VARCHAR')
+            _CONEXION_REPLICA.update({'conexion': conexion, 'ruta': ruta_version})
+            _LECTORES_REPLICA[conexion] = 0
+            if anterior is not None and _LECTORES_REPLICA.get(anterior, 0) == 0:
+                _LECTORES_REPLICA.pop(anterior, None)
+                anterior.close()
+        conexion = _CONEXION_REPLICA['conexion']
+        _LECTORES_REPLICA[conexion] += 1
+        try:
+            return conexion, conexion.cursor()
+        except Exception:
+            _LECTORES_REPLICA[conexion] -= 1
+            raise
+
+def _liberar_cursor_replica(conexion, cursor):
+    """
+    Cierra el cursor y, si la conexión ya fue reemplazada por una versión nueva y no tiene más consultas en curso,
+    cierra también la conexión.
+    """
+    cursor.close()
+    with _CANDADO_REPLICA:
+        _LECTORES_REPLICA[conexion] -= 1
+        if _LECTORES_REPLICA[conexion] == 0 and conexion is not _CONEXION_REPLICA['conexion']:
+            del _LECTORES_REPLICA[conexion]
+            conexion.close()
+
+def _reemplazar_dateadd(query):
+    """
+    Traduce DATEADD(UNIDAD, N, FECHA) de Snowflake a (FECHA + INTERVAL (N) UNIDAD) de DuckDB.
+    """
+    while True:
+        coincidencia = re.search(r'\bDATEADD\s*\(', query, flags=re.IGNORECASE)
+        if not coincidencia:
+            return query
+
+        # Ubicar el paréntesis de cierre y los argumentos de primer nivel
+        profundidad, argumentos, inicio_argumento = 1, [], coincidencia.end()
+        for posicion in range(coincidencia.end(), len(query)):
+            caracter = query[posicion]
+            if caracter == '(':
+                profundidad += 1
+            elif caracter == ')':
+                profundidad -= 1
+                if profundidad == 0:
+                    argumentos.append(query[inicio_argumento:posicion])
+                    break
+            elif caracter == ',' and profundidad == 1:
+                argumentos.append(query[inicio_argumento:posicion])
+                inicio_argumento = posicion + 1
+        else:
+            return query
+
+        if len(argumentos) != 3:
+            return query
+
+        unidad, cantidad, fecha = (argumento.strip() for argumento in argumentos)
+        query = query[:coincidencia.start()] + f"(CAST({fecha} AS DATE) + INTERVAL ({cantidad}) {unidad})" + query[posicion + 1:]
+
+def traducir_consulta_replica(query):
+    """
+    Adapta una consulta del aplicativo (dialecto Snowflake) a la réplica DuckDB: elimina el nombre de la base de datos
+    y traduce las funciones de fecha usadas por el aplicativo. Las funciones sin equivalente (por ejemplo HLL_ESTIMATE)
+    hacen fallar la consulta en la réplica y esta se responde desde Snowflake.
+
+    Parámetros:
+    - query (str): Consulta en dialecto Snowflake.
+
+    Retorna:
+    - str: Consulta para DuckDB.
+    """
+    query = re.sub(r'\bREPOSITORIO_TURISMO\.', '', query, flags=re.IGNORECASE)
+    query = re.sub(r'\bCURRENT_DATE\s*\(\s*\)', 'CURRENT_DATE', query, flags=re.IGNORECASE)
+    return _reemplazar_dateadd(query)
+
+def consultar_replica(query, ruta=RUTA_REPLICA):
+    """
+    Ejecuta una consulta sobre la réplica local.
+
+    Parámetros:
+    - query (str): Consulta en dialecto Snowflake.
+    - ruta (str): Ruta del archivo DuckDB.
+
+    Retorna:
+    - list: Lista de registros (dict columna -> valor). Las columnas van en mayúsculas, como las retorna Snowflake
+      para los identificadores sin comillas (DuckDB conserva, por ejemplo, 'sum(SILLAS)' en minúsculas).
+
+    Excepciones:
+    - Exception: Si no hay réplica disponible o la consulta no se puede ejecutar en DuckDB.
+    """
+    # Un cursor por consulta: las conexiones de DuckDB no se comparten entre hilos
+    abierto = _abrir_cursor_replica(ruta)
+    if abierto is None:
+        raise Exception("No hay réplica local disponible.")
+
+    conexion, cursor = abierto
+    try:
+        cursor.execute(traducir_consulta_replica(query))
+        columnas = [descripcion[0].upper() for descripcion in cursor.description]
+        return [dict(zip(columnas, fila)) for fila in cursor.fetchall()]
+    finally:
+        _liberar_cursor_replica(conexion, cursor)
+
+def replica_disponible(ruta=RUTA_REPLICA):
+    """
+    Indica si el aplicativo lee de la réplica local: modo de lectura 'replica', DuckDB instalado y réplica publicada.
+    """
+    return MODO_LECTURA == 'replica' and duckdb is not None and _ruta_vigente(ruta) is not None
+
+def version_replica(ruta=RUTA_REPLICA):
+    """
+    Retorna la versión publicada de la réplica que lee el aplicativo (ruta del archivo vigente), o None si no lee de
+    la réplica. Permite invalidar las cachés derivadas de la capa de servicio cuando se publica una nueva versión.
+    """
+    return _ruta_vigente(ruta) if replica_disponible(ruta) else None
+
+def consultar_filas(query, session, modo=None):
+    """
+    Ejecuta una consulta del aplicativo según el modo de lectura: en modo 'replica' se responde desde la réplica local
+    y, si no es posible (réplica inexistente, tabla no replicada o SQL no soportado por DuckDB), desde Snowflake.
+    Si Snowflake no está disponible, la réplica permite seguir respondiendo las consultas que soporta.
+
+    Parámetros:
+    - query (str): Consulta SQL a ejecutar.
+    - session: Objeto de conexión activo a Snowflake (puede ser None en modo 'replica').
+    - modo (str): 'replica' o 'snowflake'. Por defecto MODO_LECTURA.
+
+    Retorna:
+    - list: Lista de registros (dict columna -> valor).
+    """
+    modo = modo or MODO_LECTURA
+
+    if modo == 'replica':
+        try:
+            return consultar_replica(query)
+        except Exception as e:
+            print(f"Consulta respondida desde Snowflake (réplica no disponible para la consulta: {str(e)[:150]}).")
+
+    if session is None:
+        raise Exception("No hay una sesión activa de Snowflake.")
+
+    return [row.asDict() for row in session.sql(query).collect()]
+
+def estado_replica(ruta=RUTA_REPLICA):
+    """
+    Retorna el estado de la réplica local (para el panel de administración).
+
+    Retorna:
+    - dict: Modo de lectura, ruta, existencia, fecha de exportación y tablas replicadas.
+    """
+    ruta_version = _ruta_vigente(ruta)
+    estado = {'modo_lectura': MODO_LECTURA, 'ruta': ruta_version or ruta, 'duckdb_instalado': duckdb is not None, 'existe': ruta_version is not None}
+    if estado['existe'] and duckdb is not None:
+        try:
+            metadatos = consultar_replica("SELECT TABLA, REGISTROS, FECHA_EXPORTACION FROM REPLICA_METADATOS ORDER BY TABLA", ruta)
+            estado['fecha_exportacion'] = str(max(fila['FECHA_EXPORTACION'] for fila in metadatos)) if metadatos else None
+            estado['tablas'] = {fila['TABLA']: fila['REGISTROS'] for fila in metadatos}
+        except Exception as e:
+            estado['error'] = str(e)
+    return estado
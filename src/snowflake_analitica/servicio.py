@@ -0,0 +1,185 @@
+# Librerías
+import time
+from .helpers import MAX_CONCURRENCIA_SQL
+
+#################################################
+# Tablas de servicio materializadas del aplicativo
+#################################################
+
+# Esquema de origen (vistas con la lógica de negocio) y esquema de destino (tablas físicas que consulta el aplicativo)
+ESQUEMA_VISTAS = 'VISTAS'
+ESQUEMA_SERVICIO = 'SERVICIO'
+
+# Vistas que se materializan y llaves de clustering: las llaves enteras de país (ID_PAIS_*) por las que filtra el aplicativo.
+# BENCHMARK_PAISES se calcula sobre todos los países en el cargue (posición, percentil, participación y promedios).
+TABLAS_SERVICIO = {
+    'DIM_PAIS': ['ID_PAIS'],
+    'GLOBALDATA_VIAJEROS_MUNDO': ['ID_PAIS'],
+    'GLOBALDATA_NOCHES_PROMEDIO': ['ID_PAIS'],
+    'GLOBALDATA_CATEGORIAS_GASTO': ['ID_PAIS'],
+    'GLOBALDATA_RANGO_EDAD': ['ID_PAIS'],
+    'GLOBALDATA_MOTIVO_VIAJE': ['ID_PAIS'],
+    'GLOBALDATA_FORMA_VIAJE': ['ID_PAIS'],
+    'GLOBALDATA_FLUJOS_VIAJEROS_REGION': ['ID_PAIS_ORIGEN'],
+    'GLOBALDATA_MICE': ['ID_PAIS'],
+    'OAG_CONECTIVIDAD_MUNDO': ['ID_PAIS_DEPARTURE', 'ID_PAIS_ARRIVAL'],
+    'OAG_CONECTIVIDAD_COLOMBIA': ['ID_PAIS_DEPARTURE'],
+    'FORWARDKEYS_RESERVAS_PAISES': ['ID_PAIS_DEPARTURE', 'ID_PAIS_ARRIVAL'],
+    'FORWARDKEYS_BUSQUEDAS_PAISES': ['ID_PAIS_DEPARTURE', 'ID_PAIS_ARRIVAL'],
+    'FORWARDKEYS_RESERVAS_MES': ['ID_PAIS_DEPARTURE', 'ID_PAIS_ARRIVAL'],
+    'FORWARDKEYS_BUSQUEDAS_MES': ['ID_PAIS_DEPARTURE', 'ID_PAIS_ARRIVAL'],
+    'CREDIBANCO_GASTO': ['ID_PAIS'],
+    'IATAGAP_AGENCIAS': ['ID_PAIS_AGENCIA'],
+    'IATAGAP_AGENCIAS_PAIS': ['ID_PAIS_AGENCIA'],
+    'IATAGAP_AGENCIAS_CIUDADES': ['ID_PAIS_AGENCIA'],
+    'BENCHMARK_PAISES': ['ID_PAIS']
+}
+
+def _sentencia_construccion(nombre_vista, llaves_cluster, esquema_origen, esquema_destino):
+    """
+    Construye la sentencia CREATE TABLE ... CLUSTER BY ... AS SELECT que genera la tabla temporal <TABLA>__NUEVA.
+    """
+    columnas_cluster = ', '.join(llaves_cluster)
+    return f"""
+        CREATE OR REPLACE TABLE {esquema_destino}.{nombre_vista}__NUEVA
+        CLUSTER BY ({columnas_cluster})
+        AS SELECT * FROM {esquema_origen}.{nombre_vista}
+        ORDER BY {columnas_cluster};
+    """
+
+def _publicar_tabla_servicio(sesion_activa, nombre_vista, esquema_origen, esquema_destino):
+    """
+    Verifica que la tabla temporal <TABLA>__NUEVA no esté vacía, la intercambia con la tabla publicada y elimina
+    la versión anterior. Son operaciones de metadatos, por lo que se ejecutan de forma síncrona.
+
+    Retorna:
+    - int: Número de registros de la tabla publicada.
+    """
+    tabla_destino = f"{esquema_destino}.{nombre_vista}"
+    tabla_nueva = f"{esquema_destino}.{nombre_vista}__NUEVA"
+
+    # No publicar una tabla vacía
+    numero_registros = sesion_activa.sql(f"SELECT COUNT(*) AS REGISTROS FROM {tabla_nueva}").collect()[0]['REGISTROS']
+    if numero_registros == 0:
+        sesion_activa.sql(f"DROP TABLE IF EXISTS {tabla_nueva}").collect()
+        raise ValueError(f"La vista {esquema_origen}.{nombre_vista} no devolvió registros; se conserva la versión publicada.")
+
+    # Intercambio atómico con la versión publicada
+    sesion_activa.sql(f"CREATE TABLE IF NOT EXISTS {tabla_destino} LIKE {tabla_nueva}").collect()
+    sesion_activa.sql(f"ALTER TABLE {tabla_nueva} SWAP WITH {tabla_destino}").collect()
+
+    # Eliminar la versión anterior
+    sesion_activa.sql(f"DROP TABLE IF EXISTS {tabla_nueva}").collect()
+
+    return numero_registros
+
+def materializar_tabla_servicio(sesion_activa, nombre_vista, llaves_cluster, esquema_origen=ESQUEMA_VISTAS, esquema_destino=ESQUEMA_SERVICIO):
+    """
+    Materializa una vista en una tabla física agrupada (CLUSTER BY) por las columnas de país y la publica con un
+    intercambio atómico (ALTER TABLE ... SWAP WITH), de modo que el aplicativo nunca lee una tabla a medio construir.
+
+    Pasos:
+    1. Construye la tabla temporal <TABLA>__NUEVA con CREATE TABLE ... CLUSTER BY ... AS SELECT ... ORDER BY llaves.
+    2. Verifica que la tabla nueva no esté vacía (si lo está, conserva la versión publicada y lanza un error).
+    3. Crea la tabla publicada si no existe (primer cargue) e intercambia ambas tablas en una sola operación.
+    4. Elimina la tabla temporal, que después del intercambio contiene la versión anterior.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - nombre_vista (str): Nombre de la vista de origen y de la tabla de destino.
+    - llaves_cluster (list): Columnas de clustering (llaves de país por las que filtra el aplicativo).
+    - esquema_origen (str): Esquema de la vista. Por defecto 'VISTAS'.
+    - esquema_destino (str): Esquema de la tabla materializada. Por defecto 'SERVICIO'.
+
+    Retorna:
+    - dict: Resumen con la tabla, el número de registros y el tiempo de construcción en segundos.
+
+    Excepciones:
+    - Exception: Si ocurre un error al construir o publicar la tabla.
+    """
+    tabla_destino = f"{esquema_destino}.{nombre_vista}"
+    inicio = time.time()
+
+    try:
+        sesion_activa.sql(_sentencia_construccion(nombre_vista, llaves_cluster, esquema_origen, esquema_destino)).collect()
+        numero_registros = _publicar_tabla_servicio(sesion_activa, nombre_vista, esquema_origen, esquema_destino)
+
+        return {'tabla': tabla_destino, 'registros': numero_registros, 'segundos': round(time.time() - inicio, 1)}
+
+    except Exception as e:
+        raise Exception(f"Error al materializar la tabla {tabla_destino}: {str(e)}")
+
+def materializar_tablas_servicio(sesion_activa, tablas=None, esquema_origen=ESQUEMA_VISTAS, esquema_destino=ESQUEMA_SERVICIO, max_concurrencia=None, intervalo=0.5):
+    """
+    Materializa todas las tablas de servicio del aplicativo a partir de las vistas del esquema VISTAS.
+    Se ejecuta al final del flujo de cargue, después de crear las vistas. Las tablas son independientes entre sí,
+    por lo que sus CREATE TABLE ... AS SELECT se envían de forma asíncrona (collect_nowait) sobre la misma sesión,
+    hasta `max_concurrencia` a la vez; la sesión de Snowpark no se comparte entre hilos. La verificación y el
+    intercambio de cada tabla se ejecutan de forma síncrona cuando termina su construcción.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake (base de datos REPOSITORIO_TURISMO).
+    - tablas (dict): Diccionario {vista: llaves_cluster}. Por defecto TABLAS_SERVICIO.
+    - esquema_origen (str): Esquema de las vistas. Por defecto 'VISTAS'.
+    - esquema_destino (str): Esquema de las tablas materializadas. Por defecto 'SERVICIO'.
+    - max_concurrencia (int): Máximo de tablas construyéndose al mismo tiempo. Por defecto MAX_CONCURRENCIA_SQL.
+    - intervalo (float): Segundos entre revisiones del estado de las construcciones en curso.
+
+    Retorna:
+    - list: Lista de resúmenes (dict) de las tablas materializadas correctamente.
+
+    Excepciones:
+    - Exception: Si alguna tabla no se pudo materializar (las demás se publican de todas formas).
+    """
+    tablas = tablas or TABLAS_SERVICIO
+    max_concurrencia = max_concurrencia or MAX_CONCURRENCIA_SQL
+    resumenes = []
+    errores = []
+    inicio_total = time.time()
+
+    # Crear el esquema de servicio si no existe
+    sesion_activa.sql(f"CREATE SCHEMA IF NOT EXISTS {esquema_destino}").collect()
+
+    pendientes = list(tablas.items())
+    en_curso = {}
+    numero_tabla = 0
+
+    while pendientes or en_curso:
+        # Enviar las construcciones hasta el máximo de concurrencia
+        while pendientes and len(en_curso) < max_concurrencia:
+            nombre_vista, llaves_cluster = pendientes.pop(0)
+            numero_tabla += 1
+            print(f"Materializando tabla {numero_tabla}/{len(tablas)}: {esquema_destino}.{nombre_vista} (CLUSTER BY {', '.join(llaves_cluster)})...")
+            try:
+                sentencia = _sentencia_construccion(nombre_vista, llaves_cluster, esquema_origen, esquema_destino)
+                en_curso[nombre_vista] = (sesion_activa.sql(sentencia).collect_nowait(), time.time())
+            except Exception as e:
+                errores.append(f"Error al materializar la tabla {esquema_destino}.{nombre_vista}: {str(e)}")
+                print(errores[-1])
+
+        # Publicar las tablas cuya construcción terminó
+        for nombre_vista, (trabajo, inicio) in list(en_curso.items()):
+            if not trabajo.is_done():
+                continue
+            del en_curso[nombre_vista]
+            tabla_destino = f"{esquema_destino}.{nombre_vista}"
+            try:
+                trabajo.result()
+                numero_registros = _publicar_tabla_servicio(sesion_activa, nombre_vista, esquema_origen, esquema_destino)
+                resumen = {'tabla': tabla_destino, 'registros': numero_registros, 'segundos': round(time.time() - inicio, 1)}
+                resumenes.append(resumen)
+                print(f"Tabla {resumen['tabla']} publicada: {resumen['registros']} registros en {resumen['segundos']} s.")
+            except Exception as e:
+                errores.append(f"Error al materializar la tabla {tabla_destino}: {str(e)}")
+                print(errores[-1])
+
+        if en_curso:
+            time.sleep(intervalo)
+
+    print(f"{len(resumenes)}/{len(tablas)} tablas de servicio publicadas en {round(time.time() - inicio_total, 1)} s "
+          f"(suma de las tablas: {round(sum(resumen['segundos'] for resumen in resumenes), 1)} s).")
+
+    if errores:
+        raise Exception(f"No fue posible materializar {len(errores)} tabla(s) de servicio: {' | '.join(errores)}")
+
+    return resumenes
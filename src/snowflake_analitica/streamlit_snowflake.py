@@ -1,10 +1,13 @@
 # Librerías
 import streamlit as st
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
+import atexit
+import weakref
 from snowflake.snowpark import Session
 from dotenv import load_dotenv
+from .replica import replica_disponible
 
 # Inicializar variables de sesión si no existen
 if 'session' not in st.session_state:
@@ -15,6 +18,12 @@ if 'last_activity_time' not in st.session_state:
 # Definir tiempo de espera de sesión (15 minutos)
 SESSION_TIMEOUT = timedelta(minutes=15)
 
+# Eventos de seguimiento que la sesión diferida acumula antes de abrir la conexión solo para registrarlos
+MAX_EVENTOS_PENDIENTES = int(os.getenv('CITI_MAX_EVENTOS_PENDIENTES', 50))
+
+# Sesiones diferidas vivas, para registrar sus eventos pendientes al terminar el proceso
+_SESIONES_DIFERIDAS = weakref.WeakSet()
+
 # Función para crear una nueva sesión con Snowflake
 def create_session(retries=5, wait=10):
     """
@@ -98,6 +107,95 @@ def create_session(retries=5, wait=10):
         print("Todos los intentos de conexión fallaron.")
         return None
 
+def _insertar_eventos(sesion_activa, eventos):
+    """
+    Inserta eventos de seguimiento (tipo, detalle, unidad, fecha y hora UTC) con una sola sentencia. La fecha y hora
+    del evento se guarda en la hora de Bogotá.
+    """
+    def texto(valor):
+        return "'" + str(valor).replace("'", "''") + "'"
+
+    valores = ',\n'.join(f"({texto(tipo)}, {texto(detalle)}, {texto(unidad)}, CONVERT_TIMEZONE('UTC', 'America/Bogota', {texto(fecha_utc)}::TIMESTAMP_NTZ))"
+                         for tipo, detalle, unidad, fecha_utc in eventos)
+    sesion_activa.sql(f"""
+        INSERT INTO REPOSITORIO_TURISMO.SEGUIMIENTO.SEGUIMIENTO_EVENTOS (TIPO_EVENTO, DETALLE_EVENTO, UNIDAD, FECHA_HORA)
+        VALUES {valores};
+        """).collect()
+
+class SesionDiferida:
+    """
+    Sesión de Snowflake que se crea (con create_session) la primera vez que se usa. En modo réplica las consultas se
+    responden desde DuckDB, por lo que la sesión solo se abre si alguna consulta debe ir a Snowflake.
+    Los eventos de seguimiento se acumulan mientras la sesión no existe y se registran cuando se abre, cuando se
+    acumulan MAX_EVENTOS_PENDIENTES, cuando la sesión se cierra o cuando termina el proceso.
+    """
+    def __init__(self):
+        self._sesion = None
+        self._eventos_pendientes = []
+        _SESIONES_DIFERIDAS.add(self)
+
+    @property
+    def creada(self):
+        """
+        Indica si la sesión real ya se creó.
+        """
+        return self._sesion is not None
+
+    def obtener(self):
+        """
+        Retorna la sesión real, creándola si todavía no existe.
+        """
+        if self._sesion is None:
+            self._sesion = create_session()
+            if self._sesion is None:
+                raise Exception("No fue posible crear la sesión de Snowflake.")
+            self._enviar_eventos()
+        return self._sesion
+
+    def agregar_evento(self, evento):
+        """
+        Registra un evento de seguimiento: de inmediato si la sesión ya existe y, si no, cuando se abra o cuando se
+        acumulen MAX_EVENTOS_PENDIENTES (entonces se abre la sesión para registrarlos).
+        """
+        self._eventos_pendientes.append(evento)
+        if self._sesion is not None or len(self._eventos_pendientes) >= MAX_EVENTOS_PENDIENTES:
+            self._enviar_eventos()
+
+    def _enviar_eventos(self):
+        """
+        Inserta los eventos pendientes con la sesión real.
+        """
+        eventos, self._eventos_pendientes = self._eventos_pendientes, []
+        if eventos:
+            _insertar_eventos(self.obtener(), eventos)
+
+    def close(self):
+        """
+        Registra los eventos pendientes y cierra la sesión real si se llegó a crear.
+        """
+        if self._eventos_pendientes:
+            try:
+                self._enviar_eventos()
+            except Exception as e:
+                print(f"No fue posible registrar los eventos de seguimiento pendientes: {e}")
+        if self._sesion is not None:
+            self._sesion.close()
+            self._sesion = None
+
+    def __getattr__(self, nombre):
+        # Los atributos privados no abren la sesión (introspección, copia o serialización del objeto)
+        if nombre.startswith('_'):
+            raise AttributeError(nombre)
+        return getattr(self.obtener(), nombre)
+
+@atexit.register
+def _cerrar_sesiones_diferidas():
+    """
+    Al terminar el proceso registra los eventos pendientes de las sesiones diferidas que siguen abiertas.
+    """
+    for sesion in list(_SESIONES_DIFERIDAS):
+        sesion.close()
+
 # Función para verificar si la sesión ha expirado
 def check_session():
     """
@@ -129,6 +227,8 @@ def flujo_snowflake():
     Gestiona el flujo para interactuar con Snowflake, asegurando que:
     1. Se registre la última actividad del usuario.
     2. Se obtenga una sesión activa, ya sea verificando la existente o creando una nueva.
+       En modo réplica (réplica local publicada) la sesión se difiere hasta la primera consulta que vaya a Snowflake,
+       de modo que las recargas de la página no abren conexiones (ni esperan sus reintentos).
 
     Este flujo utiliza funciones auxiliares para manejar la sesión y garantizar
     que el tiempo de espera (timeout) y la lógica de reconexión se respeten.
@@ -138,6 +238,13 @@ def flujo_snowflake():
     # el cierre prematuro de la sesión por inactividad.
     update_last_activity()
 
+    # Paso 2 (modo réplica): sesión diferida, que se crea solo si una consulta no se puede responder desde la réplica
+    if replica_disponible():
+        check_session()
+        if st.session_state.session is None:
+            st.session_state.session = SesionDiferida()
+        return
+
     # Paso 2: Obtener la sesión activa
     # Verifica si hay una sesión activa. Si ha expirado o no existe, 
     # intenta crear una nueva sesión de Snowflake.
@@ -146,7 +253,9 @@ def flujo_snowflake():
 # Función para insertar datos en la tabla de seguimiento
 def registrar_evento(sesion_activa, tipo_evento, detalle_evento, unidad):
     """
-    Registra un evento en la base de datos Snowflake.
+    Registra un evento en la base de datos Snowflake. Con la sesión diferida del modo réplica que todavía no se ha
+    abierto, el evento se acumula en la sesión y se registra cuando esta se abre (ver SesionDiferida), para no abrir
+    una conexión solo por el seguimiento. Sin sesión (sin conexión) el evento no se registra.
 
     Args:
     - sesion_activa: Sesión activa de conexión a la base de datos.
@@ -154,14 +263,16 @@ def registrar_evento(sesion_activa, tipo_evento, detalle_evento, unidad):
     - detalle_evento (str): Detalle de evento ('selección continente', 'selección país', etc)
     - unidad (str): Unidad específica del evento (e.g., 'América', 'Colombia').
     """
+    if sesion_activa is None:
+        return
+
+    # Fecha y hora del evento (no la del registro, que puede ser posterior)
+    evento = (tipo_evento, detalle_evento, unidad, datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'))
     try:
-        # Crear consulta para el insert
-        query_insert = f"""
-        INSERT INTO REPOSITORIO_TURISMO.SEGUIMIENTO.SEGUIMIENTO_EVENTOS (TIPO_EVENTO, DETALLE_EVENTO, UNIDAD, FECHA_HORA) 
-        VALUES ('{tipo_evento}', '{detalle_evento}', '{unidad}', CONVERT_TIMEZONE('America/Los_Angeles', 'America/Bogota', CURRENT_TIMESTAMP));
-        """
-        # Ejecutar la consulta SQL con los valores
-        sesion_activa.sql(query_insert).collect()      
+        if isinstance(sesion_activa, SesionDiferida):
+            sesion_activa.agregar_evento(evento)
+        else:
+            _insertar_eventos(sesion_activa, [evento])
     # Error
     except Exception as e:
-        st.write(f"Error al registrar evento: {e}")
\ No newline at end of file
+        st.write(f"Error al registrar evento: {e}")
@@ -0,0 +1,431 @@
+# Librerías
+import os
+import pprint
+import pandas as pd
+from .helpers import clean_column_name
+from .lectura_tipada import leer_csv_tipado
+from .cache_excel import leer_hoja_excel
+
+##########################################################################
+# Lectura, transformación y validación por archivo de los scripts cargue_*
+##########################################################################
+
+# Las funciones de este módulo procesan un solo archivo y se ejecutan en los procesos de ejecutar_ingesta,
+# por lo que deben vivir en un módulo importable y no depender de la sesión de Snowflake.
+
+def convertir_columnas(df, columnas_float64, columnas_enteras=()):
+    """
+    Convierte las columnas indicadas a float64 o a enteros (los valores no numéricos quedan nulos) y el resto a texto.
+
+    Parámetros:
+    - df (pandas.DataFrame): DataFrame con los nombres de columna ya limpios.
+    - columnas_float64 (list): Columnas numéricas con decimales.
+    - columnas_enteras (list, opcional): Columnas de conteos. Se convierten a Int64 (enteros con nulos) para que se
+      carguen como NUMBER(p,0); un valor con decimales en estas columnas es un error.
+
+    Retorna:
+    - pandas.DataFrame: El mismo DataFrame con los tipos convertidos.
+    """
+    for col in columnas_float64:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+
+    for col in columnas_enteras:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+
+    columnas_otros = [col for col in df.columns if col not in columnas_float64 and col not in columnas_enteras]
+    df[columnas_otros] = df[columnas_otros].astype(str)
+    return df
+
+def validar_columnas(df, columnas_esperadas, nombre_archivo, permitir_extras=False):
+    """
+    Verifica que el DataFrame tenga exactamente las columnas esperadas.
+
+    Parámetros:
+    - df (pandas.DataFrame): DataFrame con los nombres de columna ya limpios.
+    - columnas_esperadas (list): Columnas esperadas (se limpian con clean_column_name).
+    - nombre_archivo (str): Nombre del archivo, para los mensajes.
+    - permitir_extras (bool): Si es True, las columnas adicionales no son un error.
+
+    Excepciones:
+    - ValueError: Si faltan columnas o hay columnas adicionales no permitidas.
+    """
+    columnas_esperadas = [clean_column_name(col) for col in columnas_esperadas]
+    columnas_faltantes = set(columnas_esperadas) - set(df.columns)
+    columnas_extras = set(df.columns) - set(columnas_esperadas)
+
+    errores = []
+    if columnas_faltantes:
+        errores.append(f"Columnas faltantes: {sorted(columnas_faltantes)}")
+    if columnas_extras and not permitir_extras:
+        errores.append(f"Columnas adicionales no esperadas: {sorted(columnas_extras)}")
+
+    if errores:
+        raise ValueError(f"Validación de columnas del archivo {nombre_archivo}: {'; '.join(errores)}")
+
+############
+# GlobalData
+############
+
+# Columnas numéricas de GlobalData
+COLUMNAS_FLOAT64_GLOBAL_DATA = ['VALUE_1', 'VALUE', 'AVERAGE_LENGTH_OF_TRIP_BY_TYPE_DAYS', 'LATITUD_GENERADO', 'LONGITUD_GENERADO']
+
+# Columnas esperadas de cada archivo de GlobalData
+ESQUEMAS_GLOBAL_DATA = {'Categorias_gasto.csv': {'columns': ['EXPENDITURE_BY_TOURISM_TYPE',
+                                      'REGION',
+                                      'COUNTRY',
+                                      '_SECTOR_',
+                                      'YEAR',
+                                      'VALUE_1',
+                                      'AXIS',
+                                      'UNITS_CUST']},
+ 'Flujo_MICE.csv': {'columns': ['REGION',
+                                'COUNTRY',
+                                'SUB_INDICATORS_1',
+                                'DATA_POINTS',
+                                'YEAR',
+                                'VALUE']},
+ 'Flujo_viajeros_mundo.csv': {'columns': ['REGION',
+                                          'COUNTRY',
+                                          'DATA_POINTS',
+                                          'SUB_INDICATORS_1',
+                                          'YEAR',
+                                          'VALUE']},
+ 'Flujo_viajeros_region.csv': {'columns': ['_',
+                                           'COUNTRY',
+                                           'COUNTRY_1',
+                                           'COUNTRY_OF_ORIGIN_DESTINATION',
+                                           'COUNTRY_OF_ORIGIN_DESTINATION_1',
+                                           'YEAR',
+                                           'INDEX',
+                                           'DATA_POINTS',
+                                           'VALUE']},
+ 'Forma_viaje.csv': {'columns': ['REGION',
+                                 'COUNTRY',
+                                 'DATA_POINTS',
+                                 'SUB_INDICATORS_1',
+                                 'YEAR',
+                                 'VALUE']},
+ 'Motivo_viaje.csv': {'columns': ['REGION',
+                                  'COUNTRY',
+                                  'PURPOSE',
+                                  'YEAR',
+                                  'DATA_POINTS',
+                                  'VALUE']},
+ 'Noches_promedio.csv': {'columns': ['COUNTRY',
+                                     'SUB_INDICATORS_1_TD_TT_TDF_NOOFOVERNIGHTSTAYS',
+                                     'AVERAGE_LENGTH_OF_TRIP_BY_TYPE_DAYS',
+                                     'YEAR_COPY',
+                                     'LATITUD_GENERADO',
+                                     'LONGITUD_GENERADO']},
+ 'Rango_edad.csv': {'columns': ['REGION',
+                                'COUNTRY',
+                                'SUB_INDICATORS_1',
+                                'YEAR',
+                                'UNITS',
+                                'VALUE']}}
+
+# Columnas que se cargan del archivo de flujos de viajeros a la región
+COLUMNAS_VALIDAS_FLUJO_REGION = ['COUNTRY', 'COUNTRY_1', 'COUNTRY_OF_ORIGIN_DESTINATION', 'COUNTRY_OF_ORIGIN_DESTINATION_1', 'YEAR', 'INDEX', 'DATA_POINTS', 'VALUE']
+
+# Reglas de validación de GlobalData (las columnas que no tiene un archivo se omiten)
+REGLAS_GLOBAL_DATA = {'requeridas': ['COUNTRY', 'YEAR'],
+                      'referencias': {'COUNTRY': 'CORRELATIVAS.PAISES_GLOBALDATA.NOMBRE_GLOBAL_DATA',
+                                      'COUNTRY_OF_ORIGIN_DESTINATION': 'CORRELATIVAS.PAISES_GLOBALDATA.NOMBRE_GLOBAL_DATA'},
+                      'variacion_registros': 0.5,
+                      'advertencias': ['referencias', 'variacion_registros']}
+
+def transformar_archivo_global_data(ruta_archivo):
+    """
+    Lee un archivo CSV de GlobalData, limpia los nombres de columna, valida sus columnas y convierte los tipos.
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del archivo. El nombre del archivo determina el esquema esperado.
+
+    Retorna:
+    - pandas.DataFrame: Datos listos para cargar.
+
+    Excepciones:
+    - ValueError: Si el archivo no tiene esquema esperado o sus columnas no coinciden.
+    """
+    archivo = os.path.basename(ruta_archivo)
+    esquema_esperado = ESQUEMAS_GLOBAL_DATA.get(archivo)
+    if not esquema_esperado:
+        raise ValueError(f"No se encontró esquema esperado para el archivo {archivo} en ESQUEMAS_GLOBAL_DATA.")
+
+    # Importar datos y limpiar los nombres de las columnas
+    df = pd.read_csv(ruta_archivo, sep=',', decimal='.')
+    df.columns = [clean_column_name(col) for col in df.columns]
+
+    # Validación de columnas
+    validar_columnas(df, esquema_esperado['columns'], archivo)
+
+    # Convertir tipos
+    df = convertir_columnas(df, [clean_column_name(col) for col in COLUMNAS_FLOAT64_GLOBAL_DATA])
+
+    # Elegir solo columnas válidas del archivo de flujos de viajeros a la región
+    if archivo == 'Flujo_viajeros_region.csv':
+        df = df[COLUMNAS_VALIDAS_FLUJO_REGION]
+
+    return df
+
+#####
+# OAG
+#####
+
+# Hoja de datos, columnas de conteos y columnas esperadas de los archivos de OAG
+HOJA_OAG = 'Export'
+COLUMNAS_ENTERAS_OAG = ['FREQUENCY', 'SEATS_TOTAL']
+COLUMNAS_OAG = ['CARRIER_NAME',
+                'DEP_AIRPORT_CODE',
+                'DEP_AIRPORT_NAME',
+                'DEP_CITY_CODE',
+                'DEP_CITY_NAME',
+                'DEP_IATA_COUNTRY_CODE',
+                'DEP_IATA_COUNTRY_NAME',
+                'ARR_AIRPORT_CODE',
+                'ARR_AIRPORT_NAME',
+                'ARR_CITY_CODE',
+                'ARR_CITY_NAME',
+                'ARR_IATA_COUNTRY_CODE',
+                'ARR_IATA_COUNTRY_NAME',
+                'FREQUENCY',
+                'SEATS_TOTAL',
+                'TIME_SERIES']
+
+# Reglas de validación de OAG
+REGLAS_OAG = {'requeridas': ['TIME_SERIES', 'DEP_AIRPORT_CODE', 'ARR_AIRPORT_CODE'],
+              'rangos': {'FREQUENCY': (0, None), 'SEATS_TOTAL': (0, None)},
+              'referencias': {'DEP_IATA_COUNTRY_CODE': 'CORRELATIVAS.PAISES_FORWARDKEYS.COUNTRYCODE',
+                              'ARR_IATA_COUNTRY_CODE': 'CORRELATIVAS.PAISES_FORWARDKEYS.COUNTRYCODE'},
+              'variacion_registros': 0.5,
+              'advertencias': ['referencias', 'variacion_registros']}
+
+def transformar_lote_oag(df, nombre_archivo=''):
+    """
+    Limpia los nombres de columna, convierte los tipos, corrige el código de país de Namibia ('NA', que pandas
+    lee como nulo) y valida las columnas de datos de OAG (un archivo completo o un lote de filas).
+
+    Parámetros:
+    - df (pandas.DataFrame): Datos leídos de la hoja de OAG.
+    - nombre_archivo (str): Nombre del archivo, para los mensajes.
+
+    Retorna:
+    - pandas.DataFrame: Datos listos para cargar.
+    """
+    df.columns = [clean_column_name(col) for col in df.columns]
+    df = convertir_columnas(df, [], COLUMNAS_ENTERAS_OAG)
+
+    # Código de país de Namibia en salidas y llegadas
+    for prefijo in ['DEP', 'ARR']:
+        columna_codigo, columna_nombre = f'{prefijo}_IATA_COUNTRY_CODE', f'{prefijo}_IATA_COUNTRY_NAME'
+        if columna_codigo in df.columns and columna_nombre in df.columns:
+            df.loc[(df[columna_codigo] == 'nan') & (df[columna_nombre] == 'Namibia'), columna_codigo] = 'NA'
+
+    validar_columnas(df, COLUMNAS_OAG, nombre_archivo)
+
+    return df
+
+def transformar_archivo_oag(ruta_archivo):
+    """
+    Lee un archivo mensual de OAG completo (desde su caché en Parquet) y lo transforma con transformar_lote_oag.
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del archivo Excel.
+
+    Retorna:
+    - pandas.DataFrame: Datos listos para cargar.
+    """
+    return transformar_lote_oag(leer_hoja_excel(ruta_archivo, HOJA_OAG), os.path.basename(ruta_archivo))
+
+##########
+# IATA-GAP
+##########
+
+# Hoja de datos, columnas del archivo original y columnas después de transformar los años a filas
+HOJA_IATA = 'Data'
+COLUMNAS_IATA = ['TRAVEL_AGENCY_NAME', 'TRAVEL_AGENCY_CITY', 'TRAVEL_AGENCY_COUNTRY', 'TRIP_ORIGIN_CITY', 'TRIP_ORIGIN_COUNTRY', 'TRIP_DESTINATION_COUNTRY', 'TOTAL']
+COLUMNAS_ID_IATA = ['TRAVEL_AGENCY_NAME', 'TRAVEL_AGENCY_CITY', 'TRAVEL_AGENCY_COUNTRY', 'TRIP_ORIGIN_CITY', 'TRIP_ORIGIN_COUNTRY', 'TRIP_DESTINATION_COUNTRY']
+COLUMNAS_IATA_MELTED = COLUMNAS_ID_IATA + ['YEAR', 'VALUE']
+
+# Reglas de validación de IATA-GAP (sobre los datos después de transformar los años a filas)
+REGLAS_IATA = {'requeridas': ['TRAVEL_AGENCY_COUNTRY', 'YEAR'],
+               'rangos': {'VALUE': (0, None)},
+               'referencias': {'TRAVEL_AGENCY_COUNTRY': 'CORRELATIVAS.PAISES_IATAGAP.NOMBRE_IATA_GAP'},
+               'variacion_registros': 0.5,
+               'advertencias': ['referencias', 'variacion_registros']}
+
+def transformar_archivo_iata(ruta_archivo):
+    """
+    Lee un archivo de IATA-GAP, valida sus columnas (las columnas de años o trimestres son adicionales permitidas),
+    elimina la columna de totales y pasa los años de columnas a filas (YEAR, VALUE).
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del archivo Excel.
+
+    Retorna:
+    - pandas.DataFrame: Datos listos para cargar.
+    """
+    nombre_archivo = os.path.basename(ruta_archivo)
+
+    # Importar datos (desde la caché en Parquet del libro) y validar columnas
+    df = leer_hoja_excel(ruta_archivo, HOJA_IATA, skiprows=4)
+    df.columns = [clean_column_name(col) for col in df.columns]
+    validar_columnas(df, COLUMNAS_IATA, nombre_archivo, permitir_extras=True)
+
+    # Eliminar la columna de totales y realizar melt de las columnas de años
+    df = df.drop(['TOTAL'], axis=1)
+    cols_a_melt = list(set(df.columns) - set(COLUMNAS_ID_IATA))
+    pprint.pprint(f"Columnas a realizar melt en {nombre_archivo}: {cols_a_melt}")
+    df = pd.melt(df, id_vars=COLUMNAS_ID_IATA, value_vars=cols_a_melt, var_name='YEAR', value_name='VALUE')
+
+    # Eliminar el carácter "_" de la columna 'YEAR' y transformar en numérica la columna valor
+    df['YEAR'] = df['YEAR'].str.replace('_', '')
+    df['VALUE'] = df['VALUE'].astype(float)
+
+    validar_columnas(df, COLUMNAS_IATA_MELTED, nombre_archivo)
+
+    return df
+
+############
+# Credibanco
+############
+
+# Esquema declarado de los archivos de Credibanco (CSV separados por ';'). Los montos se cargan como NUMBER(38,2) y los
+# conteos de turistas y transacciones como NUMBER(38,0).
+ESQUEMA_CREDIBANCO = {'sep': ';',
+                      'decimal': '.',
+                      'columnas': {'ANIO': {'tipo': 'texto', 'nulos': False},
+                                   'MES': {'tipo': 'texto', 'nulos': False},
+                                   'DEPARTAMENTO_DESTINO': {'tipo': 'texto'},
+                                   'CIUDAD_DESTINO': {'tipo': 'texto'},
+                                   'CD_DANE_CIUDAD_DESTINO': {'tipo': 'texto'},
+                                   'PAIS_ORIGEN': {'tipo': 'texto'},
+                                   'CATEGORIA': {'tipo': 'texto'},
+                                   'CLASIFICACION_CATEGORIA': {'tipo': 'texto'},
+                                   'FACTURACION_COP': {'tipo': 'decimal', 'escala': 2},
+                                   'FACTURACION_USD': {'tipo': 'decimal', 'escala': 2},
+                                   'TURISTAS': {'tipo': 'entero'},
+                                   'TRANSACCIONES': {'tipo': 'entero'},
+                                   'TICKET_PROMEDIO_TURISTA': {'tipo': 'decimal', 'escala': 2},
+                                   'TICKET_PROMEDIO_TRANSACCION': {'tipo': 'decimal', 'escala': 2}}}
+COLUMNAS_CREDIBANCO = list(ESQUEMA_CREDIBANCO['columnas'])
+
+# Carpeta de registros con errores y valores válidos
+PATH_ERRORES_CREDIBANCO = './data/CREDIBANCO/Errores/'
+ANIOS_VALIDOS_CREDIBANCO = ['2022', '2023', '2024', '2025']
+MESES_VALIDOS_CREDIBANCO = [str(i) for i in range(1, 13)]
+DEPARTAMENTOS_VALIDOS_CREDIBANCO = [
+    'AMAZONAS', 'ANTIOQUIA', 'ARCHIPIELAGO DE SAN ANDRES, PROVIDENCIA Y',
+    'ATLANTICO', 'BOGOTA, D. C.', 'BOLIVAR', 'BOYACA', 'CALDAS', 'CAQUETA',
+    'CASANARE', 'CAUCA', 'CESAR', 'CHOCO', 'CORDOBA', 'CUNDINAMARCA',
+    'GUAVIARE', 'HUILA', 'LA GUAJIRA', 'MAGDALENA', 'META', 'NARINO',
+    'NORTE DE SANTANDER', 'PUTUMAYO', 'QUINDIO', 'RISARALDA',
+    'SANTANDER', 'SUCRE', 'TOLIMA', 'VALLE DEL CAUCA', 'GUAINIA',
+    'VICHADA', 'ARAUCA', 'nan', 'VAUPES'
+]
+CLASIFICACIONES_VALIDAS_CREDIBANCO = ['INDIRECTO', 'DIRECTO', 'OTROS']
+
+# Reglas de validación de Credibanco (sobre los datos después de los ajustes de limpieza)
+REGLAS_CREDIBANCO = {'requeridas': ['ANIO', 'MES', 'CIUDAD_DESTINO', 'CD_DANE_CIUDAD_DESTINO', 'CLASIFICACION_CATEGORIA'],
+                     'valores': {'ANIO': ANIOS_VALIDOS_CREDIBANCO,
+                                 'MES': MESES_VALIDOS_CREDIBANCO,
+                                 'DEPARTAMENTO_DESTINO': DEPARTAMENTOS_VALIDOS_CREDIBANCO + ['NO INFORMADO'],
+                                 'CLASIFICACION_CATEGORIA': CLASIFICACIONES_VALIDAS_CREDIBANCO},
+                     'patrones': {'CD_DANE_CIUDAD_DESTINO': r'\d{5,6}'},
+                     'rangos': {columna: (0, None) for columna in ['FACTURACION_COP', 'FACTURACION_USD', 'TURISTAS', 'TRANSACCIONES']},
+                     'llaves_unicas': ['ANIO', 'MES', 'DEPARTAMENTO_DESTINO', 'CIUDAD_DESTINO', 'CD_DANE_CIUDAD_DESTINO', 'PAIS_ORIGEN', 'CATEGORIA', 'CLASIFICACION_CATEGORIA'],
+                     'referencias': {'PAIS_ORIGEN': 'CORRELATIVAS.PAISES_CREDIBANCO.NOMBRE_CREDIBANCO'},
+                     'variacion_registros': 0.5,
+                     'advertencias': ['rangos', 'llaves_unicas', 'referencias', 'variacion_registros']}
+
+def transformar_archivo_credibanco(ruta_archivo):
+    """
+    Lee un archivo mensual de Credibanco con su esquema declarado y aplica los ajustes de limpieza. Las validaciones
+    de valores se declaran en REGLAS_CREDIBANCO y se evalúan al cargar (ejecutar_ingesta con reglas).
+
+    Ajustes:
+    - Departamento de Itagüí sin informar -> ANTIOQUIA; departamento y país 'nan' -> 'NO INFORMADO'.
+    - CD_DANE_CIUDAD_DESTINO numérico completado con ceros a la izquierda hasta 5 dígitos.
+
+    Parámetros:
+    - ruta_archivo (str): Ruta del archivo CSV.
+
+    Retorna:
+    - pandas.DataFrame: Datos listos para validar y cargar.
+    """
+    # Importar datos con los tipos del esquema declarado (valida columnas y reporta valores mal formados)
+    df = leer_csv_tipado(ruta_archivo, ESQUEMA_CREDIBANCO)
+
+    # Ajuste para la ciudad ITAGÜI y departamentos sin informar
+    mask_itagui = (df['CIUDAD_DESTINO'] == 'ITAGÜI') & (df['CD_DANE_CIUDAD_DESTINO'] == '5360') & (df['DEPARTAMENTO_DESTINO'] == 'nan')
+    df.loc[mask_itagui, 'DEPARTAMENTO_DESTINO'] = 'ANTIOQUIA'
+    df.loc[df['DEPARTAMENTO_DESTINO'] == 'nan', 'DEPARTAMENTO_DESTINO'] = 'NO INFORMADO'
+
+    # Código DANE de la ciudad de destino (los valores no numéricos se conservan para que los reporte la validación)
+    mask_rellenar_ceros = df['CD_DANE_CIUDAD_DESTINO'].str.isdigit() & (df['CD_DANE_CIUDAD_DESTINO'].str.len() < 5)
+    df.loc[mask_rellenar_ceros, 'CD_DANE_CIUDAD_DESTINO'] = df.loc[mask_rellenar_ceros, 'CD_DANE_CIUDAD_DESTINO'].str.zfill(5)
+
+    # País de origen sin informar
+    df.loc[df['PAIS_ORIGEN'] == 'nan', 'PAIS_ORIGEN'] = 'NO INFORMADO'
+
+    return df
+
+#############
+# ForwardKeys
+#############
+
+# Esquemas declarados de las extracciones de ForwardKeys (CSV separados por '|'). Las fechas se validan con su
+# formato y se cargan como DATE.
+FORMATO_FECHA_FORWARD_KEYS = '%Y-%m-%d'
+ESQUEMA_FORWARD_KEYS_RESERVAS = {'sep': '|',
+                                 'decimal': '.',
+                                 'columnas': {'FLIGHT_TICKET_ISSUE_DATE': {'tipo': 'fecha', 'formato': FORMATO_FECHA_FORWARD_KEYS},
+                                              'FLIGHT_LEG_LEAD_TIME': {'tipo': 'float'},
+                                              'TRIP_ORIGIN_CITY': {'tipo': 'texto'},
+                                              'TRIP_ORIGIN_COUNTRY': {'tipo': 'texto'},
+                                              'FLIGHT_LEG_ORIGIN_AIRPORT': {'tipo': 'texto'},
+                                              'FLIGHT_LEG_ORIGIN_CITY': {'tipo': 'texto'},
+                                              'FLIGHT_LEG_ORIGIN_COUNTRY': {'tipo': 'texto'},
+                                              'FLIGHT_LEG_DESTINATION_AIRPORT': {'tipo': 'texto'},
+                                              'FLIGHT_LEG_DESTINATION_CITY': {'tipo': 'texto'},
+                                              'FLIGHT_LEG_DESTINATION_COUNTRY': {'tipo': 'texto'},
+                                              'FLIGHT_LEG_DEPARTURE_DATE': {'tipo': 'fecha', 'formato': FORMATO_FECHA_FORWARD_KEYS},
+                                              'FLIGHT_LEG_ARRIVAL_DATE': {'tipo': 'fecha', 'formato': FORMATO_FECHA_FORWARD_KEYS},
+                                              'EXTRACTION_DATE': {'tipo': 'texto'},
+                                              'LOS_AT_DESTINATION_CAT': {'tipo': 'texto'},
+                                              'LOS_AT_DESTINATION_NIGHTS': {'tipo': 'float'},
+                                              'TRIP_CABIN_CLASS': {'tipo': 'texto'},
+                                              'TRIP_INTERNATIONAL': {'tipo': 'texto'},
+                                              'TRIP_ORIGIN_AIRPORT': {'tipo': 'texto'},
+                                              'TRUE_ORIGIN_AIRPORT': {'tipo': 'texto'},
+                                              'TRUE_ORIGIN_CITY': {'tipo': 'texto'},
+                                              'PAX_PROFILE': {'tipo': 'texto'},
+                                              'PAX': {'tipo': 'entero'}}}
+ESQUEMA_FORWARD_KEYS_BUSQUEDAS = {'sep': '|',
+                                  'decimal': '.',
+                                  'columnas': {'SEARCH_DATE': {'tipo': 'fecha', 'formato': FORMATO_FECHA_FORWARD_KEYS, 'nulos': False},
+                                               'SEARCH_INTERNATIONAL': {'tipo': 'texto'},
+                                               'SEARCH_ORIGIN_CITY': {'tipo': 'texto'},
+                                               'SEARCH_ORIGIN_COUNTRY': {'tipo': 'texto'},
+                                               'SEARCH_DESTINATION_CITY': {'tipo': 'texto'},
+                                               'SEARCH_DESTINATION_COUNTRY': {'tipo': 'texto'},
+                                               'SEGMENT_TYPE': {'tipo': 'texto'},
+                                               'TRIP_TYPE': {'tipo': 'texto'},
+                                               'SEARCH_DEPARTURE_DATE': {'tipo': 'fecha', 'formato': FORMATO_FECHA_FORWARD_KEYS},
+                                               'LOS_AT_DESTINATION_CAT': {'tipo': 'texto'},
+                                               'SEARCH_PAX': {'tipo': 'entero'},
+                                               'YEAR': {'tipo': 'texto', 'nulos': False},
+                                               'MONTH': {'tipo': 'texto', 'nulos': False}}}
+
+# Reglas de validación de las extracciones de ForwardKeys (los tipos y nulos ya los controla el esquema declarado)
+REGLAS_FORWARD_KEYS_RESERVAS = {'rangos': {'PAX': (0, None), 'LOS_AT_DESTINATION_NIGHTS': (0, None)},
+                                'referencias': {'TRIP_ORIGIN_COUNTRY': 'CORRELATIVAS.PAISES_FORWARDKEYS.COUNTRYCODE'},
+                                'variacion_registros': 0.5,
+                                'advertencias': ['referencias', 'variacion_registros']}
+REGLAS_FORWARD_KEYS_BUSQUEDAS = {'rangos': {'SEARCH_PAX': (0, None), 'MONTH': (1, 12)},
+                                 'patrones': {'YEAR': r'\d{4}'},
+                                 'referencias': {'SEARCH_ORIGIN_COUNTRY': 'CORRELATIVAS.PAISES_FORWARDKEYS.COUNTRYCODE'},
+                                 'variacion_registros': 0.5,
+                                 'advertencias': ['referencias', 'variacion_registros']}
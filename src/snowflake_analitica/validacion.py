@@ -0,0 +1,308 @@
+# Librerías
+import os
+import json
+import numpy as np
+import pandas as pd
+
+############################################
+# Validación declarativa de datos de fuentes
+############################################
+
+# Las reglas de una fuente se declaran en un diccionario (ver REGLAS_* en transformaciones):
+# {'requeridas': ['COLUMNA', ...],                             -> sin nulos, 'nan' ni vacíos
+#  'valores': {'COLUMNA': [valores válidos]},                  -> enumeraciones
+#  'rangos': {'COLUMNA': (mínimo, máximo)},                    -> None deja el límite abierto
+#  'patrones': {'COLUMNA': expresión regular},                 -> el valor completo debe cumplir el patrón
+#  'llaves_unicas': ['COLUMNA', ...],                          -> combinación sin duplicados
+#  'referencias': {'COLUMNA': 'CORRELATIVAS.TABLA.COLUMNA'},   -> el valor debe existir en la tabla correlativa
+#  'variacion_registros': 0.5,                                 -> variación relativa máxima frente al cargue anterior
+#  'advertencias': ['referencias', ...]}                       -> tipos de regla que se reportan sin bloquear el cargue
+# Los valores, patrones y referencias solo se evalúan sobre los valores no nulos; los nulos los controla 'requeridas'.
+
+# Valores de texto que se consideran nulos (lectura con dtype=str seguida de astype(str), o lectura tipada)
+VALORES_VACIOS = {'nan', 'None', ''}
+
+# Ejemplos de valores que incumplen una regla que se incluyen en el reporte
+EJEMPLOS_POR_REGLA = 5
+
+# Tipos de regla en el orden en que se reportan
+TIPOS_REGLA = ['requeridas', 'valores', 'rangos', 'patrones', 'llaves_unicas', 'referencias', 'variacion_registros']
+
+def _severidad(reglas, tipo):
+    """
+    Retorna 'advertencia' si el tipo de regla no bloquea el cargue, o 'error' en caso contrario.
+    """
+    return 'advertencia' if tipo in reglas.get('advertencias', []) else 'error'
+
+def _columnas_reglas(reglas):
+    """
+    Retorna las columnas que usan las reglas de valor (una sola vez cada una).
+    """
+    columnas = list(reglas.get('requeridas', []))
+    for tipo in ['valores', 'patrones', 'referencias']:
+        columnas += list(reglas.get(tipo, {}))
+    return list(dict.fromkeys(columnas))
+
+def _factorizar(serie):
+    """
+    Codifica una columna en (códigos, valores únicos). Las reglas de texto se evalúan sobre los valores únicos y el
+    resultado se expande a las filas con los códigos, por lo que el costo por regla depende del número de valores
+    distintos y no del número de filas. Los nulos quedan con el código -1.
+    """
+    codigos, unicos = pd.factorize(serie, use_na_sentinel=True)
+    return codigos, pd.Series(unicos, dtype=object).astype(str)
+
+def _expandir(codigos, incumple_unicos, incumple_nulo):
+    """
+    Expande el resultado de una regla sobre los valores únicos a las filas. El último elemento corresponde al código -1.
+    """
+    return np.append(np.asarray(incumple_unicos, dtype=bool), incumple_nulo)[codigos]
+
+def cargar_referencias(sesion_activa, reglas):
+    """
+    Consulta una sola vez los valores válidos de cada referencia de las reglas (tablas de CORRELATIVAS).
+    Una referencia que no se puede consultar se omite del reporte con una advertencia.
+
+    Parámetros:
+    - sesion_activa (snowflake.snowpark.Session): Sesión activa de Snowflake.
+    - reglas (dict): Reglas de la fuente.
+
+    Retorna:
+    - dict: {'ESQUEMA.TABLA.COLUMNA': set de valores}.
+    """
+    referencias = {}
+    for referencia in set(reglas.get('referencias', {}).values()):
+        esquema, tabla, columna = referencia.split('.')
+        try:
+            filas = sesion_activa.sql(f"SELECT DISTINCT {columna} FROM REPOSITORIO_TURISMO.{esquema}.{tabla};").collect()
+            referencias[referencia] = {str(fila[0]) for fila in filas if fila[0] is not None}
+        except Exception as e:
+            print(f"Advertencia: No se pudo consultar la referencia {referencia}. Detalles: {e}")
+    return referencias
+
+def consultar_registros_anteriores(sesion_activa, esquema, nombre_tabla):
+    """
+    Retorna el número de registros del último cargue auditado de una tabla, o None si no tiene cargues.
+    """
+    try:
+        filas = sesion_activa.sql(f"""SELECT A.NUMERO_REGISTROS
+                                      FROM REPOSITORIO_TURISMO.AUDITORIA.AUDITORIA_CARGUES AS A
+                                      WHERE A.NOMBRE_ESQUEMA_DESTINO = '{esquema}' AND A.NOMBRE_TABLA = '{nombre_tabla}'
+                                      ORDER BY A.FECHA_CARGUE DESC, A.ID_AUDITORIA DESC
+                                      LIMIT 1;""").collect()
+        return int(filas[0][0]) if filas and filas[0][0] is not None else None
+    except Exception as e:
+        print(f"Advertencia: No se pudo consultar el cargue anterior de {esquema}.{nombre_tabla}. Detalles: {e}")
+        return None
+
+def evaluar_variacion_registros(reglas, registros, registros_anteriores):
+    """
+    Evalúa la regla de variación de registros frente al cargue anterior de la tabla.
+
+    Retorna:
+    - dict: Hallazgo de la regla, o None si no aplica o se cumple.
+    """
+    maxima = reglas.get('variacion_registros')
+    if maxima is None or not registros_anteriores:
+        return None
+    variacion = abs(registros - registros_anteriores) / registros_anteriores
+    if variacion <= maxima:
+        return None
+    return {'regla': 'variacion_registros', 'columna': None, 'severidad': _severidad(reglas, 'variacion_registros'),
+            'errores': 1, 'ejemplos': [f"{registros} registros frente a {registros_anteriores} del cargue anterior (variación {variacion:.1%}, máximo {maxima:.0%})"]}
+
+def evaluar_reglas(df, reglas, referencias=None, registros_anteriores=None):
+    """
+    Evalúa todas las reglas de una fuente sobre un DataFrame en una sola pasada vectorizada: cada columna se codifica
+    una vez y sus reglas de texto se evalúan sobre los valores distintos; los rangos y las llaves únicas se evalúan con
+    operaciones de columna. Las reglas sobre columnas que no están en el DataFrame se omiten.
+
+    Parámetros:
+    - df (pandas.DataFrame): Datos a validar.
+    - reglas (dict): Reglas de la fuente.
+    - referencias (dict, opcional): Valores válidos de cada referencia (cargar_referencias). Las referencias sin
+      valores se reportan como omitidas.
+    - registros_anteriores (int, opcional): Registros del cargue anterior de la tabla (variación de registros).
+
+    Retorna:
+    - tuple: (reporte, mask_invalidos). El reporte es un diccionario con 'registros', 'registros_invalidos', 'valido',
+      'reglas_evaluadas', 'reglas_omitidas' y 'hallazgos' (regla, columna, severidad, errores y ejemplos de cada regla
+      incumplida). mask_invalidos marca las filas que incumplen alguna regla de severidad 'error'.
+    """
+    referencias = referencias or {}
+    mask_invalidos = np.zeros(len(df), dtype=bool)
+    hallazgos, omitidas, evaluadas = [], [], 0
+
+    def registrar(tipo, columna, mask, valores):
+        nonlocal mask_invalidos
+        errores = int(mask.sum())
+        if not errores:
+            return
+        severidad = _severidad(reglas, tipo)
+        if severidad == 'error':
+            mask_invalidos = mask_invalidos | mask
+        ejemplos = pd.unique(valores[mask])[:EJEMPLOS_POR_REGLA]
+        hallazgos.append({'regla': tipo, 'columna': columna, 'severidad': severidad, 'errores': errores,
+                          'ejemplos': [str(ejemplo) for ejemplo in ejemplos]})
+
+    # 1. Reglas de valor: una codificación por columna para todas sus reglas
+    for columna in _columnas_reglas(reglas):
+        if columna not in df.columns:
+            omitidas.append(f"{columna}: columna ausente")
+            continue
+        valores = df[columna].to_numpy()
+        codigos, unicos = _factorizar(df[columna])
+        vacios_unicos = unicos.str.strip().isin(VALORES_VACIOS).to_numpy()
+
+        if columna in reglas.get('requeridas', []):
+            evaluadas += 1
+            registrar('requeridas', columna, _expandir(codigos, vacios_unicos, True), valores)
+
+        if columna in reglas.get('valores', {}):
+            evaluadas += 1
+            validos = {str(valor) for valor in reglas['valores'][columna]}
+            incumple = ~unicos.isin(validos).to_numpy() & ~vacios_unicos
+            registrar('valores', columna, _expandir(codigos, incumple, False), valores)
+
+        if columna in reglas.get('patrones', {}):
+            evaluadas += 1
+            incumple = ~unicos.str.fullmatch(reglas['patrones'][columna]).to_numpy(dtype=bool) & ~vacios_unicos
+            registrar('patrones', columna, _expandir(codigos, incumple, False), valores)
+
+        if columna in reglas.get('referencias', {}):
+            referencia = reglas['referencias'][columna]
+            if referencia not in referencias:
+                omitidas.append(f"{columna}: referencia {referencia} no disponible")
+            else:
+                evaluadas += 1
+                incumple = ~unicos.isin(referencias[referencia]).to_numpy() & ~vacios_unicos
+                registrar('referencias', columna, _expandir(codigos, incumple, False), valores)
+
+    # 2. Rangos numéricos
+    for columna, (minimo, maximo) in reglas.get('rangos', {}).items():
+        if columna not in df.columns:
+            omitidas.append(f"{columna}: columna ausente")
+            continue
+        evaluadas += 1
+        serie = df[columna] if pd.api.types.is_numeric_dtype(df[columna]) else pd.to_numeric(df[columna], errors='coerce')
+        mask = np.zeros(len(df), dtype=bool)
+        if minimo is not None:
+            mask |= (serie < minimo).to_numpy(dtype=bool, na_value=False)
+        if maximo is not None:
+            mask |= (serie > maximo).to_numpy(dtype=bool, na_value=False)
+        registrar('rangos', columna, mask, df[columna].to_numpy())
+
+    # 3. Llaves únicas
+    llaves = reglas.get('llaves_unicas', [])
+    if llaves:
+        if set(llaves) - set(df.columns):
+            omitidas.append(f"{llaves}: columnas ausentes")
+        else:
+            evaluadas += 1
+            mask = df.duplicated(subset=llaves, keep=False).to_numpy()
+            valores = df[llaves].astype(str).agg(' | '.join, axis=1).to_numpy() if mask.any() else np.array([])
+            registrar('llaves_unicas', ', '.join(llaves), mask, valores)
+
+    # 4. Variación de registros frente al cargue anterior
+    if reglas.get('variacion_registros') is not None:
+        evaluadas += 1
+        hallazgo = evaluar_variacion_registros(reglas, len(df), registros_anteriores)
+        if hallazgo:
+            hallazgos.append(hallazgo)
+
+    hallazgos.sort(key=lambda hallazgo: TIPOS_REGLA.index(hallazgo['regla']))
+    valido = not any(hallazgo['severidad'] == 'error' for hallazgo in hallazgos)
+    reporte = {'registros': len(df), 'registros_invalidos': int(mask_invalidos.sum()), 'valido': valido,
+               'reglas_evaluadas': evaluadas, 'reglas_omitidas': omitidas, 'hallazgos': hallazgos}
+    return reporte, mask_invalidos
+
+def combinar_reportes(reportes):
+    """
+    Combina los reportes de varios lotes de un mismo archivo en un solo reporte.
+    """
+    reportes = [reporte for reporte in reportes if reporte]
+    if not reportes:
+        return None
+
+    hallazgos = {}
+    for reporte in reportes:
+        for hallazgo in reporte['hallazgos']:
+            llave = (hallazgo['regla'], hallazgo['columna'])
+            if llave not in hallazgos:
+                hallazgos[llave] = dict(hallazgo, ejemplos=list(hallazgo['ejemplos']))
+                continue
+            acumulado = hallazgos[llave]
+            acumulado['errores'] += hallazgo['errores']
+            acumulado['ejemplos'] = (acumulado['ejemplos'] + [e for e in hallazgo['ejemplos'] if e not in acumulado['ejemplos']])[:EJEMPLOS_POR_REGLA]
+
+    return {'registros': sum(reporte['registros'] for reporte in reportes),
+            'registros_invalidos': sum(reporte['registros_invalidos'] for reporte in reportes),
+            'valido': all(reporte['valido'] for reporte in reportes),
+            'reglas_evaluadas': max(reporte['reglas_evaluadas'] for reporte in reportes),
+            'reglas_omitidas': list(dict.fromkeys(o for reporte in reportes for o in reporte['reglas_omitidas'])),
+            'hallazgos': sorted(hallazgos.values(), key=lambda hallazgo: TIPOS_REGLA.index(hallazgo['regla']))}
+
+def resumen_reporte(reporte):
+    """
+    Retorna un resumen en texto de los hallazgos de un reporte (para mensajes y errores).
+    """
+    if not reporte['hallazgos']:
+        return f"{reporte['reglas_evaluadas']} reglas cumplidas."
+    return '; '.join(f"{hallazgo['severidad']} {hallazgo['regla']}"
+                     f"{' en ' + hallazgo['columna'] if hallazgo['columna'] else ''}: {hallazgo['errores']} (ej. {hallazgo['ejemplos']})"
+                     for hallazgo in reporte['hallazgos'])
+
+def mensaje_validacion(reporte):
+    """
+    Mensaje corto de un reporte para el mensaje del cargue (el detalle se guarda en REPORTE_VALIDACION).
+    """
+    advertencias = sum(1 for hallazgo in reporte['hallazgos'] if hallazgo['severidad'] == 'advertencia')
+    return f"Validación: {reporte['reglas_evaluadas']} reglas evaluadas, {advertencias} advertencias."
+
+def reporte_json(reporte):
+    """
+    Serializa un reporte de validación para guardarlo con el registro de auditoría.
+    """
+    return json.dumps(reporte, ensure_ascii=False, default=str)
+
+def exportar_errores(df_errores, path_errores, prefijo, ruta_archivo):
+    """
+    Exporta los registros con errores de un archivo a un CSV en la carpeta de errores.
+
+    Retorna:
+    - str: Ruta del archivo de errores.
+    """
+    os.makedirs(path_errores, exist_ok=True)
+    nombre_base = os.path.splitext(os.path.basename(ruta_archivo))[0]
+    archivo_errores = os.path.join(path_errores, f'errores_{prefijo}_{nombre_base}.csv')
+    df_errores.to_csv(archivo_errores, index=False, encoding='utf-8')
+    print(f"Errores exportados correctamente a: {archivo_errores}")
+    return archivo_errores
+
+def validar_datos(df, reglas, ruta_archivo, referencias=None, registros_anteriores=None, path_errores=None):
+    """
+    Valida un DataFrame con las reglas de su fuente (evaluar_reglas). Si alguna regla de severidad 'error' se incumple,
+    exporta las filas inválidas a la carpeta de errores (si se indica) y lanza un error con el resumen del reporte.
+
+    Parámetros:
+    - df (pandas.DataFrame): Datos a validar.
+    - reglas (dict): Reglas de la fuente.
+    - ruta_archivo (str): Ruta del archivo, para los mensajes y el nombre del archivo de errores.
+    - referencias (dict, opcional): Valores válidos de cada referencia (cargar_referencias).
+    - registros_anteriores (int, opcional): Registros del cargue anterior de la tabla.
+    - path_errores (str, opcional): Carpeta donde se exportan los registros inválidos.
+
+    Retorna:
+    - dict: Reporte de validación.
+
+    Excepciones:
+    - ValueError: Si el archivo incumple alguna regla de severidad 'error'.
+    """
+    reporte, mask_invalidos = evaluar_reglas(df, reglas, referencias, registros_anteriores)
+    if reporte['valido']:
+        return reporte
+
+    if path_errores and mask_invalidos.any():
+        exportar_errores(df[mask_invalidos], path_errores, 'validacion', ruta_archivo)
+
+    raise ValueError(f"El archivo {os.path.basename(ruta_archivo)} no cumple las reglas de validación: {resumen_reporte(reporte)}")
@@ -84,6 +84,12 @@ def navbar():
                                 <span style="padding-left: 1px; font-size: 14px;">CITI</span>
                             </a>
                         </li>
+                        <li class="nav-item" id="nav-item-comparar-paises">
+                            <a class="nav-link text-white" href="?page=4" target="_self">
+                                <img src="data:image/svg+xml;base64,{location}" width="20" height="20">
+                                <span style="padding-left: 1px; font-size: 14px;">Comparar países</span>
+                            </a>
+                        </li>
                         <li class="nav-item" id="nav-item-Fuentes">
                             <a class="nav-link text-white" href="?page=3" target="_self">
                                 <img src="data:image/svg+xml;base64,{sources}" width="20" height="20">
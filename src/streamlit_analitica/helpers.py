@@ -1,6 +1,7 @@
 # Librerías
 import base64
 import streamlit as st
+from src.formato_analitica import formato_numero
 
 @st.cache_data(show_spinner=False)
 def get_image(image_path):
@@ -136,11 +137,6 @@ def load_css(file_name):
     
 # Para formato separador de miles intercambiando punto y coma
 def formato_miles(valor, decimales=0):
-    # f"{x:,.{decimales}f}" crea el separador con coma,
-    # luego intercambiamos '.' por ',' y la coma original por '.'
-    return (
-        f"{valor:,.{decimales}f}"
-        .replace(',', 'X')   # Primer swap: ',' -> 'X'
-        .replace('.', ',')  # Segundo swap: '.' -> ','
-        .replace('X', '.')  # Tercer swap: 'X' -> '.'
-    )
+    # Se delega en el módulo de formato (sin locale): punto para miles y coma para decimales.
+    # Para nulos se conserva el comportamiento anterior de retornar siempre una cadena.
+    return formato_numero(valor, decimales=decimales) or str(valor)
@@ -0,0 +1,396 @@
+# Librerías
+import os
+import sys
+import time
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+#######################################
+# Configuración de presupuestos de RAM
+#######################################
+
+# Presupuesto por sesión y por proceso en MB (configurables por variables de entorno)
+PRESUPUESTO_SESION_MB = float(os.getenv('CITI_PRESUPUESTO_SESION_MB', 256))
+PRESUPUESTO_PROCESO_MB = float(os.getenv('CITI_PRESUPUESTO_PROCESO_MB', 2048))
+
+# Minutos sin accesos tras los cuales la contabilidad de una sesión se descarta (sesión cerrada o abandonada)
+SESION_INACTIVA_MIN = float(os.getenv('CITI_SESION_INACTIVA_MIN', 60))
+
+# Llaves de session_state que se pueden recalcular y, por lo tanto, desalojar.
+# Cada llave se asocia con las llaves acompañantes que deben eliminarse junto con ella.
+# 'datos_cargados' se contabiliza pero nunca se desaloja: todas las páginas la leen en cada rerun y,
+# al ser la llave más antigua de la sesión, sería la primera en salir y los datos se recargarían en cada rerun.
+LLAVES_RECALCULABLES = {
+    'datos_comparacion': (),
+    'graficos_global_data': (),
+    'graficos_oag_mundo': (),
+    'graficos_fk_mundo': (),
+    'graficos_oag_colombia': (),
+    'graficos_credibanco': (),
+    'graficos_fk_colombia': (),
+    'graficos_iata_colombia': (),
+    'b64_docx': ('file_name_docx',),
+    'b64_xlsx': ('file_name_xlsx',),
+}
+
+# Registro global del proceso por id de sesión del runtime de Streamlit (estable entre reruns):
+# {id_sesion: {'llaves': OrderedDict(llave -> (bytes, ultimo_acceso)), 'pendientes': set(llaves), 'ultimo_acceso': t}}
+# 'pendientes' son las llaves que el presupuesto del proceso desalojó desde otra sesión: cada sesión solo modifica su
+# propio session_state, por lo que la sesión dueña las elimina en su siguiente acceso (registrar_uso).
+_REGISTRO_SESIONES = {}
+_CANDADO_REGISTRO = threading.Lock()
+
+##################################
+# Estimación de tamaño de objetos
+##################################
+
+def estimar_tamano(objeto, _vistos=None):
+    """
+    Estima de forma recursiva el tamaño en memoria (bytes) de un objeto almacenado en session_state.
+
+    Parámetros
+    ----------
+    objeto : any
+        Objeto a medir. Se manejan de forma especial DataFrames, Series, arreglos de numpy,
+        figuras de Plotly y contenedores (dict, list, tuple, set).
+    _vistos : set, opcional
+        Identificadores de objetos ya contabilizados para no contar dos veces referencias compartidas.
+
+    Retorna
+    -------
+    int
+        Tamaño estimado en bytes.
+    """
+
+    if _vistos is None:
+        _vistos = set()
+
+    # Evitar contar dos veces el mismo objeto
+    if id(objeto) in _vistos:
+        return 0
+    _vistos.add(id(objeto))
+
+    # Estructuras de pandas y numpy reportan su propio uso de memoria
+    if isinstance(objeto, pd.DataFrame):
+        return int(objeto.memory_usage(deep=True, index=True).sum())
+    if isinstance(objeto, (pd.Series, pd.Index)):
+        return int(objeto.memory_usage(deep=True))
+    if isinstance(objeto, np.ndarray):
+        return int(objeto.nbytes)
+
+    # Figuras de Plotly: se mide su representación como diccionario (sin serializar a JSON)
+    if hasattr(objeto, 'to_plotly_json') and hasattr(objeto, 'data') and hasattr(objeto, 'layout'):
+        return sys.getsizeof(objeto) + estimar_tamano(objeto.to_plotly_json(), _vistos)
+
+    # Contenedores
+    if isinstance(objeto, dict):
+        return sys.getsizeof(objeto) + sum(estimar_tamano(k, _vistos) + estimar_tamano(v, _vistos) for k, v in objeto.items())
+    if isinstance(objeto, (list, tuple, set, frozenset)):
+        return sys.getsizeof(objeto) + sum(estimar_tamano(elemento, _vistos) for elemento in objeto)
+
+    # Objetos simples (str, bytes, números, etc.)
+    return sys.getsizeof(objeto)
+
+def formato_bytes(num_bytes):
+    """
+    Convierte un número de bytes en una cadena legible (B, KB, MB, GB).
+
+    Parámetros
+    ----------
+    num_bytes : int o float
+        Cantidad de bytes.
+
+    Retorna
+    -------
+    str
+        Cadena con la unidad más adecuada, por ejemplo '12.4 MB'.
+    """
+
+    for unidad in ['B', 'KB', 'MB', 'GB']:
+        if abs(num_bytes) < 1024 or unidad == 'GB':
+            return f"{num_bytes:.1f} {unidad}"
+        num_bytes /= 1024
+
+#############################
+# Contabilidad por sesión
+#############################
+
+def _id_sesion_actual():
+    """
+    Retorna el identificador de la sesión de Streamlit en ejecución,
+    o None si la función se llama por fuera de un script de Streamlit.
+    """
+
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+def _nuevo_registro():
+    """
+    Retorna el registro vacío de una sesión.
+    """
+
+    return {'llaves': OrderedDict(), 'pendientes': set(), 'ultimo_acceso': time.monotonic()}
+
+def _eliminar_de_sesion(llaves):
+    """
+    Elimina llaves recalculables (y sus llaves acompañantes) del session_state de la sesión actual.
+    """
+
+    for llave in llaves:
+        for llave_a_borrar in (llave,) + LLAVES_RECALCULABLES.get(llave, ()):
+            try:
+                if llave_a_borrar in st.session_state:
+                    del st.session_state[llave_a_borrar]
+            except Exception as e:
+                print(f"No fue posible desalojar la llave '{llave_a_borrar}': {e}")
+
+def _aplicar_desalojos_pendientes(id_sesion):
+    """
+    Elimina del session_state de la sesión actual las llaves que el presupuesto del proceso marcó para desalojo.
+    """
+
+    with _CANDADO_REGISTRO:
+        registro = _REGISTRO_SESIONES.get(id_sesion)
+        if registro is None or not registro['pendientes']:
+            return
+        pendientes, registro['pendientes'] = registro['pendientes'], set()
+    _eliminar_de_sesion(pendientes)
+
+def registrar_uso(llave, actualizar_tamano=True):
+    """
+    Registra el acceso a una llave de session_state en la contabilidad de memoria de la sesión actual.
+    La llave se mueve al final del orden LRU y, si se solicita, se vuelve a estimar su tamaño.
+
+    Parámetros
+    ----------
+    llave : str
+        Llave de st.session_state que se acaba de escribir o leer.
+    actualizar_tamano : bool, opcional
+        Si es True (por defecto), se recalcula el tamaño del valor. Usar False en lecturas para
+        solo actualizar el orden LRU.
+    """
+
+    id_sesion = _id_sesion_actual()
+    if id_sesion is None:
+        return
+
+    # Llaves desalojadas por el presupuesto del proceso desde otra sesión (incluida, quizás, la llave actual:
+    # quien la acaba de leer conserva su valor en este rerun y la reconstruye en el siguiente)
+    _aplicar_desalojos_pendientes(id_sesion)
+    valor = st.session_state.get(llave)
+    if valor is None:
+        return
+
+    with _CANDADO_REGISTRO:
+        registro = _REGISTRO_SESIONES.setdefault(id_sesion, _nuevo_registro())
+        tamano_previo = registro['llaves'].get(llave, (0, 0))[0]
+
+    # La estimación se hace por fuera del candado para no bloquear otras sesiones
+    tamano = estimar_tamano(valor) if (actualizar_tamano or tamano_previo == 0) else tamano_previo
+
+    with _CANDADO_REGISTRO:
+        registro['llaves'][llave] = (tamano, time.monotonic())
+        registro['llaves'].move_to_end(llave)
+        registro['ultimo_acceso'] = time.monotonic()
+
+def _desalojar(id_sesion, llave):
+    """
+    Retira una llave recalculable de la contabilidad y la marca como pendiente de desalojo en el registro de su
+    sesión. Debe llamarse con el candado del registro adquirido. La sesión dueña la elimina de su session_state en su
+    siguiente acceso; las funciones de utils leen sus llaves con .get() y las reconstruyen si desaparecen.
+    """
+
+    registro = _REGISTRO_SESIONES.get(id_sesion)
+    if registro is None:
+        return 0
+
+    tamano, _ = registro['llaves'].pop(llave, (0, 0))
+    registro['pendientes'].add(llave)
+    return tamano
+
+def aplicar_presupuesto(proteger=None):
+    """
+    Aplica los presupuestos de memoria configurados:
+    1. Si la sesión actual supera PRESUPUESTO_SESION_MB, desaloja sus llaves recalculables en orden LRU.
+    2. Si el total del proceso supera PRESUPUESTO_PROCESO_MB, desaloja llaves recalculables de todas las
+       sesiones en orden LRU global (la llave con el acceso más antiguo primero). Las llaves de otras sesiones solo se
+       marcan: cada sesión las elimina de su session_state en su siguiente acceso.
+
+    Solo se desalojan llaves de LLAVES_RECALCULABLES ('datos_cargados' no se desaloja); las funciones
+    obtener_graficos_*, obtener_datos_comparacion y generar_documento_* las vuelven a construir cuando no las encuentran.
+
+    Parámetros
+    ----------
+    proteger : str, opcional
+        Llave de la sesión actual que no debe desalojarse (por ejemplo, la que se acaba de escribir).
+
+    Retorna
+    -------
+    list
+        Lista de tuplas (id_sesion, llave, bytes) con las llaves desalojadas.
+    """
+
+    desalojadas = []
+    presupuesto_sesion = PRESUPUESTO_SESION_MB * 1024 ** 2
+    presupuesto_proceso = PRESUPUESTO_PROCESO_MB * 1024 ** 2
+    id_sesion = _id_sesion_actual()
+
+    with _CANDADO_REGISTRO:
+
+        # Depurar sesiones sin accesos recientes (cerradas o abandonadas)
+        limite = time.monotonic() - SESION_INACTIVA_MIN * 60
+        for id_registro in [i for i, r in _REGISTRO_SESIONES.items() if r['ultimo_acceso'] < limite and i != id_sesion]:
+            del _REGISTRO_SESIONES[id_registro]
+
+        # 1. Presupuesto por sesión
+        registro = _REGISTRO_SESIONES.get(id_sesion)
+        if registro is not None:
+            total_sesion = sum(t for t, _ in registro['llaves'].values())
+            for llave in list(registro['llaves']):
+                if total_sesion <= presupuesto_sesion:
+                    break
+                if llave in LLAVES_RECALCULABLES and llave != proteger:
+                    tamano = _desalojar(id_sesion, llave)
+                    total_sesion -= tamano
+                    desalojadas.append((id_sesion, llave, tamano))
+
+        # 2. Presupuesto por proceso (LRU global)
+        total_proceso = sum(t for r in _REGISTRO_SESIONES.values() for t, _ in r['llaves'].values())
+        if total_proceso > presupuesto_proceso:
+            candidatas = sorted(
+                ((acceso, id_registro, llave) for id_registro, r in _REGISTRO_SESIONES.items()
+                 for llave, (_, acceso) in r['llaves'].items()
+                 if llave in LLAVES_RECALCULABLES and not (id_registro == id_sesion and llave == proteger)),
+                key=lambda x: x[0]
+            )
+            for _, id_registro, llave in candidatas:
+                if total_proceso <= presupuesto_proceso:
+                    break
+                tamano = _desalojar(id_registro, llave)
+                total_proceso -= tamano
+                desalojadas.append((id_registro, llave, tamano))
+
+    # Las llaves de la sesión actual se eliminan de inmediato
+    if id_sesion is not None:
+        _aplicar_desalojos_pendientes(id_sesion)
+
+    for id_registro, llave, tamano in desalojadas:
+        print(f"Memoria: se desalojó '{llave}' ({formato_bytes(tamano)}) de la sesión {id_registro}.")
+
+    return desalojadas
+
+def guardar_en_sesion(llave, valor):
+    """
+    Guarda un valor en st.session_state, actualiza la contabilidad de memoria y aplica los presupuestos.
+
+    Parámetros
+    ----------
+    llave : str
+        Llave de st.session_state.
+    valor : any
+        Valor a almacenar.
+
+    Retorna
+    -------
+    any
+        El mismo valor almacenado, para poder usarlo directamente.
+    """
+
+    # Aplicar antes los desalojos pendientes, para no eliminar el valor que se está guardando
+    id_sesion = _id_sesion_actual()
+    if id_sesion is not None:
+        _aplicar_desalojos_pendientes(id_sesion)
+
+    st.session_state[llave] = valor
+    registrar_uso(llave)
+    aplicar_presupuesto(proteger=llave)
+    return valor
+
+def liberar_sesion(llaves=None):
+    """
+    Elimina de la contabilidad las llaves indicadas de la sesión actual (o todas si llaves es None).
+    Se usa cuando las llaves se borran explícitamente de session_state, por ejemplo al cambiar de país.
+    """
+
+    id_sesion = _id_sesion_actual()
+    with _CANDADO_REGISTRO:
+        registro = _REGISTRO_SESIONES.get(id_sesion)
+        if registro is None:
+            return
+        for llave in (list(registro['llaves']) if llaves is None else llaves):
+            registro['llaves'].pop(llave, None)
+
+##############################
+# Reportes para administración
+##############################
+
+def obtener_resumen_memoria(top_n=10):
+    """
+    Construye el resumen de memoria del proceso para administradores.
+
+    Parámetros
+    ----------
+    top_n : int, opcional
+        Número de sesiones y de llaves a mostrar (por defecto 10).
+
+    Retorna
+    -------
+    tuple (pandas.DataFrame, pandas.DataFrame, dict)
+        - DataFrame con las sesiones de mayor consumo (Sesión, Llaves, Memoria (MB)).
+        - DataFrame con las llaves de mayor consumo (Sesión, Llave, Memoria (MB), Recalculable, Segundos sin uso).
+        - Diccionario con totales y presupuestos del proceso.
+    """
+
+    ahora = time.monotonic()
+    filas_sesiones, filas_llaves = [], []
+
+    with _CANDADO_REGISTRO:
+        for id_registro, registro in _REGISTRO_SESIONES.items():
+            total = sum(t for t, _ in registro['llaves'].values())
+            filas_sesiones.append({'Sesión': id_registro, 'Llaves': len(registro['llaves']), 'Memoria (MB)': total / 1024 ** 2})
+            for llave, (tamano, acceso) in registro['llaves'].items():
+                filas_llaves.append({
+                    'Sesión': id_registro,
+                    'Llave': llave,
+                    'Memoria (MB)': tamano / 1024 ** 2,
+                    'Recalculable': llave in LLAVES_RECALCULABLES,
+                    'Segundos sin uso': round(ahora - acceso, 1)
+                })
+
+    df_sesiones = pd.DataFrame(filas_sesiones, columns=['Sesión', 'Llaves', 'Memoria (MB)'])
+    df_llaves = pd.DataFrame(filas_llaves, columns=['Sesión', 'Llave', 'Memoria (MB)', 'Recalculable', 'Segundos sin uso'])
+
+    totales = {
+        'sesiones': len(filas_sesiones),
+        'memoria_total_mb': df_sesiones['Memoria (MB)'].sum() if not df_sesiones.empty else 0.0,
+        'presupuesto_sesion_mb': PRESUPUESTO_SESION_MB,
+        'presupuesto_proceso_mb': PRESUPUESTO_PROCESO_MB
+    }
+
+    return (
+        df_sesiones.sort_values('Memoria (MB)', ascending=False).head(top_n).reset_index(drop=True),
+        df_llaves.sort_values('Memoria (MB)', ascending=False).head(top_n).reset_index(drop=True),
+        totales
+    )
+
+def panel_memoria(top_n=10):
+    """
+    Muestra en Streamlit el panel de administración con las sesiones y llaves de mayor consumo de memoria.
+    """
+
+    df_sesiones, df_llaves, totales = obtener_resumen_memoria(top_n=top_n)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric('Sesiones activas', totales['sesiones'])
+    col2.metric('Memoria en session_state', f"{totales['memoria_total_mb']:.1f} MB", help=f"Presupuesto del proceso: {totales['presupuesto_proceso_mb']:.0f} MB")
+    col3.metric('Presupuesto por sesión', f"{totales['presupuesto_sesion_mb']:.0f} MB")
+
+    st.markdown('#### Sesiones con mayor consumo')
+    st.dataframe(df_sesiones, use_container_width=True, hide_index=True)
+
+    st.markdown('#### Llaves con mayor consumo')
+    st.dataframe(df_llaves, use_container_width=True, hide_index=True)
@@ -13,6 +13,7 @@ import src.datos_citi as procesamiento_datos
 import src.plotly_analitica as plotly_analitica
 from src.word_analitica import documento_citi
 import src.streamlit_analitica.helpers as helpers
+import src.streamlit_analitica.memoria as memoria
 
 # Función para obtener los datos
 def obtener_datos(_pais_elegido):
@@ -23,8 +24,11 @@ def obtener_datos(_pais_elegido):
     4. Devuelve los DataFrames directamente desde session_state.
     """
     
+    # Leer una sola vez la llave de la sesión (.get), de modo que el valor no desaparezca entre la verificación y la lectura
+    datos = st.session_state.get('datos_cargados')
+
     # Si aún no se ha cargado nada o se cambió de país
-    if 'datos_cargados' not in st.session_state or st.session_state['datos_cargados']['pais'] != _pais_elegido:
+    if datos is None or datos['pais'] != _pais_elegido:
 
         with st.spinner("Cargando datos..."):
             # Barra de progreso y realiza la lógica pesada
@@ -36,12 +40,12 @@ def obtener_datos(_pais_elegido):
             df_global_data = procesamiento_datos.datos_global_data(_pais_elegido, st.session_state.session)
             progress_bar.progress(20)
 
-            # OAG
-            df_oag = procesamiento_datos.datos_oag(_pais_elegido, st.session_state.session)
+            # OAG (en pandas o en el warehouse según CITI_MODO_PROCESAMIENTO)
+            df_oag = procesamiento_datos.datos_oag_modo(_pais_elegido, st.session_state.session)
             progress_bar.progress(40)
 
-            # Forward Keys
-            df_fk = procesamiento_datos.datos_forward_keys(_pais_elegido, st.session_state.session)
+            # Forward Keys (en pandas o en el warehouse según CITI_MODO_PROCESAMIENTO)
+            df_fk = procesamiento_datos.datos_forward_keys_modo(_pais_elegido, st.session_state.session)
             progress_bar.progress(60)
 
             # Credibanco
@@ -52,33 +56,34 @@ def obtener_datos(_pais_elegido):
             df_iata = procesamiento_datos.datos_iata_gap(_pais_elegido, st.session_state.session)
             progress_bar.progress(100)
 
-            # Se guardan los datos y el país de referencia en session_state
-            st.session_state['datos_cargados'] = {
+            # Se guardan los datos y el país de referencia en session_state (con contabilidad de memoria y presupuestos)
+            datos = memoria.guardar_en_sesion('datos_cargados', {
                 'pais': _pais_elegido,
                 'df_global_data': df_global_data,
                 'df_oag': df_oag,
                 'df_fk': df_fk,
                 'df_credibanco': df_credibanco,
                 'df_iata': df_iata
-            }
+            })
 
             # Retorna los mismos DataFrames desde la sesión
             return (
-                st.session_state['datos_cargados']['df_global_data'],
-                st.session_state['datos_cargados']['df_oag'],
-                st.session_state['datos_cargados']['df_fk'],
-                st.session_state['datos_cargados']['df_credibanco'],
-                st.session_state['datos_cargados']['df_iata']
+                datos['df_global_data'],
+                datos['df_oag'],
+                datos['df_fk'],
+                datos['df_credibanco'],
+                datos['df_iata']
             )
     
     else:
          # Si ya están cargados, se devuelven directamente
+        memoria.registrar_uso('datos_cargados', actualizar_tamano=False)
         return (
-            st.session_state['datos_cargados']['df_global_data'],
-            st.session_state['datos_cargados']['df_oag'],
-            st.session_state['datos_cargados']['df_fk'],
-            st.session_state['datos_cargados']['df_credibanco'],
-            st.session_state['datos_cargados']['df_iata']
+            datos['df_global_data'],
+            datos['df_oag'],
+            datos['df_fk'],
+            datos['df_credibanco'],
+            datos['df_iata']
         )
 
 # Función para obtener los gráficos de Global Data
@@ -99,8 +104,9 @@ def obtener_graficos_global_data(df_global_data, _pais_elegido):
     """
 
     # Verificar si ya existen gráficos en session_state y son del mismo país
-    if 'graficos_global_data' not in st.session_state \
-       or st.session_state['datos_cargados'].get('pais') != _pais_elegido:
+    graficos = st.session_state.get('graficos_global_data')
+    if graficos is None \
+       or st.session_state.get('datos_cargados', {}).get('pais') != _pais_elegido:
 
             # Serie de tiempo de viajeros
             fig_time_series_viajeros = plotly_analitica.plot_single_time_series(df=df_global_data['viajeros_serie_tiempo'], date_col='Año', value_col='Viajeros', x_label="Año", y_label="Viajeros (miles)", y_units=None, show_labels=True, decimal_places=0)
@@ -154,8 +160,8 @@ def obtener_graficos_global_data(df_global_data, _pais_elegido):
                 df_mice = pd.DataFrame()
             fig_time_series_mice = plotly_analitica.plot_single_time_series(df=df_mice, date_col='Año', value_col='Viajeros', x_label="Año", y_label="Viajeros (miles)", y_units=None, show_labels=True, decimal_places=0)
 
-            # Guardar todo en session_state
-            st.session_state['graficos_global_data'] = {
+            # Guardar todo en session_state (con contabilidad de memoria y presupuestos)
+            graficos = memoria.guardar_en_sesion('graficos_global_data', {
                 'fig_time_series_viajeros': fig_time_series_viajeros,
                 'fig_stacked_h_medio_viajeros': fig_stacked_h_medio_viajeros,
                 'fig_treemap_medio_viajeros': fig_treemap_medio_viajeros,
@@ -172,46 +178,47 @@ def obtener_graficos_global_data(df_global_data, _pais_elegido):
                 'fig_stacked_h_destinos_viajeros': fig_stacked_h_destinos_viajeros,
                 'fig_treemap_destinos_viajeros': fig_treemap_destinos_viajeros,
                 'fig_time_series_mice': fig_time_series_mice
-            }
+            })
 
             # Return de los gráficos 
             return (   
-                    st.session_state['graficos_global_data']['fig_time_series_viajeros'],
-                    st.session_state['graficos_global_data']['fig_stacked_h_medio_viajeros'],
-                    st.session_state['graficos_global_data']['fig_treemap_medio_viajeros'],
-                    st.session_state['graficos_global_data']['fig_time_series_noches_percnotacion'],
-                    st.session_state['graficos_global_data']['fig_time_series_gasto'],
-                    st.session_state['graficos_global_data']['fig_stacked_h_categoria_gasto'],
-                    st.session_state['graficos_global_data']['fig_treemap_categoria_gasto'],
-                    st.session_state['graficos_global_data']['fig_stacked_h_edad_viajeros'],
-                    st.session_state['graficos_global_data']['fig_treemap_edad_viajeros'],
-                    st.session_state['graficos_global_data']['fig_stacked_h_motivo_viajeros'],
-                    st.session_state['graficos_global_data']['fig_treemap_motivo_viajeros'],
-                    st.session_state['graficos_global_data']['fig_stacked_h_forma_viajeros'],
-                    st.session_state['graficos_global_data']['fig_treemap_forma_viajeros'],
-                    st.session_state['graficos_global_data']['fig_stacked_h_destinos_viajeros'],
-                    st.session_state['graficos_global_data']['fig_treemap_destinos_viajeros'],
-                    st.session_state['graficos_global_data']['fig_time_series_mice']                                           
+                    graficos['fig_time_series_viajeros'],
+                    graficos['fig_stacked_h_medio_viajeros'],
+                    graficos['fig_treemap_medio_viajeros'],
+                    graficos['fig_time_series_noches_percnotacion'],
+                    graficos['fig_time_series_gasto'],
+                    graficos['fig_stacked_h_categoria_gasto'],
+                    graficos['fig_treemap_categoria_gasto'],
+                    graficos['fig_stacked_h_edad_viajeros'],
+                    graficos['fig_treemap_edad_viajeros'],
+                    graficos['fig_stacked_h_motivo_viajeros'],
+                    graficos['fig_treemap_motivo_viajeros'],
+                    graficos['fig_stacked_h_forma_viajeros'],
+                    graficos['fig_treemap_forma_viajeros'],
+                    graficos['fig_stacked_h_destinos_viajeros'],
+                    graficos['fig_treemap_destinos_viajeros'],
+                    graficos['fig_time_series_mice']                                           
                 )
     else:
          # Si ya están cargados, se devuelven directamente
+        memoria.registrar_uso('graficos_global_data', actualizar_tamano=False)
         return(
-            st.session_state['graficos_global_data']['fig_time_series_viajeros'],
-            st.session_state['graficos_global_data']['fig_stacked_h_medio_viajeros'],
-            st.session_state['graficos_global_data']['fig_treemap_medio_viajeros'],
-            st.session_state['graficos_global_data']['fig_time_series_noches_percnotacion'],
-            st.session_state['graficos_global_data']['fig_time_series_gasto'],
-            st.session_state['graficos_global_data']['fig_stacked_h_categoria_gasto'],
-            st.session_state['graficos_global_data']['fig_treemap_categoria_gasto'],
-            st.session_state['graficos_global_data']['fig_stacked_h_edad_viajeros'],
-            st.session_state['graficos_global_data']['fig_treemap_edad_viajeros'],
-            st.session_state['graficos_global_data']['fig_stacked_h_motivo_viajeros'],
-            st.session_state['graficos_global_data']['fig_treemap_motivo_viajeros'],
-            st.session_state['graficos_global_data']['fig_stacked_h_forma_viajeros'],
-            st.session_state['graficos_global_data']['fig_treemap_forma_viajeros'],
-            st.session_state['graficos_global_data']['fig_stacked_h_destinos_viajeros'],
-            st.session_state['graficos_global_data']['fig_treemap_destinos_viajeros'],
-            st.session_state['graficos_global_data']['fig_time_series_mice']
+            graficos['fig_time_series_viajeros'],
+            graficos['fig_stacked_h_medio_viajeros'],
+            graficos['fig_treemap_medio_viajeros'],
+            graficos['fig_time_series_noches_percnotacion'],
+            graficos['fig_time_series_gasto'],
+            graficos['fig_stacked_h_categoria_gasto'],
+            graficos['fig_treemap_categoria_gasto'],
+            graficos['fig_stacked_h_edad_viajeros'],
+            graficos['fig_treemap_edad_viajeros'],
+            graficos['fig_stacked_h_motivo_viajeros'],
+            graficos['fig_treemap_motivo_viajeros'],
+            graficos['fig_stacked_h_forma_viajeros'],
+            graficos['fig_treemap_forma_viajeros'],
+            graficos['fig_stacked_h_destinos_viajeros'],
+            graficos['fig_treemap_destinos_viajeros'],
+            graficos['fig_time_series_mice']
 
         )
 
@@ -232,8 +239,9 @@ def obtener_graficos_oag_mundo(df_oag, _pais_elegido):
     """
 
     # Verificar si ya existen gráficos en session_state y son del mismo país
-    if 'graficos_oag_mundo' not in st.session_state \
-       or st.session_state['datos_cargados'].get('pais') != _pais_elegido:
+    graficos = st.session_state.get('graficos_oag_mundo')
+    if graficos is None \
+       or st.session_state.get('datos_cargados', {}).get('pais') != _pais_elegido:
         
             # Single Bar Chart: Conectividad del país con el mundo: Sillas
             fig_single_barchart_conectividad_mundo_sillas = plotly_analitica.plot_single_bar_chart(df=df_oag['conectividad_mundo_serie_tiempo'], date_col='Año', value_col='Sillas', x_label="Año", y_label="Sillas", y_units=None, show_labels=True, decimal_places=0)
@@ -247,28 +255,29 @@ def obtener_graficos_oag_mundo(df_oag, _pais_elegido):
             # StackedH: Conectividad mundo corrido destinos: Frecuencias
             fig_stacked_h_conectividad_frecuencias_destinos_corrido = plotly_analitica.plot_stacked_bar_chart_h(df=df_oag['conectividad_mundo_destino_corrido'], date_col='Periodo', group_col='País Destino', share_col='Participación Frecuencias (%)', decimal_places=1, y_label=' Año', legend_title=" ")
 
-            # Guardar todo en session_state
-            st.session_state['graficos_oag_mundo'] = {
+            # Guardar todo en session_state (con contabilidad de memoria y presupuestos)
+            graficos = memoria.guardar_en_sesion('graficos_oag_mundo', {
                 'fig_single_barchart_conectividad_mundo_sillas': fig_single_barchart_conectividad_mundo_sillas,
                 'fig_single_barchart_conectividad_mundo_frecuencias': fig_single_barchart_conectividad_mundo_frecuencias,
                 'fig_stacked_h_conectividad_frecuencias_destinos_cerrado': fig_stacked_h_conectividad_frecuencias_destinos_cerrado,
                 'fig_stacked_h_conectividad_frecuencias_destinos_corrido': fig_stacked_h_conectividad_frecuencias_destinos_corrido
-            }
+            })
 
             # Return de los gráficos 
             return (
-                    st.session_state['graficos_oag_mundo']['fig_single_barchart_conectividad_mundo_sillas'],
-                    st.session_state['graficos_oag_mundo']['fig_single_barchart_conectividad_mundo_frecuencias'],
-                    st.session_state['graficos_oag_mundo']['fig_stacked_h_conectividad_frecuencias_destinos_cerrado'],
-                    st.session_state['graficos_oag_mundo']['fig_stacked_h_conectividad_frecuencias_destinos_corrido']
+                    graficos['fig_single_barchart_conectividad_mundo_sillas'],
+                    graficos['fig_single_barchart_conectividad_mundo_frecuencias'],
+                    graficos['fig_stacked_h_conectividad_frecuencias_destinos_cerrado'],
+                    graficos['fig_stacked_h_conectividad_frecuencias_destinos_corrido']
                 )
     else:
          # Si ya están cargados, se devuelven directamente
+         memoria.registrar_uso('graficos_oag_mundo', actualizar_tamano=False)
          return(
-            st.session_state['graficos_oag_mundo']['fig_single_barchart_conectividad_mundo_sillas'],
-            st.session_state['graficos_oag_mundo']['fig_single_barchart_conectividad_mundo_frecuencias'],
-            st.session_state['graficos_oag_mundo']['fig_stacked_h_conectividad_frecuencias_destinos_cerrado'],
-            st.session_state['graficos_oag_mundo']['fig_stacked_h_conectividad_frecuencias_destinos_corrido']
+            graficos['fig_single_barchart_conectividad_mundo_sillas'],
+            graficos['fig_single_barchart_conectividad_mundo_frecuencias'],
+            graficos['fig_stacked_h_conectividad_frecuencias_destinos_cerrado'],
+            graficos['fig_stacked_h_conectividad_frecuencias_destinos_corrido']
          )
 
 # Función para obtener los gráficos de Forward Keys de búsquedas y reservas con el mundo
@@ -289,8 +298,9 @@ def obtener_graficos_fk_mundo(df_fk, _pais_elegido):
     """
 
     # Verificar si ya existen gráficos en session_state y son del mismo país
-    if 'graficos_fk_mundo' not in st.session_state \
-       or st.session_state['datos_cargados'].get('pais') != _pais_elegido:
+    graficos = st.session_state.get('graficos_fk_mundo')
+    if graficos is None \
+       or st.session_state.get('datos_cargados', {}).get('pais') != _pais_elegido:
         
             # Reservas activas del país hacia México, Costa Rica, Perú y Chile
             fig_multiple_time_series_reservas_mundo = plotly_analitica.plot_multiple_time_series(df=df_fk['reservas_serie_tiempo'], date_col='Fecha', value_col='Reservas', group_col='País', x_label="Año", y_label="Reservas", y_units=None, show_labels=True, decimal_places=0, legend_title=None)
@@ -298,22 +308,23 @@ def obtener_graficos_fk_mundo(df_fk, _pais_elegido):
             # Búsquedas activas del país hacia México, Costa Rica, Perú y Chile
             fig_multiple_time_series_busquedas_mundo = plotly_analitica.plot_multiple_time_series(df=df_fk['busquedas_serie_tiempo'], date_col='Fecha', value_col='Búsquedas', group_col='País', x_label="Año", y_label="Búsquedas", y_units=None, show_labels=True, decimal_places=0, legend_title=None)
 
-            # Guardar todo en session_state
-            st.session_state['graficos_fk_mundo'] = {
+            # Guardar todo en session_state (con contabilidad de memoria y presupuestos)
+            graficos = memoria.guardar_en_sesion('graficos_fk_mundo', {
                 'fig_multiple_time_series_reservas_mundo': fig_multiple_time_series_reservas_mundo,
                 'fig_multiple_time_series_busquedas_mundo': fig_multiple_time_series_busquedas_mundo
-            }
+            })
 
             # Return de los gráficos
             return (
-                    st.session_state['graficos_fk_mundo']['fig_multiple_time_series_reservas_mundo'],
-                    st.session_state['graficos_fk_mundo']['fig_multiple_time_series_busquedas_mundo']
+                    graficos['fig_multiple_time_series_reservas_mundo'],
+                    graficos['fig_multiple_time_series_busquedas_mundo']
                 )
     else:
          # Si ya están cargados, se devuelven directamente
+         memoria.registrar_uso('graficos_fk_mundo', actualizar_tamano=False)
          return(
-            st.session_state['graficos_fk_mundo']['fig_multiple_time_series_reservas_mundo'],
-            st.session_state['graficos_fk_mundo']['fig_multiple_time_series_busquedas_mundo']
+            graficos['fig_multiple_time_series_reservas_mundo'],
+            graficos['fig_multiple_time_series_busquedas_mundo']
          )
 
 # Función para obtener los gráficos de OAG de conetividad con Colombia
@@ -334,8 +345,9 @@ def obtener_graficos_oag_colombia(df_oag, _pais_elegido):
     """
 
     # Verificar si ya existen gráficos en session_state y son del mismo país
-    if 'graficos_oag_colombia' not in st.session_state \
-       or st.session_state['datos_cargados'].get('pais') != _pais_elegido:
+    graficos = st.session_state.get('graficos_oag_colombia')
+    if graficos is None \
+       or st.session_state.get('datos_cargados', {}).get('pais') != _pais_elegido:
     
             # Single Bar Chart: Conectividad del país con Colombia: Sillas
             fig_single_barchart_conectividad_colombia_sillas = plotly_analitica.plot_single_bar_chart(df=df_oag['conectividad_colombia_serie_tiempo'], date_col='Año', value_col='Sillas', x_label="Año", y_label="Sillas", y_units=None, show_labels=True, decimal_places=0)
@@ -349,28 +361,29 @@ def obtener_graficos_oag_colombia(df_oag, _pais_elegido):
             # StackedH: Conectividad Colombia corrido destinos: Frecuencias
             fig_stacked_h_conectividad_colombia_frecuencias_destinos_corrido = plotly_analitica.plot_stacked_bar_chart_h(df=df_oag['conectividad_colombia_municipio_corrido'], date_col='Periodo', group_col='Municipio Destino', share_col='Participación Frecuencias (%)', decimal_places=1, y_label=' Año', legend_title=" ")
 
-            # Guardar todo en session_state
-            st.session_state['graficos_oag_colombia'] = {
+            # Guardar todo en session_state (con contabilidad de memoria y presupuestos)
+            graficos = memoria.guardar_en_sesion('graficos_oag_colombia', {
                 'fig_single_barchart_conectividad_colombia_sillas': fig_single_barchart_conectividad_colombia_sillas,
                 'fig_single_barchart_conectividad_colombia_frecuencias': fig_single_barchart_conectividad_colombia_frecuencias,
                 'fig_stacked_h_conectividad_colombia_frecuencias_destinos_cerrado': fig_stacked_h_conectividad_colombia_frecuencias_destinos_cerrado,
                 'fig_stacked_h_conectividad_colombia_frecuencias_destinos_corrido': fig_stacked_h_conectividad_colombia_frecuencias_destinos_corrido
-            }
+            })
     
             # Return de los gráficos en un diccionario
             return (
-                    st.session_state['graficos_oag_colombia']['fig_single_barchart_conectividad_colombia_sillas'],
-                    st.session_state['graficos_oag_colombia']['fig_single_barchart_conectividad_colombia_frecuencias'],
-                    st.session_state['graficos_oag_colombia']['fig_stacked_h_conectividad_colombia_frecuencias_destinos_cerrado'],
-                    st.session_state['graficos_oag_colombia']['fig_stacked_h_conectividad_colombia_frecuencias_destinos_corrido']
+                    graficos['fig_single_barchart_conectividad_colombia_sillas'],
+                    graficos['fig_single_barchart_conectividad_colombia_frecuencias'],
+                    graficos['fig_stacked_h_conectividad_colombia_frecuencias_destinos_cerrado'],
+                    graficos['fig_stacked_h_conectividad_colombia_frecuencias_destinos_corrido']
                 )
     else:
          # Si ya están cargados, se devuelven directamente
+         memoria.registrar_uso('graficos_oag_colombia', actualizar_tamano=False)
          return(
-            st.session_state['graficos_oag_colombia']['fig_single_barchart_conectividad_colombia_sillas'],
-            st.session_state['graficos_oag_colombia']['fig_single_barchart_conectividad_colombia_frecuencias'],
-            st.session_state['graficos_oag_colombia']['fig_stacked_h_conectividad_colombia_frecuencias_destinos_cerrado'],
-            st.session_state['graficos_oag_colombia']['fig_stacked_h_conectividad_colombia_frecuencias_destinos_corrido']
+            graficos['fig_single_barchart_conectividad_colombia_sillas'],
+            graficos['fig_single_barchart_conectividad_colombia_frecuencias'],
+            graficos['fig_stacked_h_conectividad_colombia_frecuencias_destinos_cerrado'],
+            graficos['fig_stacked_h_conectividad_colombia_frecuencias_destinos_corrido']
          )
 
 
@@ -392,8 +405,9 @@ def obtener_graficos_credibanco(df_credibanco, _pais_elegido):
     """
 
     # Verificar si ya existen gráficos en session_state y son del mismo país
-    if 'graficos_credibanco' not in st.session_state \
-       or st.session_state['datos_cargados'].get('pais') != _pais_elegido:
+    graficos = st.session_state.get('graficos_credibanco')
+    if graficos is None \
+       or st.session_state.get('datos_cargados', {}).get('pais') != _pais_elegido:
     
             # Gasto promedio
             fig_side_by_side_bar_gasto_promedio =  plotly_analitica.plot_side_by_side_bars(df=df_credibanco['gasto_promedio'], date_col='Año', var1_col='Gasto promedio tarjeta (USD)', var2_col='Gasto promedio transacción (USD)', x_label="Año", y_label="Gasto", y_units='USD', show_labels=True, decimal_places=0, legend_title=' ', legend_labels={'Gasto promedio tarjeta (USD)' : 'Gasto promedio por tarjeta', 'Gasto promedio transacción (USD)' : 'Gasto promedio por transacción'})
@@ -416,8 +430,8 @@ def obtener_graficos_credibanco(df_credibanco, _pais_elegido):
             # Gasto por producto indirecto
             fig_treemap_gasto_categoria_indirecto_credibanco = plotly_analitica.plot_treemap(df = df_credibanco['gasto_producto_indirecto'], date_col="Año", value_col="Facturación (USD)", group_col="Categoria", share_col="Participación (%)", decimal_places=1, group_label="Categoría", value_label="Facturación USD", share_label="Participación (%)")
 
-            # Guardar todo en session_state
-            st.session_state['graficos_credibanco'] = {
+            # Guardar todo en session_state (con contabilidad de memoria y presupuestos)
+            graficos = memoria.guardar_en_sesion('graficos_credibanco', {
                 'fig_side_by_side_bar_gasto_promedio': fig_side_by_side_bar_gasto_promedio,
                 'fig_stacked_h_gasto_categoria_credibanco': fig_stacked_h_gasto_categoria_credibanco,
                 'fig_treemap_gasto_categoria_credibanco': fig_treemap_gasto_categoria_credibanco,
@@ -425,28 +439,29 @@ def obtener_graficos_credibanco(df_credibanco, _pais_elegido):
                 'fig_treemap_gasto_categoria_directo_credibanco': fig_treemap_gasto_categoria_directo_credibanco,
                 'fig_stacked_h_gasto_categoria_indirecto_credibanco': fig_stacked_h_gasto_categoria_indirecto_credibanco,
                 'fig_treemap_gasto_categoria_indirecto_credibanco': fig_treemap_gasto_categoria_indirecto_credibanco
-            }
+            })
 
             # Return de los gráficos en un diccionario
             return (
-                    st.session_state['graficos_credibanco']['fig_side_by_side_bar_gasto_promedio'],
-                    st.session_state['graficos_credibanco']['fig_stacked_h_gasto_categoria_credibanco'],
-                    st.session_state['graficos_credibanco']['fig_treemap_gasto_categoria_credibanco'],
-                    st.session_state['graficos_credibanco']['fig_stacked_h_gasto_categoria_directo_credibanco'],
-                    st.session_state['graficos_credibanco']['fig_treemap_gasto_categoria_directo_credibanco'],
-                    st.session_state['graficos_credibanco']['fig_stacked_h_gasto_categoria_indirecto_credibanco'],
-                    st.session_state['graficos_credibanco']['fig_treemap_gasto_categoria_indirecto_credibanco']
+                    graficos['fig_side_by_side_bar_gasto_promedio'],
+                    graficos['fig_stacked_h_gasto_categoria_credibanco'],
+                    graficos['fig_treemap_gasto_categoria_credibanco'],
+                    graficos['fig_stacked_h_gasto_categoria_directo_credibanco'],
+                    graficos['fig_treemap_gasto_categoria_directo_credibanco'],
+                    graficos['fig_stacked_h_gasto_categoria_indirecto_credibanco'],
+                    graficos['fig_treemap_gasto_categoria_indirecto_credibanco']
                 )
     else:
          # Si ya están cargados, se devuelven directamente
+         memoria.registrar_uso('graficos_credibanco', actualizar_tamano=False)
          return(
-            st.session_state['graficos_credibanco']['fig_side_by_side_bar_gasto_promedio'],
-            st.session_state['graficos_credibanco']['fig_stacked_h_gasto_categoria_credibanco'],
-            st.session_state['graficos_credibanco']['fig_treemap_gasto_categoria_credibanco'],
-            st.session_state['graficos_credibanco']['fig_stacked_h_gasto_categoria_directo_credibanco'],
-            st.session_state['graficos_credibanco']['fig_treemap_gasto_categoria_directo_credibanco'],
-            st.session_state['graficos_credibanco']['fig_stacked_h_gasto_categoria_indirecto_credibanco'],
-            st.session_state['graficos_credibanco']['fig_treemap_gasto_categoria_indirecto_credibanco']
+            graficos['fig_side_by_side_bar_gasto_promedio'],
+            graficos['fig_stacked_h_gasto_categoria_credibanco'],
+            graficos['fig_treemap_gasto_categoria_credibanco'],
+            graficos['fig_stacked_h_gasto_categoria_directo_credibanco'],
+            graficos['fig_treemap_gasto_categoria_directo_credibanco'],
+            graficos['fig_stacked_h_gasto_categoria_indirecto_credibanco'],
+            graficos['fig_treemap_gasto_categoria_indirecto_credibanco']
          )
 
 # Función para obtener los gráficos de Forward Keys de búsquedas y reservas con Colombia
@@ -467,8 +482,9 @@ def obtener_graficos_fk_colombia(df_fk, _pais_elegido):
     """
 
     # Verificar si ya existen gráficos en session_state y son del mismo país
-    if 'graficos_fk_colombia' not in st.session_state \
-       or st.session_state['datos_cargados'].get('pais') != _pais_elegido:
+    graficos = st.session_state.get('graficos_fk_colombia')
+    if graficos is None \
+       or st.session_state.get('datos_cargados', {}).get('pais') != _pais_elegido:
          
             # Reservas aéreas activas del país hacia Colombia
             fig_single_time_series_reservas_colombia = plotly_analitica.plot_multiple_time_series(df=df_fk['reservas_serie_tiempo_colombia'], date_col='Fecha', value_col='Reservas', group_col='País', x_label="Año", y_label="Reservas", y_units=None, show_labels=True, decimal_places=0, legend_title=None)
@@ -476,22 +492,23 @@ def obtener_graficos_fk_colombia(df_fk, _pais_elegido):
             # Búsquedas activas del país hacia Colombia 
             fig_single_time_series_busquedas_colombia = plotly_analitica.plot_multiple_time_series(df=df_fk['busquedas_serie_tiempo_colombia'], date_col='Fecha', value_col='Búsquedas', group_col='País', x_label="Año", y_label="Búsquedas", y_units=None, show_labels=True, decimal_places=0, legend_title=None)
 
-             # Guardar todo en session_state
-            st.session_state['graficos_fk_colombia'] = {
+            # Guardar todo en session_state (con contabilidad de memoria y presupuestos)
+            graficos = memoria.guardar_en_sesion('graficos_fk_colombia', {
                 'fig_single_time_series_reservas_colombia': fig_single_time_series_reservas_colombia,
                 'fig_single_time_series_busquedas_colombia': fig_single_time_series_busquedas_colombia
-            }
+            })
 
             # Return de los gráficos en un diccionario
             return (
-                    st.session_state['graficos_fk_colombia']['fig_single_time_series_reservas_colombia'],
-                    st.session_state['graficos_fk_colombia']['fig_single_time_series_busquedas_colombia']
+                    graficos['fig_single_time_series_reservas_colombia'],
+                    graficos['fig_single_time_series_busquedas_colombia']
                 )
     else:
          # Si ya están cargados, se devuelven directamente
+         memoria.registrar_uso('graficos_fk_colombia', actualizar_tamano=False)
          return(
-            st.session_state['graficos_fk_colombia']['fig_single_time_series_reservas_colombia'],
-            st.session_state['graficos_fk_colombia']['fig_single_time_series_busquedas_colombia']
+            graficos['fig_single_time_series_reservas_colombia'],
+            graficos['fig_single_time_series_busquedas_colombia']
          )
 
 # Funciones para obtener los gráficos de IATA GAP de agencias que promocionan Colombia
@@ -512,8 +529,9 @@ def obtener_graficos_iata_colombia(df_iata, _pais_elegido):
     """
 
     # Verificar si ya existen gráficos en session_state y son del mismo país
-    if 'graficos_iata_colombia' not in st.session_state \
-       or st.session_state['datos_cargados'].get('pais') != _pais_elegido:
+    graficos = st.session_state.get('graficos_iata_colombia')
+    if graficos is None \
+       or st.session_state.get('datos_cargados', {}).get('pais') != _pais_elegido:
 
             # Indicadores de agencias de ese mercado que venden Colombia como destino mostrar por q
             fig_single_time_series_agencias_colombia = plotly_analitica.plot_single_time_series(df=df_iata['agencias_serie_tiempo'], date_col='Año', value_col='Número de Agencias', x_label="Año", y_label="Agencias", y_units='Número', show_labels=True, decimal_places=0)
@@ -521,24 +539,50 @@ def obtener_graficos_iata_colombia(df_iata, _pais_elegido):
             # Agencias que venden Colombia como destino por ciudad de la agencia 15
             fig_stacked_h_agencias_ciudades = plotly_analitica.plot_stacked_bar_chart_h(df=df_iata['agencias_ciudades'], date_col='Año', group_col='Ciudad de la Agencia', share_col='Participación (%)', decimal_places=1, y_label=' Año', legend_title=" ")
 
-            # Guardar todo en session_state
-            st.session_state['graficos_iata_colombia'] = {
+            # Guardar todo en session_state (con contabilidad de memoria y presupuestos)
+            graficos = memoria.guardar_en_sesion('graficos_iata_colombia', {
                 'fig_single_time_series_agencias_colombia': fig_single_time_series_agencias_colombia,
                 'fig_stacked_h_agencias_ciudades': fig_stacked_h_agencias_ciudades
-            }
+            })
 
             # Return de los gráficos en un diccionario
             return (
-                    st.session_state['graficos_iata_colombia']['fig_single_time_series_agencias_colombia'],
-                    st.session_state['graficos_iata_colombia']['fig_stacked_h_agencias_ciudades']
+                    graficos['fig_single_time_series_agencias_colombia'],
+                    graficos['fig_stacked_h_agencias_ciudades']
                 )
     else:
          # Si ya están cargados, se devuelven directamente
+         memoria.registrar_uso('graficos_iata_colombia', actualizar_tamano=False)
          return(
-            st.session_state['graficos_iata_colombia']['fig_single_time_series_agencias_colombia'],
-            st.session_state['graficos_iata_colombia']['fig_stacked_h_agencias_ciudades']
+            graficos['fig_single_time_series_agencias_colombia'],
+            graficos['fig_stacked_h_agencias_ciudades']
          )
     
+# Indicadores de la tabla resumen: fuente, llave del DataFrame procesado, columna del valor, parámetro del año de consulta y formato
+INDICADORES_RESUMEN = [
+    {'fuente': 'df_global_data', 'llave': 'viajeros_serie_tiempo', 'columna': 'Viajeros', 'anio': 'year_global_data',
+     'prefijo': '', 'decimales': 0, 'sufijo': ' miles de viajeros', 'texto': 'Flujos de viajeros de {pais} hacia el mundo en {anio}'},
+    {'fuente': 'df_global_data', 'llave': 'noches_pernoctacion', 'columna': 'Noches de percnotación', 'anio': 'year_global_data',
+     'prefijo': '', 'decimales': 0, 'sufijo': ' noches', 'texto': 'Noches de percnotación promedio de los viajeros de {pais} en {anio}'},
+    {'fuente': 'df_global_data', 'llave': 'gasto_serie_tiempo', 'columna': 'Gasto (USD)', 'anio': 'year_global_data',
+     'prefijo': ' USD ', 'decimales': 0, 'sufijo': '', 'texto': 'Gasto promedio del viajero de {pais} al mundo en {anio}'},
+    {'fuente': 'df_oag', 'llave': 'conectividad_mundo_serie_tiempo', 'columna': 'Frecuencias', 'anio': 'year_oag_mundo',
+     'prefijo': '', 'decimales': 0, 'sufijo': ' frecuencias', 'texto': 'Conectividad de {pais} con el mundo en {anio}'},
+    {'fuente': 'df_oag', 'llave': 'conectividad_colombia_serie_tiempo', 'columna': 'Frecuencias', 'anio': 'year_oag_colombia',
+     'prefijo': '', 'decimales': 0, 'sufijo': ' frecuencias', 'texto': 'Conectividad aérea de {pais} hacia Colombia en {anio}'},
+    {'fuente': 'df_credibanco', 'llave': 'gasto_promedio', 'columna': 'Gasto promedio tarjeta (USD)', 'anio': 'year_credibanco',
+     'prefijo': ' USD ', 'decimales': 1, 'sufijo': '', 'texto': 'Gasto promedio con tarjeta de crédito de los viajeros de {pais} en Colombia en {anio}'},
+    {'fuente': 'df_iata', 'llave': 'agencias_serie_tiempo', 'columna': 'Número de Agencias', 'anio': 'year_iata',
+     'prefijo': '', 'decimales': 0, 'sufijo': ' agencias', 'texto': 'Agencias de {pais} que venden Colombia como destino en {anio}'}
+]
+
+# Texto del país en los indicadores de la tabla de comparación (una columna por país)
+ETIQUETA_PAIS_COMPARACION = 'cada país'
+
+def _formato_indicador(indicador, val):
+    """Formatea el valor de un indicador de INDICADORES_RESUMEN (miles, USD, etc.)."""
+    return indicador['prefijo'] + helpers.formato_miles(valor=val, decimales=indicador['decimales']) + indicador['sufijo']
+
 # Función para generar la tabla de resumen
 def generar_tabla_resumen(pais_elegido, df_global_data, df_oag, df_credibanco, df_iata, year_global_data, year_oag_mundo, year_oag_colombia, year_credibanco, year_iata):
 
@@ -604,193 +648,104 @@ def generar_tabla_resumen(pais_elegido, df_global_data, df_oag, df_credibanco, d
     ... print(df_resumen)
     """
 
-    # Crear df vacío
-    df_tabla_resumen = pd.DataFrame()
-
-    # Flujos de viajeros hacia el mundo
-    df_flujos_viajeros_mundo = df_global_data.get('viajeros_serie_tiempo', pd.DataFrame())
-
-    # Procesar si no llegan vacíos
-    if not df_flujos_viajeros_mundo.empty:
-
-        # Volver diccionario
-        dict_flujos_viajeros_mundo = df_flujos_viajeros_mundo.set_index('Año').T.to_dict()
-
-        # Extraer subdiccionario
-        sub_dict = dict_flujos_viajeros_mundo.get(year_global_data, {})
-
-        # Extraer val
-        val = sub_dict.get('Viajeros', 0)
-
-        # Agregar formato
-        val_flujos_viajeros_mundo =  helpers.formato_miles(valor=val, decimales=0) + ' miles de viajeros'
-
-        # Crear fila
-        row_resumen_flujos_viajeros_mundo = pd.DataFrame({
-            'Indicador': [f'Flujos de viajeros de {pais_elegido} hacia el mundo en {year_global_data}'],
-            'Valor': [val_flujos_viajeros_mundo]})
-
-        # Agregar fila a la tabla resumen
-        df_tabla_resumen = pd.concat([df_tabla_resumen, row_resumen_flujos_viajeros_mundo])
-
-    # Noches de percnotacion promedio
-    df_noches_percnotacion = df_global_data.get('noches_pernoctacion', pd.DataFrame())
-
-    # Procesar si no llegan vacíos
-    if not df_noches_percnotacion.empty:
-
-        # Volver diccionario
-        dict_noches_percnotacion = df_noches_percnotacion.set_index('Año').T.to_dict()
-
-        # Extraer subdiccionario
-        sub_dict = dict_noches_percnotacion.get(year_global_data, {})
-
-        # Extraer val
-        val = sub_dict.get('Noches de percnotación', 0)
-
-        # Agregar formato
-        val_noches_percnotacion =  helpers.formato_miles(valor=val, decimales=0) + ' noches'
-
-        # Crear fila
-        row_noches_percnotacion = pd.DataFrame({
-            'Indicador': [f'Noches de percnotación promedio de los viajeros de {pais_elegido} en {year_global_data}'],
-            'Valor': [val_noches_percnotacion]})
-
-        # Agregar fila a la tabla resumen
-        df_tabla_resumen = pd.concat([df_tabla_resumen, row_noches_percnotacion])
-
-    # Gasto promedio del viajero al mundo
-    df_gasto_promedio_viajero_mundo = df_global_data.get('gasto_serie_tiempo', pd.DataFrame())
-
-    # Procesar si no llegan vacíos
-    if not df_gasto_promedio_viajero_mundo.empty:
-
-        # Volver diccionario
-        dict_gasto_promedio_viajero_mundo = df_gasto_promedio_viajero_mundo.set_index('Año').T.to_dict()
-
-        # Extraer subdiccionario
-        sub_dict = dict_gasto_promedio_viajero_mundo.get(year_global_data, {})
-
-        # Extraer val
-        val = sub_dict.get('Gasto (USD)', 0)
-
-        # Agregar formato
-        val_gasto_promedio_viajero_mundo =  ' USD ' + helpers.formato_miles(valor=val, decimales=0)
-
-        # Crear fila
-        row_gasto_promedio_viajero_mundo = pd.DataFrame({
-            'Indicador': [f'Gasto promedio del viajero de {pais_elegido} al mundo en {year_global_data}'],
-            'Valor': [val_gasto_promedio_viajero_mundo]})
-
-        # Agregar fila a la tabla resumen
-        df_tabla_resumen = pd.concat([df_tabla_resumen, row_gasto_promedio_viajero_mundo])
-
-    # Conectividad del país con el mundo
-    df_conectividad_mundo = df_oag.get('conectividad_mundo_serie_tiempo', pd.DataFrame())
+    # Años de consulta por indicador y diccionarios por fuente
+    anios = {'year_global_data': year_global_data, 'year_oag_mundo': year_oag_mundo, 'year_oag_colombia': year_oag_colombia,
+             'year_credibanco': year_credibanco, 'year_iata': year_iata}
+    fuentes = {'df_global_data': df_global_data, 'df_oag': df_oag, 'df_credibanco': df_credibanco, 'df_iata': df_iata}
 
-    # Procesar si no llegan vacíos
-    if not df_conectividad_mundo.empty:
+    filas = []
+    for indicador in INDICADORES_RESUMEN:
 
-        # Volver diccionario
-        dict_conectividad_mundo = df_conectividad_mundo.set_index('Año').T.to_dict()
+        # Procesar si no llegan vacíos
+        df_indicador = fuentes[indicador['fuente']].get(indicador['llave'], pd.DataFrame())
+        if df_indicador.empty:
+            continue
 
-        # Extraer subdiccionario
-        sub_dict = dict_conectividad_mundo.get(year_oag_mundo, {})
+        # Valor del año de consulta (0 si el año no está en la serie)
+        anio = anios[indicador['anio']]
+        val = df_indicador.set_index('Año').T.to_dict().get(anio, {}).get(indicador['columna'], 0)
 
-        # Extraer val
-        val = sub_dict.get('Frecuencias', 0)
+        filas.append({'Indicador': indicador['texto'].format(pais=pais_elegido, anio=anio),
+                      'Valor': _formato_indicador(indicador, val)})
 
-        # Agregar formato
-        val_conectividad_mundo =  helpers.formato_miles(valor=val, decimales=0) + ' frecuencias'
-
-        # Crear fila
-        row_conectividad_mundo = pd.DataFrame({
-            'Indicador': [f'Conectividad de {pais_elegido} con el mundo en {year_oag_mundo}'],
-            'Valor': [val_conectividad_mundo]})
-
-        # Agregar fila a la tabla resumen
-        df_tabla_resumen = pd.concat([df_tabla_resumen, row_conectividad_mundo])
-
-    # Conectividad aérea hacia Colombia
-    df_conectividad_colombia = df_oag.get('conectividad_colombia_serie_tiempo', pd.DataFrame())
-
-    # Procesar si no llegan vacíos
-    if not df_conectividad_colombia.empty:
-
-        # Volver diccionario
-        dict_conectividad_colombia = df_conectividad_colombia.set_index('Año').T.to_dict()
-
-        # Extraer subdiccionario
-        sub_dict = dict_conectividad_colombia.get(year_oag_colombia, {})
-
-        # Extraer val
-        val = sub_dict.get('Frecuencias', 0)
-
-        # Agregar formato
-        val_conectividad_colombia =  helpers.formato_miles(valor=val, decimales=0) + ' frecuencias'
-
-        # Crear fila
-        row_conectividad_colombia = pd.DataFrame({
-            'Indicador': [f'Conectividad aérea de {pais_elegido} hacia Colombia en {year_oag_colombia}'],
-            'Valor': [val_conectividad_colombia]})
-
-        # Agregar fila a la tabla resumen
-        df_tabla_resumen = pd.concat([df_tabla_resumen, row_conectividad_colombia])
+    # Resultado
+    return pd.DataFrame(filas, columns=['Indicador', 'Valor']) if filas else pd.DataFrame()
 
-    # Gasto con tarjeta de crédito proveniente de ese país en Colombia
-    df_gasto_tarjeta_crédito_colombia = df_credibanco.get('gasto_promedio', pd.DataFrame())
+# Función para obtener los datos de varios países (modo comparación)
+def obtener_datos_comparacion(_paises):
+    """
+    1. Verifica si ya están los datos de comparación en 'st.session_state' para la misma lista de países.
+    2. Si no existen o la lista cambió, ejecuta una consulta por fuente para todos los países (PAIS IN (...)).
+    3. Guarda los resultados en st.session_state.
+    4. Devuelve el diccionario {pais: {'df_global_data', 'df_oag', 'df_fk', 'df_credibanco', 'df_iata'}}.
+    """
+    paises = tuple(_paises)
 
-    # Procesar si no llegan vacíos
-    if not df_gasto_tarjeta_crédito_colombia.empty:
+    # Leer una sola vez la llave de la sesión (puede desalojarse en cualquier momento)
+    comparacion = st.session_state.get('datos_comparacion')
 
-        # Volver diccionario
-        dict_gasto_tarjeta_crédito_colombia = df_gasto_tarjeta_crédito_colombia.set_index('Año').T.to_dict()
+    # Si aún no se ha cargado nada o se cambió la lista de países
+    if comparacion is None or comparacion['paises'] != paises:
 
-        # Extraer subdiccionario
-        sub_dict = dict_gasto_tarjeta_crédito_colombia.get(year_credibanco, {})
+        with st.spinner("Cargando datos de comparación..."):
+            comparacion = memoria.guardar_en_sesion('datos_comparacion', {
+                'paises': paises,
+                'datos': procesamiento_datos.datos_comparacion_paises_modo(list(paises), st.session_state.session)
+            })
 
-        # Extraer val
-        val = sub_dict.get('Gasto promedio tarjeta (USD)', 0)
+    else:
+        memoria.registrar_uso('datos_comparacion', actualizar_tamano=False)
 
-        # Agregar formato
-        val_gasto_tarjeta_crédito_colombia = ' USD ' +  helpers.formato_miles(valor=val, decimales=1)
+    return comparacion['datos']
 
-        # Crear fila
-        row_gasto_tarjeta_crédito_colombia = pd.DataFrame({
-            'Indicador': [f'Gasto promedio con tarjeta de crédito de los viajeros de {pais_elegido} en Colombia en {year_credibanco}'],
-            'Valor': [val_gasto_tarjeta_crédito_colombia]})
+# Tabla resumen de varios países lado a lado
+def generar_tabla_comparacion(datos_comparacion, year_global_data, year_oag_mundo, year_oag_colombia, year_credibanco, year_iata):
+    """
+    Construye la tabla resumen de indicadores para varios países, con una columna de valores por país.
+    Cada indicador se calcula en una sola pasada agrupada sobre la unión de los países (unir_series_paises),
+    con un texto de indicador común (ETIQUETA_PAIS_COMPARACION) en lugar del nombre de cada país.
 
-        # Agregar fila a la tabla resumen
-        df_tabla_resumen = pd.concat([df_tabla_resumen, row_gasto_tarjeta_crédito_colombia])
+    Parámetros
+    ----------
+    datos_comparacion : dict
+        Resultado de obtener_datos_comparacion: {pais: {'df_global_data', 'df_oag', 'df_fk', 'df_credibanco', 'df_iata'}}.
 
-    # Indicadores de agencias de ese mercado que venden Colombia como destino
-    df_indicadores_agencias_colombia_destino = df_iata.get('agencias_serie_tiempo', pd.DataFrame())
+    year_global_data, year_oag_mundo, year_oag_colombia, year_credibanco, year_iata : str
+        Años de consulta de cada indicador (ver generar_tabla_resumen).
 
-    # Procesar si no llegan vacíos
-    if not df_indicadores_agencias_colombia_destino.empty:
+    Retorna
+    -------
+    pd.DataFrame
+        Un DataFrame con la columna "Indicador" y una columna por país ('Sin datos' si el país no tiene la fuente o
+        el año de consulta).
+    """
+    anios = {'year_global_data': year_global_data, 'year_oag_mundo': year_oag_mundo, 'year_oag_colombia': year_oag_colombia,
+             'year_credibanco': year_credibanco, 'year_iata': year_iata}
 
-        # Volver diccionario
-        dict_indicadores_agencias_colombia_destino = df_indicadores_agencias_colombia_destino.set_index('Año').T.to_dict()
+    filas = []
+    for indicador in INDICADORES_RESUMEN:
 
-        # Extraer subdiccionario
-        sub_dict = dict_indicadores_agencias_colombia_destino.get(year_iata, {})
+        # Serie del indicador de todos los países en un solo DataFrame
+        df_indicador = procesamiento_datos.unir_series_paises(datos_comparacion, indicador['fuente'], indicador['llave'], columna_pais='País')
+        if df_indicador.empty:
+            continue
 
-        # Extraer val
-        val = sub_dict.get('Número de Agencias', 0)
+        # Valor del año de consulta por país ('Sin datos' si el país tiene la serie pero no el año)
+        anio = anios[indicador['anio']]
+        valores = df_indicador[df_indicador['Año'] == anio].groupby('País', sort=False)[indicador['columna']].last()
 
-        # Agregar formato
-        val_indicadores_agencias_colombia_destino =  helpers.formato_miles(valor=val, decimales=0) + ' agencias'
+        fila = {'Indicador': indicador['texto'].format(pais=ETIQUETA_PAIS_COMPARACION, anio=anio)}
+        for pais in df_indicador['País'].unique():
+            fila[pais] = _formato_indicador(indicador, valores[pais]) if pais in valores.index else 'Sin datos'
+        filas.append(fila)
 
-        # Crear fila
-        row_indicadores_agencias_colombia_destino = pd.DataFrame({
-            'Indicador': [f'Agencias de {pais_elegido} que venden Colombia como destino en {year_iata}'],
-            'Valor': [val_indicadores_agencias_colombia_destino]})
+    if not filas:
+        return pd.DataFrame()
 
-        # Agregar fila a la tabla resumen
-        df_tabla_resumen = pd.concat([df_tabla_resumen, row_indicadores_agencias_colombia_destino])
+    # Una columna por país con datos, en el orden de la comparación
+    paises = [pais for pais in datos_comparacion if any(pais in fila for fila in filas)]
 
-    # Resultado
-    return df_tabla_resumen
+    return pd.DataFrame(filas, columns=['Indicador'] + paises).fillna('Sin datos')
 
 # Generar documento CITI
 def generar_documento_citi(
@@ -915,8 +870,9 @@ def generar_documento_citi(
         b64_docx = base64.b64encode(docx_buffer.read()).decode()
 
         # Almacenar en session_state para disponibilizar la descarga
-        st.session_state['b64_docx'] = b64_docx
+        # (con contabilidad de memoria y presupuestos; el nombre se guarda antes porque acompaña a la llave principal)
         st.session_state['file_name_docx'] = file_name_docx
+        memoria.guardar_en_sesion('b64_docx', b64_docx)
 
     except Exception as e:
         st.error(f"Se produjo un error durante la generación del documento: {e}")
@@ -935,44 +891,44 @@ def on_selectbox_change():
     # Limpia la caché de datos
     st.cache_data.clear()
 
+    # Las llaves se eliminan con pop (sin verificar antes con 'in'): el presupuesto de memoria de otra sesión
+    # puede desalojarlas en cualquier momento
+
     # Limpia la clave 'datos_cargados' (si existe) en session_state
-    if 'datos_cargados' in st.session_state:
-        del st.session_state['datos_cargados']
+    st.session_state.pop('datos_cargados', None)
     # Limpia la clave 'graficos_global_data' (si existe) en session_state
-    if 'graficos_global_data' in st.session_state:
-        del st.session_state['graficos_global_data']
+    st.session_state.pop('graficos_global_data', None)
     # Limpia la clave 'graficos_oag_mundo' (si existe) en session_state
-    if 'graficos_oag_mundo' in st.session_state:
-        del st.session_state['graficos_oag_mundo']
+    st.session_state.pop('graficos_oag_mundo', None)
     # Limpia la clave 'graficos_fk_mundo' (si existe) en session_state
-    if 'graficos_fk_mundo' in st.session_state:
-        del st.session_state['graficos_fk_mundo']
+    st.session_state.pop('graficos_fk_mundo', None)
     # Limpia la clave 'graficos_oag_colombia' (si existe) en session_state
-    if 'graficos_oag_colombia' in st.session_state:
-        del st.session_state['graficos_oag_colombia']
+    st.session_state.pop('graficos_oag_colombia', None)
     # Limpia la clave 'graficos_credibanco' (si existe) en session_state
-    if 'graficos_credibanco' in st.session_state:
-        del st.session_state['graficos_credibanco']
+    st.session_state.pop('graficos_credibanco', None)
     # Limpia la clave 'graficos_fk_colombia' (si existe) en session_state
-    if 'graficos_fk_colombia' in st.session_state:
-        del st.session_state['graficos_fk_colombia']
+    st.session_state.pop('graficos_fk_colombia', None)
     # Limpia la clave 'graficos_iata_colombia' (si existe) en session_state
-    if 'graficos_iata_colombia' in st.session_state:
-        del st.session_state['graficos_iata_colombia']
+    st.session_state.pop('graficos_iata_colombia', None)
+
+    # Retirar las llaves eliminadas de la contabilidad de memoria de la sesión
+    memoria.liberar_sesion(['datos_cargados', 'graficos_global_data', 'graficos_oag_mundo', 'graficos_fk_mundo', 
+                            'graficos_oag_colombia', 'graficos_credibanco', 'graficos_fk_colombia', 'graficos_iata_colombia'])
 
 
 def mostrar_resultado_en_streamlit(resultado, fuente, llave):
 
     """
     Muestra un resultado en Streamlit según el tipo de dato recibido.
-    - Si el resultado es un gráfico de Plotly (go.Figure), se visualiza con st.plotly_chart y se añade una leyenda con la fuente.
+    - Si el resultado es un gráfico de Plotly (go.Figure), se optimiza su payload (submuestreo LTTB, WebGL y sin texto redundante),
+      se visualiza con st.plotly_chart y se añade una leyenda con la fuente.
     - Si es una cadena de texto, se despliega usando st.write junto a una leyenda con la fuente.
     - Para otros tipos, se muestra una advertencia indicando que el tipo de resultado no es reconocido.
     """
 
-    # Caso 1: Gráfico de Plotly
+    # Caso 1: Gráfico de Plotly (optimizado para reducir el payload enviado al navegador)
     if isinstance(resultado, go.Figure):
-        st.plotly_chart(resultado, use_container_width=True, key=llave)
+        st.plotly_chart(plotly_analitica.preparar_figura(resultado, llave), use_container_width=True, key=llave)
         st.caption(f'Fuente: {fuente}')
 
     # Caso 2: Cadena de texto
@@ -1108,14 +1064,13 @@ def boton_descarga_word(unidad, llave):
         * El atributo `st.session_state.session`.
     """
     # Verificar que los archivos están en session_state
-    if 'b64_docx' not in st.session_state:
+    # Leer las llaves con .get(): pueden desalojarse por el presupuesto de memoria
+    b64_docx = st.session_state.get('b64_docx')
+    file_name_docx = st.session_state.get('file_name_docx')
+    if b64_docx is None or file_name_docx is None:
         st.error("No se encontraron los documentos para descargar. Por favor, genere el documento nuevamente.")
         return
 
-    # Extraer objetos necesarios de la sesión
-    b64_docx = st.session_state['b64_docx']
-    file_name_docx = st.session_state['file_name_docx']
-
     # WORD Download Process
     st.download_button(
         label='Descargar el informe en Microsoft Word',
@@ -1568,8 +1523,9 @@ def generar_documento_citi_excel(pais_elegido, df_global_data, df_oag, df_credib
         b64_xlsx = base64.b64encode(xlsx_buffer.read()).decode()
 
         # Almacenar en session_state para disponibilizar la descarga
-        st.session_state['b64_xlsx'] = b64_xlsx
+        # (con contabilidad de memoria y presupuestos; el nombre se guarda antes porque acompaña a la llave principal)
         st.session_state['file_name_xlsx'] = file_name_xlsx
+        memoria.guardar_en_sesion('b64_xlsx', b64_xlsx)
 
     except Exception as e:
         st.error(f"Se produjo un error durante la generación del documento: {e}")
@@ -1578,14 +1534,13 @@ def generar_documento_citi_excel(pais_elegido, df_global_data, df_oag, df_credib
 def boton_descarga_reporte_excel(unidad, llave):
 
     # Verificar que los archivos están en session_state
-    if 'b64_xlsx' not in st.session_state:
+    # Leer las llaves con .get(): pueden desalojarse por el presupuesto de memoria
+    b64_xlsx = st.session_state.get('b64_xlsx')
+    file_name_xlsx = st.session_state.get('file_name_xlsx')
+    if b64_xlsx is None or file_name_xlsx is None:
         st.error("No se encontraron los documentos para descargar. Por favor, genere el documento nuevamente.")
         return
 
-    # Extraer objetos necesarios de la sesión
-    b64_xlsx = st.session_state['b64_xlsx']
-    file_name_xlsx = st.session_state['file_name_xlsx']
-
     # Excel Download Process
     st.download_button(
         label='Descargar el informe en Microsoft Excel',
@@ -125,6 +125,7 @@ def documento_citi(dict_bullets, fig_time_series_viajeros, fig_time_series_gasto
     bullet_gasto_promedio = dict_bullets.get('bullet_gasto_promedio', None)
     bullet_gasto_categoria = dict_bullets.get('bullet_gasto_categoria', None)
     bullet_mice = dict_bullets.get('bullet_mice', None)
+    bullet_ranking_viajeros_colombia = dict_bullets.get('bullet_ranking_viajeros_colombia', None)
     bullet_frecuencias_mundo = dict_bullets.get('bullet_frecuencias_mundo', None)
     bullet_paises_con_frecuencias = dict_bullets.get('bullet_paises_con_frecuencias', None)
     bullet_frecuencias_destino_cerrado_t = dict_bullets.get('bullet_frecuencias_destino_cerrado_t', None)
@@ -132,10 +133,12 @@ def documento_citi(dict_bullets, fig_time_series_viajeros, fig_time_series_gasto
     bullet_busquedas_aereas_mex_cost_chi_per = dict_bullets.get('bullet_busquedas_aereas_mex_cost_chi_per', None)
     bullet_frecuencias_colombia = dict_bullets.get('bullet_frecuencias_colombia', None)
     bullet_frecuencias_municipio_cerrado_t = dict_bullets.get('bullet_frecuencias_municipio_cerrado_t', None)
+    bullet_ranking_sillas_colombia = dict_bullets.get('bullet_ranking_sillas_colombia', None)
     bullet_gasto_credibanco_cerrado_promedio = dict_bullets.get('bullet_gasto_credibanco_cerrado_promedio', None)
     bullet_gasto_directo_indirecto_credibanco_cerrado = dict_bullets.get('bullet_gasto_directo_indirecto_credibanco_cerrado', None)
     bullet_gasto_directo_cerrado = dict_bullets.get('bullet_gasto_directo_cerrado', None)
     bullet_gasto_indirecto_cerrado = dict_bullets.get('bullet_gasto_indirecto_cerrado', None)
+    bullet_ranking_gasto_credibanco = dict_bullets.get('bullet_ranking_gasto_credibanco', None)
     bullet_reservas_aereas_colombia = dict_bullets.get('bullet_reservas_aereas_colombia', None)
     bullet_busquedas_aereas_colombia = dict_bullets.get('bullet_busquedas_aereas_colombia', None)
 
@@ -199,7 +202,8 @@ def documento_citi(dict_bullets, fig_time_series_viajeros, fig_time_series_gasto
         bullet_rango_edad,
         bullet_motivo_viaje,
         bullet_forma_viaje,
-        bullet_destinos_internacionales
+        bullet_destinos_internacionales,
+        bullet_ranking_viajeros_colombia
     ]
 
     # Filtrar valores None para que la lista contenga solo bullets válidos
@@ -264,7 +268,8 @@ def documento_citi(dict_bullets, fig_time_series_viajeros, fig_time_series_gasto
     # Crear la lista
     bullets_seccion_conectividad_colombia = [
         bullet_frecuencias_colombia,
-        bullet_frecuencias_municipio_cerrado_t
+        bullet_frecuencias_municipio_cerrado_t,
+        bullet_ranking_sillas_colombia
     ]
 
     # Filtrar valores None para que la lista contenga solo bullets válidos
@@ -279,7 +284,8 @@ def documento_citi(dict_bullets, fig_time_series_viajeros, fig_time_series_gasto
         bullet_gasto_credibanco_cerrado_promedio,
         bullet_gasto_directo_indirecto_credibanco_cerrado,
         bullet_gasto_directo_cerrado,
-        bullet_gasto_indirecto_cerrado
+        bullet_gasto_indirecto_cerrado,
+        bullet_ranking_gasto_credibanco
     ]
 
     # Filtrar valores None para que la lista contenga solo bullets válidos
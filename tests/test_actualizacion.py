@@ -0,0 +1,64 @@
+import os
+
+from src.snowflake_analitica import actualizacion
+from src.snowflake_analitica.helpers import dividir_sentencias_sql
+
+RUTA_VISTAS = os.path.join(os.path.dirname(__file__), '..', 'src', 'creacion_vistas.sql')
+
+
+def _script_vistas():
+    with open(RUTA_VISTAS, 'r', encoding='utf-8') as archivo:
+        return archivo.read()
+
+
+def _plan(fuentes):
+    secciones_compartidas = actualizacion._secciones_compartidas(fuentes)
+    return {
+        'fuentes': fuentes,
+        'secciones_sql': [actualizacion.SECCIONES_SQL[fuente] for fuente in fuentes] + secciones_compartidas,
+        'tablas_servicio': actualizacion._tablas_servicio_fuentes(fuentes, secciones_compartidas),
+        'firmas': {tabla: 'firma' for fuente in fuentes for tabla in actualizacion.FUENTES[fuente]}
+    }
+
+
+def _sentencia(script, objeto):
+    return next(sentencia for sentencia in dividir_sentencias_sql(script) if f'VIEW {objeto} AS' in sentencia)
+
+
+def test_seccion_compartida_se_incluye_con_cualquiera_de_sus_fuentes():
+    plan = _plan(['OAG'])
+    script = actualizacion.filtrar_script_por_secciones(_script_vistas(), plan['secciones_sql'])
+
+    assert 'Referencias entre países' in plan['secciones_sql']
+    assert 'BENCHMARK_PAISES' in plan['tablas_servicio']
+    assert 'VIEW VISTAS.BENCHMARK_PAISES AS' in script
+    assert 'VIEW VISTAS.GLOBALDATA_INDICADORES_PAISES AS' not in script
+    assert 'BENCHMARK_PAISES' not in _plan(['IATAGAP'])['tablas_servicio']
+
+
+def test_seccion_compartida_no_se_publica_si_falla_una_de_sus_fuentes():
+    plan = _plan(['GLOBALDATA', 'OAG'])
+    script = actualizacion.filtrar_script_por_secciones(_script_vistas(), plan['secciones_sql'])
+    errores = [{'sentencia': _sentencia(script, 'VISTAS.OAG_INDICADORES_PAISES'), 'error': 'falla'}]
+
+    ajustado = actualizacion.ajustar_plan_por_errores(plan, script, errores)
+
+    assert ajustado['secciones_fallidas'] == ['OAG']
+    assert 'BENCHMARK_PAISES' not in ajustado['tablas_servicio']
+    assert 'GLOBALDATA_VIAJEROS_MUNDO' in ajustado['tablas_servicio']
+    assert ajustado['fuentes'] == ['GLOBALDATA']
+
+
+def test_error_en_seccion_compartida_no_registra_sus_fuentes():
+    plan = _plan(['GLOBALDATA', 'IATAGAP'])
+    script = actualizacion.filtrar_script_por_secciones(_script_vistas(), plan['secciones_sql'])
+    errores = [{'sentencia': _sentencia(script, 'VISTAS.BENCHMARK_PAISES'), 'error': 'falla'}]
+
+    ajustado = actualizacion.ajustar_plan_por_errores(plan, script, errores)
+
+    assert ajustado['secciones_fallidas'] == ['Referencias entre países']
+    assert 'BENCHMARK_PAISES' not in ajustado['tablas_servicio']
+    # GlobalData publica sus tablas pero conserva la firma anterior para reconstruir las referencias la próxima vez
+    assert 'GLOBALDATA_VIAJEROS_MUNDO' in ajustado['tablas_servicio']
+    assert ajustado['fuentes'] == ['IATAGAP']
+    assert not any(tabla.startswith('GLOBALDATA.') for tabla in ajustado['firmas'])
@@ -0,0 +1,44 @@
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.plotly_analitica import cache
+
+
+@cache.figura_en_cache
+def _grafico_que_modifica(df, columna='VALOR'):
+    df[columna] = df[columna] * 2
+    df.drop(columns=['OTRA'], inplace=True)
+    return go.Figure(go.Scatter(x=list(range(len(df))), y=df[columna].tolist()))
+
+
+def _df():
+    return pd.DataFrame({'VALOR': [1.0, 2.0, 3.0], 'OTRA': ['a', 'b', 'c']})
+
+
+def setup_function():
+    cache.limpiar_cache_figuras()
+
+
+def test_la_figura_no_modifica_el_dataframe_del_llamador():
+    df = _df()
+    _grafico_que_modifica(df)
+    pd.testing.assert_frame_equal(df, _df())
+
+
+def test_segunda_llamada_es_acierto_con_el_mismo_dataframe():
+    df = _df()
+    antes = cache.estadisticas_cache_figuras()
+    primera = _grafico_que_modifica(df)
+    segunda = _grafico_que_modifica(df)
+    despues = cache.estadisticas_cache_figuras()
+
+    assert despues['fallos'] - antes['fallos'] == 1
+    assert despues['aciertos'] - antes['aciertos'] == 1
+    assert list(segunda.data[0].y) == list(primera.data[0].y) == [2.0, 4.0, 6.0]
+
+
+def test_modificar_la_figura_retornada_no_altera_la_cache():
+    df = _df()
+    _grafico_que_modifica(df).update_layout(title='modificada')
+    assert _grafico_que_modifica(df).layout.title.text is None
+    assert _grafico_que_modifica(df) is not _grafico_que_modifica(df)
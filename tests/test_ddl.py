@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.snowflake_analitica.ddl import (columnas_decimales_enteras, generar_script_evolucion, inferir_tipo_snowflake,
+                                         inferir_tipos_snowflake)
+
+
+def test_inferir_tipo_enteros_y_decimales():
+    assert inferir_tipo_snowflake(pd.Series([1, 2, 3])) == 'NUMBER(9,0)'
+    assert inferir_tipo_snowflake(pd.Series([1, 10 ** 12])) == 'NUMBER(18,0)'
+    assert inferir_tipo_snowflake(pd.Series([1.5, 2.0])) == 'FLOAT'
+    assert inferir_tipo_snowflake(pd.Series([None, None])) is None
+
+
+def test_lote_posterior_con_nulos_en_columna_entera():
+    # El primer lote no tiene nulos y crea la columna como NUMBER(9,0)
+    primer_lote = pd.DataFrame({'ANIO': [2023, 2024], 'VALOR': [1.5, 2.5]})
+    columnas_tabla = inferir_tipos_snowflake(primer_lote)
+    assert columnas_tabla == {'ANIO': 'NUMBER(9,0)', 'VALOR': 'FLOAT'}
+
+    # Un lote posterior con un nulo llega como float64
+    segundo_lote = pd.DataFrame({'ANIO': [2025, None], 'VALOR': [3.5, None]})
+    tipos = inferir_tipos_snowflake(segundo_lote)
+    assert tipos['ANIO'] == 'FLOAT'
+
+    enteras = columnas_decimales_enteras(segundo_lote)
+    assert enteras == {'ANIO': 'NUMBER(9,0)'}
+    assert generar_script_evolucion('TABLA', columnas_tabla, tipos, enteras) == []
+
+
+def test_lote_posterior_con_nulos_amplia_precision():
+    columnas_tabla = {'ID': 'NUMBER(9,0)'}
+    lote = pd.DataFrame({'ID': [10.0 ** 12, np.nan]})
+    sentencias = generar_script_evolucion('TABLA', columnas_tabla, inferir_tipos_snowflake(lote), columnas_decimales_enteras(lote))
+    assert sentencias == ['ALTER TABLE TABLA ALTER COLUMN ID SET DATA TYPE NUMBER(18,0);']
+
+
+def test_decimales_en_columna_entera_es_incompatible():
+    columnas_tabla = {'ANIO': 'NUMBER(9,0)'}
+    lote = pd.DataFrame({'ANIO': [2025.5, None]})
+    assert columnas_decimales_enteras(lote) == {}
+    with pytest.raises(ValueError):
+        generar_script_evolucion('TABLA', columnas_tabla, inferir_tipos_snowflake(lote), columnas_decimales_enteras(lote))
+
+
+def test_infinitos_no_son_enteros():
+    assert columnas_decimales_enteras(pd.DataFrame({'A': [1.0, np.inf]})) == {}
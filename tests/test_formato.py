@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from src.formato_analitica import formato_numero, formato_serie, nombre_mes, serie_mes_anio
+
+
+def test_formato_numero():
+    assert formato_numero(1234567.891, decimales=2) == '1.234.567,89'
+    assert formato_numero(1234.5, decimales=1, sufijo='%') == '1.234,5%'
+    assert formato_numero(None) is None
+    assert formato_numero(np.nan) is None
+
+
+def test_formato_serie_con_nulos():
+    resultado = formato_serie(pd.Series([1234.5, None], index=['a', 'b']), decimales=1, prefijo='USD ')
+    assert resultado.tolist() == ['USD 1.234,5', None]
+    assert resultado.index.tolist() == ['a', 'b']
+
+
+def test_formato_serie_vacia():
+    resultado = formato_serie(pd.Series([], dtype=float))
+    assert resultado.empty
+
+
+def test_formato_serie_sin_valores():
+    resultado = formato_serie(pd.Series([np.nan, None]), sufijo='%')
+    assert resultado.tolist() == [None, None]
+
+
+def test_formato_serie_no_numericos():
+    assert formato_serie(['1000', 'texto']).tolist() == ['1.000', None]
+
+
+def test_nombres_de_mes():
+    assert nombre_mes(1) == 'enero'
+    assert nombre_mes(pd.Timestamp('2024-09-01'), capitalizar=True, abreviado=True) == 'Sep'
+    assert serie_mes_anio(['2024-01-01', '2024-12-01']) == ['enero-2024', 'diciembre-2024']
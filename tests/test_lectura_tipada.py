@@ -0,0 +1,37 @@
+import pandas as pd
+
+from src.snowflake_analitica.ddl import inferir_tipo_snowflake
+from src.snowflake_analitica.lectura_tipada import diagnosticar_csv, leer_csv_tipado, tipos_snowflake_esquema
+from src.snowflake_analitica.transformaciones import convertir_columnas
+
+ESQUEMA = {'sep': ';',
+           'columnas': {'PAIS': {'tipo': 'texto'},
+                        'TURISTAS': {'tipo': 'entero'},
+                        'FACTURACION': {'tipo': 'decimal', 'escala': 2}}}
+
+
+def test_enteros_y_montos_no_se_cargan_como_float(tmp_path):
+    ruta = tmp_path / 'archivo.csv'
+    ruta.write_text('PAIS;TURISTAS;FACTURACION\nChile;3;10.123\nPeru;;20.1\n', encoding='utf-8')
+
+    df = leer_csv_tipado(str(ruta), ESQUEMA)
+    assert str(df['TURISTAS'].dtype) == 'Int64'
+    assert df['TURISTAS'].isna().tolist() == [False, True]
+    assert df['FACTURACION'].tolist() == [10.12, 20.1]
+
+    assert tipos_snowflake_esquema(ESQUEMA) == {'PAIS': 'VARCHAR', 'TURISTAS': 'NUMBER(38,0)', 'FACTURACION': 'NUMBER(38,2)'}
+    assert inferir_tipo_snowflake(df['TURISTAS']) == 'NUMBER(9,0)'
+
+
+def test_convertir_columnas_enteras():
+    df = convertir_columnas(pd.DataFrame({'FREQUENCY': ['4', None], 'CODIGO': ['NA', 'CO']}), [], ['FREQUENCY'])
+    assert str(df['FREQUENCY'].dtype) == 'Int64'
+    assert df['CODIGO'].tolist() == ['NA', 'CO']
+
+
+def test_diagnostico_de_enteros_sigue_la_regla_del_lector(tmp_path):
+    ruta = tmp_path / 'archivo.csv'
+    ruta.write_text('PAIS;TURISTAS;FACTURACION\nChile;3.0;1\nPeru;-4;2\nMexico;+5;3\nCuba; 6 ;4\n', encoding='utf-8')
+
+    reporte = diagnosticar_csv(str(ruta), ESQUEMA)
+    assert reporte == {'TURISTAS': {'errores': 2, 'ejemplos': ['3.0', '+5']}}
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.plotly_analitica import cache, optimizacion
+
+
+def _figura_con_hueco(n=5000):
+    y = np.sin(np.linspace(0, 20, n))
+    y[2000:2100] = np.nan
+    return go.Figure(go.Scatter(x=pd.date_range('2020-01-01', periods=n, freq='h'), y=y, mode='lines'))
+
+
+def test_submuestreo_conserva_el_hueco():
+    fig = optimizacion.optimizar_figura(_figura_con_hueco(), max_puntos=300)
+    y = np.asarray(fig.data[0].y, dtype=float)
+
+    assert len(y) < 400
+    assert np.isnan(y).sum() == 1
+    corte = int(np.flatnonzero(np.isnan(y))[0])
+    assert 0 < corte < len(y) - 1
+
+
+def test_indices_sin_nulos_equivalen_a_lttb():
+    x = np.arange(1000, dtype=float)
+    y = np.random.default_rng(1).random(1000)
+    np.testing.assert_array_equal(optimizacion.indices_submuestreo(x, y, 100), optimizacion.lttb(x, y, 100))
+
+
+def test_preparar_figura_reutiliza_la_figura_optimizada(monkeypatch):
+    llamadas = []
+    original = optimizacion.optimizar_figura
+    monkeypatch.setattr(optimizacion, 'optimizar_figura', lambda fig: llamadas.append(1) or original(fig))
+
+    primera = optimizacion.preparar_figura(_figura_con_hueco(), 'grafico_prueba')
+    segunda = optimizacion.preparar_figura(_figura_con_hueco(), 'grafico_prueba')
+
+    assert segunda is primera
+    assert len(llamadas) == 1
+
+
+def test_preparar_figura_usa_la_llave_de_la_cache_de_figuras(monkeypatch):
+    cache.limpiar_cache_figuras()
+
+    @cache.figura_en_cache
+    def grafico(df):
+        return go.Figure(go.Scatter(x=df['X'].tolist(), y=df['Y'].tolist()))
+
+    df = pd.DataFrame({'X': range(10), 'Y': range(10)})
+    figura = grafico(df)
+    assert cache.llave_de_figura(figura) is not None
+    assert cache.llave_de_figura(go.Figure()) is None
+
+    monkeypatch.setattr(optimizacion, 'pickle', None)
+    assert optimizacion.preparar_figura(grafico(df), 'grafico_cache') is optimizacion.preparar_figura(grafico(df), 'grafico_cache')
@@ -0,0 +1,154 @@
+import datetime
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.datos_citi as datos_citi
+from src.snowflake_analitica import dml
+from src.snowflake_analitica.replica import traducir_consulta_replica, _initcap
+
+
+# ---------------------------------------------------------------------------
+# Sesión de prueba: ejecuta en DuckDB las consultas del aplicativo (dialecto Snowflake)
+# ---------------------------------------------------------------------------
+
+class _Fila:
+    def __init__(self, valores):
+        self._valores = valores
+
+    def asDict(self):
+        return dict(self._valores)
+
+
+class _Consulta:
+    def __init__(self, conexion, query):
+        self.conexion = conexion
+        self.query = query
+
+    def collect(self):
+        cursor = self.conexion.execute(self.query)
+        columnas = [descripcion[0].upper() for descripcion in cursor.description]
+        return [_Fila(zip(columnas, fila)) for fila in cursor.fetchall()]
+
+
+class SesionDuckDB:
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def sql(self, query):
+        return _Consulta(self.conexion, traducir_consulta_replica(query))
+
+
+# ---------------------------------------------------------------------------
+# Datos de prueba
+# ---------------------------------------------------------------------------
+
+PAISES = {'Colombia': 1, 'Mexico': 2, 'Chile': 3}
+DESTINOS = [f'Destino {i:02d}' for i in range(1, 13)]
+
+
+def _meses(inicio, fin):
+    return pd.date_range(inicio, fin, freq='MS')
+
+
+def _tablas_prueba():
+    rng = np.random.default_rng(7)
+    ids = dict(PAISES, **{destino: 10 + i for i, destino in enumerate(DESTINOS)})
+    dim_pais = pd.DataFrame({'COUNTRY_OR_AREA': list(ids), 'ID_PAIS': list(ids.values())})
+
+    # Mexico: 13 destinos (se agrupan en "Otros"), uno de ellos sin vuelos en el último año. Chile: 5 destinos.
+    destinos_origen = {'Mexico': DESTINOS + ['Colombia'], 'Chile': DESTINOS[:4] + ['Colombia']}
+    filas_mundo, filas_colombia = [], []
+    for origen, destinos in destinos_origen.items():
+        for mes in _meses('2022-01-01', '2024-06-01'):
+            for destino in destinos:
+                if destino == 'Destino 12' and mes.year == 2024:
+                    continue
+                filas_mundo.append({'ID_PAIS_DEPARTURE': ids[origen], 'ID_PAIS_ARRIVAL': ids[destino], 'PAIS_DEPARTURE': origen, 'PAIS_ARRIVAL': destino,
+                                    'TIME_SERIES': mes.strftime('%Y-%m'), 'FRECUENCIAS': int(rng.integers(1, 500)), 'SILLAS': int(rng.integers(100, 50000))})
+            # Vuelos domésticos: se excluyen de la conectividad con el mundo
+            filas_mundo.append({'ID_PAIS_DEPARTURE': ids[origen], 'ID_PAIS_ARRIVAL': ids[origen], 'PAIS_DEPARTURE': origen, 'PAIS_ARRIVAL': origen,
+                                'TIME_SERIES': mes.strftime('%Y-%m'), 'FRECUENCIAS': 999, 'SILLAS': 99999})
+            for municipio in ['BOGOTÁ, D.C.', 'MEDELLÍN']:
+                filas_colombia.append({'ID_PAIS_DEPARTURE': ids[origen], 'ID_PAIS_ARRIVAL': 1, 'PAIS_DEPARTURE': origen, 'MUNICIPIO_DANE': municipio,
+                                       'TIME_SERIES': mes.strftime('%Y-%m'), 'FRECUENCIAS': int(rng.integers(1, 100)), 'SILLAS': int(rng.integers(100, 9000))})
+
+    # Forward Keys: meses hasta hoy (las búsquedas se limitan a los últimos 14 meses)
+    hoy = datetime.date.today()
+    filas_reservas, filas_busquedas = [], []
+    for origen, destinos in destinos_origen.items():
+        for mes in _meses(hoy.replace(day=1) - pd.DateOffset(months=20), hoy.replace(day=1)):
+            for destino in destinos[-4:]:
+                comun = {'ID_PAIS_DEPARTURE': ids[origen], 'ID_PAIS_ARRIVAL': ids[destino], 'PAIS_DEPARTURE': origen, 'PAIS_ARRIVAL': destino, 'FECHA_USABLE': mes.date()}
+                filas_reservas.append(dict(comun, RESERVAS=int(rng.integers(0, 1000))))
+                filas_busquedas.append(dict(comun, BUSQUEDAS=int(rng.integers(0, 5000))))
+
+    return {
+        'DIM_PAIS': dim_pais,
+        'OAG_CONECTIVIDAD_MUNDO': pd.DataFrame(filas_mundo),
+        'OAG_CONECTIVIDAD_COLOMBIA': pd.DataFrame(filas_colombia),
+        'FORWARDKEYS_RESERVAS_MES': pd.DataFrame(filas_reservas),
+        'FORWARDKEYS_BUSQUEDAS_MES': pd.DataFrame(filas_busquedas)
+    }
+
+
+@pytest.fixture
+def sesion():
+    conexion = duckdb.connect()
+    conexion.execute("CREATE SCHEMA SERVICIO")
+    for tabla, df in _tablas_prueba().items():
+        conexion.register('df_tabla', df)
+        conexion.execute(f"CREATE TABLE SERVICIO.{tabla} AS SELECT * FROM df_tabla")
+        conexion.unregister('df_tabla')
+
+    # Funciones de Snowflake usadas por las consultas del warehouse
+    conexion.execute("CREATE MACRO TO_DATE(texto, formato) AS CAST(strptime(texto, '%Y-%m') AS DATE)")
+    conexion.execute("CREATE MACRO TO_VARCHAR(valor) AS CAST(valor AS VARCHAR)")
+    conexion.create_function('INITCAP', _initcap, ['VARCHAR'], 'VARCHAR')
+
+    dml._CACHE_IDS_PAISES.clear()
+    yield SesionDuckDB(conexion)
+    dml._CACHE_IDS_PAISES.clear()
+    conexion.close()
+
+
+# ---------------------------------------------------------------------------
+# Paridad pandas / warehouse
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize('pais', ['Mexico', 'Chile'])
+def test_modos_procesamiento_coinciden(sesion, pais):
+    comparacion = datos_citi.comparar_modos_procesamiento(pais, sesion)
+
+    assert set(comparacion['Fuente']) == {'OAG', 'Forward Keys'}
+    assert (comparacion['Filas pandas'] > 0).all()
+    assert comparacion['Coincide'].all(), comparacion.loc[~comparacion['Coincide'], ['Llave', 'Detalle']].to_string()
+
+
+def test_top_destinos_agrupa_otros(sesion):
+    resultados = datos_citi.datos_oag_warehouse('Mexico', sesion)
+
+    cerrado = resultados['conectividad_mundo_destino_cerrado']
+    assert set(cerrado.groupby('Año')['País Destino'].nunique()) == {datos_citi.procesamiento_warehouse.TOP_DESTINOS_OAG + 1}
+    assert 'Otros' in set(cerrado['País Destino'])
+    assert cerrado.groupby('Año')['Participación Frecuencias (%)'].sum().round(6).eq(100).all()
+
+    corrido = resultados['conectividad_mundo_destino_corrido']
+    assert set(corrido['Periodo']) == {'Enero - Junio 2023', 'Enero - Junio 2024'}
+
+
+def test_comparacion_paises_warehouse_coincide_con_pandas(sesion):
+    paises = ['Mexico', 'Chile']
+    datos_pandas = datos_citi.datos_comparacion_paises_modo(paises, sesion, modo='pandas')
+    datos_warehouse = datos_citi.datos_comparacion_paises_modo(paises, sesion, modo='warehouse')
+
+    normalizar = datos_citi.procesamiento_warehouse._normalizar_para_comparar
+    for pais in paises:
+        for fuente in ['df_oag', 'df_fk']:
+            assert set(datos_pandas[pais][fuente]) == set(datos_warehouse[pais][fuente])
+            for llave, df_pandas in datos_pandas[pais][fuente].items():
+                assert not df_pandas.empty
+                pd.testing.assert_frame_equal(normalizar(df_pandas), normalizar(datos_warehouse[pais][fuente][llave]),
+                                              check_dtype=False, check_exact=False, rtol=1e-6)
@@ -0,0 +1,40 @@
+import textwrap
+
+from src.datos_citi import proyeccion
+
+
+def test_consultas_del_aplicativo_cumplen_su_proyeccion():
+    sobrantes = proyeccion.verificar_proyecciones()
+    assert sobrantes.empty, sobrantes.to_string(index=False)
+
+
+def test_uso_de_columnas_por_consulta(tmp_path, monkeypatch):
+    modulo = tmp_path / 'procesamiento.py'
+    modulo.write_text(textwrap.dedent('''
+        COLUMNAS_PAIS = {}
+        _TOTAL = """
+                    SUM(VALOR) AS TOTAL"""
+
+        def obtener(pais, session):
+            consultas = {
+                "serie": f"SELECT ANIO, {_TOTAL} FROM T WHERE PAIS = '{pais}' GROUP BY ANIO",
+                "destinos": "SELECT ANIO, DESTINO, TOTAL FROM T"
+            }
+
+        def procesar(dataframes):
+            df_serie = dataframes.get('serie')
+            if not df_serie.empty:
+                df_anual = df_serie.rename(columns={'ANIO': 'Año'})
+                df_anual['Total'] = df_anual['TOTAL']
+            df_destinos = dataframes.get('destinos')
+            return df_destinos[['ANIO', 'DESTINO']]
+    '''), encoding='utf-8')
+    monkeypatch.setattr(proyeccion, 'CONSUMIDORES_CONSULTAS', {'Prueba': ('obtener', 'procesar', 'df_prueba')})
+
+    reporte = proyeccion.analizar_uso_columnas(str(modulo))
+
+    usadas = {(fila.Consulta, fila.Columna): fila.Usada for fila in reporte.itertuples()}
+    assert usadas == {('serie', 'ANIO'): True, ('serie', 'TOTAL'): True,
+                      ('destinos', 'ANIO'): True, ('destinos', 'DESTINO'): True,
+                      # TOTAL solo se lee sobre el DataFrame de la consulta "serie"
+                      ('destinos', 'TOTAL'): False}
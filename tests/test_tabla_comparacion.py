@@ -0,0 +1,25 @@
+import pandas as pd
+
+from src.streamlit_analitica import utils
+
+
+def _viajeros(valores):
+    return pd.DataFrame({'Año': ['2023', '2024', '2025'][:len(valores)], 'Viajeros': valores})
+
+
+def test_tabla_comparacion_una_columna_por_pais():
+    datos_comparacion = {
+        'Mexico': {'df_global_data': {'viajeros_serie_tiempo': _viajeros([1000., 2000., 3500.])}, 'df_oag': {}},
+        'Chile': {'df_global_data': {'viajeros_serie_tiempo': _viajeros([10., 20.])},
+                  'df_oag': {'conectividad_mundo_serie_tiempo': pd.DataFrame({'Año': ['2024'], 'Frecuencias': [50]})}},
+        'Peru': {'df_global_data': {}, 'df_oag': {}}
+    }
+
+    tabla = utils.generar_tabla_comparacion(datos_comparacion, year_global_data='2025', year_oag_mundo='2024',
+                                            year_oag_colombia='2024', year_credibanco='2024', year_iata='2024')
+
+    assert list(tabla.columns) == ['Indicador', 'Mexico', 'Chile']
+    assert list(tabla['Indicador']) == ['Flujos de viajeros de cada país hacia el mundo en 2025', 'Conectividad de cada país con el mundo en 2024']
+    # Chile tiene la serie de viajeros pero no el año consultado; Mexico no tiene la serie de conectividad
+    assert list(tabla['Mexico']) == ['3.500 miles de viajeros', 'Sin datos']
+    assert list(tabla['Chile']) == ['Sin datos', '50 frecuencias']